@@ -24,7 +24,9 @@ from app.shared.core.app_runtime import (
     _api_documentation_allowed,
     _is_test_mode,
     _runtime_data_dir,
+    _start_event_loop_monitor,
     _stop_emissions_tracker,
+    _stop_runtime_workers,
     EmissionsTracker,
 )
 from app.shared.core.config import get_settings, reload_settings_from_environment
@@ -137,6 +139,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
             reason="testing" if _is_test_mode() else "unavailable",
         )
     app.state.emissions_tracker = tracker
+    loop_monitor = _start_event_loop_monitor()
 
     # Pass shared session factory to scheduler (DI pattern)
     # Lazy import to avoid Celery blocking on module load
@@ -240,6 +243,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
 
     scheduler.stop()
     _stop_emissions_tracker(tracker)
+    await _stop_runtime_workers(loop_monitor)
 
     # Final DB Cleanup
     try:
@@ -17,6 +17,7 @@ from sqlalchemy import (
     DateTime,
     ForeignKey,
     Boolean,
+    Index,
     event,
     JSON,
     Uuid as PG_UUID,
@@ -76,6 +77,15 @@ class BackgroundJob(Base):
     """
 
     __tablename__ = "background_jobs"
+    __table_args__ = (
+        # Per-tenant job history windows (ingestion SLA aggregates).
+        Index(
+            "ix_background_jobs_tenant_type_created",
+            "tenant_id",
+            "job_type",
+            "created_at",
+        ),
+    )
 
     id: Mapped[UUID] = mapped_column(PG_UUID(), primary_key=True, default=uuid4)
     job_type: Mapped[str] = mapped_column(String(50), nullable=False, index=True)
@@ -143,3 +143,38 @@ class CostRecord(Base):
         sa.Index("ix_cost_records_tenant_recorded", "tenant_id", "recorded_at"),
         get_partition_args("RANGE (recorded_at)"),
     )
+
+
+class DailyCostAggregate(Base):
+    """
+    Incrementally maintained daily cost rollup of `cost_records`.
+
+    One row per (tenant, day, service, region); ingestion recomputes only the
+    buckets its batch touched, replacing the nightly full refresh of the
+    `mv_daily_cost_aggregates` materialized view. A NULL record region is
+    stored as an empty string so the bucket key stays unique.
+    """
+
+    __tablename__ = "daily_cost_aggregates"
+    __table_args__ = (
+        sa.Index("ix_daily_cost_aggregates_tenant_date", "tenant_id", "cost_date"),
+    )
+
+    tenant_id: Mapped[UUID] = mapped_column(
+        PG_UUID(),
+        ForeignKey("tenants.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    cost_date: Mapped[date] = mapped_column(Date, primary_key=True)
+    service: Mapped[str] = mapped_column(String, primary_key=True)
+    region: Mapped[str] = mapped_column(String, primary_key=True, default="")
+    total_cost: Mapped[Decimal] = mapped_column(
+        Numeric(18, 8), nullable=False, default=Decimal("0")
+    )
+    total_carbon: Mapped[Decimal] = mapped_column(
+        Numeric(18, 4), nullable=False, default=Decimal("0")
+    )
+    record_count: Mapped[int] = mapped_column(sa.Integer, nullable=False, default=0)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=sa.func.now()
+    )
@@ -12,7 +12,7 @@ Why this matters:
 """
 
 from uuid import uuid4, UUID
-from datetime import datetime
+from datetime import date, datetime
 from typing import TYPE_CHECKING, Any
 from decimal import Decimal
 from sqlalchemy import (
@@ -21,7 +21,9 @@ from sqlalchemy import (
     Numeric,
     ForeignKey,
     Boolean,
+    Date,
     DateTime,
+    UniqueConstraint,
     func,
     Uuid as PG_UUID,
 )
@@ -121,6 +123,57 @@ class LLMUsage(Base):
         return f"<LLMUsage {self.model} ${self.cost_usd:.6f}>"
 
 
+class LLMUsageCounter(Base):
+    """
+    Pre-aggregated LLM request/spend counters per tenant bucket.
+
+    One row per (tenant, period, period_start, scope), incremented with an
+    atomic upsert in the same transaction as the `LLMUsage` insert, so quota
+    and alert checks read a single row instead of scanning `llm_usage`.
+
+    period: "day" or "month" (UTC bucket start in `period_start`)
+    scope:  "tenant", "actor:user", "actor:system" or "user:<user_id>"
+    """
+
+    __tablename__ = "llm_usage_counters"
+    __table_args__ = (
+        UniqueConstraint(
+            "tenant_id",
+            "period",
+            "period_start",
+            "scope",
+            name="uq_llm_usage_counters_bucket",
+        ),
+    )
+
+    id: Mapped[UUID] = mapped_column(PG_UUID(), primary_key=True, default=uuid4)
+    tenant_id: Mapped[UUID] = mapped_column(
+        PG_UUID(),
+        ForeignKey("tenants.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    period: Mapped[str] = mapped_column(String(8), nullable=False)
+    period_start: Mapped[date] = mapped_column(Date, nullable=False)
+    scope: Mapped[str] = mapped_column(String(64), nullable=False)
+    request_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    cost_usd: Mapped[Decimal] = mapped_column(
+        Numeric(18, 8), nullable=False, default=Decimal("0")
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+        onupdate=func.now(),
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<LLMUsageCounter {self.period}:{self.period_start} {self.scope} "
+            f"n={self.request_count}>"
+        )
+
+
 class LLMBudget(Base):
     """
     Tracks monthly LLM usage budget per tenant.
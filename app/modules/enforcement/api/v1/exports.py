@@ -1,20 +1,24 @@
 from __future__ import annotations
 
 from datetime import date, datetime, time, timedelta, timezone
-import io
 import json
 import zipfile
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.modules.enforcement.api.v1.common import tenant_or_403, require_feature_or_403
 from app.modules.enforcement.api.v1.schemas import EnforcementExportParityResponse
+from app.modules.enforcement.domain.export_bundle_ops import (
+    EXPORT_BUNDLE_MAX_ROWS_CEILING,
+)
 from app.modules.enforcement.domain.service import EnforcementService
 from app.shared.core.auth import CurrentUser, requires_role_with_db_context
 from app.shared.core.config import get_settings
 from app.shared.core.ops_metrics import ENFORCEMENT_EXPORT_EVENTS_TOTAL
 from app.shared.core.pricing import FeatureFlag
+from app.shared.core.spooled_export import iter_file_chunks, new_spooled_archive
 from app.shared.db.session import get_db
 
 
@@ -36,7 +40,7 @@ def _export_max_rows() -> int:
         max_rows = int(raw)
     except (TypeError, ValueError):
         max_rows = 10000
-    return max(1, min(max_rows, 50000))
+    return max(1, min(max_rows, EXPORT_BUNDLE_MAX_ROWS_CEILING))
 
 
 def _resolve_window(
@@ -106,10 +110,13 @@ async def get_export_parity(
         window_end=window_end,
         max_rows=_resolve_max_rows(max_rows),
     )
-    signed_manifest = service.build_signed_export_manifest(
-        tenant_id=tenant_id,
-        bundle=bundle,
-    )
+    try:
+        signed_manifest = service.build_signed_export_manifest(
+            tenant_id=tenant_id,
+            bundle=bundle,
+        )
+    finally:
+        bundle.close()
     ENFORCEMENT_EXPORT_EVENTS_TOTAL.labels(
         artifact="parity",
         outcome=("success" if bundle.parity_ok else "mismatch"),
@@ -158,35 +165,44 @@ async def download_export_archive(
         window_end=window_end,
         max_rows=_resolve_max_rows(max_rows),
     )
-    signed_manifest = service.build_signed_export_manifest(
-        tenant_id=tenant_id,
-        bundle=bundle,
-    )
+    archive = new_spooled_archive()
+    archive_ready = False
+    try:
+        signed_manifest = service.build_signed_export_manifest(
+            tenant_id=tenant_id,
+            bundle=bundle,
+        )
+        manifest = signed_manifest.to_payload()
+        with zipfile.ZipFile(
+            archive,
+            mode="w",
+            compression=zipfile.ZIP_DEFLATED,
+        ) as bundle_zip:
+            bundle_zip.writestr("manifest.json", json.dumps(manifest, indent=2))
+            bundle_zip.writestr(
+                "manifest.canonical.json", signed_manifest.canonical_content_json
+            )
+            bundle_zip.writestr("manifest.sha256", f"{signed_manifest.content_sha256}\n")
+            bundle_zip.writestr("manifest.sig", f"{signed_manifest.signature}\n")
+            with bundle_zip.open("decisions.csv", "w", force_zip64=True) as entry:
+                bundle.decisions_artifact.copy_to(entry)
+            with bundle_zip.open("approvals.csv", "w", force_zip64=True) as entry:
+                bundle.approvals_artifact.copy_to(entry)
+        archive_ready = True
+    finally:
+        bundle.close()
+        if not archive_ready:
+            archive.close()
     ENFORCEMENT_EXPORT_EVENTS_TOTAL.labels(
         artifact="archive",
         outcome=("success" if bundle.parity_ok else "mismatch"),
     ).inc()
-    manifest = signed_manifest.to_payload()
-
-    archive_buffer = io.BytesIO()
-    with zipfile.ZipFile(
-        archive_buffer,
-        mode="w",
-        compression=zipfile.ZIP_DEFLATED,
-    ) as bundle_zip:
-        bundle_zip.writestr("manifest.json", json.dumps(manifest, indent=2))
-        bundle_zip.writestr("manifest.canonical.json", signed_manifest.canonical_content_json)
-        bundle_zip.writestr("manifest.sha256", f"{signed_manifest.content_sha256}\n")
-        bundle_zip.writestr("manifest.sig", f"{signed_manifest.signature}\n")
-        bundle_zip.writestr("decisions.csv", bundle.decisions_csv)
-        bundle_zip.writestr("approvals.csv", bundle.approvals_csv)
-
-    archive_buffer.seek(0)
+
     filename = (
         f"enforcement-export-{tenant_id}-{bundle.generated_at.strftime('%Y%m%dT%H%M%SZ')}.zip"
     )
-    return Response(
-        content=archive_buffer.getvalue(),
+    return StreamingResponse(
+        iter_file_chunks(archive),
         media_type="application/zip",
         headers={"Content-Disposition": f'attachment; filename="{filename}"'},
     )
@@ -14,9 +14,12 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.enforcement import EnforcementApprovalRequest, EnforcementDecision
 from app.modules.enforcement.domain.export_bundle_csv import (
+    APPROVAL_CSV_HEADERS,
+    DECISION_CSV_HEADERS,
     render_approvals_csv,
     render_decisions_csv,
 )
+from app.shared.core.spooled_export import SpooledCsvArtifact
 
 __all__ = (
     "render_decisions_csv",
@@ -25,8 +28,15 @@ __all__ = (
     "resolve_manifest_signing_key_id",
     "build_signed_export_manifest_payload",
     "build_export_bundle_payload",
+    "EXPORT_BUNDLE_MAX_ROWS_CEILING",
+    "EXPORT_BUNDLE_STREAM_BATCH_SIZE",
 )
 
+# Bundles are streamed through spooled artifacts, so this ceiling is a guard
+# against runaway windows rather than a memory limit.
+EXPORT_BUNDLE_MAX_ROWS_CEILING = 1_000_000
+EXPORT_BUNDLE_STREAM_BATCH_SIZE = 1000
+
 
 def resolve_manifest_signing_secret(
     *,
@@ -133,16 +143,27 @@ async def build_export_bundle_payload(
     normalize_policy_document_sha256_fn: Callable[[str | None], str],
     computed_context_snapshot_fn: Callable[[dict[str, Any] | None], dict[str, Any]],
     json_default_fn: Callable[[Any], Any],
-    render_decisions_csv_fn: Callable[[list[EnforcementDecision]], str],
-    render_approvals_csv_fn: Callable[[list[EnforcementApprovalRequest]], str],
+    decision_csv_row_fn: Callable[[EnforcementDecision], list[str]],
+    approval_csv_row_fn: Callable[[EnforcementApprovalRequest], list[str]],
     export_events_counter: Any,
     utcnow_fn: Callable[[], datetime],
+    stream_batch_size: int = EXPORT_BUNDLE_STREAM_BATCH_SIZE,
 ) -> dict[str, Any]:
+    """
+    Build the enforcement export bundle by streaming decisions and approvals.
+
+    Rows are read through server-side cursors in `stream_batch_size` partitions
+    and written straight into spooled CSV artifacts whose SHA-256 digests are
+    computed on the fly, so memory stays flat regardless of the window size.
+    """
     bounded_max_rows = int(max_rows)
     if bounded_max_rows < 1:
         raise HTTPException(status_code=422, detail="max_rows must be >= 1")
-    if bounded_max_rows > 50000:
-        raise HTTPException(status_code=422, detail="max_rows must be <= 50000")
+    if bounded_max_rows > EXPORT_BUNDLE_MAX_ROWS_CEILING:
+        raise HTTPException(
+            status_code=422,
+            detail=f"max_rows must be <= {EXPORT_BUNDLE_MAX_ROWS_CEILING}",
+        )
 
     normalized_start = as_utc_fn(window_start)
     normalized_end = as_utc_fn(window_end)
@@ -176,16 +197,6 @@ async def build_export_bundle_payload(
             ),
         )
 
-    decision_rows = await db.execute(
-        select(EnforcementDecision)
-        .where(EnforcementDecision.tenant_id == tenant_id)
-        .where(EnforcementDecision.created_at >= normalized_start)
-        .where(EnforcementDecision.created_at <= normalized_end)
-        .order_by(EnforcementDecision.created_at.asc(), EnforcementDecision.id.asc())
-    )
-    decisions = list(decision_rows.scalars().all())
-    decision_count_exported = len(decisions)
-
     approval_count_db = int(
         (
             await db.execute(
@@ -204,30 +215,75 @@ async def build_export_bundle_payload(
         or 0
     )
 
-    approvals: list[EnforcementApprovalRequest] = []
-    if decisions:
-        decision_ids = [decision.id for decision in decisions]
-        approval_rows = await db.execute(
+    batch_size = max(1, int(stream_batch_size))
+    decisions_artifact = SpooledCsvArtifact(DECISION_CSV_HEADERS)
+    approvals_artifact = SpooledCsvArtifact(APPROVAL_CSV_HEADERS)
+    policy_lineage_counts: dict[tuple[str, str], int] = {}
+    computed_context_lineage_counts: dict[
+        tuple[str, str, str, str, int, int, int, str, str],
+        int,
+    ] = {}
+
+    decision_stream = await db.stream_scalars(
+        select(EnforcementDecision)
+        .where(EnforcementDecision.tenant_id == tenant_id)
+        .where(EnforcementDecision.created_at >= normalized_start)
+        .where(EnforcementDecision.created_at <= normalized_end)
+        .order_by(EnforcementDecision.created_at.asc(), EnforcementDecision.id.asc())
+        .execution_options(yield_per=batch_size)
+    )
+    async for decision_batch in decision_stream.partitions(batch_size):
+        for decision in decision_batch:
+            decisions_artifact.writerow(decision_csv_row_fn(decision))
+            policy_key = (
+                normalize_policy_document_schema_version_fn(
+                    getattr(decision, "policy_document_schema_version", None)
+                ),
+                normalize_policy_document_sha256_fn(
+                    getattr(decision, "policy_document_sha256", None)
+                ),
+            )
+            policy_lineage_counts[policy_key] = (
+                int(policy_lineage_counts.get(policy_key, 0)) + 1
+            )
+            snapshot = computed_context_snapshot_fn(decision.response_payload)
+            context_key = (
+                str(snapshot["context_version"]),
+                str(snapshot["generated_at"]),
+                str(snapshot["month_start"]),
+                str(snapshot["month_end"]),
+                int(snapshot["month_elapsed_days"]),
+                int(snapshot["month_total_days"]),
+                int(snapshot["observed_cost_days"]),
+                str(snapshot["latest_cost_date"]),
+                str(snapshot["data_source_mode"]),
+            )
+            computed_context_lineage_counts[context_key] = (
+                int(computed_context_lineage_counts.get(context_key, 0)) + 1
+            )
+    decision_count_exported = decisions_artifact.row_count
+
+    if decision_count_exported:
+        approval_stream = await db.stream_scalars(
             select(EnforcementApprovalRequest)
+            .join(
+                EnforcementDecision,
+                EnforcementDecision.id == EnforcementApprovalRequest.decision_id,
+            )
             .where(EnforcementApprovalRequest.tenant_id == tenant_id)
-            .where(EnforcementApprovalRequest.decision_id.in_(decision_ids))
+            .where(EnforcementDecision.tenant_id == tenant_id)
+            .where(EnforcementDecision.created_at >= normalized_start)
+            .where(EnforcementDecision.created_at <= normalized_end)
             .order_by(
                 EnforcementApprovalRequest.created_at.asc(),
                 EnforcementApprovalRequest.id.asc(),
             )
+            .execution_options(yield_per=batch_size)
         )
-        approvals = list(approval_rows.scalars().all())
-
-    policy_lineage_counts: dict[tuple[str, str], int] = {}
-    for decision in decisions:
-        schema_version = normalize_policy_document_schema_version_fn(
-            getattr(decision, "policy_document_schema_version", None)
-        )
-        policy_hash = normalize_policy_document_sha256_fn(
-            getattr(decision, "policy_document_sha256", None)
-        )
-        key = (schema_version, policy_hash)
-        policy_lineage_counts[key] = int(policy_lineage_counts.get(key, 0)) + 1
+        async for approval_batch in approval_stream.partitions(batch_size):
+            for approval in approval_batch:
+                approvals_artifact.writerow(approval_csv_row_fn(approval))
+    approval_count_exported = approvals_artifact.row_count
 
     policy_lineage: list[dict[str, Any]] = []
     for schema_version, policy_hash in sorted(policy_lineage_counts.keys()):
@@ -246,27 +302,6 @@ async def build_export_bundle_payload(
     )
     policy_lineage_sha256 = hashlib.sha256(policy_lineage_json.encode("utf-8")).hexdigest()
 
-    computed_context_lineage_counts: dict[
-        tuple[str, str, str, str, int, int, int, str, str],
-        int,
-    ] = {}
-    for decision in decisions:
-        snapshot = computed_context_snapshot_fn(decision.response_payload)
-        context_key = (
-            str(snapshot["context_version"]),
-            str(snapshot["generated_at"]),
-            str(snapshot["month_start"]),
-            str(snapshot["month_end"]),
-            int(snapshot["month_elapsed_days"]),
-            int(snapshot["month_total_days"]),
-            int(snapshot["observed_cost_days"]),
-            str(snapshot["latest_cost_date"]),
-            str(snapshot["data_source_mode"]),
-        )
-        computed_context_lineage_counts[context_key] = (
-            int(computed_context_lineage_counts.get(context_key, 0)) + 1
-        )
-
     computed_context_lineage: list[dict[str, Any]] = []
     for context_key in sorted(computed_context_lineage_counts.keys()):
         (
@@ -304,11 +339,6 @@ async def build_export_bundle_payload(
         computed_context_lineage_json.encode("utf-8")
     ).hexdigest()
 
-    approval_count_exported = len(approvals)
-    decisions_csv = render_decisions_csv_fn(decisions)
-    approvals_csv = render_approvals_csv_fn(approvals)
-    decisions_sha256 = hashlib.sha256(decisions_csv.encode("utf-8")).hexdigest()
-    approvals_sha256 = hashlib.sha256(approvals_csv.encode("utf-8")).hexdigest()
     parity_ok = (
         decision_count_db == decision_count_exported
         and approval_count_db == approval_count_exported
@@ -326,13 +356,13 @@ async def build_export_bundle_payload(
         "decision_count_exported": decision_count_exported,
         "approval_count_db": approval_count_db,
         "approval_count_exported": approval_count_exported,
-        "decisions_sha256": decisions_sha256,
-        "approvals_sha256": approvals_sha256,
+        "decisions_sha256": decisions_artifact.sha256,
+        "approvals_sha256": approvals_artifact.sha256,
         "policy_lineage_sha256": policy_lineage_sha256,
         "policy_lineage": policy_lineage,
         "computed_context_lineage_sha256": computed_context_lineage_sha256,
         "computed_context_lineage": computed_context_lineage,
-        "decisions_csv": decisions_csv,
-        "approvals_csv": approvals_csv,
+        "decisions_artifact": decisions_artifact,
+        "approvals_artifact": approvals_artifact,
         "parity_ok": parity_ok,
     }
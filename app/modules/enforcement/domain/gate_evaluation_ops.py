@@ -69,7 +69,7 @@ async def evaluate_gate(
         gate_evaluation_result_cls=gate_evaluation_result_cls,
         ttl_seconds=ttl_seconds,
         acquire_lock_fn=lambda: service._acquire_gate_evaluation_lock(
-            policy=policy, source=source
+            policy=policy, source=source, scope_key=gate_input.project_id
         ),
     )
     if existing_result is not None:
@@ -79,15 +79,6 @@ async def evaluate_gate(
     monthly_delta = quantize_fn(gate_input.estimated_monthly_delta_usd, "0.0001")
     hourly_delta = quantize_fn(gate_input.estimated_hourly_delta_usd, "0.000001")
     reasons: list[str] = []
-    reserved_alloc_total, reserved_credit_total = await service._get_reserved_totals(
-        tenant_id=tenant_id,
-        month_start=month_start,
-        month_end=month_end,
-    )
-    reserved_total_monthly = quantize_fn(
-        to_decimal_fn(reserved_alloc_total) + to_decimal_fn(reserved_credit_total),
-        "0.0001",
-    )
     tenant_tier = await service._resolve_tenant_tier(tenant_id)
     plan_ceiling = await service._resolve_plan_monthly_ceiling_usd(
         policy=policy,
@@ -97,6 +88,45 @@ async def evaluate_gate(
         policy=policy,
         tenant_tier=tenant_tier,
     )
+    budget = await service._get_effective_budget(
+        tenant_id=tenant_id,
+        scope_key=gate_input.project_id,
+    )
+    reserved_credit_headroom, emergency_credit_headroom = await service._get_credit_headrooms(
+        tenant_id=tenant_id,
+        scope_key=gate_input.project_id,
+        now=now,
+    )
+    credits_available = quantize_fn(
+        reserved_credit_headroom + emergency_credit_headroom,
+        "0.0001",
+    )
+
+    is_prod = is_production_environment_fn(normalized_env)
+    computed_context = await service._build_decision_computed_context(
+        tenant_id=tenant_id,
+        policy_version=int(policy.policy_version),
+        gate_input=gate_input,
+        now=now,
+        is_production=is_prod,
+    )
+
+    # The tenant-wide reservation total is read and extended under one lock,
+    # held until the decision commits; gates that cannot reserve skip it.
+    if not gate_input.dry_run and mode != EnforcementMode.SHADOW:
+        await service._acquire_gate_reservation_lock(
+            tenant_id=tenant_id,
+            source=source,
+        )
+    reserved_alloc_total, reserved_credit_total = await service._get_reserved_totals(
+        tenant_id=tenant_id,
+        month_start=month_start,
+        month_end=month_end,
+    )
+    reserved_total_monthly = quantize_fn(
+        to_decimal_fn(reserved_alloc_total) + to_decimal_fn(reserved_credit_total),
+        "0.0001",
+    )
     plan_headroom = (
         quantize_fn(
             max(Decimal("0.0000"), to_decimal_fn(plan_ceiling) - reserved_total_monthly),
@@ -113,19 +143,6 @@ async def evaluate_gate(
         if enterprise_ceiling is not None
         else None
     )
-    budget = await service._get_effective_budget(
-        tenant_id=tenant_id,
-        scope_key=gate_input.project_id,
-    )
-    reserved_credit_headroom, emergency_credit_headroom = await service._get_credit_headrooms(
-        tenant_id=tenant_id,
-        scope_key=gate_input.project_id,
-        now=now,
-    )
-    credits_available = quantize_fn(
-        reserved_credit_headroom + emergency_credit_headroom,
-        "0.0001",
-    )
 
     if budget is None:
         allocation_headroom: Decimal | None = None
@@ -136,14 +153,6 @@ async def evaluate_gate(
             to_decimal_fn(budget.monthly_limit_usd) - reserved_alloc_total,
         )
 
-    is_prod = is_production_environment_fn(normalized_env)
-    computed_context = await service._build_decision_computed_context(
-        tenant_id=tenant_id,
-        policy_version=int(policy.policy_version),
-        gate_input=gate_input,
-        now=now,
-        is_production=is_prod,
-    )
     approval_required = (
         policy.require_approval_for_prod
         if is_prod
@@ -50,10 +50,13 @@ from app.modules.enforcement.domain.service_private_ops import (
 )
 from app.modules.enforcement.domain.service_runtime_ops import (
     acquire_gate_evaluation_lock as _acquire_gate_evaluation_lock_impl,
+    acquire_gate_reservation_lock as _acquire_gate_reservation_lock_impl,
     append_decision_ledger_entry as _append_decision_ledger_entry_impl,
+    approval_csv_row as _approval_csv_row_runtime_impl,
     build_export_bundle as _build_export_bundle_impl,
     build_reservation_reconciliation_idempotent_replay as _build_reservation_reconciliation_idempotent_replay_impl,
     build_signed_export_manifest as _build_signed_export_manifest_impl,
+    decision_csv_row as _decision_csv_row_runtime_impl,
     list_active_reservations as _list_active_reservations_impl,
     list_decision_ledger as _list_decision_ledger_impl,
     list_reconciliation_exceptions as _list_reconciliation_exceptions_impl,
@@ -365,6 +368,8 @@ class EnforcementService(EnforcementServiceApprovalOps, EnforcementServicePrivat
     build_signed_export_manifest = _build_signed_export_manifest_impl
     _render_decisions_csv = _render_decisions_csv_runtime_impl
     _render_approvals_csv = _render_approvals_csv_runtime_impl
+    _decision_csv_row = _decision_csv_row_runtime_impl
+    _approval_csv_row = _approval_csv_row_runtime_impl
     _append_decision_ledger_entry = _append_decision_ledger_entry_impl
 
     _get_decision_by_idempotency = _get_decision_by_idempotency_impl
@@ -376,3 +381,4 @@ class EnforcementService(EnforcementServiceApprovalOps, EnforcementServicePrivat
         return _gate_lock_timeout_seconds()
 
     _acquire_gate_evaluation_lock = _acquire_gate_evaluation_lock_impl
+    _acquire_gate_reservation_lock = _acquire_gate_reservation_lock_impl
@@ -15,6 +15,7 @@ from app.models.enforcement import (
     EnforcementSource,
 )
 from app.modules.enforcement.domain.service_utils import _as_utc, _quantize
+from app.shared.core.spooled_export import SpooledCsvArtifact
 
 
 @dataclass(frozen=True)
@@ -98,10 +99,22 @@ class EnforcementExportBundle:
     policy_lineage: list[dict[str, Any]]
     computed_context_lineage_sha256: str
     computed_context_lineage: list[dict[str, Any]]
-    decisions_csv: str
-    approvals_csv: str
+    decisions_artifact: SpooledCsvArtifact
+    approvals_artifact: SpooledCsvArtifact
     parity_ok: bool
 
+    @property
+    def decisions_csv(self) -> str:
+        return self.decisions_artifact.read_text()
+
+    @property
+    def approvals_csv(self) -> str:
+        return self.approvals_artifact.read_text()
+
+    def close(self) -> None:
+        self.decisions_artifact.close()
+        self.approvals_artifact.close()
+
 
 @dataclass(frozen=True)
 class EnforcementSignedExportManifest:
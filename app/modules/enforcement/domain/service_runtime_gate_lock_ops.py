@@ -1,11 +1,35 @@
+"""
+Serialization of enforcement gate evaluations that share headroom.
+
+On PostgreSQL a gate for a project takes the tenant's transaction-scoped
+advisory lock in shared mode plus an exclusive lock on its project scope, so
+gates of different projects (CI fan-out) evaluate in parallel. Callers that
+name no scope take the tenant lock exclusively. The plan depends only on the
+scope, never on a read done before any lock is held.
+
+Allocation headroom and the plan/enterprise ceilings are net of the
+tenant-wide total of active reservations. Every gate that may reserve takes
+the tenant's reservation lock right before it reads that total, and keeps it
+until its decision commits, so the read-check-insert of the shared total is
+atomic while the expensive context and cost lookups stay outside it. Credit
+grants need no extra lock: reservations lock the grant rows themselves and
+fail with 409 when another gate used the headroom first.
+
+Other backends keep the original no-op `UPDATE` on the tenant's policy row,
+which already serializes the whole evaluation.
+"""
+
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import time
-from typing import Any, cast
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, cast
+from uuid import UUID
 
 from fastapi import HTTPException
-from sqlalchemy import update
+from sqlalchemy import func, select, update
 from sqlalchemy.engine import CursorResult
 from sqlalchemy.exc import SQLAlchemyError
 
@@ -15,45 +39,99 @@ from app.shared.core.ops_metrics import (
     ENFORCEMENT_GATE_LOCK_WAIT_SECONDS,
 )
 
+GATE_LOCK_NAMESPACE = "enforcement_gate"
+RESERVATION_LOCK_PART = "reservations"
 
-async def acquire_gate_evaluation_lock(
+
+@dataclass(frozen=True)
+class GateLockPlan:
+    """Advisory lock keys for one gate; no scope key means tenant-exclusive."""
+
+    tenant_lock_key: int
+    scope_lock_key: int | None = None
+    project_scope: str | None = None
+
+    @property
+    def tenant_exclusive(self) -> bool:
+        return self.scope_lock_key is None
+
+
+def advisory_lock_key(*parts: str) -> int:
+    """Stable signed 64-bit advisory lock key for the given name parts."""
+    name = ":".join((GATE_LOCK_NAMESPACE, *parts))
+    digest = hashlib.blake2b(name.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big", signed=True)
+
+
+def reservation_lock_key(tenant_id: UUID) -> int:
+    """Lock key guarding the tenant-wide reservation total."""
+    # The fixed leading part keeps it apart from (tenant, project) keys.
+    return advisory_lock_key(RESERVATION_LOCK_PART, str(tenant_id))
+
+
+def _uses_advisory_locks(db: Any) -> bool:
+    bind = getattr(db, "bind", None)
+    name = getattr(getattr(bind, "dialect", None), "name", None)
+    return isinstance(name, str) and name.lower() == "postgresql"
+
+
+def build_gate_lock_plan(*, tenant_id: UUID, scope_key: str | None) -> GateLockPlan:
+    tenant_lock_key = advisory_lock_key(str(tenant_id))
+    if scope_key is None:
+        return GateLockPlan(tenant_lock_key=tenant_lock_key)
+    project_scope = str(scope_key).strip().lower() or "default"
+    return GateLockPlan(
+        tenant_lock_key=tenant_lock_key,
+        scope_lock_key=advisory_lock_key(str(tenant_id), project_scope),
+        project_scope=project_scope,
+    )
+
+
+async def acquire_gate_advisory_locks(db: Any, plan: GateLockPlan) -> None:
+    """Take the plan's locks, always tenant before scope, until transaction end."""
+    if plan.scope_lock_key is None:
+        await db.execute(select(func.pg_advisory_xact_lock(plan.tenant_lock_key)))
+        return
+    await db.execute(select(func.pg_advisory_xact_lock_shared(plan.tenant_lock_key)))
+    await db.execute(select(func.pg_advisory_xact_lock(plan.scope_lock_key)))
+
+
+def _gate_lock_metrics() -> tuple[Any, Any]:
+    from app.modules.enforcement.domain import service as enforcement_service_module
+
+    return (
+        getattr(
+            enforcement_service_module,
+            "ENFORCEMENT_GATE_LOCK_EVENTS_TOTAL",
+            ENFORCEMENT_GATE_LOCK_EVENTS_TOTAL,
+        ),
+        getattr(
+            enforcement_service_module,
+            "ENFORCEMENT_GATE_LOCK_WAIT_SECONDS",
+            ENFORCEMENT_GATE_LOCK_WAIT_SECONDS,
+        ),
+    )
+
+
+async def _await_gate_lock(
     service: Any,
     *,
-    policy: EnforcementPolicy,
     source: EnforcementSource,
-) -> None:
+    acquire: Callable[[], Awaitable[Any]],
+) -> tuple[Any, float]:
+    """Run `acquire` under the gate lock timeout and record the lock metrics."""
     from app.modules.enforcement.domain import service as enforcement_service_module
 
     service_asyncio = getattr(enforcement_service_module, "asyncio", asyncio)
     service_time = getattr(enforcement_service_module, "time", time)
     wait_for_fn = getattr(service_asyncio, "wait_for", asyncio.wait_for)
     perf_counter_fn = getattr(service_time, "perf_counter", time.perf_counter)
-    lock_events_total = getattr(
-        enforcement_service_module,
-        "ENFORCEMENT_GATE_LOCK_EVENTS_TOTAL",
-        ENFORCEMENT_GATE_LOCK_EVENTS_TOTAL,
-    )
-    lock_wait_seconds = getattr(
-        enforcement_service_module,
-        "ENFORCEMENT_GATE_LOCK_WAIT_SECONDS",
-        ENFORCEMENT_GATE_LOCK_WAIT_SECONDS,
-    )
+    lock_events_total, lock_wait_seconds = _gate_lock_metrics()
 
     lock_timeout_seconds = service._gate_lock_timeout_seconds()
     started_at = perf_counter_fn()
     try:
-        result = cast(
-            CursorResult[Any],
-            await wait_for_fn(
-                service.db.execute(
-                    update(EnforcementPolicy)
-                    .where(EnforcementPolicy.id == policy.id)
-                    .where(EnforcementPolicy.tenant_id == policy.tenant_id)
-                    .values(policy_version=EnforcementPolicy.policy_version)
-                ),
-                timeout=lock_timeout_seconds,
-            ),
-        )
+        result = await wait_for_fn(acquire(), timeout=lock_timeout_seconds)
     except TimeoutError as exc:
         wait_seconds = max(0.0, perf_counter_fn() - started_at)
         lock_wait_seconds.labels(
@@ -104,7 +182,38 @@ async def acquire_gate_evaluation_lock(
             source=source.value,
             event="contended",
         ).inc()
+    return result, wait_seconds
+
+
+async def acquire_gate_evaluation_lock(
+    service: Any,
+    *,
+    policy: EnforcementPolicy,
+    source: EnforcementSource,
+    scope_key: str | None = None,
+) -> None:
+    if _uses_advisory_locks(service.db):
+        plan = build_gate_lock_plan(tenant_id=policy.tenant_id, scope_key=scope_key)
+        await _await_gate_lock(
+            service,
+            source=source,
+            acquire=lambda: acquire_gate_advisory_locks(service.db, plan),
+        )
+        return
+
+    raw_result, wait_seconds = await _await_gate_lock(
+        service,
+        source=source,
+        acquire=lambda: service.db.execute(
+            update(EnforcementPolicy)
+            .where(EnforcementPolicy.id == policy.id)
+            .where(EnforcementPolicy.tenant_id == policy.tenant_id)
+            .values(policy_version=EnforcementPolicy.policy_version)
+        ),
+    )
+    result = cast(CursorResult[Any], raw_result)
     if result.rowcount == 0:
+        lock_events_total, _lock_wait_seconds = _gate_lock_metrics()
         lock_events_total.labels(
             source=source.value,
             event="not_acquired",
@@ -117,3 +226,27 @@ async def acquire_gate_evaluation_lock(
                 "lock_wait_seconds": f"{wait_seconds:.3f}",
             },
         )
+
+
+async def acquire_gate_reservation_lock(
+    service: Any,
+    *,
+    tenant_id: UUID,
+    source: EnforcementSource,
+) -> None:
+    """
+    Serialize reads of the tenant's reservation total with the inserts.
+
+    Held until the decision commits. A no-op off PostgreSQL, where the policy
+    row lock already covers the whole evaluation.
+    """
+    if not _uses_advisory_locks(service.db):
+        return
+    lock_key = reservation_lock_key(tenant_id)
+    await _await_gate_lock(
+        service,
+        source=source,
+        acquire=lambda: service.db.execute(
+            select(func.pg_advisory_xact_lock(lock_key))
+        ),
+    )
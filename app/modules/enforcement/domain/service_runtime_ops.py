@@ -24,12 +24,17 @@ from app.modules.enforcement.domain.export_bundle_ops import (
     render_approvals_csv as _render_approvals_csv_impl,
     render_decisions_csv as _render_decisions_csv_impl,
 )
+from app.modules.enforcement.domain.export_bundle_csv import (
+    approval_csv_row as _approval_csv_row_impl,
+    decision_csv_row as _decision_csv_row_impl,
+)
 from app.modules.enforcement.domain.reconciliation_ops import (
     build_reconciliation_exception_payloads as _build_reconciliation_exception_payloads_impl,
     build_reservation_reconciliation_replay_payload as _build_reservation_reconciliation_replay_payload_impl,
 )
 from app.modules.enforcement.domain.service_runtime_gate_lock_ops import (
     acquire_gate_evaluation_lock,
+    acquire_gate_reservation_lock,
 )
 from app.modules.enforcement.domain.service_runtime_ledger_ops import (
     append_decision_ledger_entry,
@@ -81,8 +86,11 @@ __all__ = [
     "build_signed_export_manifest",
     "render_decisions_csv",
     "render_approvals_csv",
+    "decision_csv_row",
+    "approval_csv_row",
     "append_decision_ledger_entry",
     "acquire_gate_evaluation_lock",
+    "acquire_gate_reservation_lock",
 ]
 
 
@@ -347,8 +355,8 @@ async def build_export_bundle(
         normalize_policy_document_sha256_fn=_normalize_policy_document_sha256,
         computed_context_snapshot_fn=_computed_context_snapshot,
         json_default_fn=_json_default,
-        render_decisions_csv_fn=service._render_decisions_csv,
-        render_approvals_csv_fn=service._render_approvals_csv,
+        decision_csv_row_fn=service._decision_csv_row,
+        approval_csv_row_fn=service._approval_csv_row,
         export_events_counter=ENFORCEMENT_EXPORT_EVENTS_TOTAL,
         utcnow_fn=_utcnow,
     )
@@ -446,3 +454,30 @@ def render_approvals_csv(
         sanitize_csv_cell_fn=_sanitize_csv_cell,
         iso_or_empty_fn=_iso_or_empty,
     )
+
+
+def decision_csv_row(
+    _service: Any,
+    decision: EnforcementDecision,
+) -> list[str]:
+    return _decision_csv_row_impl(
+        decision,
+        computed_context_snapshot_fn=_computed_context_snapshot,
+        sanitize_csv_cell_fn=_sanitize_csv_cell,
+        normalize_policy_document_schema_version_fn=_normalize_policy_document_schema_version,
+        normalize_policy_document_sha256_fn=_normalize_policy_document_sha256,
+        to_decimal_fn=_to_decimal,
+        iso_or_empty_fn=_iso_or_empty,
+        json_default_fn=_json_default,
+    )
+
+
+def approval_csv_row(
+    _service: Any,
+    approval: EnforcementApprovalRequest,
+) -> list[str]:
+    return _approval_csv_row_impl(
+        approval,
+        sanitize_csv_cell_fn=_sanitize_csv_cell,
+        iso_or_empty_fn=_iso_or_empty,
+    )
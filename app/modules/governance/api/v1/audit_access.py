@@ -1,9 +1,9 @@
 from datetime import datetime
-from typing import Annotated, Any, List, Literal, Optional
+from typing import Annotated, Any, AsyncIterator, List, Literal, Optional
 from uuid import UUID
 
 import structlog
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy import asc, desc, select
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -11,6 +11,16 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.modules.governance.api.v1.audit_common import _rowcount, _sanitize_csv_cell
 from app.modules.governance.api.v1.audit_schemas import AuditLogResponse
 from app.modules.governance.domain.security.audit_log import AuditLog
+from app.modules.governance.domain.security.audit_log_pagination import (
+    AUDIT_LOG_EXPORT_PAGE_SIZE,
+    InvalidAuditLogCursorError,
+    apply_audit_log_keyset,
+    decode_audit_log_cursor,
+    fetch_audit_log_export_page,
+    iter_audit_log_export_pages,
+    next_audit_log_cursor,
+    render_audit_log_csv,
+)
 from app.shared.core.auth import CurrentUser, requires_role
 from app.shared.core.dependencies import requires_feature
 from app.shared.core.pricing import FeatureFlag
@@ -35,6 +45,8 @@ async def get_audit_logs(
         Depends(requires_feature(FeatureFlag.AUDIT_LOGS, required_role="admin")),
     ],
     db: AsyncSession = Depends(get_db),
+    *,
+    response: Response,
     limit: int = Query(50, ge=1, le=100),
     offset: int = Query(0, ge=0),
     event_type: Optional[str] = Query(None, description="Filter by event type"),
@@ -42,11 +54,23 @@ async def get_audit_logs(
         "event_timestamp"
     ),
     order: Literal["asc", "desc"] = Query("desc"),
+    cursor: Annotated[
+        Optional[str],
+        Query(
+            max_length=512,
+            description=(
+                "Opaque keyset cursor from the X-Next-Cursor header of the "
+                "previous page. Replaces offset for event_timestamp ordering."
+            ),
+        ),
+    ] = None,
 ) -> list[AuditLogResponse]:
     """
     Get paginated audit logs for tenant.
 
-    Admin-only. Sensitive details are masked by default.
+    Admin-only. Sensitive details are masked by default. When ordered by
+    event_timestamp, the X-Next-Cursor response header carries a keyset cursor
+    for the next page; passing it back avoids deep OFFSET scans.
     """
     try:
         if sort_by == "actor_email":
@@ -54,23 +78,41 @@ async def get_audit_logs(
                 status_code=400,
                 detail="Sorting by actor_email is not supported for encrypted audit data.",
             )
+        if cursor is not None and (sort_by != "event_timestamp" or offset):
+            raise HTTPException(
+                status_code=400,
+                detail="cursor requires sort_by=event_timestamp and cannot be combined with offset.",
+            )
 
-        sort_column = getattr(AuditLog, sort_by)
-        order_func = desc if order == "desc" else asc
-
-        query = (
-            select(AuditLog)
-            .where(AuditLog.tenant_id == user.tenant_id)
-            .order_by(order_func(sort_column))
-        )
-
+        query = select(AuditLog).where(AuditLog.tenant_id == user.tenant_id)
         if event_type:
             query = query.where(AuditLog.event_type == event_type)
 
-        query = query.offset(offset).limit(limit)
+        if sort_by == "event_timestamp":
+            after = (
+                decode_audit_log_cursor(cursor, order=order)
+                if cursor is not None
+                else None
+            )
+            query = apply_audit_log_keyset(query, order=order, after=after)
+        else:
+            order_func = desc if order == "desc" else asc
+            query = query.order_by(
+                order_func(getattr(AuditLog, sort_by)), order_func(AuditLog.id)
+            )
+
+        if cursor is None:
+            query = query.offset(offset)
+        # One extra row tells us whether a next page exists.
+        query = query.limit(limit + 1)
 
         result = await db.execute(query)
-        logs = result.scalars().all()
+        logs = list(result.scalars().all())
+
+        if sort_by == "event_timestamp" and response is not None:
+            next_cursor = next_audit_log_cursor(logs, limit=limit, order=order)
+            if next_cursor:
+                response.headers["X-Next-Cursor"] = next_cursor
 
         return [
             AuditLogResponse(
@@ -83,11 +125,13 @@ async def get_audit_logs(
                 success=log.success,
                 correlation_id=log.correlation_id,
             )
-            for log in logs
+            for log in logs[:limit]
         ]
 
     except HTTPException:
         raise
+    except InvalidAuditLogCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
     except AUDIT_ACCESS_RECOVERABLE_ERRORS as e:
         logger.error("audit_logs_fetch_failed", error=str(e))
         raise HTTPException(500, "Failed to fetch audit logs") from e
@@ -167,78 +211,63 @@ async def export_audit_logs(
     """
     Export audit logs as CSV for the tenant.
     GDPR/SOC2: Provides audit trail export for compliance.
+
+    Rows are read in keyset pages and streamed as they are formatted, so the
+    export is not capped and memory stays bounded by the page size.
     """
     from fastapi.responses import StreamingResponse
     import csv
-    import io
+
+    base_query = select(AuditLog).where(AuditLog.tenant_id == user.tenant_id)
+    if start_date:
+        base_query = base_query.where(AuditLog.event_timestamp >= start_date)
+    if end_date:
+        base_query = base_query.where(AuditLog.event_timestamp <= end_date)
+    if event_type:
+        base_query = base_query.where(AuditLog.event_type == event_type)
 
     try:
-        query = (
-            select(AuditLog)
-            .where(AuditLog.tenant_id == user.tenant_id)
-            .order_by(desc(AuditLog.event_timestamp))
+        # The first page is read eagerly so query failures still surface as 500s.
+        first_page = await fetch_audit_log_export_page(
+            db, base_query, page_size=AUDIT_LOG_EXPORT_PAGE_SIZE
         )
-
-        if start_date:
-            query = query.where(AuditLog.event_timestamp >= start_date)
-        if end_date:
-            query = query.where(AuditLog.event_timestamp <= end_date)
-        if event_type:
-            query = query.where(AuditLog.event_type == event_type)
-
-        # Limit export to 10,000 records for performance
-        query = query.limit(10000)
-
-        result = await db.execute(query)
-        logs = result.scalars().all()
-
-        # Create CSV in memory
-        output = io.StringIO()
-        writer = csv.writer(output)
-        writer.writerow(
-            [
-                "id",
-                "event_type",
-                "event_timestamp",
-                "actor_email",
-                "resource_type",
-                "resource_id",
-                "success",
-                "correlation_id",
-            ]
+        first_chunk = render_audit_log_csv(
+            first_page, _sanitize_csv_cell, include_header=True
         )
+    except AUDIT_ACCESS_RECOVERABLE_ERRORS + (csv.Error,) as e:
+        logger.error("audit_export_failed", error=str(e))
+        raise HTTPException(500, "Failed to export audit logs") from e
 
-        for log in logs:
-            writer.writerow(
-                [
-                    str(log.id),
-                    _sanitize_csv_cell(log.event_type),
-                    _sanitize_csv_cell(log.event_timestamp.isoformat()),
-                    _sanitize_csv_cell(log.actor_email or ""),
-                    _sanitize_csv_cell(log.resource_type or ""),
-                    _sanitize_csv_cell(str(log.resource_id) if log.resource_id else ""),
-                    _sanitize_csv_cell(str(log.success)),
-                    _sanitize_csv_cell(log.correlation_id or ""),
-                ]
+    async def _stream() -> AsyncIterator[str]:
+        yield first_chunk
+        record_count = len(first_page)
+        try:
+            async for page in iter_audit_log_export_pages(
+                db, base_query, first_page, page_size=AUDIT_LOG_EXPORT_PAGE_SIZE
+            ):
+                record_count += len(page)
+                yield render_audit_log_csv(page, _sanitize_csv_cell)
+        except AUDIT_ACCESS_RECOVERABLE_ERRORS + (csv.Error,) as e:
+            logger.error(
+                "audit_export_stream_failed",
+                error=str(e),
+                tenant_id=str(user.tenant_id),
+                record_count=record_count,
             )
-
-        output.seek(0)
-
+            raise
         logger.info(
-            "audit_logs_exported", tenant_id=str(user.tenant_id), record_count=len(logs)
-        )
-
-        return StreamingResponse(
-            iter([output.getvalue()]),
-            media_type="text/csv",
-            headers={
-                "Content-Disposition": f"attachment; filename=audit_logs_{user.tenant_id}.csv"
-            },
+            "audit_logs_exported",
+            tenant_id=str(user.tenant_id),
+            record_count=record_count,
         )
 
-    except AUDIT_ACCESS_RECOVERABLE_ERRORS + (csv.Error,) as e:
-        logger.error("audit_export_failed", error=str(e))
-        raise HTTPException(500, "Failed to export audit logs") from e
+    return StreamingResponse(
+        _stream(),
+        media_type="text/csv",
+        headers={
+            "Content-Disposition": f"attachment; filename=audit_logs_{user.tenant_id}.csv"
+        },
+    )
 
 
 @router.delete("/data-erasure-request")
@@ -262,7 +291,7 @@ async def request_data_erasure(
     try:
         from app.models.tenant import User
         from app.models.tenant import Tenant
-        from app.models.cloud import CostRecord, CloudAccount
+        from app.models.cloud import CostRecord, CloudAccount, DailyCostAggregate
         from app.models.remediation import RemediationRequest
         from app.models.anomaly_marker import AnomalyMarker
         from app.models.aws_connection import AWSConnection
@@ -324,6 +353,7 @@ async def request_data_erasure(
             delete(CostRecord).where(CostRecord.tenant_id == tenant_id)
         )
         deleted_counts["cost_records"] = _rowcount(result)
+        await db.execute(delete(DailyCostAggregate).filter_by(tenant_id=tenant_id))
 
         # 4. Delete anomaly markers
         result = await db.execute(
@@ -2,7 +2,7 @@ from datetime import date, datetime
 from typing import Annotated, Any, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query
-from fastapi.responses import Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.modules.governance.api.v1.audit_common import _sanitize_csv_cell
@@ -169,8 +169,8 @@ async def export_compliance_pack(
     except CompliancePackValidationError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
 
-    return Response(
-        content=bundle.body,
+    return StreamingResponse(
+        bundle.iter_chunks(),
         media_type=bundle.media_type,
         headers={"Content-Disposition": f'attachment; filename="{bundle.filename}"'},
     )
@@ -2,7 +2,7 @@
 Shared Prometheus Metrics for Scheduler Service
 """
 
-from prometheus_client import Counter, Histogram
+from prometheus_client import Counter, Gauge, Histogram
 
 # Total scheduled job runs
 SCHEDULER_JOB_RUNS = Counter(
@@ -32,3 +32,24 @@ BACKGROUND_JOBS_ENQUEUED_SCHEDULER = Counter(
     "Background jobs enqueued by scheduler",
     ["job_type", "cohort"],
 )
+
+# Cohort job spreading: planned delay after the cohort tick, busiest bucket,
+# and jobs that did not fit any bucket's capacity budget.
+SCHEDULER_COHORT_SCHEDULE_OFFSET = Histogram(
+    "valdrics_scheduler_cohort_schedule_offset_seconds",
+    "Delay between the cohort run and a job's scheduled_for",
+    ["cohort"],
+    buckets=[0, 60, 300, 900, 1800, 3600, 7200, 10800, 21600, 43200],
+)
+
+SCHEDULER_COHORT_PEAK_BUCKET_JOBS = Gauge(
+    "valdrics_scheduler_cohort_peak_bucket_jobs",
+    "Most jobs scheduled into one time bucket by the last cohort run",
+    ["cohort"],
+)
+
+SCHEDULER_COHORT_CAPACITY_OVERFLOW = Counter(
+    "valdrics_scheduler_cohort_capacity_overflow_total",
+    "Cohort jobs placed beyond the per-bucket capacity budget",
+    ["cohort"],
+)
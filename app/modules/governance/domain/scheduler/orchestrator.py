@@ -303,7 +303,8 @@ class SchedulerOrchestrator:
 
     async def detect_stuck_jobs(self) -> None:
         """
-        Series-A Hardening (Phase 2): Detects jobs stuck in PENDING status for > 1 hour.
+        Series-A Hardening (Phase 2): Detects jobs still PENDING > 1 hour past their
+        scheduled time.
         Emits critical alerts and moves them to FAILED to prevent queue poisoning.
         """
         async with self.session_maker() as db:
@@ -315,7 +316,7 @@ class SchedulerOrchestrator:
             # Find stuck jobs
             stmt = sa.select(BackgroundJob).where(
                 BackgroundJob.status == JobStatus.PENDING,
-                BackgroundJob.created_at < cutoff,
+                BackgroundJob.scheduled_for < cutoff,
                 sa.not_(BackgroundJob.is_deleted),
             )
             result = await db.execute(stmt)
@@ -25,6 +25,13 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 import structlog
 
+from app.modules.governance.domain.security.audit_log_writer import (
+    AuditLogBatchWriteError,
+    AuditLogBatcher,
+    enqueue_audit_entry,
+    flush_audit_entries,
+    supports_buffered_audit,
+)
 from app.shared.db.base import Base, get_partition_args
 from sqlalchemy_utils import StringEncryptedType
 from sqlalchemy_utils.types.encrypted.encrypted_type import AesEngine
@@ -222,8 +229,17 @@ class AuditLog(Base):
 
     # Composite indexes for common queries
     __table_args__ = (
-        Index("ix_audit_tenant_time", "tenant_id", "event_timestamp"),
         Index("ix_audit_type_time", "event_type", "event_timestamp"),
+        # Tenant time-range scans and keyset pagination: (event_timestamp, id)
+        # page boundaries per tenant.
+        Index("ix_audit_tenant_time_id", "tenant_id", "event_timestamp", "id"),
+        Index(
+            "ix_audit_tenant_type_time_id",
+            "tenant_id",
+            "event_type",
+            "event_timestamp",
+            "id",
+        ),
         get_partition_args("RANGE (event_timestamp)"),
     )
 
@@ -241,6 +257,12 @@ class AuditLogger:
             resource_id="vol-123",
             details={"action": "delete", "savings": 50.00}
         )
+
+    On an `AsyncSession` events are buffered and written in one multi-row
+    insert when the unit of work commits (or before the session's next
+    statement); `await audit.flush()` writes them immediately. Pass a running
+    `AuditLogBatcher` to hand events to the background writer instead; once
+    that writer has given up, events go back through the session.
     """
 
     # Fields to mask in details
@@ -260,8 +282,11 @@ class AuditLogger:
         db: AsyncSession,
         tenant_id: Union[str, uuid.UUID],
         correlation_id: str | None = None,
+        *,
+        batcher: AuditLogBatcher | None = None,
     ) -> None:
         self.db = db
+        self.batcher = batcher
         # Ensure tenant_id is a UUID object for SQLAlchemy
         self.tenant_id = (
             uuid.UUID(str(tenant_id))
@@ -300,6 +325,8 @@ class AuditLogger:
             parsed_actor_id = None
 
         entry = AuditLog(
+            id=uuid.uuid4(),
+            event_timestamp=datetime.now(timezone.utc).replace(tzinfo=None),
             tenant_id=self.tenant_id,
             event_type=event_type.value,
             actor_id=parsed_actor_id,
@@ -315,11 +342,8 @@ class AuditLogger:
             error_message=error_message,
         )
 
-        add_result = cast(Any, self.db).add(entry)
-        # AsyncSession.add is sync, but AsyncMock-based tests may return awaitables.
-        if inspect.isawaitable(add_result):
-            await add_result
-        await self.db.flush()
+        if not await self._submit_to_batcher(entry):
+            await self._write_inline(entry)
 
         # Also log to structured logger for real-time monitoring
         logger.info(
@@ -334,6 +358,32 @@ class AuditLogger:
 
         return entry
 
+    async def _submit_to_batcher(self, entry: AuditLog) -> bool:
+        if self.batcher is None:
+            return False
+        try:
+            await self.batcher.submit(entry)
+        except AuditLogBatchWriteError as exc:
+            logger.warning("audit_batcher_failed_writing_inline", error=str(exc))
+            return False
+        return True
+
+    async def _write_inline(self, entry: AuditLog) -> None:
+        if supports_buffered_audit(self.db):
+            enqueue_audit_entry(self.db, entry)
+            return
+        add_result = cast(Any, self.db).add(entry)
+        # AsyncSession.add is sync, but AsyncMock-based tests may return awaitables.
+        if inspect.isawaitable(add_result):
+            await add_result
+        await self.db.flush()
+
+    async def flush(self) -> int:
+        """Write this session's buffered audit entries now."""
+        if supports_buffered_audit(self.db):
+            return await flush_audit_entries(self.db)
+        return 0
+
     def _mask_sensitive(self, data: Any) -> Any:
         """
         Recursively mask sensitive fields in dicts and lists.
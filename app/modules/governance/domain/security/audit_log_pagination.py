@@ -0,0 +1,181 @@
+"""
+Keyset (cursor) pagination for the range-partitioned `audit_logs` table.
+
+Pages are addressed by the `(event_timestamp, id)` of the last row returned,
+encoded as an opaque URL-safe token. Each page is a bounded index range scan
+instead of an OFFSET scan that reads and discards every earlier row, and the
+plain `event_timestamp` bound in the predicate lets Postgres prune partitions
+that lie entirely on the far side of the cursor.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import csv
+import io
+import json
+from datetime import datetime
+from typing import Any, AsyncIterator, Callable, Literal, Sequence
+from uuid import UUID
+
+from sqlalchemy import Select, and_, asc, desc, or_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.modules.governance.domain.security.audit_log import AuditLog
+from app.modules.governance.domain.security.compliance_pack_audit_stream import (
+    AUDIT_LOG_CSV_COLUMNS,
+    audit_log_csv_row,
+)
+
+AUDIT_LOG_CURSOR_VERSION = 1
+AUDIT_LOG_EXPORT_PAGE_SIZE = 1000
+
+SortOrder = Literal["asc", "desc"]
+
+
+class InvalidAuditLogCursorError(ValueError):
+    """Raised when a pagination cursor is malformed or was issued for another order."""
+
+
+def encode_audit_log_cursor(
+    event_timestamp: datetime, log_id: UUID, *, order: SortOrder
+) -> str:
+    payload = {
+        "v": AUDIT_LOG_CURSOR_VERSION,
+        "ts": event_timestamp.isoformat(),
+        "id": str(log_id),
+        "o": order,
+    }
+    raw = json.dumps(payload, separators=(",", ":"), sort_keys=True).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_audit_log_cursor(token: str, *, order: SortOrder) -> tuple[datetime, UUID]:
+    """Return the `(event_timestamp, id)` position encoded in `token`."""
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        if not isinstance(payload, dict):
+            raise InvalidAuditLogCursorError("Invalid audit log cursor.")
+        if payload.get("v") != AUDIT_LOG_CURSOR_VERSION:
+            raise InvalidAuditLogCursorError("Unsupported audit log cursor version.")
+        event_timestamp = datetime.fromisoformat(str(payload["ts"]))
+        log_id = UUID(str(payload["id"]))
+    except InvalidAuditLogCursorError:
+        raise
+    except (
+        KeyError,
+        TypeError,
+        ValueError,
+        UnicodeError,
+        binascii.Error,
+    ) as exc:
+        raise InvalidAuditLogCursorError("Invalid audit log cursor.") from exc
+    if payload.get("o") != order:
+        raise InvalidAuditLogCursorError(
+            "Audit log cursor was issued for a different sort order."
+        )
+    return event_timestamp, log_id
+
+
+def apply_audit_log_keyset(
+    query: Select[Any],
+    *,
+    order: SortOrder,
+    after: tuple[datetime, UUID] | None = None,
+) -> Select[Any]:
+    """Order `query` by `(event_timestamp, id)` and start it after `after`."""
+    if order == "desc":
+        query = query.order_by(desc(AuditLog.event_timestamp), desc(AuditLog.id))
+    else:
+        query = query.order_by(asc(AuditLog.event_timestamp), asc(AuditLog.id))
+    if after is None:
+        return query
+
+    cursor_ts, cursor_id = after
+    if order == "desc":
+        # The standalone range bound is what the planner uses to prune partitions.
+        return query.where(
+            AuditLog.event_timestamp <= cursor_ts,
+            or_(
+                AuditLog.event_timestamp < cursor_ts,
+                and_(AuditLog.event_timestamp == cursor_ts, AuditLog.id < cursor_id),
+            ),
+        )
+    return query.where(
+        AuditLog.event_timestamp >= cursor_ts,
+        or_(
+            AuditLog.event_timestamp > cursor_ts,
+            and_(AuditLog.event_timestamp == cursor_ts, AuditLog.id > cursor_id),
+        ),
+    )
+
+
+def next_audit_log_cursor(
+    rows: Sequence[Any], *, limit: int, order: SortOrder
+) -> str | None:
+    """Cursor for the page after `rows`, or None when `rows` is the last page."""
+    if len(rows) <= limit:
+        return None
+    last = rows[limit - 1]
+    return encode_audit_log_cursor(last.event_timestamp, last.id, order=order)
+
+
+async def fetch_audit_log_export_page(
+    db: AsyncSession,
+    query: Select[Any],
+    *,
+    after: tuple[datetime, UUID] | None = None,
+    page_size: int = AUDIT_LOG_EXPORT_PAGE_SIZE,
+) -> list[AuditLog]:
+    """Read one newest-first export page of `query` starting after `after`."""
+    page_query = apply_audit_log_keyset(query, order="desc", after=after)
+    result = await db.execute(page_query.limit(page_size))
+    return list(result.scalars().all())
+
+
+async def iter_audit_log_export_pages(
+    db: AsyncSession,
+    query: Select[Any],
+    first_page: list[AuditLog],
+    *,
+    page_size: int = AUDIT_LOG_EXPORT_PAGE_SIZE,
+) -> AsyncIterator[list[AuditLog]]:
+    """Yield the export pages that follow `first_page` until a short page."""
+    page = first_page
+    while len(page) >= page_size:
+        last = page[-1]
+        page = await fetch_audit_log_export_page(
+            db, query, after=(last.event_timestamp, last.id), page_size=page_size
+        )
+        yield page
+
+
+def render_audit_log_csv(
+    rows: Sequence[AuditLog],
+    sanitize_csv_cell: Callable[[Any], str],
+    *,
+    include_header: bool = False,
+) -> str:
+    output = io.StringIO()
+    writer = csv.writer(output)
+    if include_header:
+        writer.writerow(AUDIT_LOG_CSV_COLUMNS)
+    for log in rows:
+        writer.writerow(audit_log_csv_row(log, sanitize_csv_cell))
+    return output.getvalue()
+
+
+__all__ = [
+    "AUDIT_LOG_CURSOR_VERSION",
+    "AUDIT_LOG_EXPORT_PAGE_SIZE",
+    "InvalidAuditLogCursorError",
+    "apply_audit_log_keyset",
+    "decode_audit_log_cursor",
+    "encode_audit_log_cursor",
+    "fetch_audit_log_export_page",
+    "iter_audit_log_export_pages",
+    "next_audit_log_cursor",
+    "render_audit_log_csv",
+]
@@ -0,0 +1,328 @@
+"""
+Buffered audit log writes.
+
+`AuditLogger.log` on a real `AsyncSession` does not flush per event: entries
+are appended to a per-session buffer (`session.info`) and written as one
+multi-row `INSERT` when the unit of work ends. The buffer is drained
+
+- before the session commits (after flushing other pending objects, so
+  foreign keys to rows created in the same unit of work resolve),
+- before any other statement the session executes, so reads inside the
+  transaction still see every event logged so far,
+
+and discarded on rollback, exactly like the per-event flush it replaces.
+Entries keep their emission order and carry the id and timestamp assigned
+when they were logged.
+
+`AuditLogBatcher` is the optional bounded background writer for high-volume
+async contexts: events are queued (callers wait when the queue is full),
+and a single consumer writes them in FIFO batches through its own sessions,
+one tenant-scoped insert per tenant. A failed insert is retried with
+exponential backoff. When the retries run out, or the consumer dies of any
+other error, the batcher stops writing: the unwritten events are kept in
+`failed_entries`, and `submit` and `stop` raise `AuditLogBatchWriteError` so
+callers fall back to the synchronous insert. The batcher is opt-in: its
+inserts commit on their own sessions, so events are not rolled back with the
+caller's unit of work, which request paths rely on.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+import structlog
+from sqlalchemy import event, insert
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import ORMExecuteState, Session
+
+logger = structlog.get_logger()
+
+PENDING_AUDIT_ENTRIES_KEY = "audit_log_pending_entries"
+_LISTENERS_INSTALLED_KEY = "audit_log_writer_installed"
+AUDIT_BATCH_WRITE_RECOVERABLE_EXCEPTIONS: tuple[type[Exception], ...] = (
+    SQLAlchemyError,
+    OSError,
+    RuntimeError,
+)
+
+
+class AuditLogBatchWriteError(RuntimeError):
+    """The background writer gave up; audit events must be written inline."""
+
+
+def audit_entry_values(entry: Any) -> dict[str, Any]:
+    """Column values of an audit entry for a bulk insert."""
+    return {
+        attr.key: getattr(entry, attr.key)
+        for attr in sa_inspect(type(entry)).column_attrs
+    }
+
+
+def _write_pending_entries(session: Session) -> int:
+    pending: list[Any] = session.info.pop(PENDING_AUDIT_ENTRIES_KEY, [])
+    if not pending:
+        return 0
+    session.execute(
+        insert(type(pending[0])),
+        [audit_entry_values(entry) for entry in pending],
+        execution_options={"autoflush": False},
+    )
+    return len(pending)
+
+
+def _before_commit(session: Session) -> None:
+    if session.info.get(PENDING_AUDIT_ENTRIES_KEY):
+        session.flush()
+        _write_pending_entries(session)
+
+
+def _before_execute(orm_execute_state: ORMExecuteState) -> None:
+    _write_pending_entries(orm_execute_state.session)
+
+
+def _discard_pending_entries(session: Session, *_args: Any) -> None:
+    session.info.pop(PENDING_AUDIT_ENTRIES_KEY, None)
+
+
+def _install_listeners(session: Session) -> None:
+    if session.info.get(_LISTENERS_INSTALLED_KEY):
+        return
+    event.listen(session, "before_commit", _before_commit)
+    event.listen(session, "do_orm_execute", _before_execute)
+    event.listen(session, "after_rollback", _discard_pending_entries)
+    session.info[_LISTENERS_INSTALLED_KEY] = True
+
+
+def supports_buffered_audit(db: Any) -> bool:
+    """True for real async sessions (mocks keep the add + flush path)."""
+    return isinstance(db, AsyncSession) and isinstance(
+        getattr(db, "sync_session", None), Session
+    )
+
+
+def enqueue_audit_entry(db: AsyncSession, entry: Any) -> None:
+    """Buffer an entry for the session's next multi-row audit insert."""
+    session = db.sync_session
+    _install_listeners(session)
+    session.info.setdefault(PENDING_AUDIT_ENTRIES_KEY, []).append(entry)
+
+
+def pending_audit_entries(db: AsyncSession) -> int:
+    return len(db.sync_session.info.get(PENDING_AUDIT_ENTRIES_KEY, ()))
+
+
+async def flush_audit_entries(db: AsyncSession) -> int:
+    """Write the session's buffered entries now; returns the number written."""
+    if not pending_audit_entries(db):
+        return 0
+    await db.flush()
+    return await db.run_sync(_write_pending_entries)
+
+
+class AuditLogBatcher:
+    """
+    Bounded background audit writer.
+
+    Usage:
+        batcher = AuditLogBatcher(async_session_maker)
+        batcher.start()
+        audit = AuditLogger(db, tenant_id, batcher=batcher)
+        ...
+        await batcher.stop()  # drains everything queued so far
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Any],
+        *,
+        max_pending: int = 10_000,
+        batch_size: int = 500,
+        flush_interval_seconds: float = 0.5,
+        max_write_attempts: int = 3,
+        retry_backoff_seconds: float = 0.5,
+        set_tenant_fn: Callable[[AsyncSession, Any], Awaitable[None]] | None = None,
+    ) -> None:
+        self._session_factory = session_factory
+        self._queue: asyncio.Queue[Any] = asyncio.Queue(maxsize=max(1, max_pending))
+        self._batch_size = max(1, batch_size)
+        self._flush_interval_seconds = max(0.0, flush_interval_seconds)
+        self._max_write_attempts = max(1, max_write_attempts)
+        self._retry_backoff_seconds = max(0.0, retry_backoff_seconds)
+        self._set_tenant_fn = set_tenant_fn
+        self._task: asyncio.Task[None] | None = None
+        self.written = 0
+        self.failure: BaseException | None = None
+        self.failed_entries: list[Any] = []
+        # Entries of the batch being written that have not been committed yet.
+        self._in_flight: list[Any] = []
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    @property
+    def pending(self) -> int:
+        return self._queue.qsize()
+
+    def start(self) -> None:
+        if not self.running:
+            self._task = asyncio.create_task(self._run())
+            self._task.add_done_callback(self._on_consumer_done)
+
+    def _raise_if_failed(self) -> None:
+        if self.failure is not None:
+            raise AuditLogBatchWriteError(
+                f"audit batch write failed: {self.failure}"
+            ) from self.failure
+
+    def _raise_if_stopped(self) -> None:
+        self._raise_if_failed()
+        if not self.running:
+            raise AuditLogBatchWriteError("AuditLogBatcher is not running")
+
+    async def submit(self, entry: Any) -> None:
+        """Queue an entry, waiting for room when the batcher is saturated."""
+        self._raise_if_stopped()
+        await self._queue.put(entry)
+        if not self.running:
+            # The consumer died while we waited for room; nobody will write it.
+            self._drain_queue()
+            self._raise_if_stopped()
+
+    async def stop(self) -> None:
+        """Write everything queued so far, then stop the consumer."""
+        task = self._task
+        if task is None:
+            return
+        joined = asyncio.ensure_future(self._queue.join())
+        try:
+            # A dead consumer never drains the queue, so do not wait on it alone.
+            await asyncio.wait({joined, task}, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            joined.cancel()
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        self._task = None
+        self._drain_queue()
+        self._raise_if_failed()
+
+    def _drain_queue(self) -> None:
+        while not self._queue.empty():
+            self.failed_entries.append(self._queue.get_nowait())
+            self._queue.task_done()
+
+    def _on_consumer_done(self, task: asyncio.Task[None]) -> None:
+        error = None if task.cancelled() else task.exception()
+        unwritten = self._in_flight
+        self._in_flight = []
+        self.failed_entries.extend(unwritten)
+        self._drain_queue()
+        if error is None and not unwritten:
+            return
+        if self.failure is None:
+            self.failure = error or AuditLogBatchWriteError(
+                "AuditLogBatcher was cancelled mid-batch"
+            )
+        logger.error(
+            "audit_batcher_consumer_died",
+            unwritten=len(self.failed_entries),
+            error=str(self.failure),
+        )
+
+    async def _next_batch(self) -> list[Any]:
+        batch = [await self._queue.get()]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self._flush_interval_seconds
+        while len(batch) < self._batch_size:
+            if not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+                continue
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+            except TimeoutError:
+                break
+        return batch
+
+    async def _run(self) -> None:
+        while True:
+            batch = await self._next_batch()
+            self._in_flight = batch
+            try:
+                if self.failure is None:
+                    await self._write_batch(batch)
+                else:
+                    # Entries queued before submitters saw the failure.
+                    self.failed_entries.extend(batch)
+                self._in_flight = []
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def _insert_tenant_entries(self, tenant_id: Any, entries: list[Any]) -> None:
+        async with self._session_factory() as session:
+            if self._set_tenant_fn is not None:
+                await self._set_tenant_fn(session, tenant_id)
+            await session.execute(
+                insert(type(entries[0])),
+                [audit_entry_values(entry) for entry in entries],
+            )
+            await session.commit()
+
+    async def _write_batch(self, batch: list[Any]) -> None:
+        by_tenant: dict[Any, list[Any]] = {}
+        for entry in batch:
+            by_tenant.setdefault(entry.tenant_id, []).append(entry)
+        groups = list(by_tenant.items())
+        for index, (tenant_id, entries) in enumerate(groups):
+            for attempt in range(1, self._max_write_attempts + 1):
+                try:
+                    await self._insert_tenant_entries(tenant_id, entries)
+                except AUDIT_BATCH_WRITE_RECOVERABLE_EXCEPTIONS as exc:
+                    if attempt < self._max_write_attempts:
+                        logger.warning(
+                            "audit_batch_write_retry",
+                            tenant_id=str(tenant_id),
+                            entries=len(entries),
+                            attempt=attempt,
+                            error=str(exc),
+                        )
+                        await asyncio.sleep(
+                            self._retry_backoff_seconds * 2 ** (attempt - 1)
+                        )
+                        continue
+                    self.failure = exc
+                    self.failed_entries.extend(self._in_flight)
+                    logger.error(
+                        "audit_batch_write_failed",
+                        tenant_id=str(tenant_id),
+                        entries=len(entries),
+                        attempts=attempt,
+                        unwritten=len(self.failed_entries),
+                        error=str(exc),
+                    )
+                    return
+                self.written += len(entries)
+                self._in_flight = [
+                    entry for _, rest in groups[index + 1 :] for entry in rest
+                ]
+                break
+
+
+__all__ = [
+    "AUDIT_BATCH_WRITE_RECOVERABLE_EXCEPTIONS",
+    "AuditLogBatchWriteError",
+    "AuditLogBatcher",
+    "PENDING_AUDIT_ENTRIES_KEY",
+    "audit_entry_values",
+    "enqueue_audit_entry",
+    "flush_audit_entries",
+    "pending_audit_entries",
+    "supports_buffered_audit",
+]
@@ -3,6 +3,7 @@ from typing import Any, Callable, Optional, cast
 from uuid import UUID
 
 import csv
+import hashlib
 import io
 import json
 import zipfile
@@ -22,121 +23,23 @@ def _append_unique(paths: list[str], path: str) -> None:
 def write_core_artifacts(
     *,
     zf: zipfile.ZipFile,
-    audit_csv: io.StringIO,
     json_payloads: dict[str, Any],
     doc_payloads: dict[str, Optional[str]],
-) -> None:
-    zf.writestr("audit_logs.csv", audit_csv.getvalue())
+    audit_csv: Optional[io.StringIO] = None,
+) -> dict[str, str]:
+    contents: dict[str, str] = {}
+    if audit_csv is not None:
+        contents["audit_logs.csv"] = audit_csv.getvalue()
     for path, payload in json_payloads.items():
-        zf.writestr(path, json.dumps(payload, indent=2, sort_keys=True))
-    for path, content in doc_payloads.items():
-        if content is not None:
-            zf.writestr(path, content)
+        contents[path] = json.dumps(payload, indent=2, sort_keys=True)
+    contents.update({p: c for p, c in doc_payloads.items() if c is not None})
+    digests: dict[str, str] = {}
+    for path, content in contents.items():
+        encoded = content.encode("utf-8")
+        zf.writestr(path, encoded)
+        digests[path] = hashlib.sha256(encoded).hexdigest()
+    return digests
 
-def build_manifest(
-    *,
-    exported_at: datetime,
-    run_id: str,
-    actor: CompliancePackActor,
-    app_environment: str,
-    app_version: str,
-    start_date: Optional[datetime],
-    end_date: Optional[datetime],
-    evidence_limit: int,
-    included_files: list[str],
-    focus_export_info: dict[str, Any],
-    savings_proof_info: dict[str, Any],
-    close_package_info: dict[str, Any],
-    leadership_kpi_evidence: list[dict[str, Any]],
-    quarterly_commercial_proof_evidence: list[dict[str, Any]],
-    identity_smoke_evidence: list[dict[str, Any]],
-    sso_federation_validation_evidence: list[dict[str, Any]],
-    performance_load_test_evidence: list[dict[str, Any]],
-    ingestion_persistence_benchmark_evidence: list[dict[str, Any]],
-    ingestion_soak_evidence: list[dict[str, Any]],
-    partitioning_evidence: list[dict[str, Any]],
-    job_slo_evidence: list[dict[str, Any]],
-    tenant_isolation_evidence: list[dict[str, Any]],
-    carbon_assurance_evidence: list[dict[str, Any]],
-    carbon_factor_sets: list[dict[str, Any]],
-    carbon_factor_update_logs: list[dict[str, Any]],
-) -> dict[str, Any]:
-    return {
-        "exported_at": exported_at.isoformat(),
-        "run_id": run_id,
-        "tenant_id": str(actor.tenant_id),
-        "actor_id": str(actor.id),
-        "actor_email": actor.email,
-        "environment": app_environment,
-        "app_version": app_version,
-        "window": {
-            "start_date": start_date.isoformat() if start_date else None,
-            "end_date": end_date.isoformat() if end_date else None,
-        },
-        "focus_export": focus_export_info,
-        "savings_proof": savings_proof_info,
-        "close_package": close_package_info,
-        "leadership_kpis": {
-            "count": len(leadership_kpi_evidence),
-            "limit": int(evidence_limit),
-        },
-        "quarterly_commercial_proof_reports": {
-            "count": len(quarterly_commercial_proof_evidence),
-            "limit": int(evidence_limit),
-        },
-        "identity_idp_smoke_tests": {
-            "count": len(identity_smoke_evidence),
-            "limit": int(evidence_limit),
-        },
-        "sso_federation_validation": {
-            "count": len(sso_federation_validation_evidence),
-            "limit": int(evidence_limit),
-        },
-        "performance_load_tests": {
-            "count": len(performance_load_test_evidence),
-            "limit": int(evidence_limit),
-        },
-        "ingestion_persistence_benchmarks": {
-            "count": len(ingestion_persistence_benchmark_evidence),
-            "limit": int(evidence_limit),
-        },
-        "ingestion_soak_runs": {
-            "count": len(ingestion_soak_evidence),
-            "limit": int(evidence_limit),
-        },
-        "partitioning_validation": {
-            "count": len(partitioning_evidence),
-            "limit": int(evidence_limit),
-        },
-        "job_slo_evidence": {
-            "count": len(job_slo_evidence),
-            "limit": int(evidence_limit),
-        },
-        "tenant_isolation_verifications": {
-            "count": len(tenant_isolation_evidence),
-            "limit": int(evidence_limit),
-        },
-        "carbon_assurance": {
-            "count": len(carbon_assurance_evidence),
-            "limit": int(evidence_limit),
-        },
-        "carbon_factors": {
-            "factor_sets_count": len(carbon_factor_sets),
-            "update_logs_count": len(carbon_factor_update_logs),
-            "limit": int(evidence_limit),
-        },
-        "included_files": included_files,
-        "notes": [
-            "Secrets/tokens are redacted. Only boolean 'has_*' fields are included for encrypted credentials.",
-            "Audit log export is capped at 10,000 records for performance.",
-            "Bundled FOCUS export is bounded by focus_max_rows. Use /api/v1/costs/export/focus for full streaming export.",
-            "Bundled Savings Proof prefers finance-grade realized savings evidence when available, otherwise falls back to estimated savings.",
-            "Realized savings exports are bounded by realized_limit and filtered by executed_at window; missing rows usually indicate insufficient finalized ledger coverage for the baseline/measurement windows.",
-            "Bundled close package restatement entries may be truncated via close_max_restatements.",
-            "Carbon factor exports are global methodology artifacts (not tenant-scoped billing data).",
-            "Key runbooks/licensing docs are included for procurement review under docs/.",
-        ],
-    }
 
 async def run_focus_export(
     *,
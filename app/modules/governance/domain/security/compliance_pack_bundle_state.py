@@ -1,34 +1,11 @@
 from datetime import date, datetime, timedelta
-from typing import Any, Awaitable, Callable
+from typing import Any
 
 from app.modules.governance.domain.security.compliance_pack_support import (
     normalize_optional_provider,
     resolve_window,
 )
 
-PayloadEvidenceCollector = Callable[..., Awaitable[list[dict[str, Any]]]]
-
-
-async def collect_payload_evidence_map(
-    *,
-    db: Any,
-    tenant_id: Any,
-    evidence_limit: int,
-    payload_specs: tuple[tuple[str, str, str, bool], ...],
-    collect_payload_evidence: PayloadEvidenceCollector,
-) -> dict[str, list[dict[str, Any]]]:
-    payload_evidence: dict[str, list[dict[str, Any]]] = {}
-    for key, event_type, payload_key, include_thresholds in payload_specs:
-        payload_evidence[key] = await collect_payload_evidence(
-            db=db,
-            tenant_id=tenant_id,
-            event_type=event_type,
-            payload_key=payload_key,
-            limit=int(evidence_limit),
-            include_thresholds=include_thresholds,
-        )
-    return payload_evidence
-
 
 def default_included_files() -> list[str]:
     return [
@@ -0,0 +1,367 @@
+"""
+Concurrent evidence collection for compliance pack bundles.
+
+Every evidence collector (settings snapshots, integration and payload
+evidence, carbon factor lifecycle) runs on its own tenant-scoped session bound
+to the request's engine, at most `COMPLIANCE_PACK_COLLECTOR_CONCURRENCY` at a
+time.
+
+Consistency guarantee:
+- PostgreSQL: one REPEATABLE READ transaction exports its snapshot
+  (`pg_export_snapshot()`) and every collector session imports it with
+  `SET TRANSACTION SNAPSHOT`, so all collectors, settings reads included, see
+  exactly the same committed data.
+- Other backends cannot share a snapshot. There collectors only share the
+  `as_of` cutoff applied to timestamped evidence; settings rows are read as
+  they are when each collector runs.
+
+Either way the collected evidence, and the evidence artifacts rendered from
+it, do not depend on scheduling order. Per-collector wall-clock timings are
+returned for the manifest, which also carries other per-run fields.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import re
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable, Sequence
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.modules.governance.domain.security.audit_log import AuditEventType
+from app.modules.governance.domain.security.compliance_pack_evidence import (
+    collect_carbon_factor_evidence,
+    collect_integration_evidence,
+    collect_payload_evidence,
+    collect_settings_snapshots,
+)
+from app.shared.db.session import (
+    GuardedAsyncSession,
+    mark_session_system_context,
+    set_session_tenant_id,
+)
+
+COMPLIANCE_PACK_COLLECTOR_CONCURRENCY = 4
+
+INTEGRATION_ACCEPTANCE_EVENT_TYPES: tuple[str, ...] = (
+    AuditEventType.INTEGRATION_TEST_SLACK.value,
+    AuditEventType.INTEGRATION_TEST_JIRA.value,
+    AuditEventType.INTEGRATION_TEST_TEAMS.value,
+    AuditEventType.INTEGRATION_TEST_WORKFLOW.value,
+    AuditEventType.INTEGRATION_TEST_SUITE.value,
+)
+
+# (evidence key, audit event type, details payload key, include thresholds)
+PAYLOAD_EVIDENCE_SPECS: tuple[tuple[str, str, str, bool], ...] = (
+    (
+        "acceptance_kpi_evidence",
+        AuditEventType.ACCEPTANCE_KPIS_CAPTURED.value,
+        "acceptance_kpis",
+        True,
+    ),
+    (
+        "leadership_kpi_evidence",
+        AuditEventType.LEADERSHIP_KPIS_CAPTURED.value,
+        "leadership_kpis",
+        True,
+    ),
+    (
+        "quarterly_commercial_proof_evidence",
+        AuditEventType.COMMERCIAL_QUARTERLY_REPORT_CAPTURED.value,
+        "quarterly_report",
+        True,
+    ),
+    (
+        "identity_smoke_evidence",
+        AuditEventType.IDENTITY_IDP_SMOKE_CAPTURED.value,
+        "identity_smoke",
+        False,
+    ),
+    (
+        "sso_federation_validation_evidence",
+        AuditEventType.IDENTITY_SSO_FEDERATION_VALIDATION_CAPTURED.value,
+        "sso_federation_validation",
+        False,
+    ),
+    (
+        "performance_load_test_evidence",
+        AuditEventType.PERFORMANCE_LOAD_TEST_CAPTURED.value,
+        "load_test",
+        False,
+    ),
+    (
+        "ingestion_persistence_benchmark_evidence",
+        AuditEventType.PERFORMANCE_INGESTION_PERSISTENCE_CAPTURED.value,
+        "benchmark",
+        False,
+    ),
+    (
+        "ingestion_soak_evidence",
+        AuditEventType.PERFORMANCE_INGESTION_SOAK_CAPTURED.value,
+        "ingestion_soak",
+        False,
+    ),
+    (
+        "partitioning_evidence",
+        AuditEventType.PERFORMANCE_PARTITIONING_CAPTURED.value,
+        "partitioning",
+        False,
+    ),
+    ("job_slo_evidence", AuditEventType.JOBS_SLO_CAPTURED.value, "job_slo", False),
+    (
+        "tenant_isolation_evidence",
+        AuditEventType.TENANCY_ISOLATION_VERIFICATION_CAPTURED.value,
+        "tenant_isolation",
+        False,
+    ),
+    (
+        "carbon_assurance_evidence",
+        AuditEventType.CARBON_ASSURANCE_SNAPSHOT_CAPTURED.value,
+        "carbon_assurance",
+        False,
+    ),
+)
+
+SessionOpener = Callable[[], AbstractAsyncContextManager[AsyncSession]]
+CollectFn = Callable[[AsyncSession], Awaitable[Any]]
+
+# pg_export_snapshot() identifiers look like "00000003-0000001B-1".
+_SNAPSHOT_ID_PATTERN = re.compile(r"[0-9A-Fa-f]+(?:-[0-9A-Fa-f]+)+")
+
+
+@dataclass(frozen=True, slots=True)
+class EvidenceCollector:
+    name: str
+    collect: CollectFn
+
+
+def build_evidence_collectors(
+    *, tenant_id: UUID, evidence_limit: int, as_of: datetime
+) -> list[EvidenceCollector]:
+    """Every evidence collector of a bundle, reading as of `as_of`."""
+    limit = int(evidence_limit)
+    collectors = [
+        EvidenceCollector(
+            "settings_snapshots",
+            lambda db: collect_settings_snapshots(db=db, tenant_id=tenant_id),
+        ),
+        EvidenceCollector(
+            "integration_evidence",
+            lambda db: collect_integration_evidence(
+                db=db,
+                tenant_id=tenant_id,
+                event_types=INTEGRATION_ACCEPTANCE_EVENT_TYPES,
+                limit=limit,
+                as_of=as_of,
+            ),
+        ),
+        EvidenceCollector(
+            "carbon_factor_evidence",
+            lambda db: collect_carbon_factor_evidence(db=db, limit=limit, as_of=as_of),
+        ),
+    ]
+    for key, event_type, payload_key, include_thresholds in PAYLOAD_EVIDENCE_SPECS:
+        collectors.append(
+            EvidenceCollector(
+                key,
+                _payload_collector(
+                    tenant_id=tenant_id,
+                    event_type=event_type,
+                    payload_key=payload_key,
+                    limit=limit,
+                    include_thresholds=include_thresholds,
+                    as_of=as_of,
+                ),
+            )
+        )
+    return collectors
+
+
+def _payload_collector(
+    *,
+    tenant_id: UUID,
+    event_type: str,
+    payload_key: str,
+    limit: int,
+    include_thresholds: bool,
+    as_of: datetime,
+) -> CollectFn:
+    async def _collect(db: AsyncSession) -> Any:
+        return await collect_payload_evidence(
+            db=db,
+            tenant_id=tenant_id,
+            event_type=event_type,
+            payload_key=payload_key,
+            limit=limit,
+            include_thresholds=include_thresholds,
+            as_of=as_of,
+        )
+
+    return _collect
+
+
+def _tenant_session_opener(
+    session_maker: async_sessionmaker[GuardedAsyncSession],
+    tenant_id: UUID,
+    *,
+    snapshot_id: str | None,
+) -> SessionOpener:
+    @asynccontextmanager
+    async def _open() -> AsyncIterator[AsyncSession]:
+        async with session_maker() as session:
+            if snapshot_id is not None:
+                # Must precede every other statement of the transaction.
+                await session.connection(
+                    execution_options={"isolation_level": "REPEATABLE READ"}
+                )
+                await session.execute(text(f"SET TRANSACTION SNAPSHOT '{snapshot_id}'"))
+            await set_session_tenant_id(session, tenant_id)
+            yield session
+
+    return _open
+
+
+@asynccontextmanager
+async def snapshot_session_opener(
+    db: AsyncSession, tenant_id: UUID
+) -> AsyncIterator[SessionOpener]:
+    """
+    Yield an opener of tenant-scoped sessions on the engine behind `db`.
+    On PostgreSQL every opened session reads the snapshot exported on entry,
+    which stays valid until the context exits.
+    """
+    session_maker: async_sessionmaker[GuardedAsyncSession] = async_sessionmaker(
+        bind=db.bind, class_=GuardedAsyncSession, expire_on_commit=False
+    )
+    if db.get_bind().dialect.name != "postgresql":
+        yield _tenant_session_opener(session_maker, tenant_id, snapshot_id=None)
+        return
+
+    async with session_maker() as exporter:
+        await exporter.connection(
+            execution_options={"isolation_level": "REPEATABLE READ"}
+        )
+        await mark_session_system_context(exporter)
+        result = await exporter.execute(text("SELECT pg_export_snapshot()"))
+        snapshot_id = str(result.scalar_one())
+        if not _SNAPSHOT_ID_PATTERN.fullmatch(snapshot_id):
+            raise RuntimeError(f"unexpected exported snapshot id: {snapshot_id!r}")
+        yield _tenant_session_opener(session_maker, tenant_id, snapshot_id=snapshot_id)
+
+
+async def run_evidence_collectors(
+    collectors: Sequence[EvidenceCollector],
+    *,
+    open_session: SessionOpener,
+    concurrency: int = COMPLIANCE_PACK_COLLECTOR_CONCURRENCY,
+    clock: Callable[[], float] = time.perf_counter,
+) -> tuple[dict[str, Any], dict[str, float]]:
+    """
+    Run collectors with bounded parallelism, one session each.
+    Returns results and timings (ms) keyed by collector name; the first
+    failure cancels the remaining collectors and propagates.
+    """
+    semaphore = asyncio.Semaphore(max(1, int(concurrency)))
+    results: dict[str, Any] = {}
+    timings_ms: dict[str, float] = {}
+
+    async def _run(collector: EvidenceCollector) -> None:
+        async with semaphore:
+            started = clock()
+            async with open_session() as session:
+                results[collector.name] = await collector.collect(session)
+            timings_ms[collector.name] = round((clock() - started) * 1000, 3)
+
+    tasks = [asyncio.ensure_future(_run(collector)) for collector in collectors]
+    try:
+        await asyncio.gather(*tasks)
+    finally:
+        pending = [task for task in tasks if not task.done()]
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+    return results, dict(sorted(timings_ms.items()))
+
+
+# build_manifest keyword -> payload evidence key.
+_MANIFEST_PAYLOAD_KWARGS: tuple[str, ...] = (
+    "leadership_kpi_evidence",
+    "quarterly_commercial_proof_evidence",
+    "identity_smoke_evidence",
+    "sso_federation_validation_evidence",
+    "performance_load_test_evidence",
+    "ingestion_persistence_benchmark_evidence",
+    "ingestion_soak_evidence",
+    "partitioning_evidence",
+    "job_slo_evidence",
+    "tenant_isolation_evidence",
+    "carbon_assurance_evidence",
+)
+
+# Bundle JSON artifact -> payload evidence key, in archive order.
+_PAYLOAD_JSON_FILES: tuple[tuple[str, str], ...] = (
+    ("acceptance_kpis_evidence.json", "acceptance_kpi_evidence"),
+    ("leadership_kpis_evidence.json", "leadership_kpi_evidence"),
+    ("quarterly_commercial_proof_evidence.json", "quarterly_commercial_proof_evidence"),
+    ("identity_smoke_evidence.json", "identity_smoke_evidence"),
+    ("sso_federation_validation_evidence.json", "sso_federation_validation_evidence"),
+    ("performance_load_test_evidence.json", "performance_load_test_evidence"),
+    (
+        "ingestion_persistence_benchmark_evidence.json",
+        "ingestion_persistence_benchmark_evidence",
+    ),
+    ("ingestion_soak_evidence.json", "ingestion_soak_evidence"),
+    ("partitioning_evidence.json", "partitioning_evidence"),
+    ("job_slo_evidence.json", "job_slo_evidence"),
+    ("tenant_isolation_evidence.json", "tenant_isolation_evidence"),
+    ("carbon_assurance_evidence.json", "carbon_assurance_evidence"),
+)
+
+
+def manifest_evidence_kwargs(evidence: dict[str, Any]) -> dict[str, Any]:
+    """Evidence keyword arguments for `build_manifest`."""
+    carbon_factor_sets, carbon_factor_update_logs = evidence["carbon_factor_evidence"]
+    kwargs = {key: evidence[key] for key in _MANIFEST_PAYLOAD_KWARGS}
+    kwargs["carbon_factor_sets"] = carbon_factor_sets
+    kwargs["carbon_factor_update_logs"] = carbon_factor_update_logs
+    return kwargs
+
+
+def evidence_json_payloads(evidence: dict[str, Any]) -> dict[str, Any]:
+    """Core JSON artifacts of the bundle, keyed by archive path."""
+    notif_snapshot, remediation_snapshot, identity_snapshot = evidence[
+        "settings_snapshots"
+    ]
+    carbon_factor_sets, carbon_factor_update_logs = evidence["carbon_factor_evidence"]
+    payloads: dict[str, Any] = {
+        "notification_settings.json": notif_snapshot,
+        "remediation_settings.json": remediation_snapshot,
+        "identity_settings.json": identity_snapshot,
+        "integration_acceptance_evidence.json": evidence["integration_evidence"],
+    }
+    for file_name, key in _PAYLOAD_JSON_FILES:
+        payloads[file_name] = evidence[key]
+    payloads["carbon_factor_sets.json"] = carbon_factor_sets
+    payloads["carbon_factor_update_logs.json"] = carbon_factor_update_logs
+    return payloads
+
+
+__all__ = [
+    "COMPLIANCE_PACK_COLLECTOR_CONCURRENCY",
+    "EvidenceCollector",
+    "INTEGRATION_ACCEPTANCE_EVENT_TYPES",
+    "PAYLOAD_EVIDENCE_SPECS",
+    "build_evidence_collectors",
+    "evidence_json_payloads",
+    "manifest_evidence_kwargs",
+    "run_evidence_collectors",
+    "snapshot_session_opener",
+]
@@ -1,8 +1,12 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
 from dataclasses import dataclass
+from typing import IO
 from uuid import UUID
 
+from app.shared.core.spooled_export import iter_file_chunks
+
 
 @dataclass(frozen=True, slots=True)
 class CompliancePackActor:
@@ -14,10 +18,14 @@ class CompliancePackActor:
 
 @dataclass(frozen=True, slots=True)
 class CompliancePackBundleResult:
-    body: bytes
+    body: IO[bytes]
     filename: str
     media_type: str = "application/zip"
 
+    def iter_chunks(self) -> Iterator[bytes]:
+        """Stream the spooled archive, closing it once fully read."""
+        return iter_file_chunks(self.body)
+
 
 class CompliancePackValidationError(ValueError):
     """Raised when compliance-pack export inputs fail domain validation."""
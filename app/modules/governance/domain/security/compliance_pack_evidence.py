@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from datetime import datetime
 from typing import Any, Iterable
 from uuid import UUID
 
@@ -34,6 +35,7 @@ async def collect_integration_evidence(
     tenant_id: UUID,
     event_types: Iterable[str],
     limit: int,
+    as_of: datetime | None = None,
 ) -> list[dict[str, Any]]:
     event_type_values = [str(item) for item in event_types]
     stmt = (
@@ -43,6 +45,8 @@ async def collect_integration_evidence(
         .order_by(desc(AuditLog.event_timestamp))
         .limit(int(limit))
     )
+    if as_of is not None:
+        stmt = stmt.where(AuditLog.event_timestamp <= as_of)
     rows = (await db.execute(stmt)).scalars().all()
     items: list[dict[str, Any]] = []
     for row in rows:
@@ -64,6 +68,7 @@ async def collect_payload_evidence(
     payload_key: str,
     limit: int,
     include_thresholds: bool = False,
+    as_of: datetime | None = None,
 ) -> list[dict[str, Any]]:
     stmt = (
         select(AuditLog)
@@ -72,6 +77,8 @@ async def collect_payload_evidence(
         .order_by(desc(AuditLog.event_timestamp))
         .limit(int(limit))
     )
+    if as_of is not None:
+        stmt = stmt.where(AuditLog.event_timestamp <= as_of)
     rows = (await db.execute(stmt)).scalars().all()
     items: list[dict[str, Any]] = []
     for row in rows:
@@ -291,19 +298,24 @@ async def collect_settings_snapshots(
 
 
 async def collect_carbon_factor_evidence(
-    *, db: AsyncSession, limit: int
+    *, db: AsyncSession, limit: int, as_of: datetime | None = None
 ) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
-    factor_set_rows = (
-        (
-            await db.execute(
-                select(CarbonFactorSet)
-                .order_by(desc(CarbonFactorSet.created_at))
-                .limit(int(limit))
-            )
-        )
-        .scalars()
-        .all()
+    factor_set_stmt = (
+        select(CarbonFactorSet)
+        .order_by(desc(CarbonFactorSet.created_at))
+        .limit(int(limit))
+    )
+    update_log_stmt = (
+        select(CarbonFactorUpdateLog)
+        .order_by(desc(CarbonFactorUpdateLog.recorded_at))
+        .limit(int(limit))
     )
+    if as_of is not None:
+        factor_set_stmt = factor_set_stmt.where(CarbonFactorSet.created_at <= as_of)
+        update_log_stmt = update_log_stmt.where(
+            CarbonFactorUpdateLog.recorded_at <= as_of
+        )
+    factor_set_rows = (await db.execute(factor_set_stmt)).scalars().all()
     carbon_factor_sets: list[dict[str, Any]] = []
     for factor_set_row in factor_set_rows:
         carbon_factor_sets.append(
@@ -332,17 +344,7 @@ async def collect_carbon_factor_evidence(
             }
         )
 
-    factor_update_rows = (
-        (
-            await db.execute(
-                select(CarbonFactorUpdateLog)
-                .order_by(desc(CarbonFactorUpdateLog.recorded_at))
-                .limit(int(limit))
-            )
-        )
-        .scalars()
-        .all()
-    )
+    factor_update_rows = (await db.execute(update_log_stmt)).scalars().all()
     carbon_factor_update_logs: list[dict[str, Any]] = []
     for factor_update_row in factor_update_rows:
         carbon_factor_update_logs.append(
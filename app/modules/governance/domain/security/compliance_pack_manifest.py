@@ -0,0 +1,123 @@
+"""Manifest (`manifest.json`) for compliance pack bundles."""
+
+from datetime import datetime
+from typing import Any, Optional
+
+from app.modules.governance.domain.security.compliance_pack_contracts import (
+    CompliancePackActor,
+)
+
+
+def build_manifest(
+    *,
+    exported_at: datetime,
+    run_id: str,
+    actor: CompliancePackActor,
+    app_environment: str,
+    app_version: str,
+    start_date: Optional[datetime],
+    end_date: Optional[datetime],
+    evidence_limit: int,
+    included_files: list[str],
+    focus_export_info: dict[str, Any],
+    savings_proof_info: dict[str, Any],
+    close_package_info: dict[str, Any],
+    leadership_kpi_evidence: list[dict[str, Any]],
+    quarterly_commercial_proof_evidence: list[dict[str, Any]],
+    identity_smoke_evidence: list[dict[str, Any]],
+    sso_federation_validation_evidence: list[dict[str, Any]],
+    performance_load_test_evidence: list[dict[str, Any]],
+    ingestion_persistence_benchmark_evidence: list[dict[str, Any]],
+    ingestion_soak_evidence: list[dict[str, Any]],
+    partitioning_evidence: list[dict[str, Any]],
+    job_slo_evidence: list[dict[str, Any]],
+    tenant_isolation_evidence: list[dict[str, Any]],
+    carbon_assurance_evidence: list[dict[str, Any]],
+    carbon_factor_sets: list[dict[str, Any]],
+    carbon_factor_update_logs: list[dict[str, Any]],
+    snapshot_at: datetime,
+    collector_concurrency: int,
+    collector_timings_ms: dict[str, float],
+) -> dict[str, Any]:
+    return {
+        "exported_at": exported_at.isoformat(),
+        "run_id": run_id,
+        "tenant_id": str(actor.tenant_id),
+        "actor_id": str(actor.id),
+        "actor_email": actor.email,
+        "environment": app_environment,
+        "app_version": app_version,
+        "window": {
+            "start_date": start_date.isoformat() if start_date else None,
+            "end_date": end_date.isoformat() if end_date else None,
+        },
+        "focus_export": focus_export_info,
+        "savings_proof": savings_proof_info,
+        "close_package": close_package_info,
+        "leadership_kpis": {
+            "count": len(leadership_kpi_evidence),
+            "limit": int(evidence_limit),
+        },
+        "quarterly_commercial_proof_reports": {
+            "count": len(quarterly_commercial_proof_evidence),
+            "limit": int(evidence_limit),
+        },
+        "identity_idp_smoke_tests": {
+            "count": len(identity_smoke_evidence),
+            "limit": int(evidence_limit),
+        },
+        "sso_federation_validation": {
+            "count": len(sso_federation_validation_evidence),
+            "limit": int(evidence_limit),
+        },
+        "performance_load_tests": {
+            "count": len(performance_load_test_evidence),
+            "limit": int(evidence_limit),
+        },
+        "ingestion_persistence_benchmarks": {
+            "count": len(ingestion_persistence_benchmark_evidence),
+            "limit": int(evidence_limit),
+        },
+        "ingestion_soak_runs": {
+            "count": len(ingestion_soak_evidence),
+            "limit": int(evidence_limit),
+        },
+        "partitioning_validation": {
+            "count": len(partitioning_evidence),
+            "limit": int(evidence_limit),
+        },
+        "job_slo_evidence": {
+            "count": len(job_slo_evidence),
+            "limit": int(evidence_limit),
+        },
+        "tenant_isolation_verifications": {
+            "count": len(tenant_isolation_evidence),
+            "limit": int(evidence_limit),
+        },
+        "carbon_assurance": {
+            "count": len(carbon_assurance_evidence),
+            "limit": int(evidence_limit),
+        },
+        "carbon_factors": {
+            "factor_sets_count": len(carbon_factor_sets),
+            "update_logs_count": len(carbon_factor_update_logs),
+            "limit": int(evidence_limit),
+        },
+        "evidence_collection": {
+            "snapshot_at": snapshot_at.isoformat(),
+            "concurrency": int(collector_concurrency),
+            "collector_timings_ms": collector_timings_ms,
+        },
+        "included_files": included_files,
+        "notes": [
+            "Secrets/tokens are redacted. Only boolean 'has_*' fields are included for encrypted credentials.",
+            "Audit log export is streamed in full for the selected window; per-file SHA-256 digests are listed under artifact_sha256.",
+            "Bundled FOCUS export is bounded by focus_max_rows. Use /api/v1/costs/export/focus for full streaming export.",
+            "Bundled Savings Proof prefers finance-grade realized savings evidence when available, otherwise falls back to estimated savings.",
+            "Realized savings exports are bounded by realized_limit and filtered by executed_at window; missing rows usually indicate insufficient finalized ledger coverage for the baseline/measurement windows.",
+            "Bundled close package restatement entries may be truncated via close_max_restatements.",
+            "Carbon factor exports are global methodology artifacts (not tenant-scoped billing data).",
+            "Key runbooks/licensing docs are included for procurement review under docs/.",
+            "Evidence artifacts depend only on evidence_collection.snapshot_at; exported_at, run_id and collector timings in this manifest differ per run.",
+        ],
+    }
@@ -11,6 +11,7 @@ from app.shared.core.auth import CurrentUser, get_current_user, requires_role
 from app.shared.core.dependencies import requires_feature
 from app.shared.core.pricing import FeatureFlag
 from app.shared.core.rate_limit import analysis_limit
+from app.shared.db.read_replica import get_read_db
 from app.shared.db.session import get_db
 
 router = APIRouter()
@@ -28,7 +29,7 @@ async def get_costs(
     start_date: date = Query(...),
     end_date: date = Query(...),
     provider: Optional[str] = None,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: CurrentUser = Depends(get_current_user),
 ) -> Any:
     costs_api = _costs_api()
@@ -49,7 +50,7 @@ async def get_cost_breakdown(
     provider: Optional[str] = None,
     limit: int = Query(default=100, ge=1, le=1000),
     offset: int = Query(default=0, ge=0),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: CurrentUser = Depends(get_current_user),
 ) -> Any:
     costs_api = _costs_api()
@@ -71,7 +72,7 @@ async def get_cost_attribution_summary(
     bucket: Optional[str] = Query(default=None),
     limit: int = Query(default=100, ge=1, le=1000),
     offset: int = Query(default=0, ge=0),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: CurrentUser = Depends(requires_feature(FeatureFlag.CHARGEBACK)),
 ) -> dict[str, Any]:
     costs_api = _costs_api()
@@ -93,7 +94,7 @@ async def get_cost_attribution_summary(
 async def get_cost_attribution_coverage(
     start_date: date = Query(...),
     end_date: date = Query(...),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: CurrentUser = Depends(requires_feature(FeatureFlag.CHARGEBACK)),
 ) -> dict[str, Any]:
     costs_api = _costs_api()
@@ -218,7 +219,7 @@ async def get_ingestion_sla(
     window_hours: int = Query(default=24, ge=1, le=24 * 30),
     target_success_rate_percent: float = Query(default=95.0, ge=0, le=100),
     user: CurrentUser = Depends(requires_feature(FeatureFlag.INGESTION_SLA)),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ) -> IngestionSLAResponse:
     costs_api = _costs_api()
     return cast(
@@ -20,6 +20,7 @@ from app.modules.reporting.api.v1.costs_models import (
 from app.shared.core.auth import CurrentUser, get_current_user, requires_role
 from app.shared.core.dependencies import requires_feature
 from app.shared.core.pricing import FeatureFlag
+from app.shared.db.read_replica import get_read_db
 from app.shared.db.session import get_db
 
 router = APIRouter()
@@ -320,7 +321,7 @@ async def export_focus_v13_costs_csv(
     user: CurrentUser = Depends(
         requires_feature(FeatureFlag.COMPLIANCE_EXPORTS, required_role="admin")
     ),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ) -> Any:
     costs_api = _costs_api()
     return await costs_api.export_focus_v13_costs_csv(
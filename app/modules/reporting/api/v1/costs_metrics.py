@@ -21,6 +21,11 @@ from app.models.unit_economics_settings import UnitEconomicsSettings
 from app.shared.core.async_utils import maybe_await
 from app.shared.core.connection_state import is_connection_active
 
+from .costs_metrics_aggregate_ops import (
+    IngestionSLAAggregates,
+    load_ingestion_sla_aggregates,
+    load_provider_recency_aggregates,
+)
 from .costs_models import (
     AcceptanceKpiMetric,
     IngestionSLAResponse,
@@ -86,6 +91,32 @@ def is_connection_active_state(connection: Any) -> bool:
     return is_connection_active(connection)
 
 
+def _recency_response(
+    provider: str,
+    *,
+    active_connections: int,
+    recently_ingested: int,
+    stale_connections: int,
+    never_ingested: int,
+    latest_ingested_at: Optional[datetime],
+    recency_target_hours: int,
+) -> ProviderRecencyResponse:
+    if latest_ingested_at is not None and latest_ingested_at.tzinfo is None:
+        latest_ingested_at = latest_ingested_at.replace(tzinfo=timezone.utc)
+    return ProviderRecencyResponse(
+        provider=provider,
+        active_connections=active_connections,
+        recently_ingested=recently_ingested,
+        stale_connections=stale_connections,
+        never_ingested=never_ingested,
+        latest_ingested_at=latest_ingested_at.isoformat() if latest_ingested_at else None,
+        recency_target_hours=recency_target_hours,
+        meets_recency_target=(
+            active_connections > 0 and stale_connections == 0 and never_ingested == 0
+        ),
+    )
+
+
 def build_provider_recency_summary(
     provider: str,
     connections: list[Any],
@@ -115,19 +146,14 @@ def build_provider_recency_summary(
         else:
             never_ingested += 1
 
-    meets_recency_target = (
-        len(active_connections) > 0 and stale_connections == 0 and never_ingested == 0
-    )
-
-    return ProviderRecencyResponse(
-        provider=provider,
+    return _recency_response(
+        provider,
         active_connections=len(active_connections),
         recently_ingested=recently_ingested,
         stale_connections=stale_connections,
         never_ingested=never_ingested,
-        latest_ingested_at=latest_ingested_at.isoformat() if latest_ingested_at else None,
+        latest_ingested_at=latest_ingested_at,
         recency_target_hours=recency_target_hours,
-        meets_recency_target=meets_recency_target,
     )
 
 
@@ -154,71 +180,41 @@ async def compute_provider_recency_summaries(
         ("platform", PlatformConnection),
         ("hybrid", HybridConnection),
     ]
+    aggregates = await load_provider_recency_aggregates(
+        db,
+        tenant_id=tenant_id,
+        provider_models=provider_models,
+        threshold=now - timedelta(hours=recency_target_hours),
+    )
+    if aggregates is not None:
+        return [
+            _recency_response(
+                provider,
+                active_connections=aggregates[provider].active_connections,
+                recently_ingested=aggregates[provider].recently_ingested,
+                stale_connections=aggregates[provider].stale_connections,
+                never_ingested=aggregates[provider].never_ingested,
+                latest_ingested_at=aggregates[provider].latest_ingested_at,
+                recency_target_hours=recency_target_hours,
+            )
+            for provider, _ in provider_models
+        ]
+
     summaries: list[ProviderRecencyResponse] = []
     for provider, model in provider_models:
         result = await db.execute(select(model).where(model.tenant_id == tenant_id))
-        threshold = now - timedelta(hours=recency_target_hours)
-        active_connections = 0
-        recently_ingested = 0
-        stale_connections = 0
-        never_ingested = 0
-        latest_ingested_at: Optional[datetime] = None
-
-        for conn in result.scalars():
-            if not is_connection_active_state(conn):
-                continue
-            active_connections += 1
-            last_ingested_at = getattr(conn, "last_ingested_at", None)
-            if isinstance(last_ingested_at, datetime):
-                if last_ingested_at.tzinfo is None:
-                    last_ingested_at = last_ingested_at.replace(tzinfo=timezone.utc)
-                if latest_ingested_at is None or last_ingested_at > latest_ingested_at:
-                    latest_ingested_at = last_ingested_at
-                if last_ingested_at >= threshold:
-                    recently_ingested += 1
-                else:
-                    stale_connections += 1
-            else:
-                never_ingested += 1
-
         summaries.append(
-            ProviderRecencyResponse(
-                provider=provider,
-                active_connections=active_connections,
-                recently_ingested=recently_ingested,
-                stale_connections=stale_connections,
-                never_ingested=never_ingested,
-                latest_ingested_at=latest_ingested_at.isoformat()
-                if latest_ingested_at
-                else None,
+            build_provider_recency_summary(
+                provider,
+                list(result.scalars()),
+                now=now,
                 recency_target_hours=recency_target_hours,
-                meets_recency_target=(
-                    active_connections > 0
-                    and stale_connections == 0
-                    and never_ingested == 0
-                ),
             )
         )
     return summaries
 
 
-async def compute_ingestion_sla_metrics(
-    db: AsyncSession,
-    tenant_id: UUID,
-    *,
-    window_hours: int,
-    target_success_rate_percent: float,
-) -> IngestionSLAResponse:
-    window_start = datetime.now(timezone.utc) - timedelta(hours=window_hours)
-
-    result = await db.execute(
-        select(BackgroundJob).where(
-            BackgroundJob.tenant_id == tenant_id,
-            BackgroundJob.job_type == JobType.COST_INGESTION.value,
-            BackgroundJob.created_at >= window_start,
-        )
-    )
-    jobs = list(await maybe_await(result.scalars().all()))
+def _ingestion_sla_from_jobs(jobs: list[Any]) -> IngestionSLAAggregates:
     total_jobs = 0
     successful_jobs = 0
     failed_jobs = 0
@@ -248,36 +244,80 @@ async def compute_ingestion_sla_metrics(
             if isinstance(ingested_value, (int, float)):
                 records_ingested += int(ingested_value)
 
+    p95_duration_seconds: Optional[float] = None
+    if duration_samples:
+        sorted_durations = sorted(duration_samples)
+        p95_index = max(0, math.ceil(len(sorted_durations) * 0.95) - 1)
+        p95_duration_seconds = sorted_durations[p95_index]
+
+    return IngestionSLAAggregates(
+        total_jobs=total_jobs,
+        successful_jobs=successful_jobs,
+        failed_jobs=failed_jobs,
+        latest_completed_at=latest_completed_at_dt,
+        duration_count=len(duration_samples),
+        duration_sum_seconds=sum(duration_samples),
+        p95_duration_seconds=p95_duration_seconds,
+        records_ingested=records_ingested,
+    )
+
+
+async def compute_ingestion_sla_metrics(
+    db: AsyncSession,
+    tenant_id: UUID,
+    *,
+    window_hours: int,
+    target_success_rate_percent: float,
+) -> IngestionSLAResponse:
+    window_start = datetime.now(timezone.utc) - timedelta(hours=window_hours)
+
+    stats = await load_ingestion_sla_aggregates(
+        db, tenant_id=tenant_id, window_start=window_start
+    )
+    if stats is None:
+        result = await db.execute(
+            select(BackgroundJob).where(
+                BackgroundJob.tenant_id == tenant_id,
+                BackgroundJob.job_type == JobType.COST_INGESTION.value,
+                BackgroundJob.created_at >= window_start,
+            )
+        )
+        stats = _ingestion_sla_from_jobs(
+            list(await maybe_await(result.scalars().all()))
+        )
+
+    total_jobs = stats.total_jobs
     success_rate_percent = (
-        round((successful_jobs / total_jobs) * 100, 2) if total_jobs else 0.0
+        round((stats.successful_jobs / total_jobs) * 100, 2) if total_jobs else 0.0
     )
     meets_sla = total_jobs > 0 and success_rate_percent >= target_success_rate_percent
 
     avg_duration_seconds = (
-        round(sum(duration_samples) / len(duration_samples), 2)
-        if duration_samples
+        round(stats.duration_sum_seconds / stats.duration_count, 2)
+        if stats.duration_count
         else None
     )
-    p95_duration_seconds: Optional[float] = None
-    if duration_samples:
-        sorted_durations = sorted(duration_samples)
-        p95_index = max(0, math.ceil(len(sorted_durations) * 0.95) - 1)
-        p95_duration_seconds = round(sorted_durations[p95_index], 2)
+    p95_duration_seconds = (
+        round(stats.p95_duration_seconds, 2)
+        if stats.p95_duration_seconds is not None
+        else None
+    )
+    latest_completed_at = stats.latest_completed_at
 
     return IngestionSLAResponse(
         window_hours=window_hours,
         target_success_rate_percent=round(target_success_rate_percent, 2),
         total_jobs=total_jobs,
-        successful_jobs=successful_jobs,
-        failed_jobs=failed_jobs,
+        successful_jobs=stats.successful_jobs,
+        failed_jobs=stats.failed_jobs,
         success_rate_percent=success_rate_percent,
         meets_sla=meets_sla,
-        latest_completed_at=latest_completed_at_dt.isoformat()
-        if latest_completed_at_dt
+        latest_completed_at=latest_completed_at.isoformat()
+        if latest_completed_at
         else None,
         avg_duration_seconds=avg_duration_seconds,
         p95_duration_seconds=p95_duration_seconds,
-        records_ingested=records_ingested,
+        records_ingested=stats.records_ingested,
     )
 
 
@@ -0,0 +1,217 @@
+"""
+Database-side aggregates for the ingestion SLA and provider recency metrics.
+
+The SLA metrics are one aggregate over the tenant's `COST_INGESTION` jobs in
+the window (counts, latest completion, duration sum/count, nearest-rank p95
+via `percentile_disc` and the ingested record total read from the JSON
+result), served by `ix_background_jobs_tenant_type_created`. Provider recency
+is one `UNION ALL` of per-connection-table aggregates, each using the
+table's tenant index. Both reproduce the row-by-row Python rules exactly and
+are only used on PostgreSQL and SQLite (SQLite has no `percentile_disc`, so
+the p95 is a second `ORDER BY ... OFFSET` lookup); for other sessions the
+loaders return None and callers keep the row-loading path.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Sequence
+from uuid import UUID
+
+from sqlalchemy import (
+    ColumnElement,
+    Integer,
+    Numeric,
+    and_,
+    case,
+    cast,
+    func,
+    literal,
+    select,
+    union_all,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.background_job import BackgroundJob, JobStatus, JobType
+
+AGGREGATE_DIALECTS = frozenset({"postgresql", "sqlite"})
+P95_FRACTION = 0.95
+
+
+def aggregate_dialect(db: Any) -> str | None:
+    """Dialect name when the session can run the aggregate queries, else None."""
+    bind = getattr(db, "bind", None)
+    name = getattr(getattr(bind, "dialect", None), "name", None)
+    if isinstance(name, str) and name.lower() in AGGREGATE_DIALECTS:
+        return name.lower()
+    return None
+
+
+@dataclass(frozen=True)
+class IngestionSLAAggregates:
+    total_jobs: int
+    successful_jobs: int
+    failed_jobs: int
+    latest_completed_at: datetime | None
+    duration_count: int
+    duration_sum_seconds: float
+    p95_duration_seconds: float | None
+    records_ingested: int
+
+
+@dataclass(frozen=True)
+class ProviderRecencyAggregates:
+    active_connections: int
+    recently_ingested: int
+    stale_connections: int
+    never_ingested: int
+    latest_ingested_at: datetime | None
+
+
+def _valid_duration_seconds(dialect: str) -> Any:
+    """Job duration in seconds, NULL unless started and not negative."""
+    started, completed = BackgroundJob.started_at, BackgroundJob.completed_at
+    seconds: ColumnElement[Any]
+    if dialect == "postgresql":
+        seconds = func.extract("epoch", completed - started)
+    else:
+        seconds = (func.julianday(completed) - func.julianday(started)) * 86400.0
+    valid = and_(started.isnot(None), completed.isnot(None), completed >= started)
+    return case((valid, seconds))
+
+
+def _ingested_records(dialect: str) -> Any:
+    """
+    Per-job `int(result["ingested"])` for completed jobs whose value is a JSON
+    number (or boolean, which Python counts as 0/1), truncated toward zero.
+    """
+    value: ColumnElement[Any]
+    if dialect == "postgresql":
+        result = BackgroundJob.result
+        kind = func.jsonb_typeof(func.jsonb_extract_path(result, "ingested"))
+        text = func.jsonb_extract_path_text(result, "ingested")
+        is_number, is_true = kind == "number", and_(kind == "boolean", text == "true")
+        value = func.trunc(cast(text, Numeric))
+    else:
+        kind = func.json_type(BackgroundJob.result, "$.ingested")
+        is_number, is_true = kind.in_(("integer", "real")), kind == "true"
+        value = cast(func.json_extract(BackgroundJob.result, "$.ingested"), Integer)
+    completed = BackgroundJob.status == JobStatus.COMPLETED.value
+    return case(
+        (and_(completed, is_number), value),
+        (and_(completed, is_true), 1),
+        else_=0,
+    )
+
+
+def _ingestion_window_filter(tenant_id: UUID, window_start: datetime) -> Any:
+    return and_(
+        BackgroundJob.tenant_id == tenant_id,
+        BackgroundJob.job_type == JobType.COST_INGESTION.value,
+        BackgroundJob.created_at >= window_start,
+    )
+
+
+async def load_ingestion_sla_aggregates(
+    db: AsyncSession, *, tenant_id: UUID, window_start: datetime
+) -> IngestionSLAAggregates | None:
+    dialect = aggregate_dialect(db)
+    if dialect is None:
+        return None
+    duration = _valid_duration_seconds(dialect)
+    status = BackgroundJob.status
+    columns: list[ColumnElement[Any]] = [
+        func.count().label("total_jobs"),
+        func.count().filter(status == JobStatus.COMPLETED.value),
+        func.count().filter(
+            status.in_((JobStatus.FAILED.value, JobStatus.DEAD_LETTER.value))
+        ),
+        func.max(BackgroundJob.completed_at),
+        func.count(duration),
+        func.coalesce(func.sum(duration), 0),
+        func.coalesce(func.sum(_ingested_records(dialect)), 0),
+    ]
+    if dialect == "postgresql":
+        # Ordered-set aggregates skip the NULL (invalid) durations.
+        columns.append(func.percentile_disc(P95_FRACTION).within_group(duration))
+    window = _ingestion_window_filter(tenant_id, window_start)
+    row = (await db.execute(select(*columns).where(window))).one()
+    total, successful, failed, latest, count, total_seconds, records = row[:7]
+    duration_count = int(count or 0)
+    p95 = row[7] if dialect == "postgresql" else None
+    if dialect != "postgresql" and duration_count:
+        offset = max(0, math.ceil(duration_count * P95_FRACTION) - 1)
+        p95 = (
+            await db.execute(
+                select(duration)
+                .where(window, duration.isnot(None))
+                .order_by(duration)
+                .offset(offset)
+                .limit(1)
+            )
+        ).scalar()
+    return IngestionSLAAggregates(
+        total_jobs=int(total or 0),
+        successful_jobs=int(successful or 0),
+        failed_jobs=int(failed or 0),
+        latest_completed_at=latest,
+        duration_count=duration_count,
+        duration_sum_seconds=float(total_seconds or 0),
+        p95_duration_seconds=None if p95 is None else float(p95),
+        records_ingested=int(records or 0),
+    )
+
+
+def _active_clause(model: Any) -> Any:
+    """SQL form of `is_connection_active` for a connection model."""
+    if "status" in model.__table__.c:
+        return func.lower(func.trim(model.status)) == "active"
+    return func.coalesce(model.is_active, True)
+
+
+async def load_provider_recency_aggregates(
+    db: AsyncSession,
+    *,
+    tenant_id: UUID,
+    provider_models: Sequence[tuple[str, Any]],
+    threshold: datetime,
+) -> dict[str, ProviderRecencyAggregates] | None:
+    if aggregate_dialect(db) is None or not provider_models:
+        return None
+    branches = []
+    for provider, model in provider_models:
+        active = _active_clause(model)
+        last = model.last_ingested_at
+        branches.append(
+            select(
+                literal(provider).label("provider"),
+                func.count().filter(active).label("active_connections"),
+                func.count().filter(and_(active, last >= threshold)),
+                func.count().filter(and_(active, last < threshold)),
+                func.count().filter(and_(active, last.is_(None))),
+                func.max(last).filter(active).label("latest_ingested_at"),
+            ).where(model.tenant_id == tenant_id)
+        )
+    rows = (await db.execute(union_all(*branches))).all()
+    return {
+        str(provider): ProviderRecencyAggregates(
+            active_connections=int(active or 0),
+            recently_ingested=int(recent or 0),
+            stale_connections=int(stale or 0),
+            never_ingested=int(never or 0),
+            latest_ingested_at=latest,
+        )
+        for provider, active, recent, stale, never, latest in rows
+    }
+
+
+__all__ = [
+    "AGGREGATE_DIALECTS",
+    "IngestionSLAAggregates",
+    "ProviderRecencyAggregates",
+    "aggregate_dialect",
+    "load_ingestion_sla_aggregates",
+    "load_provider_recency_aggregates",
+]
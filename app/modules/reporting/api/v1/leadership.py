@@ -23,6 +23,7 @@ from app.modules.governance.domain.security.audit_log import AuditEventType, Aud
 from app.shared.core.auth import CurrentUser
 from app.shared.core.pricing import FeatureFlag, PricingTier, normalize_tier
 from app.shared.core.dependencies import requires_feature
+from app.shared.db.read_replica import get_read_db
 from app.shared.db.session import get_db
 from app.modules.reporting.domain.commercial_reports import (
     CommercialProofReportService,
@@ -55,7 +56,7 @@ async def get_leadership_kpis(
     top_services_limit: int = Query(default=10, ge=1, le=50),
     response_format: str = Query(default="json", pattern="^(json|csv)$"),
     current_user: CurrentUser = Depends(requires_feature(FeatureFlag.COST_TRACKING)),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ) -> Any:
     tenant_id = _require_tenant_id(current_user)
     tier = normalize_tier(getattr(current_user, "tier", PricingTier.FREE))
@@ -270,7 +271,7 @@ async def get_quarterly_commercial_report(
     current_user: CurrentUser = Depends(
         requires_feature(FeatureFlag.COMPLIANCE_EXPORTS)
     ),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ) -> Any:
     tenant_id = _require_tenant_id(current_user)
     tier = normalize_tier(getattr(current_user, "tier", PricingTier.FREE))
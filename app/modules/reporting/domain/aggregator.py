@@ -10,7 +10,7 @@ from app.schemas.costs import CloudUsageSummary
 from .aggregator_breakdown_ops import (
     get_basic_breakdown as _get_basic_breakdown,
     get_cached_breakdown as _get_cached_breakdown,
-    refresh_materialized_view as _refresh_materialized_view,
+    reconcile_daily_aggregates as _reconcile_daily_aggregates,
 )
 from .aggregator_count_freshness_ops import (
     count_records as _count_records,
@@ -36,13 +36,14 @@ MAX_AGGREGATION_ROWS = 1000000  # 1M rows max per query
 MAX_DETAIL_ROWS = 100000  # 100K rows max for detail records
 STATEMENT_TIMEOUT_MS = 5000  # 5 seconds
 LARGE_DATASET_THRESHOLD = 5000  # If >5k records, suggest background job
-MATERIALIZED_VIEW_READ_RECOVERABLE_EXCEPTIONS: tuple[type[Exception], ...] = (
+DAILY_ROLLUP_RECONCILE_DAYS = 3  # Window re-checked by the maintenance sweep
+DAILY_ROLLUP_READ_RECOVERABLE_EXCEPTIONS: tuple[type[Exception], ...] = (
     SQLAlchemyError,
     RuntimeError,
     ValueError,
     TypeError,
 )
-MATERIALIZED_VIEW_REFRESH_RECOVERABLE_EXCEPTIONS: tuple[type[Exception], ...] = (
+DAILY_ROLLUP_RECONCILE_RECOVERABLE_EXCEPTIONS: tuple[type[Exception], ...] = (
     SQLAlchemyError,
     AttributeError,
     RuntimeError,
@@ -152,14 +153,20 @@ class CostAggregator:
             start_date,
             end_date,
             logger=logger,
-            mv_read_recoverable_exceptions=MATERIALIZED_VIEW_READ_RECOVERABLE_EXCEPTIONS,
+            rollup_read_recoverable_exceptions=DAILY_ROLLUP_READ_RECOVERABLE_EXCEPTIONS,
             basic_breakdown_fetcher=CostAggregator.get_basic_breakdown,
         )
 
     @staticmethod
-    async def refresh_materialized_view(db: AsyncSession) -> bool:
-        return await _refresh_materialized_view(
+    async def reconcile_daily_aggregates(
+        db: AsyncSession, lookback_days: int = DAILY_ROLLUP_RECONCILE_DAYS
+    ) -> bool:
+        return await _reconcile_daily_aggregates(
             db,
             logger=logger,
-            mv_refresh_recoverable_exceptions=MATERIALIZED_VIEW_REFRESH_RECOVERABLE_EXCEPTIONS,
+            lookback_days=lookback_days,
+            today=date.today(),
+            rollup_reconcile_recoverable_exceptions=(
+                DAILY_ROLLUP_RECONCILE_RECOVERABLE_EXCEPTIONS
+            ),
         )
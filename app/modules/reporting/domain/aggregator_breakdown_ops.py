@@ -1,4 +1,4 @@
-from datetime import date
+from datetime import date, timedelta
 from decimal import Decimal
 from typing import Any, Awaitable, Callable
 from uuid import UUID
@@ -6,7 +6,10 @@ from uuid import UUID
 from sqlalchemy import func, select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models.cloud import CloudAccount, CostRecord
+from app.models.cloud import CloudAccount, CostRecord, DailyCostAggregate
+from app.modules.reporting.domain.aggregator_daily_rollup_ops import (
+    reconcile_daily_cost_aggregates,
+)
 
 
 async def get_basic_breakdown(
@@ -85,33 +88,28 @@ async def get_cached_breakdown(
     end_date: date,
     *,
     logger: Any,
-    mv_read_recoverable_exceptions: tuple[type[Exception], ...],
+    rollup_read_recoverable_exceptions: tuple[type[Exception], ...],
     basic_breakdown_fetcher: Callable[..., Awaitable[dict[str, Any]]],
 ) -> dict[str, Any]:
-    """Query cached view breakdown; fallback to direct aggregation if unavailable."""
+    """Query the daily rollup breakdown; fallback to direct aggregation if empty."""
     try:
         async with db.begin_nested():
-            stmt = text("""
-                SELECT
-                    service,
-                    SUM(total_cost) as total_cost,
-                    SUM(total_carbon) as total_carbon
-                FROM mv_daily_cost_aggregates
-                WHERE tenant_id = :tenant_id
-                  AND cost_date >= :start_date
-                  AND cost_date <= :end_date
-                GROUP BY service
-                ORDER BY total_cost DESC
-            """)
-
-            result = await db.execute(
-                stmt,
-                {
-                    "tenant_id": tenant_id,
-                    "start_date": start_date,
-                    "end_date": end_date,
-                },
+            total_cost_col = func.sum(DailyCostAggregate.total_cost).label("total_cost")
+            stmt = (
+                select(
+                    DailyCostAggregate.service,
+                    total_cost_col,
+                    func.sum(DailyCostAggregate.total_carbon).label("total_carbon"),
+                )
+                .where(
+                    DailyCostAggregate.tenant_id == tenant_id,
+                    DailyCostAggregate.cost_date >= start_date,
+                    DailyCostAggregate.cost_date <= end_date,
+                )
+                .group_by(DailyCostAggregate.service)
+                .order_by(total_cost_col.desc())
             )
+            result = await db.execute(stmt)
             rows = result.all()
 
         if not rows:
@@ -144,30 +142,37 @@ async def get_cached_breakdown(
             "cached": True,
         }
 
-    except mv_read_recoverable_exceptions as exc:
-        logger.warning("mv_query_failed_fallback", error=str(exc))
+    except rollup_read_recoverable_exceptions as exc:
+        logger.warning("daily_rollup_query_failed_fallback", error=str(exc))
         return await basic_breakdown_fetcher(db, tenant_id, start_date, end_date)
 
 
-async def refresh_materialized_view(
+async def reconcile_daily_aggregates(
     db: AsyncSession,
     *,
     logger: Any,
-    mv_refresh_recoverable_exceptions: tuple[type[Exception], ...],
+    lookback_days: int,
+    today: date,
+    rollup_reconcile_recoverable_exceptions: tuple[type[Exception], ...],
 ) -> bool:
-    """Manually refresh the materialized view."""
+    """Check the recent daily rollup against a full recompute and repair drift."""
     try:
-        if db.bind.dialect.name == "sqlite":
-            logger.info("materialized_view_refresh_skipped_sqlite")
-            return True
-
-        await db.execute(
-            text("REFRESH MATERIALIZED VIEW CONCURRENTLY mv_daily_cost_aggregates")
+        drift = await reconcile_daily_cost_aggregates(
+            db, start_date=today - timedelta(days=lookback_days), end_date=today
         )
+        if drift is None:
+            logger.info("daily_cost_aggregates_reconcile_skipped")
+            return True
         await db.commit()
-        logger.info("materialized_view_refreshed")
+        logger.info(
+            "daily_cost_aggregates_reconciled",
+            checked_buckets=drift.checked_buckets,
+            missing=len(drift.missing),
+            stale=len(drift.stale),
+            mismatched=len(drift.mismatched),
+        )
         return True
-    except mv_refresh_recoverable_exceptions as exc:
-        logger.error("materialized_view_refresh_failed", error=str(exc))
+    except rollup_reconcile_recoverable_exceptions as exc:
+        await db.rollback()
+        logger.error("daily_cost_aggregates_reconcile_failed", error=str(exc))
         return False
-
@@ -0,0 +1,387 @@
+"""
+Incremental maintenance of the `daily_cost_aggregates` rollup.
+
+Writers recompute only the (tenant, day, service, region) buckets they
+touched: one `INSERT ... SELECT ... GROUP BY ... ON CONFLICT DO UPDATE` over
+the bucket's `cost_records` rows, so the rollup always equals a fresh
+aggregate of the affected buckets and re-running it is harmless.
+
+On PostgreSQL each refresh first takes a transaction-scoped advisory lock per
+(tenant, day), in day order. Two ingestion transactions touching the same day
+therefore refresh one after the other, and under READ COMMITTED the second
+one's recompute statement sees the first one's committed rows. Without the
+lock both would recompute from their own snapshot and the later upsert would
+drop the other writer's records from the totals.
+
+Deletes additionally prune buckets that no longer have any records. The
+consistency checker compares the rollup against a full recompute of a date
+window and `reconcile_daily_cost_aggregates` repairs the drifted days.
+
+Only PostgreSQL and SQLite sessions are maintained; for other sessions the
+helpers are no-ops that return None/False.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from typing import Any, Iterable, Sequence
+from uuid import UUID
+
+from sqlalchemy import and_, delete, exists, func, select, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.cloud import CostRecord, DailyCostAggregate
+
+ROLLUP_DIALECTS = frozenset({"postgresql", "sqlite"})
+ROLLUP_LOCK_NAMESPACE = "daily_cost_aggregates"
+# (cost_date, service, region) inside one tenant.
+DailyCostBucket = tuple[date, str, str]
+_AGGREGATE_COLUMNS = (
+    "tenant_id",
+    "cost_date",
+    "service",
+    "region",
+    "total_cost",
+    "total_carbon",
+    "record_count",
+    "updated_at",
+)
+
+
+def rollup_dialect(db: Any) -> str | None:
+    """Dialect name when the session maintains the rollup, else None."""
+    bind = getattr(db, "bind", None)
+    name = getattr(getattr(bind, "dialect", None), "name", None)
+    if isinstance(name, str) and name.lower() in ROLLUP_DIALECTS:
+        return name.lower()
+    return None
+
+
+def _as_date(value: date | datetime) -> date:
+    return value.date() if isinstance(value, datetime) else value
+
+
+def rollup_lock_key(tenant_id: UUID, cost_date: date) -> int:
+    """Stable signed 64-bit advisory lock key for one tenant day."""
+    name = f"{ROLLUP_LOCK_NAMESPACE}:{tenant_id}:{cost_date.isoformat()}"
+    digest = hashlib.blake2b(name.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big", signed=True)
+
+
+async def _lock_rollup_days(
+    db: AsyncSession, *, tenant_id: UUID, days: Iterable[date]
+) -> None:
+    # Sorted so concurrent refreshes of overlapping days cannot deadlock.
+    for day in sorted(set(days)):
+        await db.execute(
+            select(func.pg_advisory_xact_lock(rollup_lock_key(tenant_id, day)))
+        )
+
+
+def _record_region() -> Any:
+    return func.coalesce(CostRecord.region, "")
+
+
+def _bucket_filter(
+    *,
+    tenant_id: UUID | None,
+    start_date: date | None,
+    end_date: date,
+    buckets: Sequence[DailyCostBucket] | None,
+    cost_date: Any,
+    service: Any,
+    region: Any,
+    tenant_column: Any,
+) -> Any:
+    clauses = [cost_date <= end_date]
+    if start_date is not None:
+        clauses.append(cost_date >= start_date)
+    if tenant_id is not None:
+        clauses.append(tenant_column == tenant_id)
+    if buckets:
+        clauses.append(tuple_(cost_date, service, region).in_(list(buckets)))
+    return and_(*clauses)
+
+
+def _recompute_select(
+    *,
+    tenant_id: UUID | None,
+    start_date: date,
+    end_date: date,
+    buckets: Sequence[DailyCostBucket] | None = None,
+) -> Any:
+    """Full aggregate of `cost_records` for the selected buckets."""
+    region = _record_region()
+    return (
+        select(
+            CostRecord.tenant_id,
+            CostRecord.recorded_at,
+            CostRecord.service,
+            region,
+            func.coalesce(func.sum(CostRecord.cost_usd), 0),
+            func.coalesce(func.sum(CostRecord.carbon_kg), 0),
+            func.count(),
+            func.now(),
+        )
+        .where(
+            _bucket_filter(
+                tenant_id=tenant_id,
+                start_date=start_date,
+                end_date=end_date,
+                buckets=buckets,
+                cost_date=CostRecord.recorded_at,
+                service=CostRecord.service,
+                region=region,
+                tenant_column=CostRecord.tenant_id,
+            )
+        )
+        .group_by(
+            CostRecord.tenant_id, CostRecord.recorded_at, CostRecord.service, region
+        )
+    )
+
+
+async def prune_daily_cost_aggregates(
+    db: AsyncSession,
+    *,
+    end_date: date,
+    start_date: date | None = None,
+    tenant_id: UUID | None = None,
+    buckets: Sequence[DailyCostBucket] | None = None,
+) -> int:
+    """Delete rollup buckets in the range that no longer have any records."""
+    if rollup_dialect(db) is None:
+        return 0
+    aggregate = DailyCostAggregate
+    has_records = exists().where(
+        CostRecord.tenant_id == aggregate.tenant_id,
+        CostRecord.recorded_at == aggregate.cost_date,
+        CostRecord.service == aggregate.service,
+        _record_region() == aggregate.region,
+    )
+    result = await db.execute(
+        delete(aggregate)
+        .where(
+            _bucket_filter(
+                tenant_id=tenant_id,
+                start_date=start_date,
+                end_date=end_date,
+                buckets=buckets,
+                cost_date=aggregate.cost_date,
+                service=aggregate.service,
+                region=aggregate.region,
+                tenant_column=aggregate.tenant_id,
+            ),
+            ~has_records,
+        )
+        .execution_options(synchronize_session=False)
+    )
+    return int(getattr(result, "rowcount", 0) or 0)
+
+
+async def refresh_daily_cost_aggregates(
+    db: AsyncSession,
+    *,
+    tenant_id: UUID,
+    start_date: date | datetime,
+    end_date: date | datetime,
+    buckets: Sequence[DailyCostBucket] | None = None,
+    prune_empty: bool = False,
+) -> bool:
+    """
+    Recompute the tenant's rollup buckets between two days (inclusive).
+
+    `buckets` narrows the refresh to the given (day, service, region) keys.
+    Set `prune_empty` after deletes so buckets left without records go away.
+    """
+    dialect = rollup_dialect(db)
+    if dialect is None:
+        return False
+    first, last = _as_date(start_date), _as_date(end_date)
+    if dialect == "postgresql":
+        days: Iterable[date] = (
+            [bucket[0] for bucket in buckets]
+            if buckets
+            else (first + timedelta(days=n) for n in range((last - first).days + 1))
+        )
+        await _lock_rollup_days(db, tenant_id=tenant_id, days=days)
+    insert_fn = pg_insert if dialect == "postgresql" else sqlite_insert
+    stmt = insert_fn(DailyCostAggregate).from_select(
+        list(_AGGREGATE_COLUMNS),
+        _recompute_select(
+            tenant_id=tenant_id, start_date=first, end_date=last, buckets=buckets
+        ),
+    )
+    await db.execute(
+        stmt.on_conflict_do_update(
+            index_elements=["tenant_id", "cost_date", "service", "region"],
+            set_={
+                "total_cost": stmt.excluded.total_cost,
+                "total_carbon": stmt.excluded.total_carbon,
+                "record_count": stmt.excluded.record_count,
+                "updated_at": stmt.excluded.updated_at,
+            },
+        )
+    )
+    if prune_empty:
+        await prune_daily_cost_aggregates(
+            db, tenant_id=tenant_id, start_date=first, end_date=last, buckets=buckets
+        )
+    return True
+
+
+async def refresh_daily_cost_aggregates_for_records(
+    db: AsyncSession, values: Iterable[dict[str, Any]]
+) -> int:
+    """Refresh the buckets touched by a batch of upserted cost record values."""
+    if rollup_dialect(db) is None:
+        return 0
+    touched: dict[Any, set[DailyCostBucket]] = defaultdict(set)
+    for value in values:
+        touched[value["tenant_id"]].add(
+            (
+                _as_date(value["recorded_at"]),
+                str(value["service"]),
+                str(value.get("region") or ""),
+            )
+        )
+    for tenant_id, buckets in touched.items():
+        days = [bucket[0] for bucket in buckets]
+        await refresh_daily_cost_aggregates(
+            db,
+            tenant_id=tenant_id,
+            start_date=min(days),
+            end_date=max(days),
+            buckets=sorted(buckets),
+        )
+    return sum(len(buckets) for buckets in touched.values())
+
+
+@dataclass(frozen=True)
+class DailyAggregateDrift:
+    """Rollup buckets that disagree with a full recompute of the window."""
+
+    start_date: date
+    end_date: date
+    checked_buckets: int
+    missing: tuple[tuple[Any, ...], ...] = field(default=())
+    stale: tuple[tuple[Any, ...], ...] = field(default=())
+    mismatched: tuple[tuple[Any, ...], ...] = field(default=())
+
+    @property
+    def is_consistent(self) -> bool:
+        return not (self.missing or self.stale or self.mismatched)
+
+    @property
+    def drifted_days(self) -> dict[Any, list[date]]:
+        """Drifted days per tenant id."""
+        days: dict[Any, set[date]] = defaultdict(set)
+        for tenant_id, cost_date, *_rest in (
+            *self.missing,
+            *self.stale,
+            *self.mismatched,
+        ):
+            days[tenant_id].add(cost_date)
+        return {tenant_id: sorted(values) for tenant_id, values in days.items()}
+
+
+def _totals(row: Sequence[Any]) -> tuple[Decimal, Decimal, int]:
+    cost, carbon, count = row
+    return Decimal(str(cost or 0)), Decimal(str(carbon or 0)), int(count or 0)
+
+
+async def check_daily_cost_aggregates(
+    db: AsyncSession,
+    *,
+    start_date: date,
+    end_date: date,
+    tenant_id: UUID | None = None,
+) -> DailyAggregateDrift | None:
+    """Compare the rollup with a full recompute for one tenant or all tenants."""
+    if rollup_dialect(db) is None:
+        return None
+    recompute = _recompute_select(
+        tenant_id=tenant_id, start_date=start_date, end_date=end_date
+    )
+    expected = {
+        tuple(row[:4]): _totals(row[4:7]) for row in (await db.execute(recompute)).all()
+    }
+    aggregate = DailyCostAggregate
+    stored_stmt = select(
+        aggregate.tenant_id,
+        aggregate.cost_date,
+        aggregate.service,
+        aggregate.region,
+        aggregate.total_cost,
+        aggregate.total_carbon,
+        aggregate.record_count,
+    ).where(aggregate.cost_date >= start_date, aggregate.cost_date <= end_date)
+    if tenant_id is not None:
+        stored_stmt = stored_stmt.where(aggregate.tenant_id == tenant_id)
+    stored = {
+        tuple(row[:4]): _totals(row[4:7])
+        for row in (await db.execute(stored_stmt)).all()
+    }
+    return DailyAggregateDrift(
+        start_date=start_date,
+        end_date=end_date,
+        checked_buckets=len(expected.keys() | stored.keys()),
+        missing=tuple(sorted(expected.keys() - stored.keys(), key=str)),
+        stale=tuple(sorted(stored.keys() - expected.keys(), key=str)),
+        mismatched=tuple(
+            sorted(
+                (
+                    key
+                    for key in expected.keys() & stored.keys()
+                    if expected[key] != stored[key]
+                ),
+                key=str,
+            )
+        ),
+    )
+
+
+async def reconcile_daily_cost_aggregates(
+    db: AsyncSession,
+    *,
+    start_date: date,
+    end_date: date,
+    tenant_id: UUID | None = None,
+) -> DailyAggregateDrift | None:
+    """Check the window and recompute every drifted (tenant, day)."""
+    drift = await check_daily_cost_aggregates(
+        db, start_date=start_date, end_date=end_date, tenant_id=tenant_id
+    )
+    if drift is None or drift.is_consistent:
+        return drift
+    for drifted_tenant, days in drift.drifted_days.items():
+        for day in days:
+            await refresh_daily_cost_aggregates(
+                db,
+                tenant_id=drifted_tenant,
+                start_date=day,
+                end_date=day,
+                prune_empty=True,
+            )
+    return drift
+
+
+__all__ = [
+    "DailyAggregateDrift",
+    "DailyCostBucket",
+    "ROLLUP_DIALECTS",
+    "ROLLUP_LOCK_NAMESPACE",
+    "check_daily_cost_aggregates",
+    "prune_daily_cost_aggregates",
+    "reconcile_daily_cost_aggregates",
+    "refresh_daily_cost_aggregates",
+    "refresh_daily_cost_aggregates_for_records",
+    "rollup_dialect",
+    "rollup_lock_key",
+]
@@ -10,10 +10,8 @@ This module is intentionally deterministic and does not depend on any LLMs.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
 from datetime import date, datetime, timedelta, timezone
 from decimal import Decimal
-from statistics import median
 from uuid import UUID
 
 from sqlalchemy import func, select
@@ -23,6 +21,18 @@ from sqlalchemy.ext.asyncio import AsyncSession
 import structlog
 
 from app.models.cloud import CloudAccount, CostRecord
+from app.modules.reporting.domain.anomaly_detection_range_ops import (
+    detect_daily_cost_anomalies_range,
+)
+from app.modules.reporting.domain.anomaly_detection_rules import (
+    _SEVERITY_RANK,
+    CostAnomaly,
+    DailyServiceCostRow,
+    _classify_severity,
+    _confidence,
+    _evaluate_series_day,
+    severity_gte,
+)
 from app.shared.core.cache import CacheService
 from app.shared.core.notifications import NotificationDispatcher
 
@@ -43,41 +53,6 @@ ANOMALY_DISPATCH_RECOVERABLE_EXCEPTIONS = (
 )
 
 
-@dataclass(frozen=True, slots=True)
-class DailyServiceCostRow:
-    day: date
-    provider: str
-    account_id: UUID
-    account_name: str | None
-    service: str
-    cost_usd: Decimal
-
-
-@dataclass(frozen=True, slots=True)
-class CostAnomaly:
-    day: date
-    provider: str
-    account_id: UUID
-    account_name: str | None
-    service: str
-    actual_cost_usd: Decimal
-    expected_cost_usd: Decimal
-    delta_cost_usd: Decimal
-    percent_change: float | None
-    kind: str  # new_spend | spike | drop
-    probable_cause: str
-    confidence: float  # 0..1
-    severity: str  # low | medium | high | critical
-
-
-_SEVERITY_RANK: dict[str, int] = {"low": 0, "medium": 1, "high": 2, "critical": 3}
-
-
-def severity_gte(severity: str, minimum: str) -> bool:
-    """Compare severities with a stable ordering."""
-    return _SEVERITY_RANK.get(severity, 0) >= _SEVERITY_RANK.get(minimum, 0)
-
-
 def detect_daily_cost_anomalies(
     rows: list[DailyServiceCostRow],
     *,
@@ -132,93 +107,22 @@ def detect_daily_cost_anomalies(
     anomalies: list[CostAnomaly] = []
 
     for (provider, account_id, service), by_day in series.items():
-        account_name = meta.get((provider, account_id, service), (None,))[0]
-
-        # Build baseline values with explicit zeros for missing days.
-        baseline_values = [Decimal(by_day.get(day, 0)) for day in baseline_days]
-        active_days = sum(1 for v in baseline_values if v > 0)
-
-        # If the service barely shows up in the lookback window, avoid "drop" spam.
-        # We still allow "new_spend" based on expected==0.
-        weekday_values = [
-            Decimal(by_day.get(day, 0))
-            for day in baseline_days
-            if day.weekday() == target_date.weekday()
-        ]
-        all_values = baseline_values
-
-        if len(weekday_values) >= min_weekday_samples:
-            expected = median(weekday_values)
-        else:
-            expected = median(all_values) if all_values else Decimal("0")
-
-        actual = Decimal(by_day.get(target_date, 0))
-        delta = actual - expected
-
-        percent_change: float | None
-        if expected > 0:
-            percent_change = float((delta / expected) * Decimal("100"))
-        else:
-            percent_change = None
-
-        delta_abs = abs(delta)
-        percent_abs = abs(percent_change) if percent_change is not None else 0.0
-
-        kind: str | None = None
-        probable_cause: str | None = None
-
-        if expected == 0:
-            if actual >= min_abs_usd:
-                kind = "new_spend"
-                probable_cause = "new_service_spend"
-        else:
-            if (
-                delta >= min_abs_usd
-                and percent_change is not None
-                and percent_change >= min_percent
-            ):
-                kind = "spike"
-                probable_cause = "spend_spike"
-            elif (
-                delta <= -min_abs_usd
-                and percent_change is not None
-                and percent_change <= -min_percent
-                and active_days >= min_active_days
-            ):
-                kind = "drop"
-                probable_cause = "spend_drop"
-
-        if not kind or not probable_cause:
-            continue
-
-        severity = _classify_severity(delta_abs=delta_abs, percent_abs=percent_abs)
-        confidence = _confidence(
-            kind=kind,
-            active_days=active_days,
+        anomaly = _evaluate_series_day(
+            provider=provider,
+            account_id=account_id,
+            account_name=meta.get((provider, account_id, service), (None,))[0],
+            service=service,
+            by_day=by_day,
+            baseline_days=baseline_days,
+            target_date=target_date,
             lookback_days=lookback_days,
-            percent_abs=percent_abs,
+            min_abs_usd=min_abs_usd,
             min_percent=min_percent,
+            min_weekday_samples=min_weekday_samples,
+            min_active_days=min_active_days,
         )
-
-        anomalies.append(
-            CostAnomaly(
-                day=target_date,
-                provider=provider,
-                account_id=account_id,
-                account_name=account_name,
-                service=service,
-                actual_cost_usd=actual,
-                expected_cost_usd=expected,
-                delta_cost_usd=delta,
-                percent_change=None
-                if percent_change is None
-                else round(percent_change, 2),
-                kind=kind,
-                probable_cause=probable_cause,
-                confidence=confidence,
-                severity=severity,
-            )
-        )
+        if anomaly is not None:
+            anomalies.append(anomaly)
 
     # Deterministic ordering: highest severity first, then largest delta.
     anomalies.sort(
@@ -228,37 +132,6 @@ def detect_daily_cost_anomalies(
     return anomalies
 
 
-def _classify_severity(*, delta_abs: Decimal, percent_abs: float) -> str:
-    # These thresholds are intentionally simple and deterministic.
-    if delta_abs >= Decimal("1000") or percent_abs >= 500:
-        return "critical"
-    if delta_abs >= Decimal("250") or percent_abs >= 200:
-        return "high"
-    if delta_abs >= Decimal("100") or percent_abs >= 100:
-        return "medium"
-    return "low"
-
-
-def _confidence(
-    *,
-    kind: str,
-    active_days: int,
-    lookback_days: int,
-    percent_abs: float,
-    min_percent: float,
-) -> float:
-    # Confidence reflects: signal strength (how far past threshold) and baseline depth.
-    if kind == "new_spend":
-        return 0.9 if lookback_days >= 14 else 0.7
-
-    baseline_factor = min(1.0, active_days / 7.0) if active_days > 0 else 0.2
-    strength = percent_abs / max(min_percent, 1.0)
-    strength_factor = min(1.0, strength / 2.0)  # threshold => ~0.5, 2x => 1.0
-
-    score = max(0.1, min(1.0, baseline_factor * strength_factor))
-    return round(score, 2)
-
-
 class CostAnomalyDetectionService:
     """DB-backed deterministic anomaly detection service."""
 
@@ -346,6 +219,35 @@ class CostAnomalyDetectionService:
         )
         return [item for item in anomalies if severity_gte(item.severity, min_severity)]
 
+    async def detect_range(
+        self,
+        *,
+        tenant_id: UUID,
+        start_date: date,
+        end_date: date,
+        provider: str | None = None,
+        lookback_days: int = 28,
+        min_abs_usd: Decimal = Decimal("25"),
+        min_percent: float = 30.0,
+        min_severity: str = "medium",
+    ) -> list[CostAnomaly]:
+        """Backfill `detect` for every day in the range with one fetch and pass."""
+        rows = await self.fetch_daily_service_costs(
+            tenant_id=tenant_id,
+            start_date=start_date - timedelta(days=lookback_days),
+            end_date=end_date,
+            provider=provider,
+        )
+        anomalies = detect_daily_cost_anomalies_range(
+            rows,
+            start_date=start_date,
+            end_date=end_date,
+            lookback_days=lookback_days,
+            min_abs_usd=min_abs_usd,
+            min_percent=min_percent,
+        )
+        return [item for item in anomalies if severity_gte(item.severity, min_severity)]
+
 
 async def dispatch_cost_anomaly_alerts(
     *,
@@ -478,3 +380,18 @@ async def dispatch_cost_anomaly_alerts(
             logger.debug("anomaly_dispatch_item_failed", error=str(e), exc_info=True)
             continue
     return alerted
+
+
+__all__ = [
+    "ANOMALY_DISPATCH_RECOVERABLE_EXCEPTIONS",
+    "ANOMALY_JIRA_BOOTSTRAP_RECOVERABLE_EXCEPTIONS",
+    "CostAnomaly",
+    "CostAnomalyDetectionService",
+    "DailyServiceCostRow",
+    "_classify_severity",
+    "_confidence",
+    "detect_daily_cost_anomalies",
+    "detect_daily_cost_anomalies_range",
+    "dispatch_cost_anomaly_alerts",
+    "severity_gte",
+]
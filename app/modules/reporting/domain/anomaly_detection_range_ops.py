@@ -0,0 +1,176 @@
+"""
+Multi-day cost anomaly detection over a date x series matrix.
+
+Backfilling anomalies one `target_date` at a time refetches the same rows and
+recomputes the same Decimal medians once per day. Here the daily rows are
+pivoted into a `(series, day)` float matrix once, and weekday medians, deltas
+and active-day counts for every target date are computed in one vectorized
+pass. That pass is only a screen: each (series, day) pair it cannot rule out
+is re-scored with the exact Decimal rules of `detect_daily_cost_anomalies`,
+so severity, confidence and every reported amount match the per-date path.
+"""
+
+from __future__ import annotations
+
+from datetime import date, timedelta
+from decimal import Decimal
+from uuid import UUID
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from app.modules.reporting.domain.anomaly_detection_rules import (
+    _SEVERITY_RANK,
+    CostAnomaly,
+    DailyServiceCostRow,
+    _evaluate_series_day,
+)
+
+# Relative slack for the float screen; exact Decimal scoring makes the final call.
+_SCREEN_RTOL = 1e-9
+
+SeriesKey = tuple[str, UUID, str]
+
+
+def _rolling_medians(
+    matrix: np.ndarray,
+    targets: np.ndarray,
+    *,
+    lookback_days: int,
+    min_weekday_samples: int,
+) -> np.ndarray:
+    """Expected cost per (series, target): weekday median, else window median."""
+    weekday_samples = lookback_days // 7
+    if weekday_samples >= min_weekday_samples:
+        offsets = 7 * np.arange(1, weekday_samples + 1)
+        weekday_values = matrix[:, targets[:, None] - offsets[None, :]]
+        return np.asarray(np.median(weekday_values, axis=2), dtype=float)
+    windows = sliding_window_view(matrix, lookback_days, axis=1)
+    return np.asarray(
+        np.median(windows[:, targets - lookback_days, :], axis=2), dtype=float
+    )
+
+
+def detect_daily_cost_anomalies_range(
+    rows: list[DailyServiceCostRow],
+    *,
+    start_date: date,
+    end_date: date,
+    lookback_days: int = 28,
+    min_abs_usd: Decimal = Decimal("25"),
+    min_percent: float = 30.0,
+    min_weekday_samples: int = 2,
+    min_active_days: int = 3,
+) -> list[CostAnomaly]:
+    """
+    Detect anomalies for every day in `[start_date, end_date]`.
+
+    `rows` must cover `start_date - lookback_days` through `end_date`. Results
+    are ordered by day, and within a day exactly as
+    `detect_daily_cost_anomalies` orders them.
+    """
+    if lookback_days < 7:
+        raise ValueError("lookback_days must be >= 7")
+    if min_percent <= 0:
+        raise ValueError("min_percent must be > 0")
+    if end_date < start_date:
+        raise ValueError("end_date must be >= start_date")
+
+    calendar_start = start_date - timedelta(days=lookback_days)
+    n_days = (end_date - calendar_start).days + 1
+
+    key_index: dict[SeriesKey, int] = {}
+    exact: list[dict[date, Decimal]] = []
+    # (row position, day, account name) per series, in input order.
+    appearances: list[list[tuple[int, date, str | None]]] = []
+    for position, r in enumerate(rows):
+        if r.day < calendar_start or r.day > end_date:
+            continue
+        provider = (r.provider or "").strip().lower() or "unknown"
+        key = (provider, r.account_id, (r.service or "Unknown").strip() or "Unknown")
+        index = key_index.setdefault(key, len(exact))
+        if index == len(exact):
+            exact.append({})
+            appearances.append([])
+        exact[index][r.day] = Decimal(r.cost_usd or 0)
+        appearances[index].append((position, r.day, r.account_name))
+    if not exact:
+        return []
+
+    matrix = np.zeros((len(exact), n_days))
+    present = np.zeros((len(exact), n_days), dtype=bool)
+    for index, by_day in enumerate(exact):
+        columns = [(day - calendar_start).days for day in by_day]
+        matrix[index, columns] = [float(value) for value in by_day.values()]
+        present[index, columns] = True
+
+    targets = np.arange(lookback_days, n_days)
+    zeros = np.zeros((len(exact), 1), dtype=np.int64)
+    seen_cum = np.concatenate([zeros, np.cumsum(present, axis=1)], axis=1)
+    # A series is scored on day t only if it has a row in [t - lookback, t].
+    in_window = (seen_cum[:, targets + 1] - seen_cum[:, targets - lookback_days]) > 0
+
+    expected = _rolling_medians(
+        matrix,
+        targets,
+        lookback_days=lookback_days,
+        min_weekday_samples=min_weekday_samples,
+    )
+    actual = matrix[:, targets]
+    delta = np.abs(actual - expected)
+    # Float slack proportional to magnitude, so rounding never hides a candidate.
+    slack = _SCREEN_RTOL * (np.abs(actual) + np.abs(expected) + 1.0)
+    abs_floor = float(min_abs_usd) - slack
+    new_spend = (np.abs(expected) <= slack) & (actual >= abs_floor)
+    moved = (
+        (expected > 0)
+        & (delta >= abs_floor)
+        & (delta * 100.0 >= min_percent * expected - 100.0 * slack)
+    )
+    candidates = np.argwhere(in_window & (new_spend | moved))
+
+    by_target: dict[int, list[tuple[int, CostAnomaly]]] = {}
+    keys = list(key_index)
+    for series_index, target_offset in candidates.tolist():
+        target_date = start_date + timedelta(days=target_offset)
+        window_start = target_date - timedelta(days=lookback_days)
+        first_position, account_name = next(
+            (position, name)
+            for position, day, name in appearances[series_index]
+            if window_start <= day <= target_date
+        )
+        provider, account_id, service = keys[series_index]
+        anomaly = _evaluate_series_day(
+            provider=provider,
+            account_id=account_id,
+            account_name=account_name,
+            service=service,
+            by_day=exact[series_index],
+            baseline_days=[
+                window_start + timedelta(days=offset) for offset in range(lookback_days)
+            ],
+            target_date=target_date,
+            lookback_days=lookback_days,
+            min_abs_usd=min_abs_usd,
+            min_percent=min_percent,
+            min_weekday_samples=min_weekday_samples,
+            min_active_days=min_active_days,
+        )
+        if anomaly is not None:
+            by_target.setdefault(target_offset, []).append((first_position, anomaly))
+
+    anomalies: list[CostAnomaly] = []
+    for target_offset in sorted(by_target):
+        # Input order first, then the single-day sort (stable, like the scalar path).
+        day_anomalies = [
+            item for _pos, item in sorted(by_target[target_offset], key=lambda p: p[0])
+        ]
+        day_anomalies.sort(
+            key=lambda a: (_SEVERITY_RANK.get(a.severity, 0), abs(a.delta_cost_usd)),
+            reverse=True,
+        )
+        anomalies.extend(day_anomalies)
+    return anomalies
+
+
+__all__ = ["detect_daily_cost_anomalies_range"]
@@ -0,0 +1,190 @@
+"""
+Pure per-series rules for deterministic cost anomaly detection.
+
+Shared by the single-day detector in `anomaly_detection` and the multi-day
+matrix detector in `anomaly_detection_range_ops`, so both classify a
+(series, day) pair identically.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date
+from decimal import Decimal
+from statistics import median
+from uuid import UUID
+
+
+@dataclass(frozen=True, slots=True)
+class DailyServiceCostRow:
+    day: date
+    provider: str
+    account_id: UUID
+    account_name: str | None
+    service: str
+    cost_usd: Decimal
+
+
+@dataclass(frozen=True, slots=True)
+class CostAnomaly:
+    day: date
+    provider: str
+    account_id: UUID
+    account_name: str | None
+    service: str
+    actual_cost_usd: Decimal
+    expected_cost_usd: Decimal
+    delta_cost_usd: Decimal
+    percent_change: float | None
+    kind: str  # new_spend | spike | drop
+    probable_cause: str
+    confidence: float  # 0..1
+    severity: str  # low | medium | high | critical
+
+
+_SEVERITY_RANK: dict[str, int] = {"low": 0, "medium": 1, "high": 2, "critical": 3}
+
+
+def severity_gte(severity: str, minimum: str) -> bool:
+    """Compare severities with a stable ordering."""
+    return _SEVERITY_RANK.get(severity, 0) >= _SEVERITY_RANK.get(minimum, 0)
+
+
+def _evaluate_series_day(
+    *,
+    provider: str,
+    account_id: UUID,
+    account_name: str | None,
+    service: str,
+    by_day: dict[date, Decimal],
+    baseline_days: list[date],
+    target_date: date,
+    lookback_days: int,
+    min_abs_usd: Decimal,
+    min_percent: float,
+    min_weekday_samples: int,
+    min_active_days: int,
+) -> CostAnomaly | None:
+    """Classify one series on `target_date`; shared with the multi-day detector."""
+    # Build baseline values with explicit zeros for missing days.
+    baseline_values = [Decimal(by_day.get(day, 0)) for day in baseline_days]
+    active_days = sum(1 for v in baseline_values if v > 0)
+
+    # If the service barely shows up in the lookback window, avoid "drop" spam.
+    # We still allow "new_spend" based on expected==0.
+    weekday_values = [
+        Decimal(by_day.get(day, 0))
+        for day in baseline_days
+        if day.weekday() == target_date.weekday()
+    ]
+    all_values = baseline_values
+
+    if len(weekday_values) >= min_weekday_samples:
+        expected = median(weekday_values)
+    else:
+        expected = median(all_values) if all_values else Decimal("0")
+
+    actual = Decimal(by_day.get(target_date, 0))
+    delta = actual - expected
+
+    percent_change: float | None
+    if expected > 0:
+        percent_change = float((delta / expected) * Decimal("100"))
+    else:
+        percent_change = None
+
+    delta_abs = abs(delta)
+    percent_abs = abs(percent_change) if percent_change is not None else 0.0
+
+    kind: str | None = None
+    probable_cause: str | None = None
+
+    if expected == 0:
+        if actual >= min_abs_usd:
+            kind = "new_spend"
+            probable_cause = "new_service_spend"
+    else:
+        if (
+            delta >= min_abs_usd
+            and percent_change is not None
+            and percent_change >= min_percent
+        ):
+            kind = "spike"
+            probable_cause = "spend_spike"
+        elif (
+            delta <= -min_abs_usd
+            and percent_change is not None
+            and percent_change <= -min_percent
+            and active_days >= min_active_days
+        ):
+            kind = "drop"
+            probable_cause = "spend_drop"
+
+    if not kind or not probable_cause:
+        return None
+
+    severity = _classify_severity(delta_abs=delta_abs, percent_abs=percent_abs)
+    confidence = _confidence(
+        kind=kind,
+        active_days=active_days,
+        lookback_days=lookback_days,
+        percent_abs=percent_abs,
+        min_percent=min_percent,
+    )
+
+    return CostAnomaly(
+        day=target_date,
+        provider=provider,
+        account_id=account_id,
+        account_name=account_name,
+        service=service,
+        actual_cost_usd=actual,
+        expected_cost_usd=expected,
+        delta_cost_usd=delta,
+        percent_change=None if percent_change is None else round(percent_change, 2),
+        kind=kind,
+        probable_cause=probable_cause,
+        confidence=confidence,
+        severity=severity,
+    )
+
+
+def _classify_severity(*, delta_abs: Decimal, percent_abs: float) -> str:
+    # These thresholds are intentionally simple and deterministic.
+    if delta_abs >= Decimal("1000") or percent_abs >= 500:
+        return "critical"
+    if delta_abs >= Decimal("250") or percent_abs >= 200:
+        return "high"
+    if delta_abs >= Decimal("100") or percent_abs >= 100:
+        return "medium"
+    return "low"
+
+
+def _confidence(
+    *,
+    kind: str,
+    active_days: int,
+    lookback_days: int,
+    percent_abs: float,
+    min_percent: float,
+) -> float:
+    # Confidence reflects: signal strength (how far past threshold) and baseline depth.
+    if kind == "new_spend":
+        return 0.9 if lookback_days >= 14 else 0.7
+
+    baseline_factor = min(1.0, active_days / 7.0) if active_days > 0 else 0.2
+    strength = percent_abs / max(min_percent, 1.0)
+    strength_factor = min(1.0, strength / 2.0)  # threshold => ~0.5, 2x => 1.0
+
+    score = max(0.1, min(1.0, baseline_factor * strength_factor))
+    return round(score, 2)
+
+
+__all__ = [
+    "CostAnomaly",
+    "DailyServiceCostRow",
+    "_classify_severity",
+    "_confidence",
+    "_evaluate_series_day",
+    "severity_gte",
+]
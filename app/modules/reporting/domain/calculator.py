@@ -36,6 +36,10 @@ from app.modules.reporting.domain.carbon_factor_catalog import (
     carbon_assurance_snapshot,
     compute_carbon_factor_checksum,
 )
+from app.modules.reporting.domain.carbon_columnar_ops import (
+    CarbonCostColumns,
+    EnergyFactorLookup,
+)
 
 logger = structlog.get_logger()
 
@@ -92,6 +96,7 @@ class CarbonCalculator:
             payload.get("methodology_version") or CARBON_METHODOLOGY_VERSION
         )
         self._factors_checksum = compute_carbon_factor_checksum(payload)
+        self._factor_lookup = EnergyFactorLookup(self._energy_factors)
 
     def _normalize_provider(self, provider: str | None) -> str:
         provider_key = (provider or "generic").strip().lower()
@@ -120,8 +125,7 @@ class CarbonCalculator:
         provider: str = "generic",
     ) -> Dict[str, Any]:
         """Cost-proxy calculation for grouped/flat usage inputs."""
-        total_cost_usd = Decimal("0")
-        total_energy_kwh = Decimal("0")
+        columns = CarbonCostColumns(self._factor_lookup)
 
         for record in cost_data:
             try:
@@ -135,22 +139,16 @@ class CarbonCalculator:
                             .get("Amount", "0")
                         )
                         if cost_amount > 0:
-                            total_cost_usd += cost_amount
-                            energy_factor = self._resolve_energy_factor(
-                                provider, service
-                            )
-                            total_energy_kwh += cost_amount * energy_factor
+                            columns.add_cost(provider, service, cost_amount)
                 elif "cost_usd" in record:
                     # Normalized adapter payload (AWS/Azure/GCP/SaaS/license).
                     cost_amount = Decimal(str(record.get("cost_usd", "0")))
                     if cost_amount > 0:
-                        total_cost_usd += cost_amount
-                        service = str(record.get("service") or "default")
-                        row_provider = str(record.get("provider") or provider)
-                        energy_factor = self._resolve_energy_factor(
-                            row_provider, service
+                        columns.add_cost(
+                            str(record.get("provider") or provider),
+                            str(record.get("service") or "default"),
+                            cost_amount,
                         )
-                        total_energy_kwh += cost_amount * energy_factor
                 else:
                     cost_amount = Decimal(
                         record.get("Total", {})
@@ -158,13 +156,12 @@ class CarbonCalculator:
                         .get("Amount", "0")
                     )
                     if cost_amount > 0:
-                        total_cost_usd += cost_amount
-                        energy_factor = self._resolve_energy_factor(provider, None)
-                        total_energy_kwh += cost_amount * energy_factor
+                        columns.add_cost(provider, None, cost_amount)
             except (KeyError, TypeError, ValueError) as exc:
                 logger.warning("carbon_calc_skip_record", error=str(exc))
                 continue
 
+        total_cost_usd, total_energy_kwh = columns.totals()
         return self._finalize_calculation(
             total_cost_usd, total_energy_kwh, region, provider
         )
@@ -179,28 +176,27 @@ class CarbonCalculator:
         High-precision calculation from record objects.
         Uses amount_raw when available as higher-fidelity signal.
         """
-        total_cost_usd = Decimal("0")
-        total_energy_kwh = Decimal("0")
+        columns = CarbonCostColumns(self._factor_lookup)
+        vcpu_usage: dict[tuple[Any, Any], bool] = {}
 
         for record in records:
             record_provider = str(getattr(record, "provider", provider) or provider)
-            total_cost_usd += record.cost_usd
-
-            if record.amount_raw and record.amount_raw > 0:
+            amount_raw = record.amount_raw
+            if amount_raw and amount_raw > 0:
                 # Example refinement for explicit EC2 vCPU-hours usage.
-                if "EC2" in record.service and "vCPU-Hours" in str(record.usage_type):
-                    total_energy_kwh += record.amount_raw * Decimal("0.010")
-                else:
-                    energy_factor = self._resolve_energy_factor(
-                        record_provider, record.service
+                usage_key = (record.service, record.usage_type)
+                is_vcpu = vcpu_usage.get(usage_key)
+                if is_vcpu is None:
+                    is_vcpu = vcpu_usage[usage_key] = (
+                        "EC2" in record.service
+                        and "vCPU-Hours" in str(record.usage_type)
                     )
-                    total_energy_kwh += record.cost_usd * energy_factor
-            else:
-                energy_factor = self._resolve_energy_factor(
-                    record_provider, record.service
-                )
-                total_energy_kwh += record.cost_usd * energy_factor
+                if is_vcpu:
+                    columns.add_vcpu_usage(record.cost_usd, amount_raw)
+                    continue
+            columns.add_cost(record_provider, record.service, record.cost_usd)
 
+        total_cost_usd, total_energy_kwh = columns.totals()
         return self._finalize_calculation(
             total_cost_usd, total_energy_kwh, region, provider
         )
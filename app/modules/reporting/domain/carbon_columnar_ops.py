@@ -0,0 +1,113 @@
+"""
+Columnar energy totals for the carbon calculator.
+
+Instead of resolving an energy factor and doing `Decimal` arithmetic per
+record, the calculator collects cost columns grouped by the raw
+(provider, service) pair. Factors come from `EnergyFactorLookup`, which
+precompiles the provider factor tables into `Decimal` lookups keyed by
+normalized provider and service and resolves each distinct pair once. Energy
+is then `sum(factor * sum(costs))` over the groups.
+
+Rounding tolerance: the totals are exact `Decimal` sums, so they equal the
+per-record loop digit for digit (and keep the same methodology input
+checksum) as long as no intermediate needs more than the 28 significant
+digits of the default decimal context. Beyond that, the grouped and
+per-record sums can differ by one unit in the 28th significant digit.
+"""
+
+from __future__ import annotations
+
+from decimal import Decimal
+from typing import Any, Mapping
+
+from app.modules.reporting.domain.carbon_factor_catalog import (
+    AWS_SERVICE_ENERGY_FACTORS,
+    GENERIC_SERVICE_ENERGY_FACTORS,
+)
+
+# Energy per vCPU-hour for explicit EC2 usage rows (kWh).
+EC2_VCPU_HOUR_ENERGY_KWH = Decimal("0.010")
+
+
+class EnergyFactorLookup:
+    """Precompiled `Decimal` energy factors keyed by provider and service."""
+
+    def __init__(self, energy_factors: Mapping[str, Mapping[str, Any]]) -> None:
+        self._tables: dict[str, dict[str, Decimal]] = {
+            provider: {service: Decimal(str(value)) for service, value in table.items()}
+            for provider, table in energy_factors.items()
+        }
+        self._aws_fallback = {
+            service: Decimal(str(value))
+            for service, value in AWS_SERVICE_ENERGY_FACTORS.items()
+        }
+        self._generic_default = Decimal(str(GENERIC_SERVICE_ENERGY_FACTORS["default"]))
+        self._resolved: dict[tuple[Any, Any], Decimal] = {}
+
+    def normalize_provider(self, provider: str | None) -> str:
+        provider_key = (provider or "generic").strip().lower()
+        return provider_key if provider_key in self._tables else "generic"
+
+    def factor(self, provider: str | None, service: str | None) -> Decimal:
+        """Same resolution order as `CarbonCalculator._resolve_energy_factor`."""
+        key = (provider, service)
+        cached = self._resolved.get(key)
+        if cached is not None:
+            return cached
+        table = self._tables[self.normalize_provider(provider)]
+        service_key = str(service or "default")
+        if service_key in table:
+            resolved = table[service_key]
+        elif service_key in self._aws_fallback:
+            resolved = self._aws_fallback[service_key]
+        else:
+            resolved = table.get("default", self._generic_default)
+        self._resolved[key] = resolved
+        return resolved
+
+
+class CarbonCostColumns:
+    """Cost columns grouped by (provider, service), plus direct energy inputs."""
+
+    def __init__(self, lookup: EnergyFactorLookup) -> None:
+        self._lookup = lookup
+        self.grouped_costs: dict[tuple[Any, Any], list[Any]] = {}
+        self.vcpu_costs: list[Any] = []
+        self.vcpu_hours: list[Any] = []
+
+    def add_cost(self, provider: Any, service: Any, cost: Any) -> None:
+        """A cost that counts toward spend and cost-proxy energy."""
+        key = (provider, service)
+        group = self.grouped_costs.get(key)
+        if group is None:
+            # Resolve (and validate) the factor when the pair is first seen,
+            # so a lookup error surfaces at the offending record.
+            self._lookup.factor(provider, service)
+            group = self.grouped_costs[key] = []
+        group.append(cost)
+
+    def add_vcpu_usage(self, cost: Any, vcpu_hours: Any) -> None:
+        """A cost whose energy comes from explicit EC2 vCPU-hours."""
+        self.vcpu_costs.append(cost)
+        self.vcpu_hours.append(vcpu_hours)
+
+    def totals(self) -> tuple[Decimal, Decimal]:
+        """(total cost, total energy in kWh before PUE)."""
+        total_cost = sum(self.vcpu_costs, Decimal("0"))
+        total_energy = Decimal("0")
+        for (provider, service), costs in self.grouped_costs.items():
+            group_cost = sum(costs, Decimal("0"))
+            total_cost += group_cost
+            total_energy += group_cost * self._lookup.factor(provider, service)
+        if self.vcpu_hours:
+            total_energy += (
+                sum(self.vcpu_hours, Decimal("0")) * EC2_VCPU_HOUR_ENERGY_KWH
+            )
+        return total_cost, total_energy
+
+
+__all__ = [
+    "CarbonCostColumns",
+    "EC2_VCPU_HOUR_ENERGY_KWH",
+    "EnergyFactorLookup",
+]
@@ -6,7 +6,7 @@ Supports both daily and hourly granularity.
 """
 
 from typing import Any, AsyncIterable
-from datetime import date, datetime, timezone
+from datetime import date, datetime, timedelta, timezone
 import uuid
 from decimal import Decimal, InvalidOperation
 from sqlalchemy import delete
@@ -26,6 +26,11 @@ from app.modules.reporting.domain.persistence_adjustment_ops import (
 from app.modules.reporting.domain.persistence_upsert_ops import (
     bulk_upsert as _bulk_upsert_impl,
 )
+from app.modules.reporting.domain.aggregator_daily_rollup_ops import (
+    prune_daily_cost_aggregates as _prune_daily_cost_aggregates_impl,
+    refresh_daily_cost_aggregates as _refresh_daily_cost_aggregates_impl,
+    refresh_daily_cost_aggregates_for_records as _refresh_touched_aggregates_impl,
+)
 
 logger = structlog.get_logger()
 
@@ -199,6 +204,8 @@ class CostPersistenceService:
                 ingestion_meta["api_request_id"] = str(reconciliation_run_id)
             if isinstance(r.get("tags"), dict):
                 ingestion_meta["tags"] = r["tags"]
+            if isinstance(r.get("fx_snapshot"), dict):
+                ingestion_meta["fx_snapshot"] = r["fx_snapshot"]
             resource_id = r.get("resource_id")
             if resource_id not in (None, ""):
                 ingestion_meta["resource_id"] = str(resource_id)
@@ -279,6 +286,8 @@ class CostPersistenceService:
     async def _bulk_upsert(self, values: list[dict[str, Any]]) -> None:
         """Helper for PostgreSQL ON CONFLICT DO UPDATE bulk insert."""
         await _bulk_upsert_impl(self.db, values)
+        # Keep the daily rollup in step with only the buckets this batch touched.
+        await _refresh_touched_aggregates_impl(self.db, values)
 
     async def _check_for_significant_adjustments(
         self,
@@ -312,17 +321,32 @@ class CostPersistenceService:
             CostRecord.timestamp <= end_date,
         )
         await self.db.execute(stmt)
+        if isinstance(tenant_scoped, uuid.UUID):
+            await _refresh_daily_cost_aggregates_impl(
+                self.db,
+                tenant_id=tenant_scoped,
+                start_date=start_date,
+                end_date=end_date,
+                prune_empty=True,
+            )
 
     async def cleanup_old_records(self, days_retention: int = 365) -> dict[str, int]:
         """
         Deletes cost records older than the specified retention period in small batches.
         Optimized for space reclamation without long-running database locks.
+
+        On partitioned Postgres this commits the session's open transaction
+        before expired partitions are dropped.
         """
-        return await _cleanup_old_cost_records_impl(
+        result = await _cleanup_old_cost_records_impl(
             self.db,
             days_retention=days_retention,
             logger_obj=logger,
         )
+        await _prune_daily_cost_aggregates_impl(
+            self.db, end_date=date.today() - timedelta(days=days_retention)
+        )
+        return result
 
     async def cleanup_expired_records_by_plan(
         self,
@@ -335,15 +359,28 @@ class CostPersistenceService:
         Deletes retained cost records according to the tenant's pricing tier.
 
         This keeps runtime enforcement aligned with the commercial retention
-        contract instead of using a single global retention threshold.
+        contract instead of using a single global retention threshold. On
+        partitioned Postgres this commits the session's open transaction before
+        expired partitions are dropped.
         """
-        return await _cleanup_expired_cost_records_by_plan_impl(
+        result = await _cleanup_expired_cost_records_by_plan_impl(
             self.db,
             batch_size=batch_size,
             max_batches=max_batches,
             as_of_date=as_of_date,
             logger_obj=logger,
         )
+        for report in result.get("tenant_reports") or []:
+            oldest = report.get("oldest_recorded_at")
+            newest = report.get("newest_recorded_at")
+            if oldest and newest:
+                await _prune_daily_cost_aggregates_impl(
+                    self.db,
+                    tenant_id=self._coerce_uuid(report["tenant_id"], "tenant_id"),
+                    start_date=date.fromisoformat(str(oldest)),
+                    end_date=date.fromisoformat(str(newest)),
+                )
+        return result
 
     async def finalize_batch(
         self, days_ago: int = 2, tenant_id: str | None = None
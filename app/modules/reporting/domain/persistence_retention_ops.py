@@ -3,11 +3,16 @@ from __future__ import annotations
 from datetime import date, datetime, timedelta, timezone
 from typing import Any
 
-from sqlalchemy import delete, select, update
+from sqlalchemy import delete, func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.cloud import CostRecord
 from app.models.tenant import Tenant
+from app.modules.reporting.domain.persistence_retention_partition_ops import (
+    drop_expired_partitions,
+    drop_expired_partitions_by_plan,
+    record_tenant_deletion,
+)
 from app.shared.core.pricing import get_tier_limit, normalize_tier
 
 
@@ -30,11 +35,21 @@ async def cleanup_old_cost_records(
     days_retention: int,
     logger_obj: Any,
 ) -> dict[str, int]:
-    """Delete old cost records in bounded batches to avoid long locks."""
+    """
+    Delete old cost records, dropping fully expired partitions first.
+
+    Remaining rows (boundary partition or unpartitioned backends) are deleted in
+    bounded batches to avoid long locks.
+    """
     cutoff_date = datetime.combine(
         date.today() - timedelta(days=days_retention), datetime.min.time()
     ).replace(tzinfo=timezone.utc)
     total_deleted = 0
+    partition_summary = await drop_expired_partitions(
+        db, cutoff_date=cutoff_date.date(), logger_obj=logger_obj
+    )
+    if partition_summary is not None:
+        total_deleted += int(partition_summary["deleted_count"])
     batch_size = 5000
     while True:
         select_stmt = (
@@ -60,6 +75,58 @@ async def cleanup_old_cost_records(
     return {"deleted_count": total_deleted}
 
 
+def _next_month(day: date) -> date:
+    return (day.replace(day=1) + timedelta(days=32)).replace(day=1)
+
+
+async def _delete_tenant_day_ranges(
+    db: AsyncSession,
+    *,
+    tenant_id: Any,
+    oldest: date,
+    newest: date,
+    row_count: int,
+    batch_size: int,
+    max_batches: int,
+) -> tuple[int, date | None, int]:
+    """
+    Delete one tenant's expired rows with set-based DELETEs over day ranges.
+
+    Each range holds about `batch_size` rows at the tenant's average daily
+    volume and never crosses a month, so on partitioned Postgres every
+    statement touches a single partition. Returns the deleted row count, the
+    last day covered and the number of statements run.
+    """
+    span_days = (newest - oldest).days + 1
+    rows_per_day = max(1, -(-row_count // span_days))
+    window_days = max(1, batch_size // rows_per_day)
+    deleted = 0
+    batches = 0
+    last_day: date | None = None
+    start = oldest
+    while start <= newest and batches < max_batches:
+        end = min(
+            start + timedelta(days=window_days),
+            _next_month(start),
+            newest + timedelta(days=1),
+        )
+        result = await db.execute(
+            delete(CostRecord)
+            .where(
+                CostRecord.tenant_id == tenant_id,
+                CostRecord.recorded_at >= start,
+                CostRecord.recorded_at < end,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        await db.flush()
+        deleted += int(getattr(result, "rowcount", 0) or 0)
+        batches += 1
+        last_day = end - timedelta(days=1)
+        start = end
+    return deleted, last_day, batches
+
+
 async def cleanup_expired_cost_records_by_plan(
     db: AsyncSession,
     *,
@@ -70,6 +137,13 @@ async def cleanup_expired_cost_records_by_plan(
 ) -> dict[str, Any]:
     """
     Delete retained cost records according to tenant plan retention windows.
+
+    On partitioned Postgres fully expired partitions are dropped first, each in
+    its own short transaction; this commits the session's open transaction
+    before the first partition is touched. The remaining expired rows are
+    deleted per tenant with set-based `DELETE ... WHERE tenant_id = :t AND
+    recorded_at` day-range statements of about `batch_size` rows, at most
+    `max_batches` statements per tier, on every backend.
     """
     resolved_batch_size = coerce_positive_int(
         batch_size,
@@ -102,70 +176,78 @@ async def cleanup_expired_cost_records_by_plan(
             str(raw_plan)
         )
 
-    total_deleted = 0
-    total_batches = 0
+    partition_summary = await drop_expired_partitions_by_plan(
+        db,
+        retention_groups=retention_groups,
+        target_date=target_date,
+        logger_obj=logger_obj,
+    )
+    partitions_dropped: list[str] = []
     tier_deleted_counts: dict[str, int] = {}
     tenant_reports: dict[str, dict[str, Any]] = {}
+    total_deleted = 0
+    if partition_summary is not None:
+        partitions_dropped = list(partition_summary["partitions_dropped"])
+        tier_deleted_counts = dict(partition_summary["tiers"])
+        tenant_reports = {
+            str(report["tenant_id"]): dict(report)
+            for report in partition_summary["tenant_reports"]
+        }
+        total_deleted = int(partition_summary["deleted_count"])
+    total_batches = 0
 
     for (tier_name, retention_days), plan_values in sorted(retention_groups.items()):
         cutoff_date = target_date - timedelta(days=retention_days)
         tier_deleted = 0
+        remaining_batches = resolved_max_batches
 
-        for _ in range(resolved_max_batches):
-            select_stmt = (
-                select(
-                    CostRecord.id.label("id"),
-                    CostRecord.tenant_id.label("tenant_id"),
-                    CostRecord.recorded_at.label("recorded_at"),
-                )
-                .join(Tenant, Tenant.id == CostRecord.tenant_id)
-                .where(
-                    Tenant.plan.in_(plan_values),
-                    CostRecord.recorded_at < cutoff_date,
-                )
-                .order_by(CostRecord.recorded_at.asc(), CostRecord.id.asc())
-                .limit(resolved_batch_size)
+        expired_stmt = (
+            select(
+                CostRecord.tenant_id.label("tenant_id"),
+                func.count().label("row_count"),
+                func.min(CostRecord.recorded_at).label("oldest_recorded_at"),
+                func.max(CostRecord.recorded_at).label("newest_recorded_at"),
             )
-            batch_rows = (await db.execute(select_stmt)).all()
-            if not batch_rows:
+            .join(Tenant, Tenant.id == CostRecord.tenant_id)
+            .where(
+                Tenant.plan.in_(plan_values),
+                CostRecord.recorded_at < cutoff_date,
+            )
+            .group_by(CostRecord.tenant_id)
+            .order_by(func.min(CostRecord.recorded_at).asc(), CostRecord.tenant_id)
+        )
+        for row in (await db.execute(expired_stmt)).all():
+            if remaining_batches <= 0:
                 break
-
-            record_ids = [row.id for row in batch_rows]
-            for row in batch_rows:
-                tenant_key = str(row.tenant_id)
-                recorded_at_value = row.recorded_at
-                report = tenant_reports.setdefault(
-                    tenant_key,
-                    {
-                        "tenant_id": tenant_key,
-                        "tenant_tier": tier_name,
-                        "retention_days": retention_days,
-                        "deleted_count": 0,
-                        "oldest_recorded_at": None,
-                        "newest_recorded_at": None,
-                    },
-                )
-                report["deleted_count"] += 1
-                if isinstance(recorded_at_value, date):
-                    recorded_at_iso = recorded_at_value.isoformat()
-                    oldest = report["oldest_recorded_at"]
-                    newest = report["newest_recorded_at"]
-                    if oldest is None or recorded_at_iso < str(oldest):
-                        report["oldest_recorded_at"] = recorded_at_iso
-                    if newest is None or recorded_at_iso > str(newest):
-                        report["newest_recorded_at"] = recorded_at_iso
-
-            delete_stmt = delete(CostRecord).where(CostRecord.id.in_(record_ids))
-            await db.execute(delete_stmt)
-            await db.flush()
-
-            deleted_count = len(record_ids)
+            deleted_count, newest_deleted, batches = await _delete_tenant_day_ranges(
+                db,
+                tenant_id=row.tenant_id,
+                oldest=row.oldest_recorded_at,
+                newest=row.newest_recorded_at,
+                row_count=int(row.row_count or 0),
+                batch_size=resolved_batch_size,
+                max_batches=remaining_batches,
+            )
+            remaining_batches -= batches
+            total_batches += batches
+            if not deleted_count:
+                continue
+            record_tenant_deletion(
+                tenant_reports,
+                tenant_id=row.tenant_id,
+                tier_name=tier_name,
+                retention_days=retention_days,
+                deleted_count=deleted_count,
+                oldest=row.oldest_recorded_at,
+                newest=newest_deleted,
+            )
             total_deleted += deleted_count
             tier_deleted += deleted_count
-            total_batches += 1
 
         if tier_deleted:
-            tier_deleted_counts[tier_name] = tier_deleted
+            tier_deleted_counts[tier_name] = (
+                tier_deleted_counts.get(tier_name, 0) + tier_deleted
+            )
 
     reports = sorted(
         tenant_reports.values(),
@@ -178,8 +260,9 @@ async def cleanup_expired_cost_records_by_plan(
         total_batches=total_batches,
         tiers=tier_deleted_counts,
         tenants_affected=len(reports),
+        partitions_dropped=partitions_dropped,
     )
-    return {
+    summary: dict[str, Any] = {
         "deleted_count": total_deleted,
         "tiers": tier_deleted_counts,
         "tenant_reports": reports,
@@ -187,6 +270,9 @@ async def cleanup_expired_cost_records_by_plan(
         "max_batches": resolved_max_batches,
         "as_of_date": target_date.isoformat(),
     }
+    if partition_summary is not None:
+        summary["partitions_dropped"] = partitions_dropped
+    return summary
 
 
 async def finalize_cost_record_batch(
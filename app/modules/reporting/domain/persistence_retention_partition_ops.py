@@ -0,0 +1,290 @@
+"""
+Partition-aware retention for the range-partitioned `cost_records` table.
+
+Partitions whose whole range is past retention are detached and dropped instead
+of being deleted row by row, which avoids the WAL volume, index churn and vacuum
+debt of large batched deletes. Rows in partitions that are only partly expired
+are left to the caller's bounded batch deletes.
+
+`DETACH PARTITION` takes an ACCESS EXCLUSIVE lock on `cost_records` until the
+transaction ends, so these helpers commit the session's open transaction first
+and then inspect, detach and drop each partition in a short transaction of its
+own, under `lock_timeout`. A partition whose lock cannot be taken in time is
+skipped until the next run instead of stalling cost reads and ingestion.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable
+from datetime import date, timedelta
+from typing import Any, TypeVar
+
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.shared.core.maintenance import PartitionMaintenanceService
+
+PARTITION_DETACH_LOCK_TIMEOUT = "5s"
+
+_Inspection = TypeVar("_Inspection")
+
+
+def _backend_name(db: AsyncSession) -> str:
+    bind = getattr(db, "bind", None)
+    if bind is None:
+        bind_getter = getattr(db, "get_bind", None)
+        if callable(bind_getter):
+            bind = bind_getter()
+    dialect_name = getattr(getattr(bind, "dialect", None), "name", "")
+    return (
+        str(dialect_name or "").strip().lower() if isinstance(dialect_name, str) else ""
+    )
+
+
+def record_tenant_deletion(
+    tenant_reports: dict[str, dict[str, Any]],
+    *,
+    tenant_id: Any,
+    tier_name: str,
+    retention_days: int,
+    deleted_count: int,
+    oldest: Any,
+    newest: Any,
+) -> None:
+    """Fold one tenant's deleted rows into its retention report."""
+    tenant_key = str(tenant_id)
+    report = tenant_reports.setdefault(
+        tenant_key,
+        {
+            "tenant_id": tenant_key,
+            "tenant_tier": tier_name,
+            "retention_days": retention_days,
+            "deleted_count": 0,
+            "oldest_recorded_at": None,
+            "newest_recorded_at": None,
+        },
+    )
+    report["deleted_count"] += int(deleted_count)
+    if isinstance(oldest, date):
+        oldest_iso = oldest.isoformat()
+        current = report["oldest_recorded_at"]
+        if current is None or oldest_iso < str(current):
+            report["oldest_recorded_at"] = oldest_iso
+    if isinstance(newest, date):
+        newest_iso = newest.isoformat()
+        current = report["newest_recorded_at"]
+        if current is None or newest_iso > str(current):
+            report["newest_recorded_at"] = newest_iso
+
+
+async def list_droppable_partitions(
+    maintenance: PartitionMaintenanceService,
+    *,
+    cutoff_date: date,
+) -> list[str]:
+    """Return partitions whose exclusive upper bound is on/before `cutoff_date`."""
+    ranges = await maintenance.list_cost_record_partition_ranges()
+    return [name for name, _lower, upper in ranges if upper <= cutoff_date]
+
+
+async def _drop_partition_in_own_transaction(
+    db: AsyncSession,
+    maintenance: PartitionMaintenanceService,
+    partition_name: str,
+    *,
+    inspect_partition: Callable[[str], Awaitable[_Inspection | None]],
+    logger_obj: Any,
+) -> _Inspection | None:
+    """
+    Inspect, detach and drop one partition, committing right after the drop.
+
+    Returns what `inspect_partition` reported, or None when it kept the
+    partition or the partition could not be locked/dropped.
+    """
+    try:
+        await maintenance.acquire_maintenance_lock()
+        await db.execute(
+            text(f"SET LOCAL lock_timeout = '{PARTITION_DETACH_LOCK_TIMEOUT}'")
+        )
+        inspection = await inspect_partition(partition_name)
+        if inspection is None:
+            await db.rollback()
+            return None
+        await maintenance.detach_and_drop_cost_record_partition(partition_name)
+        await db.commit()
+    except SQLAlchemyError as exc:
+        await db.rollback()
+        logger_obj.warning(
+            "cost_retention_partition_drop_skipped",
+            partition=partition_name,
+            error=str(exc),
+        )
+        return None
+    return inspection
+
+
+async def drop_expired_partitions(
+    db: AsyncSession,
+    *,
+    cutoff_date: date,
+    logger_obj: Any,
+) -> dict[str, Any] | None:
+    """
+    Drop every partition entirely older than `cutoff_date` for all tenants.
+
+    Commits the session's open transaction before the first partition is
+    touched (see the module docstring), so callers must not have pending work
+    they may still want to roll back. Returns None when the backend is not partitioned Postgres so callers can
+    fall back to batched row deletes.
+    """
+    if _backend_name(db) != "postgresql":
+        return None
+    maintenance = PartitionMaintenanceService(db)
+    partitions = await list_droppable_partitions(maintenance, cutoff_date=cutoff_date)
+    await db.commit()
+
+    async def count_rows(partition_name: str) -> int:
+        return int(await db.scalar(text(f"SELECT COUNT(*) FROM {partition_name}")) or 0)
+
+    deleted_count = 0
+    partitions_dropped: list[str] = []
+    for partition_name in partitions:
+        row_count = await _drop_partition_in_own_transaction(
+            db,
+            maintenance,
+            partition_name,
+            inspect_partition=count_rows,
+            logger_obj=logger_obj,
+        )
+        if row_count is None:
+            continue
+        deleted_count += row_count
+        partitions_dropped.append(partition_name)
+
+    logger_obj.info(
+        "cost_retention_partitions_dropped",
+        cutoff_date=cutoff_date.isoformat(),
+        partitions=partitions_dropped,
+        deleted_count=deleted_count,
+    )
+    return {"deleted_count": deleted_count, "partitions_dropped": partitions_dropped}
+
+
+async def drop_expired_partitions_by_plan(
+    db: AsyncSession,
+    *,
+    retention_groups: dict[tuple[str, int], list[str]],
+    target_date: date,
+    logger_obj: Any,
+) -> dict[str, Any] | None:
+    """
+    Enforce plan retention by dropping whole partitions.
+
+    A partition is dropped only when its range ends on/before the cutoff of the
+    longest finite plan retention and every row in it belongs to a tenant on a
+    finite-retention plan. Returns None when partition retention does not apply.
+
+    Commits the session's open transaction before the first partition is
+    touched, because `DETACH PARTITION` would otherwise queue behind the locks
+    that transaction holds on `cost_records`. Callers must not have pending
+    work they may still want to roll back.
+    """
+    if not retention_groups or _backend_name(db) != "postgresql":
+        return None
+
+    maintenance = PartitionMaintenanceService(db)
+    partition_ranges = await maintenance.list_cost_record_partition_ranges()
+    if not partition_ranges:
+        return None
+
+    plan_retention: dict[str, tuple[str, int]] = {
+        plan: (tier_name, retention_days)
+        for (tier_name, retention_days), plans in retention_groups.items()
+        for plan in plans
+    }
+    longest_retention = max(days for _tier, days in retention_groups)
+    global_cutoff = target_date - timedelta(days=longest_retention)
+    expired_partitions = [
+        name for name, _lower, upper in partition_ranges if upper <= global_cutoff
+    ]
+    await db.commit()
+
+    tenant_reports: dict[str, dict[str, Any]] = {}
+    tier_deleted_counts: dict[str, int] = {}
+    partitions_dropped: list[str] = []
+    partitions_protected: list[str] = []
+
+    async def finite_retention_rows(partition_name: str) -> list[Any] | None:
+        tenant_rows = (
+            await db.execute(
+                text(
+                    f"""
+                    SELECT
+                        cr.tenant_id AS tenant_id,
+                        t.plan AS plan,
+                        COUNT(*) AS deleted_count,
+                        MIN(cr.recorded_at) AS oldest_recorded_at,
+                        MAX(cr.recorded_at) AS newest_recorded_at
+                    FROM {partition_name} AS cr
+                    LEFT JOIN tenants AS t ON t.id = cr.tenant_id
+                    GROUP BY cr.tenant_id, t.plan
+                    """
+                )
+            )
+        ).all()
+        # Unlimited-retention plans (and orphaned rows) pin the partition in place.
+        if any(
+            row.plan is None or str(row.plan) not in plan_retention
+            for row in tenant_rows
+        ):
+            partitions_protected.append(partition_name)
+            return None
+        return list(tenant_rows)
+
+    for partition_name in expired_partitions:
+        tenant_rows = await _drop_partition_in_own_transaction(
+            db,
+            maintenance,
+            partition_name,
+            inspect_partition=finite_retention_rows,
+            logger_obj=logger_obj,
+        )
+        if tenant_rows is None:
+            continue
+        partitions_dropped.append(partition_name)
+        for row in tenant_rows:
+            tier_name, retention_days = plan_retention[str(row.plan)]
+            record_tenant_deletion(
+                tenant_reports,
+                tenant_id=row.tenant_id,
+                tier_name=tier_name,
+                retention_days=retention_days,
+                deleted_count=int(row.deleted_count or 0),
+                oldest=row.oldest_recorded_at,
+                newest=row.newest_recorded_at,
+            )
+            tier_deleted_counts[tier_name] = tier_deleted_counts.get(
+                tier_name, 0
+            ) + int(row.deleted_count or 0)
+
+    if partitions_protected:
+        logger_obj.info(
+            "cost_retention_partitions_retained_for_unlimited_plans",
+            partitions=partitions_protected,
+        )
+    return {
+        "deleted_count": sum(tier_deleted_counts.values()),
+        "tiers": tier_deleted_counts,
+        "tenant_reports": list(tenant_reports.values()),
+        "partitions_dropped": partitions_dropped,
+    }
+
+
+__all__ = [
+    "PARTITION_DETACH_LOCK_TIMEOUT",
+    "drop_expired_partitions",
+    "drop_expired_partitions_by_plan",
+    "list_droppable_partitions",
+    "record_tenant_deletion",
+]
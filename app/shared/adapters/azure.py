@@ -1,6 +1,7 @@
 import logging
 from datetime import date, datetime, timezone
 from typing import Any, AsyncGenerator
+from urllib.parse import parse_qs, urlparse
 import structlog
 from azure.identity.aio import ClientSecretCredential
 from azure.mgmt.costmanagement.aio import CostManagementClient
@@ -51,6 +52,14 @@ AZURE_USAGE_LOOKUP_RECOVERABLE_ERRORS: tuple[type[Exception], ...] = (
 )
 
 
+def _next_link_skiptoken(next_link: Any) -> str | None:
+    """`$skiptoken` of a Query API `next_link`; the next page re-POSTs the query."""
+    if not isinstance(next_link, str) or not next_link:
+        return None
+    values = parse_qs(urlparse(next_link).query).get("$skiptoken")
+    return values[0] if values else None
+
+
 class AzureAdapter(BaseAdapter):
     """
     Azure Cost Management Adapter using official Azure SDK.
@@ -127,24 +136,49 @@ class AzureAdapter(BaseAdapter):
         cost_type: str = "ActualCost",
     ) -> list[dict[str, Any]]:
         """Fetch costs using Azure Query API."""
-        try:
-            client = await self._get_cost_client()
-            scope = f"subscriptions/{self.credentials.subscription_id}"
-
-            query_definition = self._build_query_definition(
-                start_date, end_date, granularity, cost_type
-            )
-
-            response = await client.query.usage(
-                scope=scope, parameters=query_definition
-            )
-
-            if response and response.rows:
-                return [self._parse_row(row, cost_type) for row in response.rows]
-            return []
-        except AZURE_OPERATION_RECOVERABLE_ERRORS as e:
-            logger.error("azure_cost_fetch_failed", error=str(e))
-            raise AdapterError(f"Azure cost fetch failed: {str(e)}") from e
+        rows: list[dict[str, Any]] = []
+        async for page in self._iter_cost_pages(
+            start_date, end_date, granularity, cost_type
+        ):
+            rows.extend(page)
+        return rows
+
+    async def _iter_cost_pages(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        granularity: str = "DAILY",
+        cost_type: str = "ActualCost",
+    ) -> AsyncGenerator[list[dict[str, Any]], None]:
+        """
+        Yield parsed Query API pages, following `next_link` until exhausted.
+        Only one page of rows is held at a time.
+        """
+        scope = f"subscriptions/{self.credentials.subscription_id}"
+        query_definition = self._build_query_definition(
+            start_date, end_date, granularity, cost_type
+        )
+        skiptoken: str | None = None
+        seen_tokens: set[str] = set()
+        while True:
+            try:
+                client = await self._get_cost_client()
+                response = await client.query.usage(
+                    scope=scope,
+                    parameters=query_definition,
+                    params={"$skiptoken": skiptoken} if skiptoken else None,
+                )
+                rows = response.rows if response and response.rows else []
+                page = [self._parse_row(row, cost_type) for row in rows]
+            except AZURE_OPERATION_RECOVERABLE_ERRORS as e:
+                logger.error("azure_cost_fetch_failed", error=str(e))
+                raise AdapterError(f"Azure cost fetch failed: {str(e)}") from e
+            if page:
+                yield page
+            skiptoken = _next_link_skiptoken(getattr(response, "next_link", None))
+            if skiptoken is None or skiptoken in seen_tokens:
+                return
+            seen_tokens.add(skiptoken)
 
     def _build_query_definition(
         self, start: datetime, end: datetime, granularity: str, cost_type: str
@@ -285,12 +319,14 @@ class AzureAdapter(BaseAdapter):
     ) -> AsyncGenerator[dict[str, Any], None]:
         """
         Stream Azure costs.
-        Currently wraps the Query API (which is list-based) but yields individually to match interface.
+        Yields rows page by page from the Query API, following `next_link`.
         """
         async def _iterate() -> AsyncGenerator[dict[str, Any], None]:
-            records = await self.get_cost_and_usage(start_date, end_date, granularity)
-            for row in records:
-                yield row
+            async for page in self._iter_cost_pages(
+                start_date, end_date, granularity
+            ):
+                for row in page:
+                    yield row
 
         return _iterate()
 
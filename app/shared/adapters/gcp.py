@@ -14,6 +14,7 @@ from google.oauth2 import service_account
 import tenacity
 
 from app.shared.adapters.base import BaseAdapter
+from app.shared.adapters.paged_stream_ops import stream_blocking_pages
 from app.shared.adapters.resource_usage_projection import (
     project_cost_rows_to_resource_usage,
     resource_usage_lookback_window,
@@ -32,6 +33,9 @@ gcp_retry = tenacity.retry(
     before_sleep=tenacity.before_sleep_log(logger, logging.WARNING),
 )
 
+# BigQuery rows fetched per result page when streaming the billing export.
+GCP_BQ_PAGE_SIZE = 5000
+
 # BE-ADAPT-8: Project ID format validation
 PROJECT_ID_PATTERN = re.compile(r"^[a-z][a-z0-9\-]{4,28}[a-z0-9]$")
 
@@ -143,13 +147,20 @@ class GCPAdapter(BaseAdapter):
         Fetch GCP costs from BigQuery billing export.
         Phase 5: Includes CUD credit extraction for amortized cost calculation.
         """
+        rows: list[dict[str, Any]] = []
+        async for page in self._iter_cost_pages(
+            start_date, end_date, include_credits=include_credits
+        ):
+            rows.extend(page)
+        return rows
+
+    def _billing_table_path(self) -> str | None:
+        """Validated `project.dataset.table` of the billing export, if configured."""
         if not self.credentials.billing_dataset or not self.credentials.billing_table:
             logger.warning(
                 "gcp_bq_export_not_configured", project_id=self.credentials.project_id
             )
-            return []
-
-        client = self._get_bq_client()
+            return None
 
         # Determine and validate the table path (SEC-06)
         billing_project = (
@@ -173,10 +184,24 @@ class GCPAdapter(BaseAdapter):
             )
             raise ConfigurationError(error_msg)
 
-        table_path = f"{billing_project}.{billing_dataset}.{billing_table}"
+        return f"{billing_project}.{billing_dataset}.{billing_table}"
 
-        query = self._build_cost_query(table_path, include_credits=include_credits)
+    async def _iter_cost_pages(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        include_credits: bool = True,
+    ) -> AsyncGenerator[list[dict[str, Any]], None]:
+        """
+        Yield parsed BigQuery result pages.
+        The query job and every page read run in a worker thread.
+        """
+        table_path = self._billing_table_path()
+        if table_path is None:
+            return
 
+        client = self._get_bq_client()
+        query = self._build_cost_query(table_path, include_credits=include_credits)
         job_config = bigquery.QueryJobConfig(
             query_parameters=[
                 bigquery.ScalarQueryParameter("start_date", "TIMESTAMP", start_date),
@@ -184,11 +209,15 @@ class GCPAdapter(BaseAdapter):
             ]
         )
 
-        try:
+        def _open_rows() -> Any:
             query_job = client.query(query, job_config=job_config)
-            results = query_job.result()
+            return query_job.result(page_size=GCP_BQ_PAGE_SIZE)
 
-            return [self._parse_row(row) for row in results]
+        try:
+            async for page in stream_blocking_pages(
+                _open_rows, page_size=GCP_BQ_PAGE_SIZE
+            ):
+                yield [self._parse_row(row) for row in page]
         except GCP_OPERATION_RECOVERABLE_ERRORS as e:
             logger.error("gcp_bq_query_failed", table=table_path, error=str(e))
             raise AdapterError(f"GCP BigQuery cost fetch failed: {str(e)}") from e
@@ -304,12 +333,13 @@ class GCPAdapter(BaseAdapter):
     ) -> AsyncGenerator[dict[str, Any], None]:
         """
         Stream GCP costs from BigQuery.
-        Yields records one-by-one from the BigQuery result set.
+        Reads the result set page by page off the event loop; at most two
+        pages are buffered at a time.
         """
         async def _iterate() -> AsyncGenerator[dict[str, Any], None]:
-            records = await self.get_cost_and_usage(start_date, end_date, granularity)
-            for row in records:
-                yield row
+            async for page in self._iter_cost_pages(start_date, end_date):
+                for row in page:
+                    yield row
 
         return _iterate()
 
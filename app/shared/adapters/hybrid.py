@@ -19,7 +19,6 @@ from app.shared.adapters.resource_usage_projection import (
     resource_usage_lookback_window,
 )
 from app.shared.core.credentials import HybridCredentials
-from app.shared.core.currency import convert_to_usd
 from app.shared.core.exceptions import ExternalAPIError
 
 logger = structlog.get_logger()
@@ -160,9 +159,6 @@ class HybridAdapter(HybridNativeConnectorMixin, BaseAdapter):
     def _http_async_client(self, *, timeout: float, verify: bool) -> httpx.AsyncClient:
         return httpx.AsyncClient(timeout=timeout, verify=verify)
 
-    async def _convert_to_usd(self, amount_local: float, currency_code: str) -> float:
-        return float(await convert_to_usd(amount_local, currency_code))
-
     def _resolve_native_verify_handler(
         self, native_vendor: str | None
     ) -> Callable[[], Awaitable[None]] | None:
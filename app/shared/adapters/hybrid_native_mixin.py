@@ -2,7 +2,6 @@ from __future__ import annotations
 
 from collections.abc import AsyncGenerator
 from datetime import datetime, time, timedelta, timezone
-from decimal import InvalidOperation
 from typing import Any
 from urllib.parse import urljoin
 
@@ -10,19 +9,15 @@ import httpx
 import structlog
 
 from app.shared.adapters.feed_utils import as_float, is_number, parse_timestamp
-from app.shared.core.currency import ExchangeRateUnavailableError
+from app.shared.core.currency_snapshot import (
+    FX_SNAPSHOT_RECOVERABLE_ERRORS,
+    FxRateSnapshot,
+)
 from app.shared.core.exceptions import ExternalAPIError
 
 logger = structlog.get_logger()
 
-HYBRID_CURRENCY_CONVERSION_RECOVERABLE_ERRORS: tuple[type[Exception], ...] = (
-    ExchangeRateUnavailableError,
-    httpx.HTTPError,
-    InvalidOperation,
-    RuntimeError,
-    TypeError,
-    ValueError,
-)
+HYBRID_CURRENCY_CONVERSION_RECOVERABLE_ERRORS = FX_SNAPSHOT_RECOVERABLE_ERRORS
 
 class HybridNativeConnectorMixin:
     def _resolve_openstack_auth_url(self: Any) -> str:
@@ -177,6 +172,7 @@ class HybridNativeConnectorMixin:
             },
         )
         rows = self._extract_cloudkitty_summary_rows(payload)
+        fx_snapshot = await FxRateSnapshot.capture([currency_code])
         for entry in rows:
             timestamp = parse_timestamp(entry.get("begin"))
             rate = as_float(entry.get("rate"))
@@ -189,7 +185,7 @@ class HybridNativeConnectorMixin:
             cost_usd = float(rate)
             if currency_code != "USD":
                 try:
-                    cost_usd = float(await self._convert_to_usd(rate, currency_code))
+                    cost_usd = float(fx_snapshot.convert_to_usd(rate, currency_code))
                 except HYBRID_CURRENCY_CONVERSION_RECOVERABLE_ERRORS as exc:
                     logger.warning(
                         "hybrid_cloudkitty_currency_conversion_failed",
@@ -210,6 +206,7 @@ class HybridNativeConnectorMixin:
                 "currency": currency_code,
                 "timestamp": timestamp,
                 "source_adapter": "hybrid_openstack_cloudkitty",
+                "fx_snapshot": fx_snapshot.row_metadata(currency_code),
                 "tags": {
                     "vendor": "openstack",
                     "groupby": groupby,
@@ -390,6 +387,11 @@ class HybridNativeConnectorMixin:
         }
         payload = await self._get_json(endpoint, headers=headers, params=params)
         records = self._extract_ledger_records(payload)
+        fx_snapshot = await FxRateSnapshot.capture(
+            entry.get("currency")
+            for entry in records
+            if not is_number(entry.get("cost_usd", entry.get("amount_usd")))
+        )
 
         for entry in records:
             timestamp = parse_timestamp(entry.get("timestamp") or entry.get("date"))
@@ -428,7 +430,7 @@ class HybridNativeConnectorMixin:
                 if currency_code != "USD":
                     try:
                         cost_usd = float(
-                            await self._convert_to_usd(amount_local, currency_code)
+                            fx_snapshot.convert_to_usd(amount_local, currency_code)
                         )
                     except HYBRID_CURRENCY_CONVERSION_RECOVERABLE_ERRORS as exc:
                         logger.warning(
@@ -469,6 +471,7 @@ class HybridNativeConnectorMixin:
                 "currency": currency_code,
                 "timestamp": timestamp,
                 "source_adapter": "hybrid_ledger_http",
+                "fx_snapshot": fx_snapshot.row_metadata(currency_code),
                 "tags": tags,
             }
 
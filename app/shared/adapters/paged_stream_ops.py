@@ -0,0 +1,57 @@
+"""
+Page-by-page streaming over blocking SDK result iterators.
+
+Cloud SDKs such as BigQuery expose query results as synchronous iterators
+that fetch the next page over HTTP when the current one is exhausted.
+`stream_blocking_pages` opens the iterator and reads each page in a worker
+thread so the event loop never blocks on SDK I/O. It prefetches at most one
+page while the caller processes the current one, so at most two pages are
+held in memory at a time.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncGenerator, Callable, Iterable
+from itertools import islice
+from typing import TypeVar
+
+_T = TypeVar("_T")
+
+DEFAULT_STREAM_PAGE_SIZE = 5000
+
+
+async def stream_blocking_pages(
+    open_iterable: Callable[[], Iterable[_T]],
+    *,
+    page_size: int = DEFAULT_STREAM_PAGE_SIZE,
+) -> AsyncGenerator[list[_T], None]:
+    """Yield lists of up to `page_size` items, reading each page off the loop."""
+    page_size = max(1, int(page_size))
+    iterator = iter(await asyncio.to_thread(open_iterable))
+
+    def _read_page() -> list[_T]:
+        return list(islice(iterator, page_size))
+
+    pending: asyncio.Future[list[_T]] = asyncio.ensure_future(
+        asyncio.to_thread(_read_page)
+    )
+    try:
+        while True:
+            page = await pending
+            if not page:
+                return
+            if len(page) < page_size:
+                yield page
+                return
+            # Only one read is ever in flight: the iterator is not thread-safe.
+            pending = asyncio.ensure_future(asyncio.to_thread(_read_page))
+            yield page
+    finally:
+        if not pending.done():
+            pending.cancel()
+        elif not pending.cancelled():
+            pending.exception()  # Mark a failed prefetch as retrieved.
+
+
+__all__ = ["DEFAULT_STREAM_PAGE_SIZE", "stream_blocking_pages"]
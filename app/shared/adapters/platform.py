@@ -19,7 +19,6 @@ from app.shared.adapters.resource_usage_projection import (
     resource_usage_lookback_window,
 )
 from app.shared.core.credentials import PlatformCredentials
-from app.shared.core.currency import convert_to_usd
 from app.shared.core.exceptions import ExternalAPIError
 
 logger = structlog.get_logger()
@@ -193,9 +192,6 @@ class PlatformAdapter(PlatformNativeConnectorMixin, BaseAdapter):
             return raw
         return True
 
-    async def _convert_to_usd(self, amount_local: float, currency_code: str) -> float:
-        return float(await convert_to_usd(amount_local, currency_code))
-
     def _resolve_native_verify_handler(
         self, native_vendor: str | None
     ) -> Callable[[], Awaitable[None]] | None:
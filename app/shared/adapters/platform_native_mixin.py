@@ -2,28 +2,22 @@ from __future__ import annotations
 
 from collections.abc import AsyncGenerator
 from datetime import date, datetime, time, timezone
-from decimal import InvalidOperation
 from typing import Any
 from urllib.parse import urljoin
 
-import httpx
 import structlog
 
 from app.shared.adapters.feed_utils import as_float, is_number, parse_timestamp
-from app.shared.core.currency import ExchangeRateUnavailableError
+from app.shared.core.currency_snapshot import (
+    FX_SNAPSHOT_RECOVERABLE_ERRORS,
+    FxRateSnapshot,
+)
 from app.shared.core.exceptions import ExternalAPIError
 
 logger = structlog.get_logger()
 
 _DATADOG_VENDOR = "datadog"
-PLATFORM_CURRENCY_CONVERSION_RECOVERABLE_ERRORS: tuple[type[Exception], ...] = (
-    ExchangeRateUnavailableError,
-    httpx.HTTPError,
-    InvalidOperation,
-    RuntimeError,
-    TypeError,
-    ValueError,
-)
+PLATFORM_CURRENCY_CONVERSION_RECOVERABLE_ERRORS = FX_SNAPSHOT_RECOVERABLE_ERRORS
 
 
 class PlatformNativeConnectorMixin:
@@ -388,6 +382,11 @@ class PlatformNativeConnectorMixin:
         }
         payload = await self._get_json(endpoint, headers=headers, params=params)
         records = self._extract_ledger_records(payload)
+        fx_snapshot = await FxRateSnapshot.capture(
+            entry.get("currency")
+            for entry in records
+            if not is_number(entry.get("cost_usd", entry.get("amount_usd")))
+        )
 
         for entry in records:
             timestamp = parse_timestamp(entry.get("timestamp") or entry.get("date"))
@@ -426,7 +425,7 @@ class PlatformNativeConnectorMixin:
                 if currency_code != "USD":
                     try:
                         cost_usd = float(
-                            await self._convert_to_usd(amount_local, currency_code)
+                            fx_snapshot.convert_to_usd(amount_local, currency_code)
                         )
                     except PLATFORM_CURRENCY_CONVERSION_RECOVERABLE_ERRORS as exc:
                         logger.warning(
@@ -467,6 +466,7 @@ class PlatformNativeConnectorMixin:
                 "currency": currency_code,
                 "timestamp": timestamp,
                 "source_adapter": "platform_ledger_http",
+                "fx_snapshot": fx_snapshot.row_metadata(currency_code),
                 "tags": tags,
             }
 
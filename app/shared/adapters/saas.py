@@ -21,7 +21,8 @@ from app.shared.adapters.resource_usage_projection import (
     project_cost_rows_to_resource_usage,
     resource_usage_lookback_window,
 )
-from app.shared.core.currency import ExchangeRateUnavailableError, convert_to_usd
+from app.shared.core.currency import ExchangeRateUnavailableError
+from app.shared.core.currency_snapshot import FxRateSnapshot
 from app.shared.core.exceptions import ExternalAPIError
 from app.shared.core.credentials import SaaSCredentials
 
@@ -344,7 +345,9 @@ class SaaSAdapter(BaseAdapter):
             start_date=start_date,
             end_date=end_date,
             logger=logger,
-            convert_to_usd_fn=convert_to_usd,
+            fx_snapshot=FxRateSnapshot(
+                recoverable_errors=SAAS_CURRENCY_CONVERSION_RECOVERABLE_ERRORS
+            ),
             as_float_fn=as_float,
             parse_timestamp_fn=parse_timestamp,
             currency_conversion_recoverable_errors=SAAS_CURRENCY_CONVERSION_RECOVERABLE_ERRORS,
@@ -361,7 +364,9 @@ class SaaSAdapter(BaseAdapter):
             start_date=start_date,
             end_date=end_date,
             logger=logger,
-            convert_to_usd_fn=convert_to_usd,
+            fx_snapshot=FxRateSnapshot(
+                recoverable_errors=SAAS_CURRENCY_CONVERSION_RECOVERABLE_ERRORS
+            ),
             as_float_fn=as_float,
             parse_timestamp_fn=parse_timestamp,
             urljoin_fn=urljoin,
@@ -4,6 +4,7 @@ from collections.abc import AsyncGenerator, Awaitable, Callable
 from datetime import datetime
 from typing import Any
 
+from app.shared.core.currency_snapshot import FxRateSnapshot
 from app.shared.core.exceptions import ExternalAPIError
 
 
@@ -42,7 +43,7 @@ async def stream_stripe_cost_and_usage(
     start_date: datetime,
     end_date: datetime,
     logger: Any,
-    convert_to_usd_fn: Callable[[float, str], Awaitable[Any]],
+    fx_snapshot: FxRateSnapshot,
     as_float_fn: Callable[..., float],
     parse_timestamp_fn: Callable[[Any], datetime],
     currency_conversion_recoverable_errors: tuple[type[Exception], ...],
@@ -65,6 +66,9 @@ async def stream_stripe_cost_and_usage(
         entries = payload.get("data")
         if not isinstance(entries, list):
             raise ExternalAPIError("Invalid Stripe invoices payload: expected list in data")
+        await fx_snapshot.resolve(
+            invoice.get("currency") for invoice in entries if isinstance(invoice, dict)
+        )
 
         for invoice in entries:
             if not isinstance(invoice, dict):
@@ -82,7 +86,7 @@ async def stream_stripe_cost_and_usage(
             cost_usd = amount_local
             if currency_code != "USD":
                 try:
-                    cost_usd = float(await convert_to_usd_fn(amount_local, currency_code))
+                    cost_usd = float(fx_snapshot.convert_to_usd(amount_local, currency_code))
                 except currency_conversion_recoverable_errors as exc:
                     logger.warning(
                         "saas_currency_conversion_failed",
@@ -110,6 +114,7 @@ async def stream_stripe_cost_and_usage(
                 "currency": currency_code,
                 "timestamp": timestamp,
                 "source_adapter": "saas_stripe_api",
+                "fx_snapshot": fx_snapshot.row_metadata(currency_code),
                 "tags": {
                     "vendor": "stripe",
                     "invoice_id": str(invoice.get("id") or ""),
@@ -133,7 +138,7 @@ async def stream_salesforce_cost_and_usage(
     start_date: datetime,
     end_date: datetime,
     logger: Any,
-    convert_to_usd_fn: Callable[[float, str], Awaitable[Any]],
+    fx_snapshot: FxRateSnapshot,
     as_float_fn: Callable[..., float],
     parse_timestamp_fn: Callable[[Any], datetime],
     urljoin_fn: Callable[[str, str], str],
@@ -163,6 +168,9 @@ async def stream_salesforce_cost_and_usage(
         records = payload.get("records")
         if not isinstance(records, list):
             raise ExternalAPIError("Invalid Salesforce query payload: expected list in records")
+        await fx_snapshot.resolve(
+            record.get("CurrencyIsoCode") for record in records if isinstance(record, dict)
+        )
 
         for record in records:
             if not isinstance(record, dict):
@@ -176,7 +184,7 @@ async def stream_salesforce_cost_and_usage(
             cost_usd = amount_local
             if currency_code != "USD":
                 try:
-                    cost_usd = float(await convert_to_usd_fn(amount_local, currency_code))
+                    cost_usd = float(fx_snapshot.convert_to_usd(amount_local, currency_code))
                 except currency_conversion_recoverable_errors as exc:
                     logger.warning(
                         "saas_currency_conversion_failed",
@@ -197,6 +205,7 @@ async def stream_salesforce_cost_and_usage(
                 "currency": currency_code,
                 "timestamp": timestamp,
                 "source_adapter": "saas_salesforce_api",
+                "fx_snapshot": fx_snapshot.row_metadata(currency_code),
                 "tags": {
                     "vendor": "salesforce",
                     "record_id": str(record.get("Id") or ""),
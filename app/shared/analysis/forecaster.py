@@ -2,13 +2,18 @@ import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
 from decimal import Decimal
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Hashable, Mapping, Optional
 import structlog
 from sqlalchemy.exc import SQLAlchemyError
 from app.shared.analysis.carbon_data import (
     REGION_CARBON_INTENSITY,
     DEFAULT_CARBON_INTENSITY,
 )
+from app.shared.analysis.forecaster_prophet_ops import run_prophet_fit
+from app.shared.analysis.holt_winters_batch import (
+    align_daily_series,
+    batch_holt_winters_forecast,
+)
 
 logger = structlog.get_logger()
 
@@ -141,7 +146,12 @@ class SymbolicForecaster:
     async def _run_prophet(
         df: pd.DataFrame, days: int, db: Optional[Any], tenant_id: Optional[Any]
     ) -> Dict[str, Any]:
-        """Runs Facebook Prophet with holiday/anomaly markers."""
+        """
+        Runs Facebook Prophet with holiday/anomaly markers.
+
+        The fit runs off the event loop and is cached per cleaned history,
+        horizon and marker set (see `forecaster_prophet_ops`).
+        """
         holidays_df = None
         if db and tenant_id:
             from sqlalchemy import select
@@ -157,42 +167,35 @@ class SymbolicForecaster:
             except FORECAST_MARKER_LOAD_RECOVERABLE_ERRORS as e:
                 logger.warning("failed_to_load_anomaly_markers", error=str(e))
 
-        m = Prophet(
-            holidays=holidays_df,
-            daily_seasonality=False,
-            weekly_seasonality=True,
-            yearly_seasonality=False,
+        fit = await run_prophet_fit(
+            Prophet, df[~df["is_outlier"]], holidays_df, days, len(df)
         )
-        m.fit(df[~df["is_outlier"]])
-
-        future = m.make_future_dataframe(periods=days)
-        forecast = m.predict(future)
-
-        # Extract forecast window
-        result_df = forecast.tail(days)
-        forecast_entries = []
-        total_cost = Decimal("0")
 
-        for _, row in result_df.iterrows():
-            amount = Decimal(str(max(0.0, float(row["yhat"]))))
-            forecast_entries.append(
-                {
-                    "date": row["ds"].date(),
-                    "amount": amount.quantize(Decimal("0.01")),
-                    "confidence_lower": Decimal(
-                        str(max(0.0, float(row["yhat_lower"])))
-                    ).quantize(Decimal("0.01")),
-                    "confidence_upper": Decimal(
-                        str(float(row["yhat_upper"]))
-                    ).quantize(Decimal("0.01")),
-                }
+        # Extract forecast window from whole columns instead of per-row Series.
+        forecast_dates = pd.DatetimeIndex(fit.forecast_ds).date
+        amounts = [Decimal(str(max(0.0, value))) for value in fit.yhat.tolist()]
+        forecast_entries = [
+            {
+                "date": forecast_date,
+                "amount": amount.quantize(Decimal("0.01")),
+                "confidence_lower": Decimal(str(max(0.0, lower))).quantize(
+                    Decimal("0.01")
+                ),
+                "confidence_upper": Decimal(str(upper)).quantize(Decimal("0.01")),
+            }
+            for forecast_date, amount, lower, upper in zip(
+                forecast_dates,
+                amounts,
+                fit.yhat_lower.tolist(),
+                fit.yhat_upper.tolist(),
             )
-            total_cost += amount
+        ]
+        total_cost = sum(amounts, Decimal("0"))
 
         # Simple MAPE on training data for accuracy tracking
         try:
             y_true = np.array(df[~df["is_outlier"]]["y"].tolist())
-            y_pred = np.array(forecast.head(len(df))["yhat"].tolist())
+            y_pred = fit.fitted_yhat
             
             # Use safety for zero-division
             mask = y_true != 0
@@ -213,30 +216,14 @@ class SymbolicForecaster:
         }
 
     @staticmethod
-    async def _run_holt_winters(df: pd.DataFrame, days: int) -> Dict[str, Any]:
-        """
-        Simplified Holt-Winters Fallback (Exponential Smoothing with Trend).
-        Used for small datasets (<14 days).
-        """
-        # Manual Alpha/Beta for small datasets
-        alpha = 0.3  # Level smoothing
-        beta = 0.1  # Trend smoothing
-
-        level = df["y"].iloc[0]
-        trend = df["y"].iloc[1] - df["y"].iloc[0] if len(df) > 1 else 0
-
-        for i in range(1, len(df)):
-            last_level = level
-            level = alpha * df["y"].iloc[i] + (1 - alpha) * (level + trend)
-            trend = beta * (level - last_level) + (1 - beta) * trend
-
+    def _holt_winters_entries(
+        forecast_values: List[float], last_date: Any
+    ) -> tuple[List[Dict[str, Any]], Decimal]:
         forecast_entries = []
         total_cost = Decimal("0")
-        last_date = df["ds"].iloc[-1]
-
         # Uncertainty grows over time: +/- 10% * days_out
-        for i in range(1, days + 1):
-            amount = Decimal(str(max(0.0, level + (i * trend))))
+        for i, value in enumerate(forecast_values, start=1):
+            amount = Decimal(str(value))
             uncertainty = (Decimal("0.1") + (Decimal(str(i)) * Decimal("0.02"))) * amount
 
             forecast_entries.append(
@@ -248,6 +235,21 @@ class SymbolicForecaster:
                 }
             )
             total_cost += amount
+        return forecast_entries, total_cost
+
+    @staticmethod
+    async def _run_holt_winters(df: pd.DataFrame, days: int) -> Dict[str, Any]:
+        """
+        Simplified Holt-Winters Fallback (Exponential Smoothing with Trend).
+        Used for small datasets (<14 days). Runs as a batch of one through
+        `batch_holt_winters_forecast` with fixed alpha=0.3 / beta=0.1.
+        """
+        result = batch_holt_winters_forecast(
+            df["y"].to_numpy(dtype=float), days, alpha=0.3, beta=0.1
+        )
+        forecast_entries, total_cost = SymbolicForecaster._holt_winters_entries(
+            result.forecast[0].tolist(), df["ds"].iloc[-1]
+        )
 
         return {
             "confidence": "low",
@@ -257,6 +259,69 @@ class SymbolicForecaster:
             "accuracy_mape": Decimal("20.00"),
         }
 
+    @staticmethod
+    def forecast_batch(
+        histories: Mapping[Hashable, List[Any]],
+        days: int = 30,
+        fit_parameters: bool = True,
+        regions: Optional[Mapping[Hashable, str]] = None,
+    ) -> Dict[Hashable, Dict[str, Any]]:
+        """
+        Forecast many daily series (e.g. every tenant x service) in one pass.
+
+        Histories are aligned on a shared calendar and smoothed together with
+        per-series fitted alpha/beta. Passing `regions` adds the same carbon
+        fields as `forecast_carbon` for each series. Series without a single
+        finite observation get an empty low-confidence forecast instead of
+        failing the whole batch.
+        """
+        keys, dates, matrix = align_daily_series(histories)
+        if not keys:
+            return {}
+        observed_days = np.isfinite(matrix).sum(axis=1)
+        observed_rows = np.flatnonzero(observed_days)
+        result = None
+        if observed_rows.size:
+            result = batch_holt_winters_forecast(
+                matrix[observed_rows], days, fit_parameters=fit_parameters
+            )
+        batch_row = {int(row): position for position, row in enumerate(observed_rows)}
+
+        forecasts: Dict[Hashable, Dict[str, Any]] = {}
+        for index, key in enumerate(keys):
+            position = batch_row.get(index)
+            payload: Dict[str, Any]
+            if result is None or position is None:
+                payload = {
+                    "confidence": "low",
+                    "reason": "No observations to forecast from.",
+                    "forecast": [],
+                    "total_forecasted_cost": Decimal("0"),
+                    "model": "None",
+                    "accuracy_mape": None,
+                }
+            else:
+                forecast_entries, total_cost = SymbolicForecaster._holt_winters_entries(
+                    result.forecast[position].tolist(), pd.Timestamp(dates[-1])
+                )
+                payload = {
+                    "confidence": "medium" if observed_days[index] >= 14 else "low",
+                    "forecast": forecast_entries,
+                    "total_forecasted_cost": total_cost.quantize(Decimal("0.01")),
+                    "model": "Holt-Winters Batch",
+                    "accuracy_mape": None,
+                    "parameters": {
+                        "alpha": float(result.alpha[position]),
+                        "beta": float(result.beta[position]),
+                    },
+                }
+            if regions is not None:
+                SymbolicForecaster._attach_carbon(
+                    payload, regions.get(key, "global")
+                )
+            forecasts[key] = payload
+        return forecasts
+
     @staticmethod
     def _prepare_dataframe(history: List[Any]) -> pd.DataFrame:
         """Converts raw history objects to normalized DataFrame."""
@@ -291,13 +356,7 @@ class SymbolicForecaster:
         return pd.DataFrame(holidays_list)
 
     @staticmethod
-    async def forecast_carbon(
-        history: List[Any], region: str = "global", days: int = 30
-    ) -> Dict[str, Any]:
-        """
-        Project future carbon emissions based on cost trends.
-        """
-        cost_forecast = await SymbolicForecaster.forecast(history, days)
+    def _attach_carbon(cost_forecast: Dict[str, Any], region: str) -> Dict[str, Any]:
         intensity = Decimal(str(REGION_CARBON_INTENSITY.get(region, DEFAULT_CARBON_INTENSITY)))
 
         total_g = Decimal("0")
@@ -309,5 +368,14 @@ class SymbolicForecaster:
         cost_forecast["total_forecasted_co2_kg"] = (total_g / Decimal("1000")).quantize(Decimal("0.0001"))
         cost_forecast["unit"] = "kg CO2e"
         cost_forecast["region"] = region
-
         return cost_forecast
+
+    @staticmethod
+    async def forecast_carbon(
+        history: List[Any], region: str = "global", days: int = 30
+    ) -> Dict[str, Any]:
+        """
+        Project future carbon emissions based on cost trends.
+        """
+        cost_forecast = await SymbolicForecaster.forecast(history, days)
+        return SymbolicForecaster._attach_carbon(cost_forecast, region)
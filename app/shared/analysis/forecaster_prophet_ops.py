@@ -0,0 +1,207 @@
+"""
+Off-loop execution and result caching for Prophet forecast fits.
+
+Prophet fitting is CPU-bound and takes seconds, so it never runs on the event
+loop: model classes fit in a small, bounded process pool (they pickle by
+reference) sized by `FORECAST_PROCESS_POOL_WORKERS`. Fitted outputs are cached by a digest of the cleaned training
+history, horizon and holiday markers, so repeated dashboard and job requests
+over unchanged data skip the fit entirely.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import multiprocessing
+import threading
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from typing import Any, Optional
+
+import numpy as np
+import pandas as pd
+import structlog
+
+logger = structlog.get_logger()
+
+PROPHET_FIT_CACHE_MAX_ENTRIES = 256
+
+
+@dataclass(frozen=True)
+class ProphetFitResult:
+    """Column arrays extracted from a Prophet prediction frame."""
+
+    forecast_ds: np.ndarray
+    yhat: np.ndarray
+    yhat_lower: np.ndarray
+    yhat_upper: np.ndarray
+    fitted_yhat: np.ndarray
+
+
+def fit_prophet_forecast(
+    model_cls: Any,
+    train_df: pd.DataFrame,
+    holidays_df: Optional[pd.DataFrame],
+    days: int,
+    history_len: int,
+) -> ProphetFitResult:
+    """Fit and predict in one call; module-level so process pools can run it."""
+    model = model_cls(
+        holidays=holidays_df,
+        daily_seasonality=False,
+        weekly_seasonality=True,
+        yearly_seasonality=False,
+    )
+    model.fit(train_df)
+    future = model.make_future_dataframe(periods=days)
+    forecast = model.predict(future)
+
+    window = forecast.tail(days)
+    return ProphetFitResult(
+        forecast_ds=pd.to_datetime(window["ds"]).to_numpy(),
+        yhat=window["yhat"].to_numpy(dtype=float),
+        yhat_lower=window["yhat_lower"].to_numpy(dtype=float),
+        yhat_upper=window["yhat_upper"].to_numpy(dtype=float),
+        fitted_yhat=forecast.head(history_len)["yhat"].to_numpy(dtype=float),
+    )
+
+
+def prophet_fit_cache_key(
+    train_df: pd.DataFrame,
+    holidays_df: Optional[pd.DataFrame],
+    days: int,
+    history_len: int,
+) -> str:
+    digest = hashlib.sha256()
+    digest.update(f"{int(days)}:{int(history_len)}:{len(train_df)}|".encode())
+    digest.update(
+        pd.to_datetime(train_df["ds"]).to_numpy(dtype="datetime64[ns]").tobytes()
+    )
+    digest.update(train_df["y"].to_numpy(dtype=np.float64).tobytes())
+    if holidays_df is not None and not holidays_df.empty:
+        for holiday, ds in sorted(
+            zip(
+                holidays_df["holiday"].astype(str),
+                pd.to_datetime(holidays_df["ds"]).astype("int64"),
+            )
+        ):
+            digest.update(f"|{holiday}@{ds}".encode())
+    return digest.hexdigest()
+
+
+class ProphetFitCache:
+    """
+    Bounded LRU of fit results.
+
+    Entries remember the model class they were produced with, so a result is
+    only reused for the same model implementation.
+    """
+
+    def __init__(self, max_entries: int = PROPHET_FIT_CACHE_MAX_ENTRIES) -> None:
+        self._max_entries = max(1, int(max_entries))
+        self._entries: OrderedDict[str, tuple[Any, ProphetFitResult]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str, model_cls: Any) -> Optional[ProphetFitResult]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] is not model_cls:
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def put(self, key: str, model_cls: Any, result: ProphetFitResult) -> None:
+        with self._lock:
+            self._entries[key] = (model_cls, result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+prophet_fit_cache = ProphetFitCache()
+
+_executor: Optional[Executor] = None
+_executor_lock = threading.Lock()
+
+
+def _configured_pool_workers() -> int:
+    from app.shared.core.config import get_settings
+
+    return max(1, get_settings().FORECAST_PROCESS_POOL_WORKERS)
+
+
+def get_forecast_executor(*, max_workers: Optional[int] = None) -> Executor:
+    """Lazily create the shared pool; `max_workers` only applies on creation."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            # spawn: forking a process that owns an event loop and DB pools is unsafe.
+            _executor = ProcessPoolExecutor(
+                max_workers=max_workers or _configured_pool_workers(),
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _executor
+
+
+def shutdown_forecast_executor(*, wait: bool = False) -> None:
+    global _executor
+    with _executor_lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=wait, cancel_futures=True)
+
+
+async def run_prophet_fit(
+    model_cls: Any,
+    train_df: pd.DataFrame,
+    holidays_df: Optional[pd.DataFrame],
+    days: int,
+    history_len: int,
+) -> ProphetFitResult:
+    """Return a cached fit or compute one without blocking the event loop."""
+    cache_key = prophet_fit_cache_key(train_df, holidays_df, days, history_len)
+    cached = prophet_fit_cache.get(cache_key, model_cls)
+    if cached is not None:
+        logger.debug("prophet_fit_cache_hit", days=days, rows=len(train_df))
+        return cached
+
+    loop = asyncio.get_running_loop()
+    try:
+        result = await loop.run_in_executor(
+            get_forecast_executor(),
+            fit_prophet_forecast,
+            model_cls,
+            train_df,
+            holidays_df,
+            days,
+            history_len,
+        )
+    except BrokenProcessPool:
+        # A crashed worker poisons the pool; rebuild it on the next call.
+        shutdown_forecast_executor()
+        raise
+
+    prophet_fit_cache.put(cache_key, model_cls, result)
+    return result
+
+
+__all__ = [
+    "PROPHET_FIT_CACHE_MAX_ENTRIES",
+    "ProphetFitCache",
+    "ProphetFitResult",
+    "fit_prophet_forecast",
+    "get_forecast_executor",
+    "prophet_fit_cache",
+    "prophet_fit_cache_key",
+    "run_prophet_fit",
+    "shutdown_forecast_executor",
+]
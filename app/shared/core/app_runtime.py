@@ -7,6 +7,10 @@ from typing import Any
 import structlog
 
 from app.shared.core.config import get_settings
+from app.shared.core.event_loop_monitor import (
+    EventLoopMonitor,
+    build_event_loop_monitor,
+)
 from app.shared.core.ops_metrics import record_runtime_carbon_emissions
 
 
@@ -73,11 +77,32 @@ def _stop_emissions_tracker(tracker: Any) -> None:
     record_runtime_carbon_emissions(emissions_kg)
 
 
+def _start_event_loop_monitor() -> EventLoopMonitor:
+    """Start event loop health sampling on the running loop (off in test mode)."""
+    if _is_test_mode():
+        monitor = EventLoopMonitor(mode="off")
+    else:
+        monitor = build_event_loop_monitor(get_settings())
+    monitor.start()
+    return monitor
+
+
+async def _stop_runtime_workers(monitor: EventLoopMonitor) -> None:
+    """Stop the event loop monitor and the shared forecast process pool."""
+    await monitor.stop()
+    # Lazy import: the forecaster pulls in pandas/prophet helpers.
+    from app.shared.analysis.forecaster_prophet_ops import shutdown_forecast_executor
+
+    shutdown_forecast_executor()
+
+
 __all__ = [
     "_api_documentation_allowed",
     "_is_test_mode",
     "_load_emissions_tracker",
     "_runtime_data_dir",
+    "_start_event_loop_monitor",
     "_stop_emissions_tracker",
+    "_stop_runtime_workers",
     "EmissionsTracker",
 ]
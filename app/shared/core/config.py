@@ -2,7 +2,7 @@ from functools import lru_cache
 from threading import Lock
 from typing import Optional
 import structlog
-from pydantic_settings import BaseSettings, SettingsConfigDict
+from pydantic_settings import SettingsConfigDict
 from pydantic import Field, model_validator
 from app.shared.core.constants import AWS_SUPPORTED_REGIONS
 from app.shared.core.config_validation import (
@@ -21,6 +21,7 @@ from app.shared.core.config_validation import (
 from app.shared.core.config_validation_observability import (
     validate_observability_config as _validate_observability_config_impl,
 )
+from app.shared.core.config_runtime_tuning import RuntimeTuningSettings
 
 # Environment Constants (Finding #10)
 ENV_PRODUCTION = "production"
@@ -60,7 +61,7 @@ def reload_settings_from_environment() -> "Settings":
         return current
 
 
-class Settings(BaseSettings):
+class Settings(RuntimeTuningSettings):
     """
     Main configuration for Valdrics AI.
     Uses Pydantic-Settings for environment variable parsing from .env.
@@ -283,10 +284,16 @@ class Settings(BaseSettings):
     DB_POOL_RECYCLE: int = 3600
     DB_ECHO: bool = False
     DB_SLOW_QUERY_THRESHOLD_SECONDS: float = 0.2
+    # Optional read-only replica for reporting reads (`get_read_db`); falls back to primary.
+    DATABASE_READ_REPLICA_URL: Optional[str] = None
+    DB_READ_REPLICA_MAX_LAG_SECONDS: float = 5.0
     # Set true only when an external DB pooler (e.g. Supavisor transaction pooler)
     # is explicitly used and double-pooling is undesirable.
     DB_USE_NULL_POOL: bool = False
     DB_EXTERNAL_POOLER: bool = False
+    # auto|transaction|session|direct; statement caching is on only for direct/session.
+    DB_POOLER_MODE: str = "auto"
+    DB_STATEMENT_CACHE_SIZE: int = 256
     # Tests default to in-memory sqlite to avoid accidental side-effects on real databases.
     # Set true to allow tests to use DATABASE_URL (e.g., integration tests against Postgres).
     ALLOW_TEST_DATABASE_URL: bool = False
@@ -0,0 +1,28 @@
+"""Runtime tuning settings shared by the app process and its workers."""
+
+from pydantic_settings import BaseSettings
+
+
+class RuntimeTuningSettings(BaseSettings):
+    """
+    Event loop, process pool and scheduler spread knobs.
+
+    Kept apart from `Settings` so the main config stays readable; every field
+    is still read from the environment through `Settings`.
+    """
+
+    # Event loop health: off | lag (lag histogram) | sampled | full (stall stacks).
+    EVENT_LOOP_MONITOR_MODE: str = "sampled"
+    EVENT_LOOP_BLOCKING_THRESHOLD_SECONDS: float = 0.25
+    EVENT_LOOP_STACK_SAMPLE_RATE: float = 0.1
+    # Worker processes for off-loop Prophet fits (shared per app process).
+    FORECAST_PROCESS_POOL_WORKERS: int = 2
+    # Cohort jobs are spread over a fraction of the cohort interval in buckets.
+    SCHEDULER_COHORT_SPREAD_FRACTION: float = 0.5
+    SCHEDULER_COHORT_SPREAD_MAX_SECONDS: int = 21600
+    SCHEDULER_COHORT_BUCKET_SECONDS: int = 300
+    SCHEDULER_COHORT_BUCKET_CAPACITY_SECONDS: int = 7200
+    SCHEDULER_COHORT_BUCKET_MAX_JOBS: int = 100
+
+
+__all__ = ["RuntimeTuningSettings"]
@@ -219,8 +219,8 @@ def validate_enforcement_guardrails(settings_obj: object) -> None:
         raise ValueError("ENFORCEMENT_EXPORT_MAX_DAYS must be <= 3650.")
     if getattr(settings_obj, "ENFORCEMENT_EXPORT_MAX_ROWS", 0) < 1:
         raise ValueError("ENFORCEMENT_EXPORT_MAX_ROWS must be >= 1.")
-    if getattr(settings_obj, "ENFORCEMENT_EXPORT_MAX_ROWS", 0) > 50000:
-        raise ValueError("ENFORCEMENT_EXPORT_MAX_ROWS must be <= 50000.")
+    if getattr(settings_obj, "ENFORCEMENT_EXPORT_MAX_ROWS", 0) > 1_000_000:
+        raise ValueError("ENFORCEMENT_EXPORT_MAX_ROWS must be <= 1000000.")
 
     fallback_signing_keys = list(
         getattr(settings_obj, "ENFORCEMENT_APPROVAL_TOKEN_FALLBACK_SECRETS", []) or []
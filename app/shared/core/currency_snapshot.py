@@ -0,0 +1,116 @@
+"""
+Per-run FX snapshots for ingestion streams.
+
+An ingestion run resolves each currency it sees once through the FX service
+(`get_exchange_rate`, with the usual L1/Redis/DB/live layers) and freezes the
+rate for the rest of the run. Row conversion is then synchronous and uses the
+same `convert_to_usd_amount` arithmetic as `convert_to_usd`, so converted
+values are identical to the per-row path. Every row records the snapshot id,
+capture time and the rate it was converted with.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable, Iterable
+from datetime import datetime, timezone
+from decimal import Decimal, InvalidOperation
+from types import MappingProxyType
+from typing import Any, Mapping
+from uuid import uuid4
+
+import httpx
+
+from app.shared.core import currency as fx_service
+from app.shared.core.currency_ops import convert_to_usd_amount, normalize_currency
+
+USD_RATE = Decimal("1.0")
+FX_SNAPSHOT_RECOVERABLE_ERRORS: tuple[type[Exception], ...] = (
+    fx_service.ExchangeRateUnavailableError,
+    httpx.HTTPError,
+    InvalidOperation,
+    RuntimeError,
+    TypeError,
+    ValueError,
+)
+
+
+class FxRateSnapshot:
+    """
+    Run-scoped, write-once FX rates (USD base).
+
+    Usage:
+        fx = await FxRateSnapshot.capture(row["currency"] for row in page)
+        await fx.resolve(row["currency"] for row in next_page)
+        cost_usd = float(fx.convert_to_usd(amount, currency))
+        row["fx_snapshot"] = fx.row_metadata(currency)
+    """
+
+    def __init__(
+        self,
+        *,
+        rate_fn: Callable[[str], Awaitable[Decimal]] | None = None,
+        recoverable_errors: tuple[type[Exception], ...] | None = None,
+    ) -> None:
+        self.snapshot_id = str(uuid4())
+        self.captured_at = datetime.now(timezone.utc)
+        self._rate_fn = rate_fn
+        self._recoverable_errors = (
+            FX_SNAPSHOT_RECOVERABLE_ERRORS
+            if recoverable_errors is None
+            else recoverable_errors
+        )
+        self._rates: dict[str, Decimal] = {"USD": USD_RATE}
+        self._failures: dict[str, Exception] = {}
+
+    @classmethod
+    async def capture(cls, currencies: Iterable[Any], **kwargs: Any) -> FxRateSnapshot:
+        snapshot = cls(**kwargs)
+        await snapshot.resolve(currencies)
+        return snapshot
+
+    @property
+    def rates(self) -> Mapping[str, Decimal]:
+        return MappingProxyType(self._rates)
+
+    async def _lookup(self, currency: str) -> Decimal:
+        if self._rate_fn is not None:
+            return await self._rate_fn(currency)
+        return await fx_service.get_exchange_rate(currency)
+
+    async def resolve(self, currencies: Iterable[Any]) -> None:
+        """Resolve every currency not yet in the snapshot, once each."""
+        for raw in currencies:
+            currency = normalize_currency(str(raw) if raw else None)
+            if currency in self._rates or currency in self._failures:
+                continue
+            try:
+                self._rates[currency] = Decimal(str(await self._lookup(currency)))
+            except self._recoverable_errors as exc:
+                # Surfaced per row by `convert_to_usd`, like the per-row lookups.
+                self._failures[currency] = exc
+
+    def convert_to_usd(self, amount: float | Decimal, currency: str) -> Decimal:
+        """Convert against the snapshot (no I/O); unresolved currencies raise."""
+        code = normalize_currency(currency)
+        if code == "USD":
+            return Decimal(str(amount))
+        rate = self._rates.get(code)
+        if rate is None:
+            raise fx_service.ExchangeRateUnavailableError(
+                f"{code} rate is not in FX snapshot {self.snapshot_id}: "
+                f"{self._failures.get(code, 'not resolved')}"
+            ) from self._failures.get(code)
+        return convert_to_usd_amount(amount, rate)
+
+    def row_metadata(self, currency: str) -> dict[str, Any]:
+        code = normalize_currency(currency)
+        rate = self._rates.get(code)
+        return {
+            "snapshot_id": self.snapshot_id,
+            "captured_at": self.captured_at.isoformat(),
+            "currency": code,
+            "rate": str(rate) if rate is not None else None,
+        }
+
+
+__all__ = ["FX_SNAPSHOT_RECOVERABLE_ERRORS", "FxRateSnapshot", "USD_RATE"]
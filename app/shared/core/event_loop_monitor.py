@@ -0,0 +1,244 @@
+"""
+Event loop health: scheduling lag and blocking-call detection.
+
+Synchronous work hidden inside a coroutine (a Prophet fit, a BigQuery
+`result()`, a pandas transform) stalls every other request on the worker.
+`EventLoopMonitor` makes that visible:
+- a sampler task records how late the loop runs it on every tick
+  (`valdrics_ops_event_loop_lag_seconds`);
+- a watchdog thread watches the sampler's next due time and, once the loop is
+  overdue by more than the blocking threshold, counts the stall and grabs the
+  loop thread's stack while the offending call is still running.
+
+Modes (`EVENT_LOOP_MONITOR_MODE`):
+- ``off``: nothing runs.
+- ``lag``: lag histogram only, no watchdog thread.
+- ``sampled``: lag and stall counts; a stack is captured for a random
+  `EVENT_LOOP_STACK_SAMPLE_RATE` share of stalls and at most once per
+  `min_capture_interval_seconds`, which keeps it cheap enough for production.
+- ``full``: capture every stall (load tests, local debugging).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import os
+import random
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from dataclasses import dataclass
+from typing import Any
+
+import structlog
+
+from app.shared.core.ops_metrics_runtime import (
+    EVENT_LOOP_BLOCKED_TOTAL,
+    EVENT_LOOP_LAG_SECONDS,
+)
+
+logger = structlog.get_logger()
+
+EVENT_LOOP_MONITOR_MODES = ("off", "lag", "sampled", "full")
+DEFAULT_EVENT_LOOP_MONITOR_MODE = "sampled"
+DEFAULT_LAG_INTERVAL_SECONDS = 0.5
+DEFAULT_BLOCKING_THRESHOLD_SECONDS = 0.25
+DEFAULT_STACK_SAMPLE_RATE = 0.1
+DEFAULT_MIN_CAPTURE_INTERVAL_SECONDS = 30.0
+MAX_STACK_FRAMES = 40
+RECENT_STALLS_LIMIT = 20
+
+_APP_PACKAGE_DIR = (
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    + os.sep
+)
+
+
+@dataclass(frozen=True)
+class BlockingStall:
+    """A stall observed by the watchdog while the loop was still blocked."""
+
+    overdue_seconds: float
+    site: str | None = None  # innermost application frame, when captured
+    stack: tuple[str, ...] = ()  # formatted frames, outermost first
+
+    @property
+    def stack_captured(self) -> bool:
+        return bool(self.stack)
+
+
+def offending_site(frames: list[traceback.FrameSummary]) -> str | None:
+    """Innermost frame in application code, else the innermost frame."""
+    if not frames:
+        return None
+    app_frames = [item for item in frames if item.filename.startswith(_APP_PACKAGE_DIR)]
+    frame = (app_frames or frames)[-1]
+    return f"{frame.filename}:{frame.lineno} in {frame.name}"
+
+
+class EventLoopMonitor:
+    """Samples event loop lag and captures stacks of calls that block it."""
+
+    def __init__(
+        self,
+        *,
+        mode: str = DEFAULT_EVENT_LOOP_MONITOR_MODE,
+        lag_interval_seconds: float = DEFAULT_LAG_INTERVAL_SECONDS,
+        blocking_threshold_seconds: float = DEFAULT_BLOCKING_THRESHOLD_SECONDS,
+        stack_sample_rate: float = DEFAULT_STACK_SAMPLE_RATE,
+        min_capture_interval_seconds: float = DEFAULT_MIN_CAPTURE_INTERVAL_SECONDS,
+        rng: random.Random | None = None,
+    ) -> None:
+        if mode not in EVENT_LOOP_MONITOR_MODES:
+            raise ValueError(f"unsupported event loop monitor mode: {mode!r}")
+        if lag_interval_seconds <= 0 or blocking_threshold_seconds <= 0:
+            raise ValueError("event loop monitor intervals must be > 0")
+        self.mode = mode
+        self.blocking_threshold_seconds = float(blocking_threshold_seconds)
+        self.stack_sample_rate = min(1.0, max(0.0, float(stack_sample_rate)))
+        self.min_capture_interval_seconds = max(0.0, min_capture_interval_seconds)
+        # Stall detection needs a heartbeat well inside the blocking threshold.
+        self.tick_seconds = float(lag_interval_seconds)
+        if self.detects_stalls:
+            self.tick_seconds = min(self.tick_seconds, blocking_threshold_seconds / 2)
+        self.recent_stalls: deque[BlockingStall] = deque(maxlen=RECENT_STALLS_LIMIT)
+        self._rng = rng or random.Random()
+        self._next_due = math.inf
+        self._last_capture_at = -math.inf
+        self._loop_thread_id: int | None = None
+        self._task: asyncio.Task[None] | None = None
+        self._watchdog: threading.Thread | None = None
+        self._stopping = threading.Event()
+
+    @property
+    def detects_stalls(self) -> bool:
+        return self.mode in {"sampled", "full"}
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start sampling on the running loop; a no-op when off or running."""
+        if self.mode == "off" or self.running:
+            return
+        self._stopping.clear()
+        self._loop_thread_id = threading.get_ident()
+        self._next_due = math.inf
+        self._task = asyncio.get_running_loop().create_task(
+            self._sample_lag(), name="event-loop-monitor"
+        )
+        if self.detects_stalls:
+            self._watchdog = threading.Thread(
+                target=self._watch, name="event-loop-watchdog", daemon=True
+            )
+            self._watchdog.start()
+        logger.info(
+            "event_loop_monitor_started",
+            mode=self.mode,
+            tick_seconds=self.tick_seconds,
+            blocking_threshold_seconds=self.blocking_threshold_seconds,
+        )
+
+    async def stop(self) -> None:
+        self._stopping.set()
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+        watchdog, self._watchdog = self._watchdog, None
+        if watchdog is not None:
+            watchdog.join(timeout=1.0)
+        self._next_due = math.inf
+
+    async def _sample_lag(self) -> None:
+        # `time.monotonic` is the clock both asyncio and the watchdog run on.
+        while True:
+            due = time.monotonic() + self.tick_seconds
+            self._next_due = due
+            await asyncio.sleep(self.tick_seconds)
+            EVENT_LOOP_LAG_SECONDS.observe(max(0.0, time.monotonic() - due))
+
+    def _watch(self) -> None:
+        handled_due: float | None = None
+        while not self._stopping.wait(self.blocking_threshold_seconds / 4):
+            due = self._next_due
+            overdue = time.monotonic() - due
+            if overdue < self.blocking_threshold_seconds or due == handled_due:
+                continue
+            handled_due = due  # one record per stall, however long it lasts
+            self._record_stall(overdue)
+
+    def _should_capture(self, now: float) -> bool:
+        if self.mode == "full":
+            return True
+        if now - self._last_capture_at < self.min_capture_interval_seconds:
+            return False
+        return self._rng.random() < self.stack_sample_rate
+
+    def _record_stall(self, overdue_seconds: float) -> None:
+        now = time.monotonic()
+        stall = BlockingStall(overdue_seconds=round(overdue_seconds, 6))
+        if self._should_capture(now):
+            self._last_capture_at = now
+            stall = self._capture_stack(stall.overdue_seconds)
+        self.recent_stalls.append(stall)
+        EVENT_LOOP_BLOCKED_TOTAL.labels(
+            stack_captured=str(stall.stack_captured).lower()
+        ).inc()
+        if stall.stack_captured:
+            logger.warning(
+                "event_loop_blocked",
+                overdue_seconds=stall.overdue_seconds,
+                site=stall.site,
+                stack=list(stall.stack),
+            )
+
+    def _capture_stack(self, overdue_seconds: float) -> BlockingStall:
+        frame = sys._current_frames().get(self._loop_thread_id or -1)
+        if frame is None:
+            return BlockingStall(overdue_seconds=overdue_seconds)
+        frames = list(traceback.extract_stack(frame, limit=MAX_STACK_FRAMES))
+        del frame
+        return BlockingStall(
+            overdue_seconds=overdue_seconds,
+            site=offending_site(frames),
+            stack=tuple(line.rstrip() for line in traceback.format_list(frames)),
+        )
+
+
+def build_event_loop_monitor(settings: Any) -> EventLoopMonitor:
+    """Build the monitor from settings, falling back to defaults on bad values."""
+    mode = str(getattr(settings, "EVENT_LOOP_MONITOR_MODE", "") or "").strip().lower()
+    if mode not in EVENT_LOOP_MONITOR_MODES:
+        logger.warning("event_loop_monitor_mode_invalid", mode=mode)
+        mode = DEFAULT_EVENT_LOOP_MONITOR_MODE
+    threshold = float(
+        getattr(settings, "EVENT_LOOP_BLOCKING_THRESHOLD_SECONDS", 0) or 0
+    )
+    return EventLoopMonitor(
+        mode=mode,
+        blocking_threshold_seconds=(
+            threshold if threshold > 0 else DEFAULT_BLOCKING_THRESHOLD_SECONDS
+        ),
+        stack_sample_rate=float(
+            getattr(settings, "EVENT_LOOP_STACK_SAMPLE_RATE", DEFAULT_STACK_SAMPLE_RATE)
+        ),
+    )
+
+
+__all__ = [
+    "DEFAULT_BLOCKING_THRESHOLD_SECONDS",
+    "DEFAULT_EVENT_LOOP_MONITOR_MODE",
+    "DEFAULT_LAG_INTERVAL_SECONDS",
+    "DEFAULT_MIN_CAPTURE_INTERVAL_SECONDS",
+    "DEFAULT_STACK_SAMPLE_RATE",
+    "EVENT_LOOP_MONITOR_MODES",
+    "BlockingStall",
+    "EventLoopMonitor",
+    "build_event_loop_monitor",
+    "offending_site",
+]
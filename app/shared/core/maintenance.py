@@ -14,6 +14,9 @@ PARTITION_MAINTENANCE_RECOVERABLE_EXCEPTIONS = (
 )
 _SAFE_IDENTIFIER_PATTERN = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
 _PARTITION_NAME_PATTERN = re.compile(r"^cost_records_(\d{4})_(\d{2})$")
+_PARTITION_RANGE_BOUND_PATTERN = re.compile(
+    r"FROM \('(\d{4}-\d{2}-\d{2})'\) TO \('(\d{4}-\d{2}-\d{2})'\)"
+)
 
 class PartitionMaintenanceService:
     """
@@ -139,6 +142,60 @@ class PartitionMaintenanceService:
             if getattr(row, "partition_name", None)
         ]
 
+    async def list_cost_record_partition_ranges(self) -> list[tuple[str, date, date]]:
+        """
+        Return `(partition_name, lower_bound, upper_bound)` for every bounded
+        cost_records range partition. The DEFAULT partition is skipped and names
+        are validated as safe SQL identifiers.
+        """
+        result = await self.db.execute(
+            text(
+                """
+                SELECT
+                    child.relname AS partition_name,
+                    pg_get_expr(child.relpartbound, child.oid) AS partition_bound
+                FROM pg_inherits
+                JOIN pg_class AS parent ON pg_inherits.inhparent = parent.oid
+                JOIN pg_class AS child ON pg_inherits.inhrelid = child.oid
+                JOIN pg_namespace AS ns ON child.relnamespace = ns.oid
+                WHERE parent.relname = 'cost_records'
+                  AND ns.nspname = current_schema()
+                ORDER BY child.relname
+                """
+            )
+        )
+        ranges: list[tuple[str, date, date]] = []
+        for row in result:
+            match = _PARTITION_RANGE_BOUND_PATTERN.search(
+                str(getattr(row, "partition_bound", "") or "")
+            )
+            if not match or not getattr(row, "partition_name", None):
+                continue
+            ranges.append(
+                (
+                    self._validate_identifier(str(row.partition_name)),
+                    date.fromisoformat(match.group(1)),
+                    date.fromisoformat(match.group(2)),
+                )
+            )
+        return sorted(ranges, key=lambda item: item[1])
+
+    async def acquire_maintenance_lock(self) -> None:
+        """Serialize partition maintenance within the current transaction."""
+        await self.db.execute(
+            text("SELECT pg_advisory_xact_lock(:lock_id)"),
+            {"lock_id": self.PARTITION_MAINTENANCE_LOCK_ID},
+        )
+
+    async def detach_and_drop_cost_record_partition(self, partition_name: str) -> None:
+        """Detach a cost_records partition and drop it without row-level deletes."""
+        safe_partition_name = self._validate_identifier(partition_name)
+        await self.db.execute(
+            text(f"ALTER TABLE cost_records DETACH PARTITION {safe_partition_name}")
+        )
+        await self.db.execute(text(f"DROP TABLE IF EXISTS {safe_partition_name}"))
+        logger.info("partition_dropped", partition=safe_partition_name)
+
     async def _archive_partition(self, partition_name: str, *, shared_columns: list[str]) -> int:
         safe_partition_name = self._validate_identifier(partition_name)
         if not shared_columns:
@@ -1,9 +1,10 @@
-from collections.abc import Awaitable, Callable
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.responses import Response
-from fastapi import Request
 import uuid
+
 import structlog
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.requests import Request
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
 from app.shared.core.config import get_settings
 from app.shared.core.proxy_headers import apply_trusted_proxy_headers
 from app.shared.core.tracing import set_correlation_id
@@ -13,6 +14,11 @@ REQUEST_ID_ALLOWED_CHARS = frozenset(
 )
 REQUEST_ID_MIN_LENGTH = 8
 REQUEST_ID_MAX_LENGTH = 128
+DOCS_PATHS = frozenset({"/docs", "/redoc", "/openapi.json"})
+
+# Pure ASGI middlewares: unlike BaseHTTPMiddleware they do not spawn a task per
+# request or re-wrap the response body stream, so streaming responses (FOCUS CSV
+# export, SSE) pass through untouched and per-request overhead stays minimal.
 
 
 def _normalize_request_id(value: str | None) -> str:
@@ -25,76 +31,101 @@ def _normalize_request_id(value: str | None) -> str:
     return str(uuid.uuid4())
 
 
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
-    async def dispatch(
-        self, request: Request, call_next: Callable[[Request], Awaitable[Response]]
-    ) -> Response:
-        settings = get_settings()
+def _build_csp_policy(cors_origins: list[str]) -> str:
+    # CSP connect-src: Restrict based on allowed origins from config
+    # Convert CORS_ORIGINS list to a space-separated string for CSP
+    allowed_origins = " ".join(cors_origins)
+    connect_src = f"'self' {allowed_origins}"
+    return (
+        "default-src 'self'; "
+        "img-src 'self' data: https:; "
+        "script-src 'self'; "
+        "style-src 'self'; "
+        "style-src-elem 'self'; "
+        "style-src-attr 'none'; "
+        "font-src 'self' data:; "
+        f"connect-src {connect_src}; "
+        "object-src 'none'; "
+        "frame-ancestors 'none'; "
+        "form-action 'self'; "
+        "base-uri 'self';"
+    )
+
+
+def apply_security_headers(
+    headers: MutableHeaders, *, scheme: str, path: str, settings_obj: object
+) -> None:
+    """Apply the platform security header set to an outgoing response."""
+    # HSTS: Disable in debug mode for local development, only send on HTTPS
+    if scheme == "https":
+        if getattr(settings_obj, "DEBUG", False):
+            headers["Strict-Transport-Security"] = "max-age=0"
+        else:
+            headers["Strict-Transport-Security"] = (
+                "max-age=31536000; includeSubDomains; preload"
+            )
 
-        response = await call_next(request)
+    if "X-Content-Type-Options" not in headers:
+        headers["X-Content-Type-Options"] = "nosniff"
 
-        # HSTS: Disable in debug mode for local development
-        # HSTS: Disable in debug mode for local development, only send on HTTPS
-        if request.url.scheme == "https":
-            if settings.DEBUG:
-                response.headers["Strict-Transport-Security"] = "max-age=0"
-            else:
-                response.headers["Strict-Transport-Security"] = (
-                    "max-age=31536000; includeSubDomains; preload"
-                )
+    if "X-Frame-Options" not in headers:
+        headers["X-Frame-Options"] = "DENY"
+
+    # Skip strict CSP for Swagger UI (requires inline scripts)
+    if path in DOCS_PATHS:
+        return
 
-        if "X-Content-Type-Options" not in response.headers:
-            response.headers["X-Content-Type-Options"] = "nosniff"
-
-        if "X-Frame-Options" not in response.headers:
-            response.headers["X-Frame-Options"] = "DENY"
-
-        # Skip strict CSP for Swagger UI (requires inline scripts)
-        if request.url.path in ["/docs", "/redoc", "/openapi.json"]:
-            return response
-
-        # CSP connect-src: Restrict based on allowed origins from config
-        # Convert CORS_ORIGINS list to a space-separated string for CSP
-        allowed_origins = " ".join(settings.CORS_ORIGINS)
-        connect_src = f"'self' {allowed_origins}"
-
-        csp_policy = (
-            "default-src 'self'; "
-            "img-src 'self' data: https:; "
-            "script-src 'self'; "
-            "style-src 'self'; "
-            "style-src-elem 'self'; "
-            "style-src-attr 'none'; "
-            "font-src 'self' data:; "
-            f"connect-src {connect_src}; "
-            "object-src 'none'; "
-            "frame-ancestors 'none'; "
-            "form-action 'self'; "
-            "base-uri 'self';"
+    if "Content-Security-Policy" not in headers:
+        headers["Content-Security-Policy"] = _build_csp_policy(
+            list(getattr(settings_obj, "CORS_ORIGINS", []) or [])
         )
-        if "Content-Security-Policy" not in response.headers:
-            response.headers["Content-Security-Policy"] = csp_policy
 
-        if "Referrer-Policy" not in response.headers:
-            response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
+    if "Referrer-Policy" not in headers:
+        headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
+
+    if "Permissions-Policy" not in headers:
+        headers["Permissions-Policy"] = (
+            "camera=(), microphone=(), geolocation=(), interest-cohort=()"
+        )
 
-        if "Permissions-Policy" not in response.headers:
-            response.headers["Permissions-Policy"] = (
-                "camera=(), microphone=(), geolocation=(), interest-cohort=()"
-            )
 
-        return response
+class SecurityHeadersMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
 
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        settings = get_settings()
+
+        async def send_with_security_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # Read scheme/path at response time so upstream scope rewrites
+                # (trusted proxy headers) are honoured.
+                apply_security_headers(
+                    MutableHeaders(scope=message),
+                    scheme=str(scope.get("scheme") or "http"),
+                    path=str(scope.get("path") or ""),
+                    settings_obj=settings,
+                )
+            await send(message)
+
+        await self.app(scope, receive, send_with_security_headers)
 
-class TrustedProxyHeadersMiddleware(BaseHTTPMiddleware):
-    async def dispatch(
-        self, request: Request, call_next: Callable[[Request], Awaitable[Response]]
-    ) -> Response:
-        apply_trusted_proxy_headers(request, settings_obj=get_settings())
-        return await call_next(request)
 
+class TrustedProxyHeadersMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
 
-class RequestIDMiddleware(BaseHTTPMiddleware):
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http":
+            apply_trusted_proxy_headers(Request(scope), settings_obj=get_settings())
+        await self.app(scope, receive, send)
+
+
+class RequestIDMiddleware:
     """
     Injects a unique X-Request-ID into the logs and response.
     Integrates with app.shared.core.tracing for cross-process correlation.
@@ -102,10 +133,15 @@ class RequestIDMiddleware(BaseHTTPMiddleware):
     This is intended for correlation and debugging, not as a security principal.
     """
 
-    async def dispatch(
-        self, request: Request, call_next: Callable[[Request], Awaitable[Response]]
-    ) -> Response:
-        raw_request_id = request.headers.get("X-Request-ID")
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        raw_request_id = Headers(scope=scope).get("X-Request-ID")
         request_id = _normalize_request_id(raw_request_id)
         if raw_request_id and raw_request_id != request_id:
             structlog.get_logger().warning(
@@ -116,13 +152,16 @@ class RequestIDMiddleware(BaseHTTPMiddleware):
         # Set unified tracing context
         set_correlation_id(request_id)
 
-        # Store in state for easy access in endpoints and tests
-        request.state.request_id = request_id
+        # Store in state (backs request.state) for easy access in endpoints and tests
+        scope.setdefault("state", {})["request_id"] = request_id
 
         # Log injection via contextvars (supported by structlog)
         structlog.contextvars.clear_contextvars()
         structlog.contextvars.bind_contextvars(request_id=request_id)
 
-        response = await call_next(request)
-        response.headers["X-Request-ID"] = request_id
-        return response
+        async def send_with_request_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message)["X-Request-ID"] = request_id
+            await send(message)
+
+        await self.app(scope, receive, send_with_request_id)
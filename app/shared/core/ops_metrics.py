@@ -48,6 +48,15 @@ RLS_ENFORCEMENT_LATENCY = Histogram(
     "Latency in seconds to apply RLS tenant context in DB session setup",
     buckets=(0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1),
 )
+DB_READ_REPLICA_LAG_SECONDS = Gauge(
+    "valdrics_ops_db_read_replica_lag_seconds",
+    "Last measured read replica replay lag in seconds",
+)
+DB_READ_ROUTING_TOTAL = Counter(
+    "valdrics_ops_db_read_routing_total",
+    "Read-only request sessions by serving database and routing reason",
+    ["target", "reason"],
+)
 
 # --- Queue & Scheduling Metrics ---
 BACKGROUND_JOBS_ENQUEUED = Counter(
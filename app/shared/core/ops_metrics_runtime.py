@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import math
 
-from prometheus_client import Counter, Gauge
+from prometheus_client import Counter, Gauge, Histogram
 import structlog
 
 
@@ -28,6 +28,18 @@ RUNTIME_CARBON_EMISSIONS_LAST_RUN = Gauge(
     "Carbon emissions measured for the most recent application runtime in kilograms CO2eq",
 )
 
+EVENT_LOOP_LAG_SECONDS = Histogram(
+    "valdrics_ops_event_loop_lag_seconds",
+    "How late the event loop ran the loop health sampler",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+)
+
+EVENT_LOOP_BLOCKED_TOTAL = Counter(
+    "valdrics_ops_event_loop_blocked_total",
+    "Event loop stalls longer than the blocking threshold",
+    ["stack_captured"],
+)
+
 
 def record_runtime_carbon_emissions(emissions_kg: float | None) -> None:
     """Persist runtime carbon emissions as Prometheus signals."""
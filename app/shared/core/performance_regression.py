@@ -0,0 +1,112 @@
+"""
+Statistical regression checks for offline benchmark baselines.
+
+`PerformanceRegressionDetector` flags any run whose mean exceeds a fixed
+multiple of the baseline, which is either too loose for stable benchmarks or
+too trigger-happy on noisy ones. Here a benchmark regresses only when both:
+- its median slowed down by more than the benchmark's own noise budget, and
+- a one-sided Mann-Whitney U test over the raw per-repeat samples says the
+  slowdown is statistically significant (p < alpha).
+"""
+
+from __future__ import annotations
+
+import statistics
+from collections.abc import Sequence
+from dataclasses import asdict, dataclass
+
+from scipy.stats import mannwhitneyu
+
+DEFAULT_REGRESSION_ALPHA = 0.01
+# Below this many samples per side the U test cannot reach significance.
+MIN_SAMPLES_FOR_SIGNIFICANCE = 5
+
+
+@dataclass(frozen=True)
+class BenchmarkComparison:
+    """Outcome of comparing one benchmark against its stored baseline."""
+
+    name: str
+    status: str  # "regressed" | "improved" | "unchanged" | "new"
+    noise_budget: float
+    current_median_seconds: float
+    baseline_median_seconds: float | None = None
+    change_ratio: float | None = None
+    p_value: float | None = None
+
+    @property
+    def regressed(self) -> bool:
+        return self.status == "regressed"
+
+    def model_dump(self) -> dict[str, object]:
+        return asdict(self)
+
+
+def _one_sided_p_value(
+    baseline: Sequence[float], current: Sequence[float], *, alternative: str
+) -> float | None:
+    if min(len(baseline), len(current)) < MIN_SAMPLES_FOR_SIGNIFICANCE:
+        return None
+    result = mannwhitneyu(current, baseline, alternative=alternative)
+    return float(result.pvalue)
+
+
+def compare_benchmark_samples(
+    name: str,
+    *,
+    current_samples: Sequence[float],
+    baseline_samples: Sequence[float] | None,
+    noise_budget: float,
+    alpha: float = DEFAULT_REGRESSION_ALPHA,
+) -> BenchmarkComparison:
+    """
+    Compare per-repeat timings (seconds) of one benchmark with its baseline.
+
+    `noise_budget` is the relative median change tolerated before the
+    significance test is consulted (0.10 == 10%).
+    """
+    if not current_samples:
+        raise ValueError(f"benchmark {name!r} has no samples")
+    current_median = statistics.median(current_samples)
+    if not baseline_samples:
+        return BenchmarkComparison(
+            name=name,
+            status="new",
+            noise_budget=noise_budget,
+            current_median_seconds=current_median,
+        )
+
+    baseline_median = statistics.median(baseline_samples)
+    change_ratio = current_median / baseline_median if baseline_median > 0 else None
+    status = "unchanged"
+    p_value: float | None = None
+    if change_ratio is not None and change_ratio > 1.0 + noise_budget:
+        p_value = _one_sided_p_value(
+            baseline_samples, current_samples, alternative="greater"
+        )
+        if p_value is not None and p_value < alpha:
+            status = "regressed"
+    elif change_ratio is not None and change_ratio < 1.0 - noise_budget:
+        p_value = _one_sided_p_value(
+            baseline_samples, current_samples, alternative="less"
+        )
+        if p_value is not None and p_value < alpha:
+            status = "improved"
+
+    return BenchmarkComparison(
+        name=name,
+        status=status,
+        noise_budget=noise_budget,
+        current_median_seconds=current_median,
+        baseline_median_seconds=baseline_median,
+        change_ratio=round(change_ratio, 4) if change_ratio is not None else None,
+        p_value=p_value,
+    )
+
+
+__all__ = [
+    "DEFAULT_REGRESSION_ALPHA",
+    "MIN_SAMPLES_FOR_SIGNIFICANCE",
+    "BenchmarkComparison",
+    "compare_benchmark_samples",
+]
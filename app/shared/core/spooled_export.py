@@ -0,0 +1,170 @@
+"""
+Spooled, hash-on-write export artifacts.
+
+Large exports (audit CSVs, enforcement ledgers, compliance bundles) are written
+row by row into a `SpooledTemporaryFile` that stays in memory while small and
+rolls over to disk once it grows, so peak memory is bounded by the spool size
+rather than by the row count. The SHA-256 digest is computed while writing, so
+manifests never need a second pass over the content.
+"""
+
+from __future__ import annotations
+
+import csv
+import hashlib
+import shutil
+import tempfile
+from collections.abc import Iterable, Iterator
+from typing import IO, Any
+
+DEFAULT_SPOOL_MAX_BYTES = 8 * 1024 * 1024
+DEFAULT_CHUNK_BYTES = 64 * 1024
+
+
+class _HashingTextSink:
+    """File-like text sink that encodes, hashes and forwards writes."""
+
+    def __init__(self, artifact: "SpooledExportArtifact") -> None:
+        self._artifact = artifact
+
+    def write(self, text: str) -> int:
+        self._artifact.write_bytes(text.encode("utf-8"))
+        return len(text)
+
+
+class SpooledExportArtifact:
+    """
+    Append-only binary artifact backed by a spooled temporary file.
+
+    `sha256` and `size` always describe the bytes written so far.
+    """
+
+    def __init__(self, *, max_memory_bytes: int = DEFAULT_SPOOL_MAX_BYTES) -> None:
+        self._spool: IO[bytes] = tempfile.SpooledTemporaryFile(
+            max_size=max(0, int(max_memory_bytes)), mode="w+b"
+        )
+        self._digest = hashlib.sha256()
+        self._size = 0
+        self.row_count = 0
+
+    @property
+    def sha256(self) -> str:
+        return self._digest.hexdigest()
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def rolled_to_disk(self) -> bool:
+        return bool(getattr(self._spool, "_rolled", False))
+
+    @property
+    def fileobj(self) -> IO[bytes]:
+        return self._spool
+
+    def write_bytes(self, data: bytes) -> None:
+        if not data:
+            return
+        self._spool.write(data)
+        self._digest.update(data)
+        self._size += len(data)
+
+    def iter_chunks(self, chunk_size: int = DEFAULT_CHUNK_BYTES) -> Iterator[bytes]:
+        self._spool.seek(0)
+        while True:
+            chunk = self._spool.read(chunk_size)
+            if not chunk:
+                break
+            yield chunk
+        self._spool.seek(0, 2)
+
+    def copy_to(self, target: IO[bytes], chunk_size: int = DEFAULT_CHUNK_BYTES) -> None:
+        self._spool.seek(0)
+        shutil.copyfileobj(self._spool, target, chunk_size)
+        self._spool.seek(0, 2)
+
+    def read_text(self) -> str:
+        """Materialize the artifact as text; intended for small artifacts and tests."""
+        return b"".join(self.iter_chunks()).decode("utf-8")
+
+    def close(self) -> None:
+        self._spool.close()
+
+
+class SpooledCsvArtifact(SpooledExportArtifact):
+    """CSV writer over a `SpooledExportArtifact`; rows are hashed as written."""
+
+    def __init__(
+        self,
+        headers: Iterable[Any] | None = None,
+        *,
+        max_memory_bytes: int = DEFAULT_SPOOL_MAX_BYTES,
+    ) -> None:
+        super().__init__(max_memory_bytes=max_memory_bytes)
+        # `csv.writer` formats each row into a single write() call, so the
+        # bytes (and therefore the digest) match `csv.writer(io.StringIO())`.
+        self._writer = csv.writer(_HashingTextSink(self))
+        if headers is not None:
+            self._writer.writerow(list(headers))
+
+    def writerow(self, row: Iterable[Any]) -> None:
+        self._writer.writerow(list(row))
+        self.row_count += 1
+
+    def writerows(self, rows: Iterable[Iterable[Any]]) -> None:
+        for row in rows:
+            self.writerow(row)
+
+
+def new_spooled_archive(
+    *, max_memory_bytes: int = DEFAULT_SPOOL_MAX_BYTES
+) -> IO[bytes]:
+    """Seekable spool for zip archives that are assembled before being streamed."""
+    return tempfile.SpooledTemporaryFile(
+        max_size=max(0, int(max_memory_bytes)), mode="w+b"
+    )
+
+
+def iter_file_chunks(
+    fileobj: IO[bytes],
+    *,
+    chunk_size: int = DEFAULT_CHUNK_BYTES,
+    close: bool = True,
+) -> Iterator[bytes]:
+    """Yield a spooled file from the start, closing it afterwards."""
+    try:
+        fileobj.seek(0)
+        while True:
+            chunk = fileobj.read(chunk_size)
+            if not chunk:
+                break
+            yield chunk
+    finally:
+        if close:
+            fileobj.close()
+
+
+def iter_artifact_chunks(
+    artifact: SpooledExportArtifact,
+    *,
+    chunk_size: int = DEFAULT_CHUNK_BYTES,
+    close: bool = True,
+) -> Iterator[bytes]:
+    """Yield artifact content for a streaming response, closing it afterwards."""
+    try:
+        yield from artifact.iter_chunks(chunk_size)
+    finally:
+        if close:
+            artifact.close()
+
+
+__all__ = [
+    "DEFAULT_CHUNK_BYTES",
+    "DEFAULT_SPOOL_MAX_BYTES",
+    "SpooledCsvArtifact",
+    "SpooledExportArtifact",
+    "iter_artifact_chunks",
+    "iter_file_chunks",
+    "new_spooled_archive",
+]
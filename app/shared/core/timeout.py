@@ -13,10 +13,8 @@ from collections.abc import AsyncIterator, Awaitable, Callable
 from typing import Any, TypeVar
 
 import structlog
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import JSONResponse, Response
-from starlette.types import ASGIApp
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.shared.core.config import get_settings
 from app.shared.core.exceptions import ExternalAPIError
@@ -207,39 +205,55 @@ def set_timeout_config(operation_type: str, config: dict[str, int | float]) -> N
     logger.info("timeout_config_updated", operation_type=operation_type, config=config)
 
 
-class TimeoutMiddleware(BaseHTTPMiddleware):
+class TimeoutMiddleware:
     """
     Middleware to enforce request timeouts.
 
     Cancels requests that exceed the configured timeout to prevent
-    resource exhaustion from long-running operations.
+    resource exhaustion from long-running operations. The deadline covers the
+    time until the response starts; once headers are sent the body is allowed
+    to stream to completion (matching the previous call_next semantics).
     """
 
-    def __init__(self, app: ASGIApp, timeout_seconds: int | None = None) -> None:
-        super().__init__(app)
+    def __init__(self, app: ASGIApp, timeout_seconds: float | None = None) -> None:
+        self.app = app
         settings = get_settings()
         self.timeout_seconds = timeout_seconds or getattr(
             settings, "REQUEST_TIMEOUT", DEFAULT_TIMEOUT_SECONDS
         )
 
-    async def dispatch(
-        self, request: Request, call_next: Callable[[Request], Awaitable[Response]]
-    ) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        response_started = False
+
         try:
-            return await asyncio.wait_for(
-                call_next(request), timeout=self.timeout_seconds
-            )
-        except asyncio.TimeoutError:
+            async with asyncio.timeout(self.timeout_seconds) as deadline:
+
+                async def send_with_deadline(message: Message) -> None:
+                    nonlocal response_started
+                    if message["type"] == "http.response.start":
+                        response_started = True
+                        deadline.reschedule(None)
+                    await send(message)
+
+                await self.app(scope, receive, send_with_deadline)
+        except TimeoutError:
+            if response_started:
+                raise
             logger.warning(
                 "request_timeout",
-                path=request.url.path,
-                method=request.method,
+                path=scope.get("path"),
+                method=scope.get("method"),
                 timeout_seconds=self.timeout_seconds,
             )
-            return JSONResponse(
+            response = JSONResponse(
                 status_code=504,
                 content={
                     "detail": f"Request timed out after {self.timeout_seconds} seconds",
                     "error": "gateway_timeout",
                 },
             )
+            await response(scope, receive, send)
@@ -0,0 +1,304 @@
+"""
+Optional read replica routing for read-only request handlers.
+
+`get_read_db` serves reporting reads (cost dashboards, leadership KPIs, FOCUS
+exports) from `DATABASE_READ_REPLICA_URL` when it is configured, with the
+caller's tenant RLS context applied exactly like `get_db`. The primary session
+is only opened (through `get_db`) when the read falls back to it:
+
+- no replica is configured (tests, single-database deployments),
+- the authenticated user has no tenant,
+- measured replay lag is above `DB_READ_REPLICA_MAX_LAG_SECONDS` or the lag
+  probe fails,
+- the tenant context could not be bound on the replica session.
+
+Replica lag is probed at most once per `LAG_CHECK_INTERVAL_SECONDS`, by one
+request at a time. A replica whose WAL receiver is not streaming (disconnected,
+stalled past `wal_receiver_timeout`, or invisible to the probe role) counts as
+unavailable: having replayed everything it received says nothing about what it
+missed. A streaming replica that has replayed everything reports zero lag, so an
+idle primary does not push reads back to itself. The probe role needs
+`pg_read_all_stats` (e.g. via `pg_monitor`) to see the receiver status.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import AbstractAsyncContextManager, aclosing, asynccontextmanager
+from dataclasses import dataclass
+from functools import partial
+from threading import Lock
+from typing import Any, AsyncGenerator
+
+import structlog
+from fastapi import Depends, Request
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+
+from app.shared.core.auth import CurrentUser, get_current_user
+from app.shared.core.config import get_settings
+from app.shared.core.ops_metrics import (
+    DB_READ_REPLICA_LAG_SECONDS,
+    DB_READ_ROUTING_TOTAL,
+)
+from app.shared.db.session import (
+    DB_OPERATION_RECOVERABLE_ERRORS,
+    DB_RUNTIME_DISPOSE_ERRORS,
+    GuardedAsyncSession,
+    _as_bool,
+    _build_connect_args,
+    _build_pool_config,
+    _normalize_db_url,
+    _register_engine_event_listeners,
+    get_db,
+    mark_session_system_context,
+    set_session_tenant_id,
+)
+
+logger = structlog.get_logger()
+
+LAG_CHECK_INTERVAL_SECONDS = 10.0
+# NULL means "not streaming from the primary": the replica is unavailable.
+REPLICA_LAG_SQL = text(
+    """
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN receiver.status IS DISTINCT FROM 'streaming' THEN NULL
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(
+            EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0
+        )
+    END
+    FROM (SELECT 1) AS probe
+    LEFT JOIN pg_stat_wal_receiver AS receiver ON true
+    """
+)
+
+
+class ReplicaLagMonitor:
+    """Cached replica lag check; `fallback_reason()` is None while usable."""
+
+    def __init__(
+        self,
+        probe_fn: Callable[[], Awaitable[float | None]],
+        *,
+        max_lag_seconds: float,
+        check_interval_seconds: float = LAG_CHECK_INTERVAL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._probe_fn = probe_fn
+        self.max_lag_seconds = max(0.0, float(max_lag_seconds))
+        self._check_interval_seconds = max(0.0, float(check_interval_seconds))
+        self._clock = clock
+        self._checked_at: float | None = None
+        self._lag_seconds: float | None = None
+        self._probe_lock = asyncio.Lock()
+
+    def _is_fresh(self) -> bool:
+        return (
+            self._checked_at is not None
+            and self._clock() - self._checked_at < self._check_interval_seconds
+        )
+
+    async def lag_seconds(self) -> float | None:
+        if self._is_fresh():
+            return self._lag_seconds
+        # One probe per interval: concurrent callers wait for it and reuse it.
+        async with self._probe_lock:
+            if self._is_fresh():
+                return self._lag_seconds
+            self._lag_seconds = await self._probe_fn()
+            self._checked_at = self._clock()
+        if self._lag_seconds is not None:
+            DB_READ_REPLICA_LAG_SECONDS.set(self._lag_seconds)
+        return self._lag_seconds
+
+    async def fallback_reason(self) -> str | None:
+        lag = await self.lag_seconds()
+        if lag is None:
+            return "replica_unavailable"
+        if lag > self.max_lag_seconds:
+            return "replica_lag"
+        return None
+
+
+async def probe_replica_lag(
+    session_factory: Callable[[], Any],
+) -> float | None:
+    """
+    Replay lag in seconds (0 on non-PostgreSQL backends).
+
+    None when the probe fails or the replica is not streaming from the primary.
+    """
+    try:
+        async with session_factory() as session:
+            await mark_session_system_context(session)
+            if session.bind.dialect.name != "postgresql":
+                return 0.0
+            lag = await session.scalar(REPLICA_LAG_SQL)
+    except DB_OPERATION_RECOVERABLE_ERRORS as exc:
+        logger.warning("read_replica_lag_probe_failed", error=str(exc))
+        return None
+    if lag is None:
+        logger.warning("read_replica_wal_receiver_not_streaming")
+        return None
+    return max(0.0, float(lag))
+
+
+@dataclass(slots=True)
+class _ReadReplicaRuntime:
+    engine: AsyncEngine
+    session_maker: async_sessionmaker[GuardedAsyncSession]
+    effective_url: str
+    lag_monitor: ReplicaLagMonitor
+
+
+_read_replica_runtime: _ReadReplicaRuntime | None = None
+_read_replica_configured = False
+_read_replica_lock = Lock()
+
+
+def _resolve_read_replica_url(settings_obj: Any) -> str | None:
+    url = _normalize_db_url(
+        str(getattr(settings_obj, "DATABASE_READ_REPLICA_URL", "") or "")
+    )
+    if not url:
+        return None
+    if (
+        bool(getattr(settings_obj, "TESTING", False))
+        and "sqlite" not in url
+        and not _as_bool(getattr(settings_obj, "ALLOW_TEST_DATABASE_URL", False))
+    ):
+        return None
+    return url
+
+
+def _build_read_replica_runtime(settings_obj: Any) -> _ReadReplicaRuntime | None:
+    effective_url = _resolve_read_replica_url(settings_obj)
+    if effective_url is None:
+        return None
+    use_null_pool = _as_bool(getattr(settings_obj, "DB_USE_NULL_POOL", False))
+    external_pooler = _as_bool(getattr(settings_obj, "DB_EXTERNAL_POOLER", False))
+    connect_args = _build_connect_args(settings_obj, effective_url)
+    if "postgresql" in effective_url and not external_pooler:
+        # Guard against writes when the "replica" is a second DSN to the primary.
+        connect_args["server_settings"] = {"default_transaction_read_only": "on"}
+    engine = create_async_engine(
+        effective_url,
+        **_build_pool_config(
+            settings_obj, effective_url, use_null_pool, external_pooler
+        ),
+        connect_args=connect_args,
+    )
+    _register_engine_event_listeners(engine)
+    session_maker = async_sessionmaker(
+        engine, class_=GuardedAsyncSession, expire_on_commit=False
+    )
+    lag_monitor = ReplicaLagMonitor(
+        partial(probe_replica_lag, session_maker),
+        max_lag_seconds=float(
+            getattr(settings_obj, "DB_READ_REPLICA_MAX_LAG_SECONDS", 5.0)
+        ),
+    )
+    logger.info("read_replica_engine_configured", max_lag=lag_monitor.max_lag_seconds)
+    return _ReadReplicaRuntime(
+        engine=engine,
+        session_maker=session_maker,
+        effective_url=effective_url,
+        lag_monitor=lag_monitor,
+    )
+
+
+def get_read_replica_runtime() -> _ReadReplicaRuntime | None:
+    """Lazily build the replica runtime; None when no replica is configured."""
+    global _read_replica_runtime, _read_replica_configured
+    if _read_replica_configured:
+        return _read_replica_runtime
+    with _read_replica_lock:
+        if not _read_replica_configured:
+            _read_replica_runtime = _build_read_replica_runtime(get_settings())
+            _read_replica_configured = True
+    return _read_replica_runtime
+
+
+def reset_read_replica_runtime() -> None:
+    """Test helper for forcing runtime re-initialization on next access."""
+    global _read_replica_runtime, _read_replica_configured
+    runtime = _read_replica_runtime
+    _read_replica_runtime = None
+    _read_replica_configured = False
+    if runtime is None:
+        return
+    try:
+        runtime.engine.sync_engine.dispose()
+    except DB_RUNTIME_DISPOSE_ERRORS as exc:
+        logger.debug("read_replica_dispose_skipped", error=str(exc), exc_info=True)
+
+
+def _record_route(target: str, reason: str) -> None:
+    DB_READ_ROUTING_TOTAL.labels(target=target, reason=reason).inc()
+    if target == "primary" and reason != "not_configured":
+        logger.debug("read_db_routed_to_primary", reason=reason)
+
+
+PrimarySessionOpener = Callable[[], AbstractAsyncContextManager[AsyncSession]]
+
+
+def get_primary_session_opener(request: Request) -> PrimarySessionOpener:
+    """Defer the primary `get_db` session until a read actually falls back."""
+
+    @asynccontextmanager
+    async def _open_primary() -> AsyncIterator[AsyncSession]:
+        async with aclosing(get_db(request)) as sessions:
+            async for session in sessions:
+                yield session
+
+    return _open_primary
+
+
+async def get_read_db(
+    user: CurrentUser = Depends(get_current_user),
+    open_primary: PrimarySessionOpener = Depends(get_primary_session_opener),
+) -> AsyncGenerator[AsyncSession, None]:
+    """Read-only tenant session on the replica, or the primary session as fallback."""
+    runtime = get_read_replica_runtime()
+    tenant_id = user.tenant_id
+    if runtime is None:
+        reason = "not_configured"
+    elif tenant_id is None:
+        reason = "no_tenant"
+    else:
+        lag_reason = await runtime.lag_monitor.fallback_reason()
+        reason = lag_reason or "rls_context_failed"
+        if lag_reason is None:
+            async with runtime.session_maker() as session:
+                try:
+                    await set_session_tenant_id(session, tenant_id)
+                except DB_OPERATION_RECOVERABLE_ERRORS as exc:
+                    logger.warning("read_replica_session_setup_failed", error=str(exc))
+                if session.info.get("rls_context_set") is True:
+                    _record_route("replica", "healthy")
+                    yield session
+                    return
+    _record_route("primary", reason)
+    async with open_primary() as primary_db:
+        yield primary_db
+
+
+__all__ = [
+    "LAG_CHECK_INTERVAL_SECONDS",
+    "PrimarySessionOpener",
+    "ReplicaLagMonitor",
+    "get_primary_session_opener",
+    "get_read_db",
+    "get_read_replica_runtime",
+    "probe_replica_lag",
+    "reset_read_replica_runtime",
+]
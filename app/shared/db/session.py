@@ -23,7 +23,12 @@ from sqlalchemy.pool import NullPool, StaticPool
 from app.shared.core.config import get_settings
 from app.shared.core.constants import RLS_EXEMPT_TABLES
 from app.shared.core.exceptions import ValdricsException
-from app.shared.core.ops_metrics import RLS_CONTEXT_MISSING, RLS_ENFORCEMENT_LATENCY
+from app.shared.core.ops_metrics import (
+    CACHE_HITS_TOTAL,
+    CACHE_MISSES_TOTAL,
+    RLS_CONTEXT_MISSING,
+    RLS_ENFORCEMENT_LATENCY,
+)
 from app.shared.db.session_context_ops import (
     backend_from_url as _backend_from_url_impl,
     clear_session_tenant_context as _clear_session_tenant_context_impl,
@@ -32,7 +37,14 @@ from app.shared.db.session_context_ops import (
     resolve_session_backend as _resolve_session_backend_impl,
     set_session_tenant_id as _set_session_tenant_id_impl,
 )
-from app.shared.db.session_rls_ops import check_rls_policy as _check_rls_policy_impl
+from app.shared.db.session_rls_ops import (
+    RLSStatementVerdictCache,
+    check_rls_policy as _check_rls_policy_impl,
+)
+from app.shared.db.statement_cache_ops import (
+    register_statement_cache_invalidation,
+    statement_cache_connect_args,
+)
 
 logger = structlog.get_logger()
 __all__ = ["ValdricsException"]
@@ -46,6 +58,11 @@ settings = get_settings()
 _RLS_EXEMPT_TABLE_PATTERN = re.compile(
     r"\b(" + "|".join(re.escape(table.lower()) for table in RLS_EXEMPT_TABLES) + r")\b"
 )
+_RLS_STATEMENT_VERDICTS = RLSStatementVerdictCache(
+    _RLS_EXEMPT_TABLE_PATTERN,
+    hit_metric=CACHE_HITS_TOTAL.labels(cache_type="rls_statement_verdict"),
+    miss_metric=CACHE_MISSES_TOTAL.labels(cache_type="rls_statement_verdict"),
+)
 
 
 @dataclass(slots=True)
@@ -125,8 +142,7 @@ def _build_connect_args(settings_obj: Any, effective_url: str) -> dict[str, Any]
     connect_args: dict[str, Any] = {}
     ssl_mode = str(getattr(settings_obj, "DB_SSL_MODE", "require")).lower()
 
-    if "postgresql" in effective_url:
-        connect_args["statement_cache_size"] = 0  # Required for Supavisor
+    connect_args.update(statement_cache_connect_args(settings_obj, effective_url))
 
     if ssl_mode == "disable":
         logger.warning(
@@ -226,6 +242,7 @@ def _register_engine_event_listeners(engine: AsyncEngine) -> None:
     event.listen(sync_engine, "before_cursor_execute", check_rls_policy, retval=True)
     event.listen(sync_engine, "before_cursor_execute", before_cursor_execute)
     event.listen(sync_engine, "after_cursor_execute", after_cursor_execute)
+    register_statement_cache_invalidation(sync_engine)
 
 
 def _build_db_runtime() -> _DBRuntime:
@@ -448,6 +465,7 @@ def check_rls_policy(
         rls_context_missing_metric=RLS_CONTEXT_MISSING,
         rls_metric_recoverable_errors=RLS_METRIC_RECOVERABLE_ERRORS,
         logger_obj=logger,
+        statement_verdict_cache=_RLS_STATEMENT_VERDICTS,
     )
 
 
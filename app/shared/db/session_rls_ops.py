@@ -2,12 +2,108 @@
 
 from __future__ import annotations
 
+from collections import OrderedDict
+from dataclasses import dataclass
+from threading import Lock
 from typing import Any
 
 from sqlalchemy.engine import Connection
 
 from app.shared.core.exceptions import ValdricsException
 
+RLS_STATEMENT_VERDICT_CACHE_MAX_ENTRIES = 4096
+# Bulk multi-row INSERTs render unique, very large SQL strings; classifying them
+# uncached keeps the cache bounded in bytes as well as entries.
+RLS_STATEMENT_VERDICT_CACHE_MAX_STATEMENT_CHARS = 16384
+_RLS_SCOPED_VERBS = frozenset({"select", "insert", "update", "delete", "with"})
+_RLS_PROBE_FRAGMENTS = ("select 1", "select version()", "select pg_is_in_recovery()")
+
+
+@dataclass(frozen=True, slots=True)
+class RLSStatementVerdict:
+    """Per-statement RLS classification, independent of connection state."""
+
+    requires_context: bool
+    statement_type: str
+
+
+def classify_rls_statement(
+    statement: str, rls_exempt_table_pattern: Any
+) -> RLSStatementVerdict:
+    """Classify SQL text as RLS-scoped or exempt (verb, probe and table checks)."""
+    tokens = statement.split(None, 1)
+    statement_type = tokens[0].upper() if tokens else ""
+    stmt_lower = statement.lower()
+    if statement_type and statement_type.lower() not in _RLS_SCOPED_VERBS:
+        return RLSStatementVerdict(False, statement_type)
+    if any(fragment in stmt_lower for fragment in _RLS_PROBE_FRAGMENTS):
+        return RLSStatementVerdict(False, statement_type)
+    if rls_exempt_table_pattern.search(stmt_lower):
+        return RLSStatementVerdict(False, statement_type)
+    return RLSStatementVerdict(True, statement_type)
+
+
+class RLSStatementVerdictCache:
+    """
+    Bounded LRU of statement classifications keyed on the SQL string.
+
+    SQLAlchemy re-emits the same compiled SQL for every execution of a
+    statement shape, so the lowercase/regex work only runs once per shape.
+    """
+
+    def __init__(
+        self,
+        rls_exempt_table_pattern: Any,
+        *,
+        max_entries: int = RLS_STATEMENT_VERDICT_CACHE_MAX_ENTRIES,
+        hit_metric: Any = None,
+        miss_metric: Any = None,
+    ) -> None:
+        self.rls_exempt_table_pattern = rls_exempt_table_pattern
+        self.max_entries = max(1, int(max_entries))
+        self._entries: OrderedDict[str, RLSStatementVerdict] = OrderedDict()
+        self._lock = Lock()
+        self._hit_metric = hit_metric
+        self._miss_metric = miss_metric
+        self.hits = 0
+        self.misses = 0
+
+    def classify(self, statement: str) -> RLSStatementVerdict:
+        with self._lock:
+            verdict = self._entries.get(statement)
+            if verdict is not None:
+                self._entries.move_to_end(statement)
+                self.hits += 1
+        if verdict is not None:
+            if self._hit_metric is not None:
+                self._hit_metric.inc()
+            return verdict
+
+        verdict = classify_rls_statement(statement, self.rls_exempt_table_pattern)
+        with self._lock:
+            self.misses += 1
+            if len(statement) <= RLS_STATEMENT_VERDICT_CACHE_MAX_STATEMENT_CHARS:
+                self._entries[statement] = verdict
+                if len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        if self._miss_metric is not None:
+            self._miss_metric.inc()
+        return verdict
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
 
 def check_rls_policy(
     *,
@@ -19,26 +115,21 @@ def check_rls_policy(
     rls_context_missing_metric: Any,
     rls_metric_recoverable_errors: tuple[type[Exception], ...],
     logger_obj: Any,
+    statement_verdict_cache: RLSStatementVerdictCache | None = None,
 ) -> tuple[str, Any]:
     """Enforce fail-closed RLS posture for tenant-scoped SQL queries."""
     if settings_obj.TESTING and not settings_obj.ENFORCE_RLS_IN_TESTS:
         return statement, parameters
 
-    stmt_lower = statement.lower()
-    stmt_stripped = stmt_lower.lstrip()
-    if stmt_stripped:
-        verb = stmt_stripped.split(None, 1)[0]
-        if verb not in {"select", "insert", "update", "delete", "with"}:
-            return statement, parameters
-
+    # Verdicts are only valid for the pattern the cache was built with.
     if (
-        "select 1" in stmt_lower
-        or "select version()" in stmt_lower
-        or "select pg_is_in_recovery()" in stmt_lower
+        statement_verdict_cache is not None
+        and statement_verdict_cache.rls_exempt_table_pattern is rls_exempt_table_pattern
     ):
-        return statement, parameters
-
-    if rls_exempt_table_pattern.search(stmt_lower):
+        verdict = statement_verdict_cache.classify(statement)
+    else:
+        verdict = classify_rls_statement(statement, rls_exempt_table_pattern)
+    if not verdict.requires_context:
         return statement, parameters
 
     rls_status = conn.info.get("rls_context_set")
@@ -51,9 +142,9 @@ def check_rls_policy(
 
         if not settings_obj.TESTING:
             try:
-                if statement.split():
+                if verdict.statement_type:
                     rls_context_missing_metric.labels(
-                        statement_type=statement.split()[0].upper()
+                        statement_type=verdict.statement_type
                     ).inc()
             except rls_metric_recoverable_errors as exc:
                 logger_obj.debug("rls_metric_increment_failed", error=str(exc))
@@ -85,9 +176,9 @@ def check_rls_policy(
 
     if rls_status is False:
         try:
-            if statement.split():
+            if verdict.statement_type:
                 rls_context_missing_metric.labels(
-                    statement_type=statement.split()[0].upper()
+                    statement_type=verdict.statement_type
                 ).inc()
         except rls_metric_recoverable_errors as exc:
             logger_obj.debug("rls_metric_increment_failed", error=str(exc))
@@ -112,4 +203,9 @@ def check_rls_policy(
     return statement, parameters
 
 
-__all__ = ["check_rls_policy"]
+__all__ = [
+    "RLSStatementVerdict",
+    "RLSStatementVerdictCache",
+    "check_rls_policy",
+    "classify_rls_statement",
+]
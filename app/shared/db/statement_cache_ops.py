@@ -0,0 +1,108 @@
+"""
+asyncpg prepared statement caching by pooler mode.
+
+Transaction-mode poolers (Supavisor/PgBouncer in transaction mode) hand each
+transaction a different backend, so the asyncpg statement cache stays
+disabled there, as before. Direct connections and session-mode poolers keep
+one backend per client connection and get a bounded cache
+(`DB_STATEMENT_CACHE_SIZE` statements per connection) in both asyncpg and the
+SQLAlchemy asyncpg adapter.
+
+A pooler cannot be detected reliably from the DSN (PgBouncer commonly listens
+on 6432, custom deployments anywhere), so `DB_POOLER_MODE=auto` keeps the
+cache disabled. Caching is only enabled when the mode is explicitly `direct`
+or `session`.
+
+Schema migrations: cached plans can outlive DDL applied by another process.
+The asyncpg dialect clears its caches when a statement fails with a stale plan
+but cannot retry it; `register_statement_cache_invalidation` also discards the
+whole pool on that error so no other pooled connection reuses a stale plan,
+and cached statements expire after `STATEMENT_CACHE_MAX_LIFETIME_SECONDS`.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import structlog
+from sqlalchemy import event
+from sqlalchemy.engine import ExceptionContext
+
+logger = structlog.get_logger()
+
+POOLER_MODES: tuple[str, ...] = ("auto", "transaction", "session", "direct")
+DEFAULT_STATEMENT_CACHE_SIZE = 256
+STATEMENT_CACHE_MAX_LIFETIME_SECONDS = 300
+_STALE_STATEMENT_MARKERS = (
+    "invalidcachedstatementerror",
+    "cached statement plan is invalid",
+    "cache lookup failed for type",
+)
+
+
+def resolve_pooler_mode(settings_obj: Any) -> str:
+    """Effective pooler mode: transaction unless direct/session is explicit."""
+    mode = str(getattr(settings_obj, "DB_POOLER_MODE", "auto") or "auto").lower()
+    mode = mode.strip()
+    if mode not in POOLER_MODES:
+        # Unknown modes keep the pooler-safe behaviour (no statement cache).
+        logger.warning("db_pooler_mode_invalid", mode=mode, allowed=POOLER_MODES)
+        return "transaction"
+    return "transaction" if mode == "auto" else mode
+
+
+def statement_cache_connect_args(
+    settings_obj: Any, effective_url: str
+) -> dict[str, Any]:
+    """asyncpg/SQLAlchemy statement cache connect args for a PostgreSQL DSN."""
+    if "postgresql" not in effective_url:
+        return {}
+    if resolve_pooler_mode(settings_obj) == "transaction":
+        return {"statement_cache_size": 0}  # Required for Supavisor
+    raw_size = getattr(settings_obj, "DB_STATEMENT_CACHE_SIZE", None)
+    size = max(0, int(DEFAULT_STATEMENT_CACHE_SIZE if raw_size is None else raw_size))
+    return {
+        "statement_cache_size": size,
+        "prepared_statement_cache_size": size,
+        "max_cached_statement_lifetime": STATEMENT_CACHE_MAX_LIFETIME_SECONDS,
+    }
+
+
+def is_stale_statement_error(exc: BaseException | None) -> bool:
+    """True for asyncpg errors raised by plans or type caches made stale by DDL."""
+    seen: set[int] = set()
+    while exc is not None and id(exc) not in seen:
+        seen.add(id(exc))
+        names = " ".join(cls.__name__ for cls in type(exc).__mro__).lower()
+        text = f"{names} {exc}".lower()
+        if any(marker in text for marker in _STALE_STATEMENT_MARKERS):
+            return True
+        exc = getattr(exc, "orig", None) or exc.__cause__
+    return False
+
+
+def _invalidate_pool_on_stale_statement(context: ExceptionContext) -> None:
+    if not is_stale_statement_error(context.original_exception):
+        return
+    # Treat it like a disconnect: SQLAlchemy then invalidates the whole pool.
+    # Writable in handle_error per the SQLAlchemy docs; the stubs omit it.
+    context.is_disconnect = True  # type: ignore[misc]
+    logger.warning(
+        "db_statement_cache_invalidated",
+        error=str(context.original_exception)[:200],
+    )
+
+
+def register_statement_cache_invalidation(sync_engine: Any) -> None:
+    event.listen(sync_engine, "handle_error", _invalidate_pool_on_stale_statement)
+
+
+__all__ = [
+    "DEFAULT_STATEMENT_CACHE_SIZE",
+    "POOLER_MODES",
+    "STATEMENT_CACHE_MAX_LIFETIME_SECONDS",
+    "is_stale_statement_error",
+    "register_statement_cache_invalidation",
+    "resolve_pooler_mode",
+    "statement_cache_connect_args",
+]
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import asyncio
 import copy
+import functools
 import json
 import os
 import uuid
@@ -24,7 +25,7 @@ from app.modules.notifications.domain import get_slack_service, get_tenant_slack
 from app.shared.analysis.forecaster import SymbolicForecaster
 from app.shared.core.cache import get_cache_service
 from app.shared.core.config import get_settings
-from app.shared.core.exceptions import AIAnalysisError, BudgetExceededError
+from app.shared.core.exceptions import AIAnalysisError
 from app.shared.core.pricing import PricingTier, get_tenant_tier, get_tier_limit
 from app.shared.llm.analyzer_cache import check_cache_and_delta
 from app.shared.llm.analyzer_limits import (
@@ -33,6 +34,7 @@ from app.shared.llm.analyzer_limits import (
     normalize_analysis_payload,
     record_to_date,
     resolve_output_token_ceiling,
+    reserve_analysis_budget,
     resolve_positive_limit,
     strip_markdown,
 )
@@ -40,6 +42,10 @@ from app.shared.llm.analyzer_results import (
     check_and_alert_anomalies,
     process_analysis_results,
 )
+from app.shared.llm.analyzer_singleflight import (
+    analysis_content_key,
+    analysis_single_flight,
+)
 from app.shared.llm.budget_manager import LLMBudgetManager
 from app.shared.llm.factory import LLMFactory
 from app.shared.llm.guardrails import FinOpsAnalysisResult, LLMGuardrails
@@ -237,142 +243,149 @@ class FinOpsAnalyzer:
                         limits=shape_limits,
                     )
 
-            reserved_amount: Decimal | None = None
-            max_output_tokens: int | None = None
-            max_prompt_tokens: int | None = None
-            actor_type = "user" if user_id else "system"
-
-            llm_model = getattr(
-                self.llm,
-                "model_name",
-                getattr(self.llm, "model", "llama-3.3-70b-versatile"),
+            run_analysis = functools.partial(
+                self._run_analysis,
+                usage_summary_to_analyze,
+                tenant_id=tenant_id,
+                db=effective_db,
+                tenant_tier=tenant_tier,
+                provider=provider,
+                model=model,
+                user_id=user_id,
+                client_ip=client_ip,
+                operation_id=operation_id,
+            )
+            if tenant_id is None:
+                return await run_analysis()
+
+            # Identical concurrent requests share one provider call and its result.
+            await self._get_prompt()
+            content_key = analysis_content_key(
+                tenant_id=tenant_id,
+                payload=usage_summary_to_analyze.model_dump(mode="json"),
+                prompt_version=self.prompt_version,
+                provider=provider,
+                model=model or self._default_model_name(),
+            )
+            return await analysis_single_flight.run(
+                content_key,
+                run_analysis,
+                cache_service=get_cache_service(),
+                use_cached=not force_refresh,
             )
-            effective_model = model or llm_model
 
-            try:
-                if tenant_id and effective_db:
-                    if tenant_tier is None:
-                        tenant_tier = await get_tenant_tier(tenant_id, effective_db)
-                    max_output_tokens = self._resolve_output_token_ceiling(
-                        get_tier_limit(tenant_tier, "llm_output_max_tokens")
-                    )
-                    max_prompt_tokens = self._resolve_positive_limit(
-                        get_tier_limit(tenant_tier, "llm_prompt_max_input_tokens"),
-                        minimum=256,
-                        maximum=131_072,
-                    )
+    def _default_model_name(self) -> str:
+        fallback = getattr(self.llm, "model", "llama-3.3-70b-versatile")
+        return str(getattr(self.llm, "model_name", fallback))
 
-                    prompt_tokens = max(500, len(usage_summary_to_analyze.records) * 20)
-                    if max_prompt_tokens is not None:
-                        prompt_tokens = min(prompt_tokens, max_prompt_tokens)
-                    completion_tokens = max_output_tokens or 500
-
-                    reserved_amount = await LLMBudgetManager.check_and_reserve(
-                        tenant_id=tenant_id,
-                        db=effective_db,
-                        model=effective_model,
-                        prompt_tokens=prompt_tokens,
-                        completion_tokens=completion_tokens,
-                        operation_id=operation_id,
-                        user_id=user_id,
-                        actor_type=actor_type,
-                        client_ip=client_ip,
-                    )
+    async def _run_analysis(
+        self,
+        usage_summary_to_analyze: "CloudUsageSummary",
+        *,
+        tenant_id: Optional[UUID],
+        db: Optional[AsyncSession],
+        tenant_tier: PricingTier | None,
+        provider: Optional[str],
+        model: Optional[str],
+        user_id: Optional[UUID],
+        client_ip: Optional[str],
+        operation_id: str,
+    ) -> dict[str, Any]:
+        """Reserve budget, call the provider and process one analysis."""
+        effective_db = db
+        effective_model = model or self._default_model_name()
+        actor_type = "user" if user_id else "system"
+        reserved_amount: Decimal | None = None
+        max_output_tokens: int | None = None
+        if tenant_id and effective_db:
+            reserved_amount, max_output_tokens = await reserve_analysis_budget(
+                tenant_id=tenant_id,
+                db=effective_db,
+                tenant_tier=tenant_tier,
+                record_count=len(usage_summary_to_analyze.records),
+                model=effective_model,
+                operation_id=operation_id,
+                user_id=user_id,
+                actor_type=actor_type,
+                client_ip=client_ip,
+                budget_manager=LLMBudgetManager,
+                get_tenant_tier_fn=get_tenant_tier,
+                get_tier_limit_fn=get_tier_limit,
+                logger_obj=logger,
+            )
 
-                    logger.info(
-                        "llm_budget_authorized",
-                        tenant_id=str(tenant_id),
-                        reserved_amount=float(reserved_amount),
-                        operation_id=operation_id,
-                    )
-            except BudgetExceededError:
-                raise
-            except (
-                SQLAlchemyError,
-                RuntimeError,
-                ValueError,
-                TypeError,
-                OSError,
-            ) as exc:  # noqa: BLE001
-                logger.error(
-                    "budget_check_failed_unexpected",
-                    error=str(exc),
-                    operation_id=operation_id,
-                )
-                raise AIAnalysisError(f"Budget verification failed: {str(exc)}") from exc
+        try:
+            sanitized_data = await LLMGuardrails.sanitize_input(
+                usage_summary_to_analyze.model_dump()
+            )
+            sanitized_data["symbolic_forecast"] = await SymbolicForecaster.forecast(
+                usage_summary_to_analyze.records,
+                db=effective_db,
+                tenant_id=tenant_id,
+            )
+            formatted_data = json.dumps(sanitized_data, default=str)
+        except (
+            AIAnalysisError,
+            ValueError,
+            TypeError,
+            RuntimeError,
+        ) as exc:  # noqa: BLE001
+            logger.error("data_preparation_failed", error=str(exc), operation_id=operation_id)
+            raise AIAnalysisError(f"Failed to prepare data: {str(exc)}")
+
+        effective_provider, final_model, byok_key = await self._setup_client_and_usage(
+            tenant_id,
+            effective_db,
+            provider,
+            effective_model,
+            input_text=formatted_data,
+        )
+        try:
+            response_content, response_metadata = await self._invoke_llm(
+                formatted_data,
+                effective_provider,
+                final_model,
+                byok_key,
+                max_output_tokens=max_output_tokens,
+                tenant_tier=tenant_tier,
+            )
+        except (AIAnalysisError, RuntimeError, ValueError, TypeError) as exc:
+            logger.error("llm_invocation_failed", error=str(exc), operation_id=operation_id)
+            raise
 
+        if reserved_amount and effective_db:
             try:
-                sanitized_data = await LLMGuardrails.sanitize_input(
-                    usage_summary_to_analyze.model_dump()
-                )
-                sanitized_data["symbolic_forecast"] = await SymbolicForecaster.forecast(
-                    usage_summary_to_analyze.records,
+                token_usage = response_metadata.get("token_usage", {})
+                tenant_id_for_usage = cast(UUID, tenant_id)
+                await LLMBudgetManager.record_usage(
+                    tenant_id=tenant_id_for_usage,
                     db=effective_db,
-                    tenant_id=tenant_id,
+                    model=final_model,
+                    provider=effective_provider,
+                    prompt_tokens=token_usage.get("prompt_tokens", 500),
+                    completion_tokens=token_usage.get("completion_tokens", 500),
+                    is_byok=bool(byok_key),
+                    operation_id=operation_id,
+                    user_id=user_id,
+                    actor_type=actor_type,
+                    client_ip=client_ip,
                 )
-                formatted_data = json.dumps(sanitized_data, default=str)
-            except (
-                AIAnalysisError,
-                ValueError,
-                TypeError,
-                RuntimeError,
-            ) as exc:  # noqa: BLE001
-                logger.error("data_preparation_failed", error=str(exc), operation_id=operation_id)
-                raise AIAnalysisError(f"Failed to prepare data: {str(exc)}")
-
-            effective_provider, final_model, byok_key = await self._setup_client_and_usage(
-                tenant_id,
-                effective_db,
-                provider,
-                effective_model,
-                input_text=formatted_data,
-            )
-            try:
-                response_content, response_metadata = await self._invoke_llm(
-                    formatted_data,
-                    effective_provider,
-                    final_model,
-                    byok_key,
-                    max_output_tokens=max_output_tokens,
-                    tenant_tier=tenant_tier,
+            except (SQLAlchemyError, RuntimeError, ValueError, TypeError) as exc:
+                logger.warning(
+                    "usage_recording_failed",
+                    error=str(exc),
+                    operation_id=operation_id,
                 )
-            except (AIAnalysisError, RuntimeError, ValueError, TypeError) as exc:
-                logger.error("llm_invocation_failed", error=str(exc), operation_id=operation_id)
-                raise
-
-            if reserved_amount and effective_db:
-                try:
-                    token_usage = response_metadata.get("token_usage", {})
-                    tenant_id_for_usage = cast(UUID, tenant_id)
-                    await LLMBudgetManager.record_usage(
-                        tenant_id=tenant_id_for_usage,
-                        db=effective_db,
-                        model=final_model,
-                        provider=effective_provider,
-                        prompt_tokens=token_usage.get("prompt_tokens", 500),
-                        completion_tokens=token_usage.get("completion_tokens", 500),
-                        is_byok=bool(byok_key),
-                        operation_id=operation_id,
-                        user_id=user_id,
-                        actor_type=actor_type,
-                        client_ip=client_ip,
-                    )
-                except (SQLAlchemyError, RuntimeError, ValueError, TypeError) as exc:
-                    logger.warning(
-                        "usage_recording_failed",
-                        error=str(exc),
-                        operation_id=operation_id,
-                    )
 
-            return await self._process_analysis_results(
-                response_content,
-                tenant_id,
-                usage_summary_to_analyze,
-                db=effective_db,
-                provider=effective_provider,
-                model=final_model,
-                response_metadata=response_metadata,
-            )
+        return await self._process_analysis_results(
+            response_content,
+            tenant_id,
+            usage_summary_to_analyze,
+            db=effective_db,
+            provider=effective_provider,
+            model=final_model,
+            response_metadata=response_metadata,
+        )
 
     async def _check_cache_and_delta(
         self,
@@ -3,8 +3,13 @@ from __future__ import annotations
 import copy
 import re
 from datetime import date, datetime, timedelta
-from typing import Any, Callable, TYPE_CHECKING
+from decimal import Decimal
+from typing import Any, Awaitable, Callable, TYPE_CHECKING
+from uuid import UUID
 
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.shared.core.exceptions import AIAnalysisError, BudgetExceededError
 from app.shared.core.pricing import PricingTier
 
 if TYPE_CHECKING:
@@ -139,6 +144,76 @@ def apply_tier_analysis_shape_limits(
     return updated_summary, limits
 
 
+async def reserve_analysis_budget(
+    *,
+    tenant_id: UUID,
+    db: Any,
+    tenant_tier: PricingTier | None,
+    record_count: int,
+    model: str,
+    operation_id: str,
+    user_id: UUID | None,
+    actor_type: str,
+    client_ip: str | None,
+    budget_manager: Any,
+    get_tenant_tier_fn: Callable[[UUID, Any], Awaitable[PricingTier]],
+    get_tier_limit_fn: Callable[[PricingTier, str], Any],
+    logger_obj: Any,
+) -> tuple[Decimal, int | None]:
+    """Reserve LLM budget for one analysis; returns (reserved, output token cap)."""
+    try:
+        if tenant_tier is None:
+            tenant_tier = await get_tenant_tier_fn(tenant_id, db)
+        max_output_tokens = resolve_output_token_ceiling(
+            get_tier_limit_fn(tenant_tier, "llm_output_max_tokens")
+        )
+        max_prompt_tokens = resolve_positive_limit(
+            get_tier_limit_fn(tenant_tier, "llm_prompt_max_input_tokens"),
+            minimum=256,
+            maximum=131_072,
+        )
+
+        prompt_tokens = max(500, record_count * 20)
+        if max_prompt_tokens is not None:
+            prompt_tokens = min(prompt_tokens, max_prompt_tokens)
+        completion_tokens = max_output_tokens or 500
+
+        reserved_amount: Decimal = await budget_manager.check_and_reserve(
+            tenant_id=tenant_id,
+            db=db,
+            model=model,
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            operation_id=operation_id,
+            user_id=user_id,
+            actor_type=actor_type,
+            client_ip=client_ip,
+        )
+
+        logger_obj.info(
+            "llm_budget_authorized",
+            tenant_id=str(tenant_id),
+            reserved_amount=float(reserved_amount),
+            operation_id=operation_id,
+        )
+        return reserved_amount, max_output_tokens
+    except BudgetExceededError:
+        raise
+    except (
+        SQLAlchemyError,
+        RuntimeError,
+        ValueError,
+        TypeError,
+        OSError,
+    ) as exc:  # noqa: BLE001
+        logger_obj.error(
+            "budget_check_failed_unexpected",
+            error=str(exc),
+            operation_id=operation_id,
+        )
+        raise AIAnalysisError(f"Budget verification failed: {str(exc)}") from exc
+
+
 def bind_output_token_ceiling(llm: "BaseChatModel", max_output_tokens: int) -> Any:
     bind_fn = getattr(llm, "bind", None)
     if not callable(bind_fn):
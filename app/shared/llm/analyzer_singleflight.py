@@ -0,0 +1,189 @@
+"""
+Content-addressed, single-flight execution of FinOps LLM analyses.
+
+An analysis is identified by the tenant plus a SHA-256 over the canonical JSON
+of the normalized usage payload, the prompt version, provider and model. The
+first request for a key runs the analysis (budget reservation, provider call,
+result processing); concurrent requests for the same key await that run
+instead of paying the provider again. Results are stored under the key (Redis
+when configured, otherwise a bounded in-process LRU), and analysis failures are
+remembered for a short window so retry storms do not hammer a failing
+provider.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable
+from uuid import UUID
+
+import structlog
+
+from app.shared.core.cache import ANALYSIS_TTL, PREFIX_ANALYSIS, CacheService
+from app.shared.core.exceptions import AIAnalysisError
+
+logger = structlog.get_logger()
+
+ANALYSIS_NEGATIVE_CACHE_TTL_SECONDS = 30.0
+ANALYSIS_LOCAL_RESULT_MAX_ENTRIES = 128
+
+
+def _shared_cache(cache_service: Any) -> CacheService | None:
+    """The Redis-backed cache when one is configured, else None (use the LRU)."""
+    if isinstance(cache_service, CacheService) and cache_service.enabled:
+        return cache_service
+    return None
+
+
+def analysis_content_key(
+    *,
+    tenant_id: UUID,
+    payload: Any,
+    prompt_version: str,
+    provider: str | None,
+    model: str | None,
+) -> str:
+    """Cache key for one tenant's analysis of `payload` under a prompt/model."""
+    canonical = json.dumps(
+        {
+            "payload": payload,
+            "prompt_version": prompt_version,
+            "provider": (provider or "").strip().lower(),
+            "model": str(model or ""),
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    digest = hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+    return f"{PREFIX_ANALYSIS}:{tenant_id}:content:{digest}"
+
+
+class AnalysisSingleFlight:
+    """Coalesces identical in-flight analyses and caches their outcomes."""
+
+    def __init__(
+        self,
+        *,
+        negative_ttl_seconds: float = ANALYSIS_NEGATIVE_CACHE_TTL_SECONDS,
+        max_local_entries: int = ANALYSIS_LOCAL_RESULT_MAX_ENTRIES,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._negative_ttl = max(0.0, float(negative_ttl_seconds))
+        self._max_local_entries = max(1, int(max_local_entries))
+        self._clock = clock
+        self._inflight: dict[str, asyncio.Future[dict[str, Any]]] = {}
+        self._results: OrderedDict[str, tuple[float, dict[str, Any]]] = OrderedDict()
+        self._failures: dict[str, tuple[float, AIAnalysisError]] = {}
+
+    def clear(self) -> None:
+        self._results.clear()
+        self._failures.clear()
+
+    async def run(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[dict[str, Any]]],
+        *,
+        cache_service: Any = None,
+        use_cached: bool = True,
+    ) -> dict[str, Any]:
+        """
+        Return the analysis for `key`, running `compute` at most once at a time.
+
+        `use_cached=False` (force refresh) skips stored results and remembered
+        failures but still joins an analysis that is already running.
+        """
+        while True:
+            pending = self._inflight.get(key)
+            if pending is None:
+                break
+            try:
+                result = await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                if not pending.cancelled():
+                    raise
+                continue  # the leader was cancelled; take over
+            logger.info("analysis_single_flight_joined", key=key)
+            return copy.deepcopy(result)
+
+        if use_cached:
+            failure = self._failures.get(key)
+            if failure is not None and failure[0] > self._clock():
+                logger.info("analysis_negative_cache_hit", key=key)
+                raise AIAnalysisError(
+                    failure[1].message, code=failure[1].code, details=failure[1].details
+                )
+            cached = await self._load(key, cache_service)
+            if cached is not None:
+                logger.info("analysis_content_cache_hit", key=key)
+                return cached
+
+        # The computation runs as its own task so whatever it raises reaches
+        # every follower; cancelling the leader cancels it and a follower
+        # takes over.
+        task: asyncio.Future[dict[str, Any]] = asyncio.ensure_future(compute())
+        self._inflight[key] = task
+        try:
+            result = await task
+        except AIAnalysisError as exc:
+            self._remember_failure(key, exc)
+            raise
+        else:
+            self._failures.pop(key, None)
+            # Store before leaving `_inflight` so later callers always see one.
+            await self._store(key, result, cache_service)
+        finally:
+            self._inflight.pop(key, None)
+        return copy.deepcopy(result)
+
+    def _remember_failure(self, key: str, exc: AIAnalysisError) -> None:
+        if self._negative_ttl <= 0:
+            return
+        now = self._clock()
+        self._failures = {k: v for k, v in self._failures.items() if v[0] > now}
+        self._failures[key] = (now + self._negative_ttl, exc)
+
+    async def _load(self, key: str, cache_service: Any) -> dict[str, Any] | None:
+        shared = _shared_cache(cache_service)
+        if shared is not None:
+            cached = await shared.get(key)
+            return cached if isinstance(cached, dict) else None
+        entry = self._results.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= self._clock():
+            self._results.pop(key, None)
+            return None
+        self._results.move_to_end(key)
+        return copy.deepcopy(entry[1])
+
+    async def _store(
+        self, key: str, result: dict[str, Any], cache_service: Any
+    ) -> None:
+        shared = _shared_cache(cache_service)
+        if shared is not None:
+            await shared.set(key, result, ANALYSIS_TTL)
+            return
+        expires_at = self._clock() + ANALYSIS_TTL.total_seconds()
+        self._results[key] = (expires_at, copy.deepcopy(result))
+        self._results.move_to_end(key)
+        while len(self._results) > self._max_local_entries:
+            self._results.popitem(last=False)
+
+
+analysis_single_flight = AnalysisSingleFlight()
+
+
+__all__ = [
+    "ANALYSIS_LOCAL_RESULT_MAX_ENTRIES",
+    "ANALYSIS_NEGATIVE_CACHE_TTL_SECONDS",
+    "AnalysisSingleFlight",
+    "analysis_content_key",
+    "analysis_single_flight",
+]
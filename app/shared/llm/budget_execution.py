@@ -16,9 +16,11 @@ from app.shared.llm.budget_execution_helpers import (
 )
 from app.shared.llm.budget_execution_runtime_ops import (
     check_and_reserve_budget as _check_and_reserve_budget_impl,
+    record_usage_entry as _record_usage_entry_impl,
+)
+from app.shared.llm.budget_execution_state_ops import (
     check_budget_and_alert as _check_budget_and_alert_impl,
     check_budget_state as _check_budget_state_impl,
-    record_usage_entry as _record_usage_entry_impl,
 )
 from app.shared.llm.budget_fair_use import (
     enforce_fair_use_guards,
@@ -8,9 +8,17 @@ from decimal import Decimal
 from typing import Any, Callable, cast
 from uuid import UUID
 
-from sqlalchemy import func, select
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.shared.llm.budget_ledger_ops import (
+    increment_usage_counters,
+    ledger_dialect,
+    publish_usage_increment,
+    reserve_within_limit,
+    settle_reservation,
+)
+
 
 async def check_and_reserve_budget(
     *,
@@ -78,6 +86,25 @@ async def check_and_reserve_budget(
                 tier=tier,
             )
 
+        # Common case: one conditional UPDATE; the locked path below handles
+        # bootstrap, month rollover and the over-limit error.
+        new_pending = await reserve_within_limit(
+            db,
+            tenant_id=tenant_id,
+            estimated_cost=estimated_cost,
+            now=datetime.now(timezone.utc),
+        )
+        if new_pending is not None:
+            manager_module.logger.info(
+                "llm_budget_reserved",
+                tenant_id=str(tenant_id),
+                model=model,
+                reserved_amount=float(estimated_cost),
+                new_pending_total=float(new_pending),
+                operation_id=operation_id,
+            )
+            return estimated_cost
+
         result = await db.execute(
             select(manager_module.LLMBudget)
             .where(manager_module.LLMBudget.tenant_id == tenant_id)
@@ -214,18 +241,20 @@ async def record_usage_entry(
         if user_id is not None and normalized_actor_type == "system":
             normalized_actor_type = "user"
 
-        result = await db.execute(
-            select(manager_module.LLMBudget)
-            .where(manager_module.LLMBudget.tenant_id == tenant_id)
-            .with_for_update()
-        )
-
-        budget_accessor = getattr(result, "scalar_one_or_none", None)
+        recorded_at = datetime.now(timezone.utc)
+        ledgered = ledger_dialect(db) is not None
         budget_candidate: Any = None
-        if callable(budget_accessor):
-            budget_candidate = budget_accessor()
-            if inspect.isawaitable(budget_candidate):
-                budget_candidate = await budget_candidate
+        if not ledgered:
+            result = await db.execute(
+                select(manager_module.LLMBudget)
+                .where(manager_module.LLMBudget.tenant_id == tenant_id)
+                .with_for_update()
+            )
+            budget_accessor = getattr(result, "scalar_one_or_none", None)
+            if callable(budget_accessor):
+                budget_candidate = budget_accessor()
+                if inspect.isawaitable(budget_candidate):
+                    budget_candidate = await budget_candidate
         budget = budget_candidate
 
         if is_byok:
@@ -237,7 +266,16 @@ async def record_usage_entry(
 
         actual_cost_decimal = manager_cls._to_decimal(actual_cost_usd)
 
-        if budget:
+        if ledgered:
+            await settle_reservation(
+                db,
+                tenant_id=tenant_id,
+                reserved_usd=manager_cls.estimate_cost(
+                    prompt_tokens, completion_tokens, model, provider
+                ),
+                actual_usd=actual_cost_decimal,
+            )
+        elif budget:
             estimated_reservation = manager_cls.estimate_cost(
                 prompt_tokens, completion_tokens, model, provider
             )
@@ -267,6 +305,15 @@ async def record_usage_entry(
             request_type=compose_request_type_fn(normalized_actor_type, request_type),
         )
         db.add(usage)
+        if ledgered:
+            await increment_usage_counters(
+                db,
+                tenant_id=tenant_id,
+                user_id=user_id,
+                request_type=usage.request_type,
+                cost_usd=actual_cost_decimal,
+                at=recorded_at,
+            )
 
         try:
             tier = await manager_module.get_tenant_tier(tenant_id, db)
@@ -280,6 +327,14 @@ async def record_usage_entry(
 
         await db.flush()
         await db.commit()
+        if ledgered:
+            await publish_usage_increment(
+                manager_module.get_cache_service(),
+                tenant_id=tenant_id,
+                user_id=user_id,
+                request_type=usage.request_type,
+                at=recorded_at,
+            )
 
         await manager_cls._check_budget_and_alert(tenant_id, db, actual_cost_usd)
 
@@ -316,175 +371,7 @@ async def record_usage_entry(
         await manager_cls._release_fair_use_inflight_slot(tenant_id)
 
 
-async def check_budget_state(
-    *,
-    manager_cls: Any,
-    tenant_id: UUID,
-    db: AsyncSession,
-    coerce_decimal_fn: Callable[[Any], Decimal | None],
-    coerce_threshold_percent_fn: Callable[[Any], Decimal],
-    coerce_bool_fn: Callable[[Any], bool],
-    cache_recoverable_errors: tuple[type[Exception], ...],
-) -> Any:
-    """Unified budget state computation for tenants."""
-    import app.shared.llm.budget_manager as manager_module
-
-    cache = manager_module.get_cache_service()
-    if cache.enabled and cache.client is not None:
-        try:
-            if await cache.client.get(f"budget_blocked:{tenant_id}"):
-                return manager_module.BudgetStatus.HARD_LIMIT
-            if await cache.client.get(f"budget_soft:{tenant_id}"):
-                return manager_module.BudgetStatus.SOFT_LIMIT
-        except cache_recoverable_errors as exc:
-            manager_module.logger.error(
-                "llm_budget_check_cache_error_fail_closed",
-                error=str(exc),
-                tenant_id=str(tenant_id),
-            )
-            raise manager_module.BudgetExceededError(
-                "Fail-Closed: LLM Budget check failed due to system error.",
-                details={"error": "service_unavailable", "reason": str(exc)},
-            )
-    result = await db.execute(
-        select(manager_module.LLMBudget).where(
-            manager_module.LLMBudget.tenant_id == tenant_id
-        )
-    )
-    budget_accessor = getattr(result, "scalar_one_or_none", None)
-    budget: Any = None
-    if callable(budget_accessor):
-        budget = budget_accessor()
-        if inspect.isawaitable(budget):
-            budget = await budget
-    if not budget:
-        return manager_module.BudgetStatus.OK
-
-    limit_dec = coerce_decimal_fn(getattr(budget, "monthly_limit_usd", None))
-    spend_dec = coerce_decimal_fn(getattr(budget, "monthly_spend_usd", Decimal("0")))
-    pending_dec = coerce_decimal_fn(getattr(budget, "pending_reservations_usd", Decimal("0")))
-    if limit_dec is None or spend_dec is None or pending_dec is None:
-        return manager_module.BudgetStatus.OK
-
-    limit = manager_cls._to_decimal(limit_dec)
-    current_usage = manager_cls._to_decimal(spend_dec) + manager_cls._to_decimal(pending_dec)
-    threshold = (
-        coerce_threshold_percent_fn(getattr(budget, "alert_threshold_percent", Decimal("80")))
-        / Decimal("100")
-    )
-    hard_limit = coerce_bool_fn(getattr(budget, "hard_limit", False))
-
-    if current_usage >= limit:
-        if hard_limit:
-            if cache.enabled and cache.client is not None:
-                await cache.client.set(f"budget_blocked:{tenant_id}", "1", ex=600)
-            raise manager_module.BudgetExceededError(
-                f"LLM budget of ${limit:.2f} exceeded.",
-                details={"usage": float(current_usage), "limit": float(limit)},
-            )
-        return manager_module.BudgetStatus.SOFT_LIMIT
-
-    if current_usage >= (limit * threshold):
-        if cache.enabled and cache.client is not None:
-            await cache.client.set(f"budget_soft:{tenant_id}", "1", ex=300)
-        return manager_module.BudgetStatus.SOFT_LIMIT
-
-    return manager_module.BudgetStatus.OK
-
-
-async def check_budget_and_alert(
-    *,
-    manager_cls: Any,
-    tenant_id: UUID,
-    db: AsyncSession,
-    last_cost: Decimal,
-    coerce_decimal_fn: Callable[[Any], Decimal | None],
-    coerce_threshold_percent_fn: Callable[[Any], Decimal],
-    alert_recoverable_errors: tuple[type[Exception], ...],
-) -> None:
-    """Check budget threshold and dispatch warning/critical alerts."""
-    import app.shared.llm.budget_manager as manager_module
-
-    result = await db.execute(
-        select(manager_module.LLMBudget).where(
-            manager_module.LLMBudget.tenant_id == tenant_id
-        )
-    )
-    budget = result.scalar_one_or_none()
-    if inspect.isawaitable(budget):
-        budget = await budget
-    if not budget:
-        return
-
-    now = datetime.now(timezone.utc)
-    month_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-    result_usage = await db.execute(
-        select(func.coalesce(func.sum(manager_module.LLMUsage.cost_usd), Decimal("0"))).where(
-            (manager_module.LLMUsage.tenant_id == tenant_id)
-            & (manager_module.LLMUsage.created_at >= month_start)
-        )
-    )
-    current_usage = manager_cls._to_decimal(result_usage.scalar())
-
-    limit_dec = coerce_decimal_fn(getattr(budget, "monthly_limit_usd", None))
-    if limit_dec is None:
-        return
-
-    limit = manager_cls._to_decimal(limit_dec)
-    threshold_percent = coerce_threshold_percent_fn(
-        getattr(budget, "alert_threshold_percent", Decimal("80"))
-    )
-    usage_percent = (current_usage / limit * 100) if limit > 0 else Decimal("0")
-
-    alert_sent_at = getattr(budget, "alert_sent_at", None)
-    already_sent = (
-        isinstance(alert_sent_at, datetime)
-        and alert_sent_at.year == now.year
-        and alert_sent_at.month == now.month
-    )
-
-    if usage_percent >= threshold_percent and not already_sent:
-        manager_module.audit_log(
-            event="llm_budget_alert",
-            user_id="system",
-            tenant_id=str(tenant_id),
-            details={
-                "usage_usd": float(current_usage),
-                "limit_usd": float(limit),
-                "percent": float(usage_percent),
-            },
-        )
-
-        try:
-            from app.modules.notifications.domain import get_tenant_slack_service
-
-            slack = await get_tenant_slack_service(db, tenant_id)
-            if slack:
-                await slack.send_alert(
-                    title="LLM Budget Alert",
-                    message=f"Usage: ${current_usage:.2f} / ${limit:.2f} ({usage_percent:.1f}%)",
-                    severity="critical" if usage_percent >= 100 else "warning",
-                )
-            else:
-                manager_module.logger.info(
-                    "llm_budget_alert_slack_not_configured",
-                    tenant_id=str(tenant_id),
-                )
-        except alert_recoverable_errors as exc:
-            manager_module.logger.warning(
-                "llm_budget_alert_slack_dispatch_failed",
-                tenant_id=str(tenant_id),
-                error=str(exc),
-            )
-
-        budget.alert_sent_at = now
-        await db.flush()
-        await db.commit()
-
-
 __all__ = [
     "check_and_reserve_budget",
-    "check_budget_and_alert",
-    "check_budget_state",
     "record_usage_entry",
 ]
@@ -0,0 +1,184 @@
+"""Budget state and alert checks for tenant LLM budgets."""
+
+from __future__ import annotations
+
+import inspect
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import Any, Callable
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.shared.llm.budget_ledger_ops import month_to_date_spend
+
+
+async def check_budget_state(
+    *,
+    manager_cls: Any,
+    tenant_id: UUID,
+    db: AsyncSession,
+    coerce_decimal_fn: Callable[[Any], Decimal | None],
+    coerce_threshold_percent_fn: Callable[[Any], Decimal],
+    coerce_bool_fn: Callable[[Any], bool],
+    cache_recoverable_errors: tuple[type[Exception], ...],
+) -> Any:
+    """Unified budget state computation for tenants."""
+    import app.shared.llm.budget_manager as manager_module
+
+    cache = manager_module.get_cache_service()
+    if cache.enabled and cache.client is not None:
+        try:
+            if await cache.client.get(f"budget_blocked:{tenant_id}"):
+                return manager_module.BudgetStatus.HARD_LIMIT
+            if await cache.client.get(f"budget_soft:{tenant_id}"):
+                return manager_module.BudgetStatus.SOFT_LIMIT
+        except cache_recoverable_errors as exc:
+            manager_module.logger.error(
+                "llm_budget_check_cache_error_fail_closed",
+                error=str(exc),
+                tenant_id=str(tenant_id),
+            )
+            raise manager_module.BudgetExceededError(
+                "Fail-Closed: LLM Budget check failed due to system error.",
+                details={"error": "service_unavailable", "reason": str(exc)},
+            )
+    result = await db.execute(
+        select(manager_module.LLMBudget).where(
+            manager_module.LLMBudget.tenant_id == tenant_id
+        )
+    )
+    budget_accessor = getattr(result, "scalar_one_or_none", None)
+    budget: Any = None
+    if callable(budget_accessor):
+        budget = budget_accessor()
+        if inspect.isawaitable(budget):
+            budget = await budget
+    if not budget:
+        return manager_module.BudgetStatus.OK
+
+    limit_dec = coerce_decimal_fn(getattr(budget, "monthly_limit_usd", None))
+    spend_dec = coerce_decimal_fn(getattr(budget, "monthly_spend_usd", Decimal("0")))
+    pending_dec = coerce_decimal_fn(
+        getattr(budget, "pending_reservations_usd", Decimal("0"))
+    )
+    if limit_dec is None or spend_dec is None or pending_dec is None:
+        return manager_module.BudgetStatus.OK
+
+    limit = manager_cls._to_decimal(limit_dec)
+    current_usage = manager_cls._to_decimal(spend_dec) + manager_cls._to_decimal(
+        pending_dec
+    )
+    threshold = coerce_threshold_percent_fn(
+        getattr(budget, "alert_threshold_percent", Decimal("80"))
+    ) / Decimal("100")
+    hard_limit = coerce_bool_fn(getattr(budget, "hard_limit", False))
+
+    if current_usage >= limit:
+        if hard_limit:
+            if cache.enabled and cache.client is not None:
+                await cache.client.set(f"budget_blocked:{tenant_id}", "1", ex=600)
+            raise manager_module.BudgetExceededError(
+                f"LLM budget of ${limit:.2f} exceeded.",
+                details={"usage": float(current_usage), "limit": float(limit)},
+            )
+        return manager_module.BudgetStatus.SOFT_LIMIT
+
+    if current_usage >= (limit * threshold):
+        if cache.enabled and cache.client is not None:
+            await cache.client.set(f"budget_soft:{tenant_id}", "1", ex=300)
+        return manager_module.BudgetStatus.SOFT_LIMIT
+
+    return manager_module.BudgetStatus.OK
+
+
+async def check_budget_and_alert(
+    *,
+    manager_cls: Any,
+    tenant_id: UUID,
+    db: AsyncSession,
+    last_cost: Decimal,
+    coerce_decimal_fn: Callable[[Any], Decimal | None],
+    coerce_threshold_percent_fn: Callable[[Any], Decimal],
+    alert_recoverable_errors: tuple[type[Exception], ...],
+) -> None:
+    """Check budget threshold and dispatch warning/critical alerts."""
+    import app.shared.llm.budget_manager as manager_module
+
+    result = await db.execute(
+        select(manager_module.LLMBudget).where(
+            manager_module.LLMBudget.tenant_id == tenant_id
+        )
+    )
+    budget = result.scalar_one_or_none()
+    if inspect.isawaitable(budget):
+        budget = await budget
+    if not budget:
+        return
+
+    now = datetime.now(timezone.utc)
+    current_usage = manager_cls._to_decimal(
+        await month_to_date_spend(db, tenant_id=tenant_id, now=now)
+    )
+
+    limit_dec = coerce_decimal_fn(getattr(budget, "monthly_limit_usd", None))
+    if limit_dec is None:
+        return
+
+    limit = manager_cls._to_decimal(limit_dec)
+    threshold_percent = coerce_threshold_percent_fn(
+        getattr(budget, "alert_threshold_percent", Decimal("80"))
+    )
+    usage_percent = (current_usage / limit * 100) if limit > 0 else Decimal("0")
+
+    alert_sent_at = getattr(budget, "alert_sent_at", None)
+    already_sent = (
+        isinstance(alert_sent_at, datetime)
+        and alert_sent_at.year == now.year
+        and alert_sent_at.month == now.month
+    )
+
+    if usage_percent >= threshold_percent and not already_sent:
+        manager_module.audit_log(
+            event="llm_budget_alert",
+            user_id="system",
+            tenant_id=str(tenant_id),
+            details={
+                "usage_usd": float(current_usage),
+                "limit_usd": float(limit),
+                "percent": float(usage_percent),
+            },
+        )
+
+        try:
+            from app.modules.notifications.domain import get_tenant_slack_service
+
+            slack = await get_tenant_slack_service(db, tenant_id)
+            if slack:
+                await slack.send_alert(
+                    title="LLM Budget Alert",
+                    message=f"Usage: ${current_usage:.2f} / ${limit:.2f} ({usage_percent:.1f}%)",
+                    severity="critical" if usage_percent >= 100 else "warning",
+                )
+            else:
+                manager_module.logger.info(
+                    "llm_budget_alert_slack_not_configured",
+                    tenant_id=str(tenant_id),
+                )
+        except alert_recoverable_errors as exc:
+            manager_module.logger.warning(
+                "llm_budget_alert_slack_dispatch_failed",
+                tenant_id=str(tenant_id),
+                error=str(exc),
+            )
+
+        budget.alert_sent_at = now
+        await db.flush()
+        await db.commit()
+
+
+__all__ = [
+    "check_budget_and_alert",
+    "check_budget_state",
+]
@@ -17,6 +17,12 @@ from app.shared.llm.budget_fair_use_limits import (
     enforce_daily_analysis_limit_impl,
     enforce_fair_use_guards_impl,
 )
+from app.shared.llm.budget_ledger_ops import (
+    count_daily_requests,
+    counter_scope,
+    ledger_dialect,
+    utc_day_window,
+)
 
 FAIR_USE_CACHE_RECOVERABLE_ERRORS: tuple[type[Exception], ...] = (RuntimeError, OSError, TimeoutError, TypeError, ValueError, AttributeError)
 FAIR_USE_PARSE_RECOVERABLE_ERRORS: tuple[type[Exception], ...] = (TypeError, ValueError)
@@ -91,6 +97,20 @@ async def count_requests_in_window(
 ) -> int:
     import app.shared.llm.budget_manager as manager_module
 
+    # Whole-UTC-day windows are answered from the pre-aggregated usage ledger.
+    day = utc_day_window(start, end)
+    scope = counter_scope(actor_type=actor_type, user_id=user_id)
+    if day is not None and scope is not None and ledger_dialect(db) is not None:
+        counted = await count_daily_requests(
+            db,
+            tenant_id=tenant_id,
+            day=day,
+            scope=scope,
+            cache=manager_module.get_cache_service(),
+        )
+        if counted is not None:
+            return counted
+
     query = select(func.count(manager_module.LLMUsage.id)).where(
         manager_module.LLMUsage.tenant_id == tenant_id,
         manager_module.LLMUsage.created_at >= start,
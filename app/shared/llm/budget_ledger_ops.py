@@ -0,0 +1,367 @@
+"""
+Incremental LLM usage ledger and lock-free budget reservation.
+
+`LLMUsageCounter` keeps per-tenant daily and monthly request/spend counters
+that are upserted in the same transaction as each `LLMUsage` insert, so the
+fair-use quotas and budget alerts read one row instead of running
+`COUNT`/`SUM` over the growing usage table. Reservations and settlements are
+single conditional `UPDATE` statements on `llm_budgets`: the database
+re-checks `spend + pending + cost <= limit` against the latest row version,
+which keeps the no-over-spend guarantee without a `SELECT ... FOR UPDATE`
+read-modify-write round trip.
+
+Both paths need a dialect with `ON CONFLICT` upserts and `UPDATE ... RETURNING`
+(PostgreSQL, SQLite); for anything else the helpers return None and callers
+keep their row-locked fallback. Optionally (`LLM_USAGE_LEDGER_REDIS_ENABLED`)
+daily request counts are served from Redis, seeded from the database on a
+miss and expired after a short TTL so drift reconciles with the ledger. Money
+is never reserved from Redis; the database stays authoritative for spend.
+"""
+
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+from typing import Any, Callable
+from uuid import UUID, uuid4
+
+import structlog
+from sqlalchemy import case, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.llm import LLMBudget, LLMUsage, LLMUsageCounter
+from app.shared.core.config import get_settings
+
+logger = structlog.get_logger()
+
+LEDGER_DIALECTS = frozenset({"postgresql", "sqlite"})
+LEDGER_CACHE_TTL_SECONDS = 30
+LEDGER_CACHE_RECOVERABLE_ERRORS: tuple[type[Exception], ...] = (
+    RuntimeError,
+    OSError,
+    TimeoutError,
+    TypeError,
+    ValueError,
+    AttributeError,
+)
+_ZERO = Decimal("0")
+
+
+def ledger_dialect(db: Any) -> str | None:
+    """Dialect name when the session supports the ledger statements, else None."""
+    bind = getattr(db, "bind", None)
+    name = getattr(getattr(bind, "dialect", None), "name", None)
+    if isinstance(name, str) and name.lower() in LEDGER_DIALECTS:
+        return name.lower()
+    return None
+
+
+def month_start(now: datetime) -> datetime:
+    return now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def utc_day_window(start: datetime, end: datetime | None) -> date | None:
+    """The UTC day when `[start, end)` is exactly one whole UTC day."""
+    if end is None or start.tzinfo is None or end.tzinfo is None:
+        return None
+    start_utc = start.astimezone(timezone.utc)
+    if start_utc != start_utc.replace(hour=0, minute=0, second=0, microsecond=0):
+        return None
+    if end.astimezone(timezone.utc) - start_utc != timedelta(days=1):
+        return None
+    return start_utc.date()
+
+
+def counter_scope(
+    *, actor_type: str | None = None, user_id: UUID | None = None
+) -> str | None:
+    """
+    Counter scope matching a `count_requests_in_window` filter.
+
+    Mirrors the `request_type LIKE '<actor>:%'` and `user_id` filters; a user
+    filter without the `user` actor filter has no pre-aggregated bucket.
+    """
+    actor = str(actor_type or "").strip().lower()
+    if user_id is not None:
+        return f"user:{user_id}" if actor == "user" else None
+    if actor in {"user", "system"}:
+        return f"actor:{actor}"
+    return "tenant"
+
+
+def usage_scopes(request_type: str | None, user_id: UUID | None) -> tuple[str, ...]:
+    """Every counter scope one recorded usage row contributes to."""
+    scopes = ["tenant"]
+    actor = str(request_type or "").split(":", 1)[0]
+    if actor in {"user", "system"}:
+        scopes.append(f"actor:{actor}")
+        if actor == "user" and user_id is not None:
+            scopes.append(f"user:{user_id}")
+    return tuple(scopes)
+
+
+def _upsert(dialect: str) -> Callable[..., Any]:
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+        return pg_insert
+    from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+    return sqlite_insert
+
+
+async def increment_usage_counters(
+    db: AsyncSession,
+    *,
+    tenant_id: UUID,
+    user_id: UUID | None,
+    request_type: str | None,
+    cost_usd: Decimal,
+    at: datetime,
+) -> bool:
+    """Add one request and `cost_usd` to the day/month buckets of every scope."""
+    dialect = ledger_dialect(db)
+    if dialect is None:
+        return False
+    at_utc = at.astimezone(timezone.utc)
+    buckets = (("day", at_utc.date()), ("month", at_utc.date().replace(day=1)))
+    rows = [
+        {
+            "id": uuid4(),
+            "tenant_id": tenant_id,
+            "period": period,
+            "period_start": period_start,
+            "scope": scope,
+            "request_count": 1,
+            "cost_usd": cost_usd,
+        }
+        for period, period_start in buckets
+        for scope in usage_scopes(request_type, user_id)
+    ]
+    stmt = _upsert(dialect)(LLMUsageCounter).values(rows)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["tenant_id", "period", "period_start", "scope"],
+        set_={
+            "request_count": LLMUsageCounter.request_count
+            + stmt.excluded.request_count,
+            "cost_usd": LLMUsageCounter.cost_usd + stmt.excluded.cost_usd,
+            "updated_at": func.now(),
+        },
+    )
+    await db.execute(stmt)
+    return True
+
+
+async def _read_counter(
+    db: AsyncSession,
+    *,
+    tenant_id: UUID,
+    period: str,
+    period_start: date,
+    scope: str,
+    column: Any,
+) -> Any:
+    result = await db.execute(
+        select(column).where(
+            LLMUsageCounter.tenant_id == tenant_id,
+            LLMUsageCounter.period == period,
+            LLMUsageCounter.period_start == period_start,
+            LLMUsageCounter.scope == scope,
+        )
+    )
+    return result.scalar()
+
+
+def _counter_cache_key(tenant_id: UUID, day: date, scope: str) -> str:
+    return f"llm:usage_counter:{tenant_id}:{day.isoformat()}:{scope}"
+
+
+def _cache_client(cache: Any) -> Any:
+    if not getattr(get_settings(), "LLM_USAGE_LEDGER_REDIS_ENABLED", False):
+        return None
+    if cache is None or not getattr(cache, "enabled", False):
+        return None
+    return getattr(cache, "client", None)
+
+
+async def count_daily_requests(
+    db: AsyncSession,
+    *,
+    tenant_id: UUID,
+    day: date,
+    scope: str,
+    cache: Any = None,
+) -> int | None:
+    """Requests recorded on `day` for `scope`, or None without ledger support."""
+    if ledger_dialect(db) is None:
+        return None
+    client = _cache_client(cache)
+    key = _counter_cache_key(tenant_id, day, scope)
+    if client is not None:
+        try:
+            cached = await client.get(key)
+            if cached is not None:
+                return int(cached)
+        except LEDGER_CACHE_RECOVERABLE_ERRORS as exc:
+            logger.warning(
+                "llm_usage_counter_cache_read_failed",
+                tenant_id=str(tenant_id),
+                error=str(exc),
+            )
+            client = None
+    count = int(
+        await _read_counter(
+            db,
+            tenant_id=tenant_id,
+            period="day",
+            period_start=day,
+            scope=scope,
+            column=LLMUsageCounter.request_count,
+        )
+        or 0
+    )
+    if client is not None:
+        try:
+            await client.set(key, str(count), ex=LEDGER_CACHE_TTL_SECONDS)
+        except LEDGER_CACHE_RECOVERABLE_ERRORS as exc:
+            logger.warning(
+                "llm_usage_counter_cache_seed_failed",
+                tenant_id=str(tenant_id),
+                error=str(exc),
+            )
+    return count
+
+
+async def publish_usage_increment(
+    cache: Any,
+    *,
+    tenant_id: UUID,
+    user_id: UUID | None,
+    request_type: str | None,
+    at: datetime,
+) -> None:
+    """
+    Bump cached daily counts after the usage row committed.
+
+    Only keys that are already seeded are bumped: an `INCR` that creates a key
+    (result 1) is dropped again so the next read re-seeds from the database.
+    """
+    client = _cache_client(cache)
+    if client is None:
+        return
+    day = at.astimezone(timezone.utc).date()
+    try:
+        for scope in usage_scopes(request_type, user_id):
+            key = _counter_cache_key(tenant_id, day, scope)
+            if int(await client.incr(key)) <= 1:
+                await client.delete(key)
+    except LEDGER_CACHE_RECOVERABLE_ERRORS as exc:
+        logger.warning(
+            "llm_usage_counter_cache_publish_failed",
+            tenant_id=str(tenant_id),
+            error=str(exc),
+        )
+
+
+async def month_to_date_spend(
+    db: AsyncSession, *, tenant_id: UUID, now: datetime
+) -> Any:
+    """Raw spend recorded since the start of `now`'s month (None when empty)."""
+    start = month_start(now)
+    if ledger_dialect(db) is not None:
+        value = await _read_counter(
+            db,
+            tenant_id=tenant_id,
+            period="month",
+            period_start=start.date(),
+            scope="tenant",
+            column=LLMUsageCounter.cost_usd,
+        )
+    else:
+        result = await db.execute(
+            select(func.coalesce(func.sum(LLMUsage.cost_usd), _ZERO)).where(
+                (LLMUsage.tenant_id == tenant_id) & (LLMUsage.created_at >= start)
+            )
+        )
+        value = result.scalar()
+    return value
+
+
+async def reserve_within_limit(
+    db: AsyncSession,
+    *,
+    tenant_id: UUID,
+    estimated_cost: Decimal,
+    now: datetime,
+) -> Decimal | None:
+    """
+    Reserve `estimated_cost` in one conditional UPDATE and return the new
+    pending total.
+
+    None means nothing was reserved and the caller must take the row-locked
+    path: no ledger support, no budget row yet, a month rollover to apply, or
+    the reservation would exceed the limit (the locked path reports it).
+    """
+    if ledger_dialect(db) is None:
+        return None
+    start = month_start(now)
+    next_month = (start + timedelta(days=32)).replace(day=1)
+    committed = LLMBudget.monthly_spend_usd + LLMBudget.pending_reservations_usd
+    stmt = (
+        update(LLMBudget)
+        .where(
+            LLMBudget.tenant_id == tenant_id,
+            LLMBudget.budget_reset_at >= start,
+            LLMBudget.budget_reset_at < next_month,
+            committed + estimated_cost <= LLMBudget.monthly_limit_usd,
+        )
+        .values(
+            pending_reservations_usd=LLMBudget.pending_reservations_usd + estimated_cost
+        )
+        .returning(LLMBudget.pending_reservations_usd)
+        .execution_options(synchronize_session="fetch")
+    )
+    pending = (await db.execute(stmt)).scalar()
+    return None if pending is None else Decimal(str(pending))
+
+
+async def settle_reservation(
+    db: AsyncSession,
+    *,
+    tenant_id: UUID,
+    reserved_usd: Decimal,
+    actual_usd: Decimal,
+) -> bool:
+    """Move a reservation into committed spend in one UPDATE; False if unsupported."""
+    if ledger_dialect(db) is None:
+        return False
+    pending_after = LLMBudget.pending_reservations_usd - reserved_usd
+    await db.execute(
+        update(LLMBudget)
+        .where(LLMBudget.tenant_id == tenant_id)
+        .values(
+            pending_reservations_usd=case(
+                (pending_after > 0, pending_after), else_=_ZERO
+            ),
+            monthly_spend_usd=LLMBudget.monthly_spend_usd + actual_usd,
+        )
+        .execution_options(synchronize_session="fetch")
+    )
+    return True
+
+
+__all__ = [
+    "LEDGER_CACHE_TTL_SECONDS",
+    "LEDGER_DIALECTS",
+    "counter_scope",
+    "count_daily_requests",
+    "increment_usage_counters",
+    "ledger_dialect",
+    "month_start",
+    "month_to_date_spend",
+    "publish_usage_increment",
+    "reserve_within_limit",
+    "settle_reservation",
+    "usage_scopes",
+    "utc_day_window",
+]
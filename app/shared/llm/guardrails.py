@@ -1,10 +1,16 @@
 import re
 import json
-import unicodedata
-from typing import Dict, Any, List, Type, TypeVar, Optional
+from typing import Dict, Any, List, Tuple, Type, TypeVar, Optional
 from pydantic import BaseModel, Field, ValidationError
 import structlog
 
+from app.shared.llm.guardrails_scan_ops import (
+    arbiter_flags,
+    iter_payload_strings,
+    rebuild_payload,
+    scan_text,
+)
+
 logger = structlog.get_logger()
 
 T = TypeVar("T", bound=BaseModel)
@@ -42,111 +48,47 @@ class LLMGuardrails:
         cls, data: Any, db: Any = None, tenant_id: Any = None
     ) -> Any:
         """
-        Recursively sanitizes input data to strip prompt injection attempts.
+        Sanitizes input data (recursively through lists and dicts) to strip
+        prompt injection attempts.
         """
+        patterns = tuple(cls.INJECTION_PATTERNS)
         if isinstance(data, str):
-
-            def _to_plain_ascii(s: str) -> str:
-                # 1. Full-width and Small-caps handling
-                src_sc = "\u1d00\u0299\u1d04\u1d05\u1d07\ua730\u0262\u029c\u026a\u1d0a\u1d0b\u029f\u1d0d\u0274\u1d0f\u1d18\ua7af\u0280\ua731\u1d1b\u1d1c\u1d20\u1d21\u1d22\u028f\u1d22"
-                dst_sc = "abcdefghijklmnopqrstuvwxyz"
-                s = s.translate(str.maketrans(src_sc, dst_sc))
-
-                src_fw = "".join(chr(i) for i in range(0xFF41, 0xFF5B))
-                dst_fw = "abcdefghijklmnopqrstuvwxyz"
-                s = s.translate(str.maketrans(src_fw, dst_fw))
-
-                # 2. General Normalization & Lowercase
-                s = unicodedata.normalize("NFKC", s).lower()
-
-                # 3. Robust Homoglyph Mapping via Dictionary (To avoid alignment errors)
-                homoglyph_map = {
-                    "\u0430": "a",
-                    "\u0432": "v",
-                    "\u0433": "g",
-                    "\u0434": "d",
-                    "\u0435": "e",
-                    "\u0437": "z",
-                    "\u0456": "i",
-                    "\u0458": "j",
-                    "\u043a": "k",
-                    "\u04cf": "i",
-                    "\u043c": "m",
-                    "\u043d": "n",
-                    "\u043f": "p",
-                    "\u043e": "o",
-                    "\u0440": "p",
-                    "\u0441": "s",
-                    "\u0442": "t",
-                    "\u0443": "y",
-                    "\u0445": "x",
-                    "\u0446": "c",
-                    "\u0447": "c",
-                    "\u0448": "s",
-                    "\u0449": "s",
-                    "\u044b": "y",
-                    "\u044c": "b",
-                    "\u044d": "e",
-                    "\u044e": "a",
-                    "\u044f": "i",
-                    "\u0438": "i",
-                }
-                return "".join(homoglyph_map.get(c, c) for c in s)
-
-            # Generate multiple checkable forms
-            forms = [
-                _to_plain_ascii(data),
-                unicodedata.normalize("NFKD", data).lower(),
-                data.lower(),
-            ]
-
-            # Layer 3: Check all forms (normalized and collapsed)
-            for form in set(forms):
-                collapsed = re.sub(r"[^a-z0-9]", "", form)
-
-                for pattern in cls.INJECTION_PATTERNS:
-                    clean_pattern = re.sub(r"[^a-z0-9]", "", pattern).lower()
-                    if clean_pattern and clean_pattern in collapsed:
-                        logger.critical(
-                            "prompt_injection_detected",
-                            pattern=pattern,
-                            form_detected=collapsed[:50],
-                            tenant_id=str(tenant_id),
-                        )
-                        return "[REDACTED]"
-
-            # Layer 4: Advanced Adversarial Arbiter
-            trigger_keywords = [
-                "prompt",
-                "ignore",
-                "system",
-                "mode",
-                "unfilter",
-                "jailbreak",
-                "dan",
-                "output",
-            ]
-            if any(kw in forms[0] for kw in trigger_keywords):
-                arbiter = AdversarialArbiter()
-                if await arbiter.is_adversarial(data):
-                    logger.critical(
-                        "prompt_injection_blocked_by_arbiter", tenant_id=str(tenant_id)
-                    )
-                    return "[REDACTED]"
-
+            return await cls._sanitize_text(data, patterns, tenant_id)
+        if not isinstance(data, (list, dict)):
             return data
 
-        elif isinstance(data, list):
-            return [await cls.sanitize_input(item, db, tenant_id) for item in data]
-        elif isinstance(data, dict):
-            return {
-                await cls.sanitize_input(k, db, tenant_id): await cls.sanitize_input(
-                    v, db, tenant_id
+        # Each distinct string is judged once, however often the payload repeats it.
+        verdicts: Dict[str, str] = {}
+        for text in iter_payload_strings(data):
+            if text not in verdicts:
+                verdicts[text] = await cls._sanitize_text(text, patterns, tenant_id)
+        return rebuild_payload(data, verdicts.__getitem__)
+
+    @staticmethod
+    async def _sanitize_text(
+        text: str, patterns: Tuple[str, ...], tenant_id: Any
+    ) -> str:
+        # Layers 1-3: normalized and collapsed forms against every pattern at once.
+        scan = scan_text(text, patterns)
+        if scan.pattern is not None:
+            logger.critical(
+                "prompt_injection_detected",
+                pattern=scan.pattern,
+                form_detected=scan.form_detected,
+                tenant_id=str(tenant_id),
+            )
+            return "[REDACTED]"
+
+        # Layer 4: Advanced Adversarial Arbiter
+        if scan.needs_arbiter:
+            arbiter = AdversarialArbiter()
+            if await arbiter.is_adversarial(text):
+                logger.critical(
+                    "prompt_injection_blocked_by_arbiter", tenant_id=str(tenant_id)
                 )
-                for k, v in data.items()
-            }
+                return "[REDACTED]"
 
-        return data
+        return text
 
     @classmethod
     def validate_output(cls, raw_content: str, schema_class: Type[T]) -> T:
@@ -233,59 +175,4 @@ class AdversarialArbiter:
     async def is_adversarial(self, text: str) -> bool:
         if not text:
             return False
-
-        def _to_plain_ascii(s: str) -> str:
-            src_sc = "\u1d00\u0299\u1d04\u1d05\u1d07\ua730\u0262\u029c\u026a\u1d0a\u1d0b\u029f\u1d0d\u0274\u1d0f\u1d18\ua7af\u0280\ua731\u1d1b\u1d1c\u1d20\u1d21\u1d22\u028f\u1d22"
-            dst_sc = "abcdefghijklmnopqrstuvwxyz"
-            s = s.translate(str.maketrans(src_sc, dst_sc))
-            s = unicodedata.normalize("NFKC", s).lower()
-            homoglyph_map = {
-                "\u0430": "a",
-                "\u0432": "v",
-                "\u0433": "g",
-                "\u0434": "d",
-                "\u0435": "e",
-                "\u0437": "z",
-                "\u0456": "i",
-                "\u0458": "j",
-                "\u043a": "k",
-                "\u04cf": "i",
-                "\u043c": "m",
-                "\u043d": "n",
-                "\u043f": "p",
-                "\u043e": "o",
-                "\u0440": "p",
-                "\u0441": "s",
-                "\u0442": "t",
-                "\u0443": "y",
-                "\u0445": "x",
-                "\u0446": "c",
-                "\u0447": "c",
-                "\u0448": "s",
-                "\u0449": "s",
-                "\u044b": "y",
-                "\u044c": "b",
-                "\u044d": "e",
-                "\u044e": "a",
-                "\u044f": "i",
-                "\u0438": "i",
-            }
-            return "".join(homoglyph_map.get(c, c) for c in s)
-
-        processed_text = _to_plain_ascii(text)
-        jailbreak_keywords = [
-            "dan",
-            "jailbreak",
-            "unfiltered",
-            "developer mode",
-            "ignore previous",
-            "system prompt",
-            "output only",
-        ]
-        collapsed = re.sub(r"[^a-z]", "", processed_text)
-        for kw in jailbreak_keywords:
-            clean_kw = re.sub(r"[^a-z]", "", kw)
-            if clean_kw in collapsed:
-                return True
-
-        return False
+        return arbiter_flags(text)
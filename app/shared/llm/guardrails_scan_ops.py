@@ -0,0 +1,250 @@
+"""
+Precompiled text scanning for `LLMGuardrails`.
+
+Everything the guardrails need per string is built once per process: the
+small-caps / full-width / homoglyph translation tables, one alternation regex
+over every collapsed injection pattern (a single left-to-right pass instead of
+one substring search per pattern), and the arbiter keyword regex. Verdicts for
+short strings are memoized because analyzer payloads repeat the same keys and
+labels thousands of times. Nested payloads are walked with an explicit stack,
+so deep structures cannot hit the recursion limit.
+"""
+
+from __future__ import annotations
+
+import re
+import unicodedata
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Callable, Iterator
+
+_SMALL_CAPS = (
+    "\u1d00\u0299\u1d04\u1d05\u1d07\ua730\u0262\u029c\u026a\u1d0a\u1d0b\u029f\u1d0d"
+    "\u0274\u1d0f\u1d18\ua7af\u0280\ua731\u1d1b\u1d1c\u1d20\u1d21\u1d22\u028f\u1d22"
+)
+_ASCII_LOWER = "abcdefghijklmnopqrstuvwxyz"
+_FULL_WIDTH = "".join(chr(i) for i in range(0xFF41, 0xFF5B))
+
+_SMALL_CAPS_TABLE = str.maketrans(_SMALL_CAPS, _ASCII_LOWER)
+# Small caps and full-width letters are disjoint and both map to plain ASCII,
+# so one merged table equals translating with each in turn.
+_SMALL_CAPS_FULL_WIDTH_TABLE = {
+    **_SMALL_CAPS_TABLE,
+    **str.maketrans(_FULL_WIDTH, _ASCII_LOWER),
+}
+_HOMOGLYPH_TABLE = str.maketrans(
+    {
+        "\u0430": "a",
+        "\u0432": "v",
+        "\u0433": "g",
+        "\u0434": "d",
+        "\u0435": "e",
+        "\u0437": "z",
+        "\u0456": "i",
+        "\u0458": "j",
+        "\u043a": "k",
+        "\u04cf": "i",
+        "\u043c": "m",
+        "\u043d": "n",
+        "\u043f": "p",
+        "\u043e": "o",
+        "\u0440": "p",
+        "\u0441": "s",
+        "\u0442": "t",
+        "\u0443": "y",
+        "\u0445": "x",
+        "\u0446": "c",
+        "\u0447": "c",
+        "\u0448": "s",
+        "\u0449": "s",
+        "\u044b": "y",
+        "\u044c": "b",
+        "\u044d": "e",
+        "\u044e": "a",
+        "\u044f": "i",
+        "\u0438": "i",
+    }
+)
+
+_NON_ALNUM = re.compile(r"[^a-z0-9]")
+_NON_ALPHA = re.compile(r"[^a-z]")
+
+TRIGGER_KEYWORDS: tuple[str, ...] = (
+    "prompt",
+    "ignore",
+    "system",
+    "mode",
+    "unfilter",
+    "jailbreak",
+    "dan",
+    "output",
+)
+ARBITER_KEYWORDS: tuple[str, ...] = (
+    "dan",
+    "jailbreak",
+    "unfiltered",
+    "developer mode",
+    "ignore previous",
+    "system prompt",
+    "output only",
+)
+# Longer strings are scanned every time rather than pinned in the memo.
+SCAN_CACHE_MAX_TEXT_CHARS = 4096
+SCAN_CACHE_MAX_ENTRIES = 8192
+
+
+@dataclass(frozen=True)
+class InjectionScan:
+    """Outcome of the deterministic layers for one string."""
+
+    pattern: str | None
+    form_detected: str
+    needs_arbiter: bool
+
+
+def to_plain_ascii(text: str, *, full_width: bool = True) -> str:
+    """Fold small caps, full-width letters and Cyrillic homoglyphs to ASCII."""
+    table = _SMALL_CAPS_FULL_WIDTH_TABLE if full_width else _SMALL_CAPS_TABLE
+    folded = unicodedata.normalize("NFKC", text.translate(table)).lower()
+    return folded.translate(_HOMOGLYPH_TABLE)
+
+
+class _CompiledPatterns:
+    def __init__(self, patterns: tuple[str, ...]) -> None:
+        cleaned = [(p, _NON_ALNUM.sub("", p.lower())) for p in patterns]
+        self.cleaned = [(p, c) for p, c in cleaned if c]
+        # Longest first so the alternation never stops at a shorter prefix.
+        alternatives = sorted({c for _p, c in self.cleaned}, key=len, reverse=True)
+        self.regex = (
+            re.compile("|".join(re.escape(c) for c in alternatives))
+            if alternatives
+            else None
+        )
+
+    def first_pattern(self, collapsed: str) -> str | None:
+        if self.regex is None or self.regex.search(collapsed) is None:
+            return None
+        # Report the first configured pattern present, as the per-pattern loop did.
+        return next(p for p, c in self.cleaned if c in collapsed)
+
+
+@lru_cache(maxsize=32)
+def _compiled(patterns: tuple[str, ...]) -> _CompiledPatterns:
+    return _CompiledPatterns(patterns)
+
+
+def _scan(text: str, patterns: tuple[str, ...]) -> InjectionScan:
+    lowered = text.lower()
+    if text.isascii():
+        # NFKC/NFKD and every translation table are identities on ASCII.
+        forms = [lowered]
+    else:
+        forms = list(
+            dict.fromkeys(
+                (
+                    to_plain_ascii(text),
+                    unicodedata.normalize("NFKD", text).lower(),
+                    lowered,
+                )
+            )
+        )
+    compiled = _compiled(patterns)
+    for form in forms:
+        collapsed = _NON_ALNUM.sub("", form)
+        pattern = compiled.first_pattern(collapsed)
+        if pattern is not None:
+            return InjectionScan(pattern, collapsed[:50], needs_arbiter=False)
+    return InjectionScan(
+        None, "", needs_arbiter=any(kw in forms[0] for kw in TRIGGER_KEYWORDS)
+    )
+
+
+_scan_cached = lru_cache(maxsize=SCAN_CACHE_MAX_ENTRIES)(_scan)
+
+
+def scan_text(text: str, patterns: tuple[str, ...]) -> InjectionScan:
+    """Run the normalization and injection-pattern layers on `text`."""
+    if len(text) <= SCAN_CACHE_MAX_TEXT_CHARS:
+        return _scan_cached(text, patterns)
+    return _scan(text, patterns)
+
+
+_ARBITER_KEYWORDS_RE = re.compile(
+    "|".join(
+        re.escape(kw)
+        for kw in sorted(
+            {_NON_ALPHA.sub("", kw) for kw in ARBITER_KEYWORDS}, key=len, reverse=True
+        )
+    )
+)
+
+
+def arbiter_flags(text: str) -> bool:
+    """Heuristic jailbreak check used by `AdversarialArbiter`."""
+    collapsed = _NON_ALPHA.sub("", to_plain_ascii(text, full_width=False))
+    return _ARBITER_KEYWORDS_RE.search(collapsed) is not None
+
+
+def iter_payload_strings(data: Any) -> Iterator[str]:
+    """Yield every string in nested lists/dicts (keys included) in document order."""
+    stack = [data]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, str):
+            yield node
+        elif isinstance(node, list):
+            stack.extend(reversed(node))
+        elif isinstance(node, dict):
+            for key, value in reversed(list(node.items())):
+                stack.append(value)
+                stack.append(key)
+
+
+def rebuild_payload(data: Any, replace: Callable[[str], Any]) -> Any:
+    """
+    Copy nested lists/dicts with every string (keys included) passed through
+    `replace`; other values are returned as-is.
+    """
+
+    def _shallow(value: Any) -> tuple[Any, Any]:
+        if isinstance(value, str):
+            return replace(value), None
+        if isinstance(value, list):
+            out_list: list[Any] = []
+            return out_list, out_list
+        if isinstance(value, dict):
+            out_dict: dict[Any, Any] = {}
+            return out_dict, out_dict
+        return value, None
+
+    root, container = _shallow(data)
+    stack = [] if container is None else [(data, container)]
+    while stack:
+        source, target = stack.pop()
+        if isinstance(source, list):
+            for item in source:
+                value, child = _shallow(item)
+                target.append(value)
+                if child is not None:
+                    stack.append((item, child))
+        else:
+            for key, item in source.items():
+                value, child = _shallow(item)
+                target[replace(key) if isinstance(key, str) else key] = value
+                if child is not None:
+                    stack.append((item, child))
+    return root
+
+
+__all__ = [
+    "ARBITER_KEYWORDS",
+    "SCAN_CACHE_MAX_ENTRIES",
+    "SCAN_CACHE_MAX_TEXT_CHARS",
+    "TRIGGER_KEYWORDS",
+    "InjectionScan",
+    "arbiter_flags",
+    "iter_payload_strings",
+    "rebuild_payload",
+    "scan_text",
+    "to_plain_ascii",
+]
@@ -0,0 +1,278 @@
+"""
+Jittered, capacity-aware spreading of cohort scan jobs.
+
+Instead of scheduling every tenant's jobs at the cohort tick, the jobs are
+spread over a window (a fraction of the cohort interval) cut into fixed
+buckets. Each job prefers the bucket given by a stable hash of
+`<tenant_id>:<job_type>`, so a tenant keeps the same slot from run to run.
+Buckets have a capacity budget in seconds of expected work plus a job cap:
+jobs are placed heaviest first, weighted by the tenant's recent average
+duration for that job type, and move on to the next bucket with room when
+their preferred one is full. When no bucket has room the job goes to the
+least loaded bucket and is counted as overflow.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import math
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Callable, Sequence
+
+import sqlalchemy as sa
+
+COHORT_INTERVALS: dict[str, timedelta] = {
+    "high_value": timedelta(hours=6),
+    "active": timedelta(days=1),
+    "dormant": timedelta(days=7),
+}
+# Width in hours of the deduplication bucket; other cohorts bucket hourly.
+COHORT_DEDUP_BUCKET_HOURS: dict[str, int] = {"high_value": 6, "active": 3}
+DEFAULT_JOB_SECONDS = 60.0
+MIN_JOB_SECONDS = 1.0
+DURATION_HISTORY_DAYS = 14
+DURATION_HISTORY_DIALECTS = frozenset({"postgresql", "sqlite"})
+
+
+@dataclass(frozen=True)
+class CohortSpreadPolicy:
+    """Spread window and per-bucket capacity budget for one cohort run."""
+
+    window_seconds: float
+    bucket_seconds: float
+    bucket_capacity_seconds: float
+    bucket_max_jobs: int
+
+    @property
+    def bucket_count(self) -> int:
+        if self.window_seconds <= 0 or self.bucket_seconds <= 0:
+            return 1
+        return max(1, math.ceil(self.window_seconds / self.bucket_seconds))
+
+
+@dataclass(frozen=True)
+class CohortSpreadPlan:
+    """Offsets (seconds after the cohort tick) per job key and bucket loads."""
+
+    offsets: dict[str, float]
+    bucket_jobs: tuple[int, ...]
+    bucket_load_seconds: tuple[float, ...]
+    overflow_jobs: int
+
+    @property
+    def peak_bucket_jobs(self) -> int:
+        return max(self.bucket_jobs, default=0)
+
+
+def _float_setting(settings: Any, name: str, default: float) -> float:
+    try:
+        value = float(getattr(settings, name, default))
+    except (TypeError, ValueError):
+        return default
+    return value if math.isfinite(value) else default
+
+
+def resolve_spread_policy(
+    cohort_value: str, *, get_settings_fn: Callable[[], Any]
+) -> CohortSpreadPolicy:
+    settings = get_settings_fn()
+    interval = COHORT_INTERVALS.get(str(cohort_value).lower(), timedelta(hours=1))
+    fraction = min(
+        max(_float_setting(settings, "SCHEDULER_COHORT_SPREAD_FRACTION", 0.5), 0.0),
+        1.0,
+    )
+    max_window = max(
+        _float_setting(settings, "SCHEDULER_COHORT_SPREAD_MAX_SECONDS", 21600.0), 0.0
+    )
+    capacity = _float_setting(
+        settings, "SCHEDULER_COHORT_BUCKET_CAPACITY_SECONDS", 7200.0
+    )
+    return CohortSpreadPolicy(
+        window_seconds=min(interval.total_seconds() * fraction, max_window),
+        bucket_seconds=max(
+            _float_setting(settings, "SCHEDULER_COHORT_BUCKET_SECONDS", 300.0), 1.0
+        ),
+        bucket_capacity_seconds=max(capacity, 0.0),
+        bucket_max_jobs=max(
+            int(_float_setting(settings, "SCHEDULER_COHORT_BUCKET_MAX_JOBS", 100.0)), 1
+        ),
+    )
+
+
+def cohort_dedup_bucket(cohort_value: str, now: datetime) -> str:
+    """Deduplication bucket for the cohort run at `now` (ISO hour boundary)."""
+    hours = COHORT_DEDUP_BUCKET_HOURS.get(str(cohort_value).lower(), 1)
+    bucket = now.replace(minute=0, second=0, microsecond=0)
+    return bucket.replace(hour=(now.hour // hours) * hours).isoformat()
+
+
+def jitter_fraction(key: str) -> float:
+    """Stable value in [0, 1) derived from `key` (independent of PYTHONHASHSEED)."""
+    digest = hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big") / float(1 << 64)
+
+
+def plan_cohort_spread(
+    jobs: Sequence[tuple[str, float]], *, policy: CohortSpreadPolicy
+) -> CohortSpreadPlan:
+    """
+    Assign each `(key, expected_seconds)` job an offset inside the window.
+
+    Deterministic for a given job set and policy: the order of `jobs` does not
+    change the plan.
+    """
+    count = policy.bucket_count
+    bucket_jobs = [0] * count
+    bucket_load = [0.0] * count
+    offsets: dict[str, float] = {}
+    overflow = 0
+    if policy.window_seconds <= 0:
+        for key, weight in jobs:
+            offsets[key] = 0.0
+            bucket_jobs[0] += 1
+            bucket_load[0] += weight
+        return CohortSpreadPlan(offsets, tuple(bucket_jobs), tuple(bucket_load), 0)
+
+    width = policy.window_seconds / count
+    ranked = sorted(
+        (
+            (key, max(float(weight), MIN_JOB_SECONDS), jitter_fraction(key))
+            for key, weight in jobs
+        ),
+        key=lambda item: (-item[1], item[2], item[0]),
+    )
+    for key, weight, jitter in ranked:
+        position = jitter * count
+        preferred = min(int(position), count - 1)
+        chosen: int | None = None
+        for step in range(count):
+            index = (preferred + step) % count
+            if bucket_jobs[index] >= policy.bucket_max_jobs:
+                continue
+            # An empty bucket always takes one job, however long it runs.
+            if bucket_jobs[index] and (
+                bucket_load[index] + weight > policy.bucket_capacity_seconds
+            ):
+                continue
+            chosen = index
+            break
+        if chosen is None:
+            overflow += 1
+            chosen = min(
+                range(count),
+                key=lambda index: (bucket_load[index], (index - preferred) % count),
+            )
+        bucket_jobs[chosen] += 1
+        bucket_load[chosen] += weight
+        offsets[key] = (chosen + (position - int(position))) * width
+    return CohortSpreadPlan(
+        offsets=offsets,
+        bucket_jobs=tuple(bucket_jobs),
+        bucket_load_seconds=tuple(bucket_load),
+        overflow_jobs=overflow,
+    )
+
+
+def _dialect_name(db: Any) -> str | None:
+    bind = getattr(db, "bind", None)
+    name = getattr(getattr(bind, "dialect", None), "name", None)
+    return name.lower() if isinstance(name, str) else None
+
+
+async def load_job_duration_history(
+    db: Any,
+    *,
+    background_job_model: Any,
+    completed_status: Any,
+    tenant_ids: Sequence[Any],
+    job_types: Sequence[str],
+    now: datetime,
+) -> dict[tuple[str, str], float]:
+    """Average completed duration in seconds per `(tenant_id, job_type)`."""
+    dialect = _dialect_name(db)
+    if dialect not in DURATION_HISTORY_DIALECTS or not tenant_ids or not job_types:
+        return {}
+    model = background_job_model
+    seconds: sa.ColumnElement[Any]
+    if dialect == "postgresql":
+        seconds = sa.func.extract("epoch", model.completed_at - model.started_at)
+    else:
+        seconds = (
+            sa.func.julianday(model.completed_at) - sa.func.julianday(model.started_at)
+        ) * 86400.0
+    result = await db.execute(
+        sa.select(model.tenant_id, model.job_type, sa.func.avg(seconds))
+        .where(
+            model.status == getattr(completed_status, "value", completed_status),
+            model.started_at.isnot(None),
+            model.completed_at >= now - timedelta(days=DURATION_HISTORY_DAYS),
+            model.tenant_id.in_(list(tenant_ids)),
+            model.job_type.in_(list(job_types)),
+        )
+        .group_by(model.tenant_id, model.job_type)
+    )
+    return {
+        (str(tenant_id), str(job_type)): float(avg_seconds)
+        for tenant_id, job_type, avg_seconds in result.all()
+        if avg_seconds is not None
+    }
+
+
+async def spread_cohort_jobs(
+    db: Any,
+    *,
+    cohort_value: str,
+    jobs: list[dict[str, Any]],
+    now: datetime,
+    background_job_model: Any,
+    completed_status: Any,
+    get_settings_fn: Callable[[], Any],
+    offset_histogram: Any,
+    peak_bucket_gauge: Any,
+    overflow_counter: Any,
+) -> CohortSpreadPlan:
+    """Set `scheduled_for` on each job row in place and record the spread."""
+    policy = resolve_spread_policy(cohort_value, get_settings_fn=get_settings_fn)
+    history = await load_job_duration_history(
+        db,
+        background_job_model=background_job_model,
+        completed_status=completed_status,
+        tenant_ids=sorted({job["tenant_id"] for job in jobs}, key=str),
+        job_types=sorted({str(job["job_type"]) for job in jobs}),
+        now=now,
+    )
+    keyed = {f"{job['tenant_id']}:{job['job_type']}": job for job in jobs}
+    plan = plan_cohort_spread(
+        [
+            (
+                key,
+                history.get(
+                    (str(job["tenant_id"]), str(job["job_type"])), DEFAULT_JOB_SECONDS
+                ),
+            )
+            for key, job in keyed.items()
+        ],
+        policy=policy,
+    )
+    for key, job in keyed.items():
+        offset = plan.offsets[key]
+        job["scheduled_for"] = now + timedelta(seconds=offset)
+        offset_histogram.labels(cohort=cohort_value).observe(offset)
+    peak_bucket_gauge.labels(cohort=cohort_value).set(plan.peak_bucket_jobs)
+    if plan.overflow_jobs:
+        overflow_counter.labels(cohort=cohort_value).inc(plan.overflow_jobs)
+    return plan
+
+
+__all__ = [
+    "COHORT_INTERVALS",
+    "CohortSpreadPlan",
+    "CohortSpreadPolicy",
+    "cohort_dedup_bucket",
+    "jitter_fraction",
+    "load_job_duration_history",
+    "plan_cohort_spread",
+    "resolve_spread_policy",
+    "spread_cohort_jobs",
+]
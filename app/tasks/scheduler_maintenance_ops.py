@@ -235,7 +235,7 @@ async def maintenance_sweep_logic(
                 logger.warning("maintenance_cost_retention_failed", error=str(exc))
 
             aggregator = cost_aggregator_cls()
-            await aggregator.refresh_materialized_view(db)
+            await aggregator.reconcile_daily_aggregates(db)
 
             try:
                 from app.shared.core.maintenance import PartitionMaintenanceService
@@ -0,0 +1,147 @@
+"""
+Set-based enqueueing for scheduler sweeps.
+
+A sweep describes its candidates as a SELECT over the source table (one row per
+job, labelled `tenant_id` and optionally `payload`). The jobs are written with
+a single `INSERT ... SELECT ... ON CONFLICT (deduplication_key) DO NOTHING`,
+where the deduplication key (`<tenant_id>:<job_type>:<bucket>`) is computed in
+SQL. No candidate rows are loaded into Python or locked, and concurrent
+scheduler instances racing on the same bucket simply skip each other's jobs.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable
+
+import sqlalchemy as sa
+
+
+@dataclass(frozen=True)
+class SweepEnqueueResult:
+    """Outcome of one set-based enqueue."""
+
+    candidates: int
+    inserted: int
+
+    @property
+    def skipped(self) -> int:
+        """Candidates whose job for this bucket already existed."""
+        return max(self.candidates - self.inserted, 0)
+
+
+def _dialect_name(db: Any) -> str:
+    bind = getattr(db, "bind", None)
+    name = getattr(getattr(bind, "dialect", None), "name", None)
+    return name.lower() if isinstance(name, str) else "postgresql"
+
+
+def _new_uuid_expr(db: Any) -> Any:
+    if _dialect_name(db) == "sqlite":
+        # SQLite stores `Uuid` as 32 hex characters.
+        return sa.func.lower(sa.func.hex(sa.func.randomblob(16)))
+    return sa.func.gen_random_uuid()
+
+
+def json_object_expr(db: Any, *key_values: Any) -> Any:
+    """Per-row JSON object built in SQL (`jsonb_build_object` on PostgreSQL)."""
+    if _dialect_name(db) == "sqlite":
+        return sa.func.json_object(*key_values)
+    return sa.func.jsonb_build_object(*key_values)
+
+
+def _scalar_default(model: Any, column: str) -> Any:
+    default = model.__table__.c[column].default
+    return default.arg if default is not None and default.is_scalar else None
+
+
+async def enqueue_jobs_from_select(
+    db: Any,
+    *,
+    insert_fn: Callable[[Any], Any],
+    background_job_model: Any,
+    source: Any,
+    job_type_value: str,
+    bucket: str,
+    status: Any,
+    now: datetime,
+    priority: int = 0,
+    payload: dict[str, Any] | None = None,
+    limit: int | None = None,
+    scope: str = "",
+    logger: Any = None,
+) -> SweepEnqueueResult:
+    """
+    Enqueue one job per row of `source` in a single statement.
+
+    `payload` is used for every job unless `source` selects its own `payload`
+    column. With `limit`, at most that many candidates are enqueued and the
+    cap is logged as `scheduler_scope_capped`, like the list-based sweeps.
+    """
+    available = (
+        await db.execute(
+            sa.select(sa.func.count()).select_from(source.subquery("sweep_source"))
+        )
+    ).scalar()
+    available = int(available or 0)
+    candidates_count = available if limit is None else min(available, limit)
+    if limit is not None and available > limit and logger is not None:
+        logger.warning(
+            "scheduler_scope_capped",
+            scope=scope,
+            total_items=available,
+            capped_items=limit,
+            limit=limit,
+        )
+    if candidates_count <= 0:
+        return SweepEnqueueResult(candidates=0, inserted=0)
+
+    if limit is not None:
+        source = source.limit(limit)
+    candidates = source.subquery("sweep_candidates")
+    table = background_job_model.__table__
+    if "payload" in candidates.c:
+        payload_expr = candidates.c.payload
+    elif payload is None:
+        payload_expr = sa.null()
+    else:
+        payload_expr = sa.literal(payload, type_=table.c.payload.type)
+    timestamp = sa.literal(now, type_=table.c.created_at.type)
+    values: dict[str, Any] = {
+        "id": _new_uuid_expr(db),
+        "job_type": sa.literal(job_type_value),
+        "tenant_id": candidates.c.tenant_id,
+        "deduplication_key": sa.cast(candidates.c.tenant_id, sa.String)
+        + sa.literal(f":{job_type_value}:{bucket}"),
+        "status": sa.literal(str(getattr(status, "value", status))),
+        "payload": payload_expr,
+        "attempts": sa.literal(_scalar_default(background_job_model, "attempts")),
+        "max_attempts": sa.literal(
+            _scalar_default(background_job_model, "max_attempts")
+        ),
+        "priority": sa.literal(priority),
+        "scheduled_for": timestamp,
+        "created_at": timestamp,
+        "updated_at": timestamp,
+        "is_deleted": sa.false(),
+    }
+    # `WHERE true` keeps SQLite from parsing ON CONFLICT as a join constraint.
+    rows = sa.select(*values.values()).select_from(candidates).where(sa.true())
+    stmt = (
+        insert_fn(background_job_model)
+        .from_select(list(values), rows)
+        .on_conflict_do_nothing(index_elements=["deduplication_key"])
+    )
+    result = await db.execute(stmt)
+    inserted = max(int(getattr(result, "rowcount", 0) or 0), 0)
+    return SweepEnqueueResult(
+        candidates=candidates_count, inserted=min(inserted, candidates_count)
+    )
+
+
+__all__ = [
+    "SweepEnqueueResult",
+    "enqueue_jobs_from_select",
+    "json_object_expr",
+]
@@ -6,6 +6,10 @@ from typing import Any, Callable
 
 from sqlalchemy.exc import SQLAlchemyError
 
+from app.tasks.scheduler_sweep_enqueue_ops import (
+    enqueue_jobs_from_select,
+    json_object_expr,
+)
 from app.tasks.scheduler_sweep_runtime import (
     increment_background_job_metric,
     open_transaction_session,
@@ -54,51 +58,41 @@ async def billing_sweep_logic(
                 open_db_session_fn=open_db_session_fn,
                 asyncio_module=asyncio_module,
             ) as db:
-                query = (
-                    sa.select(TenantSubscription)
-                    .where(
-                        TenantSubscription.status == SubscriptionStatus.ACTIVE.value,
-                        TenantSubscription.next_payment_date <= datetime.now(timezone.utc),
-                        TenantSubscription.paystack_auth_code.isnot(None),
-                    )
-                    .with_for_update(skip_locked=True)
-                )
-                result = await db.execute(query)
-                due_subscriptions = result.scalars().all()
-
                 now = datetime.now(timezone.utc)
-                bucket_str = now.strftime("%Y-%m-%d")
-                jobs_enqueued = 0
-                for sub in due_subscriptions:
-                    dedup_key = (
-                        f"{sub.tenant_id}:{job_type.RECURRING_BILLING.value}:{bucket_str}"
-                    )
-                    stmt = (
-                        insert(background_job_model)
-                        .values(
-                            job_type=job_type.RECURRING_BILLING.value,
-                            tenant_id=sub.tenant_id,
-                            payload={"subscription_id": str(sub.id)},
-                            status=job_status.PENDING,
-                            scheduled_for=now,
-                            created_at=now,
-                            deduplication_key=dedup_key,
-                        )
-                        .on_conflict_do_nothing(index_elements=["deduplication_key"])
-                    )
-                    result_proxy = await db.execute(stmt)
-                    if hasattr(result_proxy, "rowcount") and result_proxy.rowcount > 0:
-                        jobs_enqueued += 1
-                        increment_background_job_metric(
-                            background_jobs_enqueued=background_jobs_enqueued,
-                            job_type_value=job_type.RECURRING_BILLING.value,
-                            cohort="BILLING",
-                        )
+                source = sa.select(
+                    TenantSubscription.tenant_id.label("tenant_id"),
+                    json_object_expr(
+                        db,
+                        sa.literal("subscription_id"),
+                        sa.cast(TenantSubscription.id, sa.String),
+                    ).label("payload"),
+                ).where(
+                    TenantSubscription.status == SubscriptionStatus.ACTIVE.value,
+                    TenantSubscription.next_payment_date <= now,
+                    TenantSubscription.paystack_auth_code.isnot(None),
+                )
+                outcome = await enqueue_jobs_from_select(
+                    db,
+                    insert_fn=insert,
+                    background_job_model=background_job_model,
+                    source=source,
+                    job_type_value=job_type.RECURRING_BILLING.value,
+                    bucket=now.strftime("%Y-%m-%d"),
+                    status=job_status.PENDING,
+                    now=now,
+                )
+                increment_background_job_metric(
+                    background_jobs_enqueued=background_jobs_enqueued,
+                    job_type_value=job_type.RECURRING_BILLING.value,
+                    cohort="BILLING",
+                    amount=outcome.inserted,
+                )
 
                 logger.info(
                     "billing_sweep_completed",
-                    due_count=len(due_subscriptions),
-                    jobs_enqueued=jobs_enqueued,
+                    due_count=outcome.candidates,
+                    jobs_enqueued=outcome.inserted,
+                    jobs_skipped=outcome.skipped,
                 )
 
         await run_sweep_with_retries(
@@ -130,7 +124,6 @@ async def acceptance_sweep_logic(
     job_status: Any,
     job_type: Any,
     system_sweep_tenant_limit_fn: Callable[[], int],
-    cap_scope_items_fn: Callable[..., list[Any]],
     datetime_module: Any,
     timezone_obj: Any,
     asyncio_module: Any,
@@ -147,76 +140,57 @@ async def acceptance_sweep_logic(
                     open_db_session_fn=open_db_session_fn,
                     asyncio_module=asyncio_module,
                 ) as db:
-                        result = await db.execute(
-                            sa.select(tenant_model).with_for_update(skip_locked=True)
-                        )
-                        tenant_limit = system_sweep_tenant_limit_fn()
-                        tenants = cap_scope_items_fn(
-                            result.scalars().all(),
-                            scope="acceptance_tenants",
-                            limit=tenant_limit,
-                        )
-                        if not tenants:
-                            logger.info("acceptance_sweep_no_tenants")
-                            return
+                    now = datetime_module.now(timezone_obj.utc)
+                    bucket_str = now.strftime("%Y-%m-%d")
+                    capture_close_package = now.day == 1
+                    capture_quarterly_report = now.day == 1 and now.month in {
+                        1,
+                        4,
+                        7,
+                        10,
+                    }
+                    payload: dict[str, Any] | None = None
+                    if capture_close_package or capture_quarterly_report:
+                        payload = {}
+                        if capture_close_package:
+                            payload["capture_close_package"] = True
+                        if capture_quarterly_report:
+                            payload["capture_quarterly_report"] = True
 
-                        now = datetime_module.now(timezone_obj.utc)
-                        bucket_str = now.strftime("%Y-%m-%d")
-                        jobs_enqueued = 0
-                        capture_close_package = now.day == 1
-                        capture_quarterly_report = now.day == 1 and now.month in {
-                            1,
-                            4,
-                            7,
-                            10,
-                        }
-
-                        for tenant in tenants:
-                            dedup_key = (
-                                f"{tenant.id}:{job_type.ACCEPTANCE_SUITE_CAPTURE.value}:{bucket_str}"
-                            )
-                            payload: dict[str, Any] | None = None
-                            if capture_close_package or capture_quarterly_report:
-                                payload = {}
-                                if capture_close_package:
-                                    payload["capture_close_package"] = True
-                                if capture_quarterly_report:
-                                    payload["capture_quarterly_report"] = True
-                            stmt = (
-                                insert(background_job_model)
-                                .values(
-                                    job_type=job_type.ACCEPTANCE_SUITE_CAPTURE.value,
-                                    tenant_id=tenant.id,
-                                    status=job_status.PENDING,
-                                    scheduled_for=now,
-                                    created_at=now,
-                                    payload=payload,
-                                    deduplication_key=dedup_key,
-                                    priority=0,
-                                )
-                                .on_conflict_do_nothing(
-                                    index_elements=["deduplication_key"]
-                                )
-                            )
-
-                            result_proxy = await db.execute(stmt)
-                            if (
-                                hasattr(result_proxy, "rowcount")
-                                and result_proxy.rowcount > 0
-                            ):
-                                jobs_enqueued += 1
-                                increment_background_job_metric(
-                                    background_jobs_enqueued=background_jobs_enqueued,
-                                    job_type_value=job_type.ACCEPTANCE_SUITE_CAPTURE.value,
-                                    cohort="ACCEPTANCE",
-                                )
+                    outcome = await enqueue_jobs_from_select(
+                        db,
+                        insert_fn=insert,
+                        background_job_model=background_job_model,
+                        source=sa.select(tenant_model.id.label("tenant_id")).order_by(
+                            tenant_model.id
+                        ),
+                        job_type_value=job_type.ACCEPTANCE_SUITE_CAPTURE.value,
+                        bucket=bucket_str,
+                        status=job_status.PENDING,
+                        now=now,
+                        priority=0,
+                        payload=payload,
+                        limit=system_sweep_tenant_limit_fn(),
+                        scope="acceptance_tenants",
+                        logger=logger,
+                    )
+                    if not outcome.candidates:
+                        logger.info("acceptance_sweep_no_tenants")
+                        return
+                    increment_background_job_metric(
+                        background_jobs_enqueued=background_jobs_enqueued,
+                        job_type_value=job_type.ACCEPTANCE_SUITE_CAPTURE.value,
+                        cohort="ACCEPTANCE",
+                        amount=outcome.inserted,
+                    )
 
-                        logger.info(
-                            "acceptance_sweep_enqueued",
-                            tenants=len(tenants),
-                            jobs_enqueued=jobs_enqueued,
-                            bucket=bucket_str,
-                        )
+                    logger.info(
+                        "acceptance_sweep_enqueued",
+                        tenants=outcome.candidates,
+                        jobs_enqueued=outcome.inserted,
+                        jobs_skipped=outcome.skipped,
+                        bucket=bucket_str,
+                    )
 
                 scheduler_job_runs.labels(job_name=job_name, status="success").inc()
                 break
@@ -280,7 +254,6 @@ async def enforcement_reconciliation_sweep_logic(
     job_status: Any,
     job_type: Any,
     system_sweep_tenant_limit_fn: Callable[[], int],
-    cap_scope_items_fn: Callable[..., list[Any]],
     datetime_cls: Any,
     timezone_obj: Any,
     time_module: Any,
@@ -300,52 +273,39 @@ async def enforcement_reconciliation_sweep_logic(
                 open_db_session_fn=open_db_session_fn,
                 asyncio_module=asyncio_module,
             ) as db:
-                result = await db.execute(
-                    sa.select(tenant_model.id).with_for_update(skip_locked=True)
-                )
-                tenant_limit = system_sweep_tenant_limit_fn()
-                tenant_ids = cap_scope_items_fn(
-                    result.scalars().all(),
-                    scope="enforcement_reconciliation_tenants",
-                    limit=tenant_limit,
-                )
                 now = datetime_cls.now(timezone_obj.utc)
                 bucket_str = now.replace(
                     minute=0, second=0, microsecond=0
                 ).isoformat()
-                jobs_enqueued = 0
-
-                for tenant_id in tenant_ids:
-                    dedup_key = (
-                        f"{tenant_id}:{job_type.ENFORCEMENT_RECONCILIATION.value}:{bucket_str}"
-                    )
-                    stmt = (
-                        insert(background_job_model)
-                        .values(
-                            job_type=job_type.ENFORCEMENT_RECONCILIATION.value,
-                            tenant_id=tenant_id,
-                            status=job_status.PENDING,
-                            scheduled_for=now,
-                            created_at=now,
-                            payload={"trigger": "scheduled"},
-                            deduplication_key=dedup_key,
-                            priority=1,
-                        )
-                        .on_conflict_do_nothing(index_elements=["deduplication_key"])
-                    )
-                    result_proxy = await db.execute(stmt)
-                    if hasattr(result_proxy, "rowcount") and result_proxy.rowcount > 0:
-                        jobs_enqueued += 1
-                        increment_background_job_metric(
-                            background_jobs_enqueued=background_jobs_enqueued,
-                            job_type_value=job_type.ENFORCEMENT_RECONCILIATION.value,
-                            cohort="ENFORCEMENT",
-                        )
+                outcome = await enqueue_jobs_from_select(
+                    db,
+                    insert_fn=insert,
+                    background_job_model=background_job_model,
+                    source=sa.select(tenant_model.id.label("tenant_id")).order_by(
+                        tenant_model.id
+                    ),
+                    job_type_value=job_type.ENFORCEMENT_RECONCILIATION.value,
+                    bucket=bucket_str,
+                    status=job_status.PENDING,
+                    now=now,
+                    priority=1,
+                    payload={"trigger": "scheduled"},
+                    limit=system_sweep_tenant_limit_fn(),
+                    scope="enforcement_reconciliation_tenants",
+                    logger=logger,
+                )
+                increment_background_job_metric(
+                    background_jobs_enqueued=background_jobs_enqueued,
+                    job_type_value=job_type.ENFORCEMENT_RECONCILIATION.value,
+                    cohort="ENFORCEMENT",
+                    amount=outcome.inserted,
+                )
 
                 logger.info(
                     "enforcement_reconciliation_sweep_enqueued",
-                    tenants=len(tenant_ids),
-                    jobs_enqueued=jobs_enqueued,
+                    tenants=outcome.candidates,
+                    jobs_enqueued=outcome.inserted,
+                    jobs_skipped=outcome.skipped,
                     bucket=bucket_str,
                 )
 
@@ -60,8 +60,11 @@ def increment_background_job_metric(
     background_jobs_enqueued: Any,
     job_type_value: str,
     cohort: str,
+    amount: int = 1,
 ) -> None:
+    if amount <= 0:
+        return
     background_jobs_enqueued.labels(
         job_type=job_type_value,
         cohort=cohort,
-    ).inc()
+    ).inc(amount)
@@ -20,6 +20,9 @@ from app.modules.governance.domain.scheduler.metrics import (
     SCHEDULER_JOB_DURATION,
     SCHEDULER_DEADLOCK_DETECTED,
     BACKGROUND_JOBS_ENQUEUED_SCHEDULER as BACKGROUND_JOBS_ENQUEUED,
+    SCHEDULER_COHORT_CAPACITY_OVERFLOW,
+    SCHEDULER_COHORT_PEAK_BUCKET_JOBS,
+    SCHEDULER_COHORT_SCHEDULE_OFFSET,
 )
 import time
 import uuid
@@ -48,6 +51,10 @@ from app.tasks.scheduler_runtime_ops import (
     system_sweep_connection_limit as _system_sweep_connection_limit_impl,
     system_sweep_tenant_limit as _system_sweep_tenant_limit_impl,
 )
+from app.tasks.scheduler_cohort_spread_ops import (
+    cohort_dedup_bucket as _cohort_dedup_bucket,
+    spread_cohort_jobs as _spread_cohort_jobs_impl,
+)
 from app.tasks.scheduler_remediation_ops import (
     remediation_sweep_logic as _remediation_sweep_logic_impl,
 )
@@ -193,15 +200,7 @@ async def _cohort_analysis_logic(target_cohort: TenantCohort) -> None:
                             return
 
                         now = datetime.now(timezone.utc)
-                        bucket = now.replace(minute=0, second=0, microsecond=0)
-                        if target_cohort == TenantCohort.HIGH_VALUE:
-                            hour = (now.hour // 6) * 6
-                            bucket = bucket.replace(hour=hour)
-                        elif target_cohort == TenantCohort.ACTIVE:
-                            hour = (now.hour // 3) * 3
-                            bucket = bucket.replace(hour=hour)
-
-                        bucket_str = bucket.isoformat()
+                        bucket_str = _cohort_dedup_bucket(target_cohort.value, now)
                         jobs_to_insert = []
 
                         with _scheduler_span(
@@ -232,11 +231,22 @@ async def _cohort_analysis_logic(target_cohort: TenantCohort) -> None:
                                         "job_type": jtype.value,
                                         "tenant_id": tenant.id,
                                         "status": JobStatus.PENDING,
-                                        "scheduled_for": now,
                                         "created_at": now,
                                         "deduplication_key": dedup_key,
                                     })
 
+                        spread = await _spread_cohort_jobs_impl(
+                            db,
+                            cohort_value=target_cohort.value,
+                            jobs=jobs_to_insert,
+                            now=now,
+                            background_job_model=BackgroundJob,
+                            completed_status=JobStatus.COMPLETED,
+                            get_settings_fn=get_settings,
+                            offset_histogram=SCHEDULER_COHORT_SCHEDULE_OFFSET,
+                            peak_bucket_gauge=SCHEDULER_COHORT_PEAK_BUCKET_JOBS,
+                            overflow_counter=SCHEDULER_COHORT_CAPACITY_OVERFLOW,
+                        )
                         jobs_enqueued = 0
                         if jobs_to_insert:
                             with _scheduler_span(
@@ -270,6 +280,8 @@ async def _cohort_analysis_logic(target_cohort: TenantCohort) -> None:
                             cohort=target_cohort.value,
                             tenants=len(cohort_tenants),
                             jobs_enqueued=jobs_enqueued,
+                            peak_bucket_jobs=spread.peak_bucket_jobs,
+                            overflow_jobs=spread.overflow_jobs,
                         )
 
                 SCHEDULER_JOB_RUNS.labels(job_name=job_name, status="success").inc()
@@ -391,7 +403,6 @@ async def _acceptance_sweep_logic() -> None:
         job_status=JobStatus,
         job_type=JobType,
         system_sweep_tenant_limit_fn=_system_sweep_tenant_limit,
-        cap_scope_items_fn=_cap_scope_items,
         datetime_module=datetime,
         timezone_obj=timezone,
         asyncio_module=asyncio,
@@ -456,7 +467,6 @@ async def _enforcement_reconciliation_sweep_logic() -> None:
         job_status=JobStatus,
         job_type=JobType,
         system_sweep_tenant_limit_fn=_system_sweep_tenant_limit,
-        cap_scope_items_fn=_cap_scope_items,
         datetime_cls=datetime,
         timezone_obj=timezone,
         time_module=time,
@@ -13,11 +13,11 @@ import ssl
 
 from app.shared.db.base import Base
 # Import all models so Base knows about them!
-from app.models.llm import LLMUsage, LLMBudget  # noqa: F401 # pylint: disable=unused-import
+from app.models.llm import LLMUsage, LLMBudget, LLMUsageCounter  # noqa: F401 # pylint: disable=unused-import
 from app.models.carbon_settings import CarbonSettings  # noqa: F401 # pylint: disable=unused-import
 from app.models.aws_connection import AWSConnection  # noqa: F401 # pylint: disable=unused-import
 from app.models.discovered_account import DiscoveredAccount  # noqa: F401 # pylint: disable=unused-import
-from app.models.cloud import CostRecord  # noqa: F401 # pylint: disable=unused-import
+from app.models.cloud import CostRecord, DailyCostAggregate  # noqa: F401 # pylint: disable=unused-import
 from app.models.notification_settings import NotificationSettings  # noqa: F401 # pylint: disable=unused-import
 from app.models.remediation import RemediationRequest  # noqa: F401 # pylint: disable=unused-import
 from app.models.remediation_settings import RemediationSettings  # noqa: F401 # pylint: disable=unused-import
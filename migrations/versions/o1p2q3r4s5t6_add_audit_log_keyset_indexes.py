@@ -0,0 +1,45 @@
+"""Add keyset pagination indexes for audit logs.
+
+`ix_audit_tenant_time_id` covers every lookup `ix_audit_tenant_time` served
+(same leading columns), so the narrower index is dropped.
+
+Revision ID: o1p2q3r4s5t6
+Revises: n0p1q2r3s4t5
+Create Date: 2026-03-09
+"""
+
+from alembic import op
+
+
+revision = "o1p2q3r4s5t6"
+down_revision = "n0p1q2r3s4t5"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Indexes created on the partitioned parent cascade to every partition.
+    op.create_index(
+        "ix_audit_tenant_time_id",
+        "audit_logs",
+        ["tenant_id", "event_timestamp", "id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_audit_tenant_type_time_id",
+        "audit_logs",
+        ["tenant_id", "event_type", "event_timestamp", "id"],
+        unique=False,
+    )
+    op.drop_index("ix_audit_tenant_time", table_name="audit_logs")
+
+
+def downgrade() -> None:
+    op.create_index(
+        "ix_audit_tenant_time",
+        "audit_logs",
+        ["tenant_id", "event_timestamp"],
+        unique=False,
+    )
+    op.drop_index("ix_audit_tenant_type_time_id", table_name="audit_logs")
+    op.drop_index("ix_audit_tenant_time_id", table_name="audit_logs")
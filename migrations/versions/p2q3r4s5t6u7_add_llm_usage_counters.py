@@ -0,0 +1,105 @@
+"""Add pre-aggregated LLM usage counters (reservation ledger).
+
+Revision ID: p2q3r4s5t6u7
+Revises: o1p2q3r4s5t6
+Create Date: 2026-03-10
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "p2q3r4s5t6u7"
+down_revision = "o1p2q3r4s5t6"
+branch_labels = None
+depends_on = None
+
+
+_BACKFILL_SQL = """
+INSERT INTO llm_usage_counters
+    (id, tenant_id, period, period_start, scope, request_count, cost_usd, updated_at)
+SELECT gen_random_uuid(), tenant_id, period, period_start, scope,
+       COUNT(*), COALESCE(SUM(cost_usd), 0), now()
+FROM (
+    SELECT u.tenant_id, p.period, u.cost_usd,
+           CASE p.period
+               WHEN 'day' THEN (u.created_at AT TIME ZONE 'UTC')::date
+               ELSE date_trunc('month', u.created_at AT TIME ZONE 'UTC')::date
+           END AS period_start,
+           s.scope
+    FROM llm_usage u
+    CROSS JOIN (VALUES ('day'), ('month')) AS p(period)
+    CROSS JOIN LATERAL (
+        VALUES
+            ('tenant'),
+            (CASE
+                WHEN u.request_type LIKE 'user:%' THEN 'actor:user'
+                WHEN u.request_type LIKE 'system:%' THEN 'actor:system'
+            END),
+            (CASE
+                WHEN u.request_type LIKE 'user:%' AND u.user_id IS NOT NULL
+                THEN 'user:' || u.user_id::text
+            END)
+    ) AS s(scope)
+    WHERE s.scope IS NOT NULL
+) buckets
+GROUP BY tenant_id, period, period_start, scope
+"""
+
+
+def upgrade() -> None:
+    op.create_table(
+        "llm_usage_counters",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("tenant_id", sa.Uuid(), nullable=False),
+        sa.Column("period", sa.String(length=8), nullable=False),
+        sa.Column("period_start", sa.Date(), nullable=False),
+        sa.Column("scope", sa.String(length=64), nullable=False),
+        sa.Column("request_count", sa.Integer(), nullable=False),
+        sa.Column("cost_usd", sa.Numeric(18, 8), nullable=False),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(["tenant_id"], ["tenants.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "tenant_id",
+            "period",
+            "period_start",
+            "scope",
+            name="uq_llm_usage_counters_bucket",
+        ),
+    )
+    op.create_index(
+        op.f("ix_llm_usage_counters_tenant_id"),
+        "llm_usage_counters",
+        ["tenant_id"],
+        unique=False,
+    )
+
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.execute("ALTER TABLE llm_usage_counters ENABLE ROW LEVEL SECURITY")
+    op.execute(
+        """
+        CREATE POLICY llm_usage_counters_isolation_policy ON llm_usage_counters
+        USING (tenant_id = (SELECT current_setting('app.current_tenant_id', TRUE)::uuid));
+        """
+    )
+    # Seed the counters from history so quotas stay exact across the cutover.
+    op.execute(_BACKFILL_SQL)
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        op.execute(
+            "DROP POLICY IF EXISTS llm_usage_counters_isolation_policy "
+            "ON llm_usage_counters"
+        )
+    op.drop_index(
+        op.f("ix_llm_usage_counters_tenant_id"), table_name="llm_usage_counters"
+    )
+    op.drop_table("llm_usage_counters")
@@ -0,0 +1,43 @@
+"""Add the background job index behind the ingestion SLA aggregates.
+
+Revision ID: q3r4s5t6u7v8
+Revises: p2q3r4s5t6u7
+Create Date: 2026-03-11
+
+Index plan for the reporting metrics pushed down into SQL:
+
+- Ingestion SLA: a single aggregate over
+  `background_jobs WHERE tenant_id = :t AND job_type = 'cost_ingestion'
+  AND created_at >= :window_start` (counts, max(completed_at), duration
+  sum/count, percentile_disc(0.95), sum of result->'ingested'). The new
+  `(tenant_id, job_type, created_at)` index turns it into a range scan over
+  the tenant's ingestion jobs in the window; previously the planner had to
+  pick one of the single-column tenant/job_type/created_at indexes and
+  filter the rest.
+- Provider recency: one UNION ALL of per-table aggregates, each filtered on
+  `tenant_id`. Every connection table already has its tenant_id index and
+  holds a handful of rows per tenant, so no new index is needed there.
+"""
+
+from alembic import op
+
+
+revision = "q3r4s5t6u7v8"
+down_revision = "p2q3r4s5t6u7"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_background_jobs_tenant_type_created",
+        "background_jobs",
+        ["tenant_id", "job_type", "created_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_background_jobs_tenant_type_created", table_name="background_jobs"
+    )
@@ -0,0 +1,119 @@
+"""Replace the daily cost materialized view with an incremental rollup table.
+
+`mv_daily_cost_aggregates` was rebuilt for every tenant on each refresh.
+`daily_cost_aggregates` has the same grain (tenant, day, service, region) and
+is maintained by ingestion, which recomputes only the buckets it touched.
+The table is seeded from `cost_records`, and the nightly pg_cron refresh job
+and the view are dropped.
+
+Revision ID: r4s5t6u7v8w9
+Revises: q3r4s5t6u7v8
+Create Date: 2026-03-12
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "r4s5t6u7v8w9"
+down_revision = "q3r4s5t6u7v8"
+branch_labels = None
+depends_on = None
+
+
+_BACKFILL_SQL = """
+INSERT INTO daily_cost_aggregates
+    (tenant_id, cost_date, service, region, total_cost, total_carbon,
+     record_count, updated_at)
+SELECT tenant_id, recorded_at, service, COALESCE(region, ''),
+       COALESCE(SUM(cost_usd), 0), COALESCE(SUM(carbon_kg), 0), COUNT(*), now()
+FROM cost_records
+GROUP BY tenant_id, recorded_at, service, COALESCE(region, '')
+"""
+
+_UNSCHEDULE_REFRESH_SQL = """
+DO $$
+BEGIN
+    IF EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pg_cron') THEN
+        PERFORM cron.unschedule('refresh_cost_aggregates');
+    END IF;
+EXCEPTION WHEN OTHERS THEN
+    RAISE NOTICE 'pg_cron job removal skipped';
+END $$;
+"""
+
+_MATERIALIZED_VIEW_SQL = """
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_daily_cost_aggregates AS
+SELECT
+    tenant_id,
+    service,
+    region,
+    DATE(recorded_at) as cost_date,
+    SUM(cost_usd) as total_cost,
+    COALESCE(SUM(carbon_kg), 0) as total_carbon,
+    COUNT(*) as record_count
+FROM cost_records
+GROUP BY tenant_id, service, region, DATE(recorded_at)
+WITH DATA;
+"""
+
+
+def upgrade() -> None:
+    op.create_table(
+        "daily_cost_aggregates",
+        sa.Column("tenant_id", sa.Uuid(), nullable=False),
+        sa.Column("cost_date", sa.Date(), nullable=False),
+        sa.Column("service", sa.String(), nullable=False),
+        sa.Column("region", sa.String(), nullable=False),
+        sa.Column("total_cost", sa.Numeric(18, 8), nullable=False),
+        sa.Column("total_carbon", sa.Numeric(18, 4), nullable=False),
+        sa.Column("record_count", sa.Integer(), nullable=False),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(["tenant_id"], ["tenants.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("tenant_id", "cost_date", "service", "region"),
+    )
+    op.create_index(
+        "ix_daily_cost_aggregates_tenant_date",
+        "daily_cost_aggregates",
+        ["tenant_id", "cost_date"],
+        unique=False,
+    )
+
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.execute("ALTER TABLE daily_cost_aggregates ENABLE ROW LEVEL SECURITY")
+    op.execute(
+        """
+        CREATE POLICY daily_cost_aggregates_isolation_policy ON daily_cost_aggregates
+        USING (tenant_id = (SELECT current_setting('app.current_tenant_id', TRUE)::uuid));
+        """
+    )
+    op.execute(_BACKFILL_SQL)
+    op.execute(_UNSCHEDULE_REFRESH_SQL)
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS mv_daily_cost_aggregates")
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        op.execute(_MATERIALIZED_VIEW_SQL)
+        op.execute(
+            "CREATE UNIQUE INDEX IF NOT EXISTS idx_mv_daily_cost_unique "
+            "ON mv_daily_cost_aggregates (tenant_id, service, region, cost_date)"
+        )
+        op.execute(
+            "CREATE INDEX IF NOT EXISTS idx_mv_daily_cost_tenant_date "
+            "ON mv_daily_cost_aggregates (tenant_id, cost_date)"
+        )
+        op.execute(
+            "DROP POLICY IF EXISTS daily_cost_aggregates_isolation_policy "
+            "ON daily_cost_aggregates"
+        )
+    op.drop_index(
+        "ix_daily_cost_aggregates_tenant_date", table_name="daily_cost_aggregates"
+    )
+    op.drop_table("daily_cost_aggregates")
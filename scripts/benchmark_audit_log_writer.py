@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Audit log writer throughput benchmark (real ORM writes).
+
+Goal:
+- Compare the per-event `add` + `flush` audit write with the buffered unit of
+  work writer (one multi-row insert at commit) and the bounded background
+  `AuditLogBatcher`, for a burst of audit events from one unit of work.
+
+Defaults to a scratch SQLite file; pass `--database-url` to run against a
+disposable PostgreSQL database (tables are created with `create_all`).
+
+Example:
+  uv run python scripts/benchmark_audit_log_writer.py --events 5000 \\
+    --out reports/performance/audit_log_writer.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import tempfile
+import time
+from typing import Any
+from uuid import uuid4
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+import app.models  # noqa: F401  (registers every ORM table for create_all)
+from app.models.tenant import Tenant
+from app.modules.governance.domain.security.audit_log import (
+    AuditEventType,
+    AuditLogger,
+)
+from app.modules.governance.domain.security.audit_log_writer import AuditLogBatcher
+from app.shared.db.base import Base
+
+WRITE_MODES: tuple[str, ...] = ("per_event_flush", "buffered", "batcher")
+
+
+def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Benchmark per-event vs buffered vs batched audit log writes."
+    )
+    parser.add_argument(
+        "--events",
+        dest="events",
+        type=int,
+        default=2000,
+        help="Audit events emitted per mode",
+    )
+    parser.add_argument(
+        "--database-url",
+        dest="database_url",
+        default="",
+        help="Async database URL (default: scratch SQLite file)",
+    )
+    parser.add_argument(
+        "--batch-size",
+        dest="batch_size",
+        type=int,
+        default=500,
+        help="AuditLogBatcher batch size",
+    )
+    parser.add_argument(
+        "--out",
+        dest="out",
+        default="",
+        help="Write JSON results to this path (optional).",
+    )
+    return parser.parse_args(argv)
+
+
+def summarize_mode(*, mode: str, events: int, elapsed_seconds: float) -> dict[str, Any]:
+    return {
+        "mode": mode,
+        "events": events,
+        "elapsed_seconds": round(elapsed_seconds, 4),
+        "events_per_second": round(events / elapsed_seconds, 1)
+        if elapsed_seconds > 0
+        else None,
+    }
+
+
+async def _emit(audit: AuditLogger, *, events: int) -> None:
+    for idx in range(events):
+        await audit.log(
+            event_type=AuditEventType.RESOURCE_UPDATE,
+            resource_type="benchmark",
+            resource_id=f"res-{idx}",
+            details={"idx": idx, "token": "redacted-by-masking"},
+        )
+
+
+async def _run_mode(
+    session_maker: async_sessionmaker[AsyncSession],
+    *,
+    mode: str,
+    tenant_id: Any,
+    events: int,
+    batch_size: int,
+) -> dict[str, Any]:
+    async with session_maker() as session:
+        started = time.perf_counter()
+        if mode == "per_event_flush":
+            # The pre-buffering write path: one flush round-trip per event.
+            audit = AuditLogger(_FlushingSession(session), tenant_id)
+            await _emit(audit, events=events)
+            await session.commit()
+        elif mode == "buffered":
+            await _emit(AuditLogger(session, tenant_id), events=events)
+            await session.commit()
+        else:
+            batcher = AuditLogBatcher(session_maker, batch_size=batch_size)
+            batcher.start()
+            await _emit(AuditLogger(session, tenant_id, batcher=batcher), events=events)
+            await batcher.stop()
+        elapsed = time.perf_counter() - started
+    return summarize_mode(mode=mode, events=events, elapsed_seconds=elapsed)
+
+
+class _FlushingSession:
+    """Session proxy that is not an AsyncSession, forcing add + flush per event."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    def add(self, entry: Any) -> None:
+        self._session.add(entry)
+
+    async def flush(self) -> None:
+        await self._session.flush()
+
+
+async def run_benchmark(
+    *, events: int, database_url: str, batch_size: int
+) -> dict[str, Any]:
+    scratch_dir = None
+    if not database_url:
+        scratch_dir = tempfile.TemporaryDirectory()
+        path = os.path.join(scratch_dir.name, "audit_writer.sqlite")
+        database_url = f"sqlite+aiosqlite:///{path}"
+    engine = create_async_engine(database_url)
+    try:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        session_maker = async_sessionmaker(
+            engine, class_=AsyncSession, expire_on_commit=False
+        )
+        async with session_maker() as session:
+            tenant = Tenant(id=uuid4(), name="Audit writer benchmark", plan="pro")
+            session.add(tenant)
+            await session.commit()
+            tenant_id = tenant.id
+        results = [
+            await _run_mode(
+                session_maker,
+                mode=mode,
+                tenant_id=tenant_id,
+                events=max(1, events),
+                batch_size=batch_size,
+            )
+            for mode in WRITE_MODES
+        ]
+    finally:
+        await engine.dispose()
+        if scratch_dir is not None:
+            scratch_dir.cleanup()
+    baseline = results[0]["elapsed_seconds"]
+    for result in results:
+        elapsed = result["elapsed_seconds"]
+        result["speedup_vs_per_event_flush"] = (
+            round(baseline / elapsed, 2) if elapsed else None
+        )
+    return {
+        "events": max(1, events),
+        "backend": database_url.split("+", 1)[0].split(":", 1)[0],
+        "modes": results,
+        "runner": "scripts/benchmark_audit_log_writer.py",
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _parse_args(argv)
+    payload = asyncio.run(
+        run_benchmark(
+            events=args.events,
+            database_url=args.database_url,
+            batch_size=args.batch_size,
+        )
+    )
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(payload, f, indent=2, sort_keys=True)
+    print(json.dumps(payload, indent=2, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
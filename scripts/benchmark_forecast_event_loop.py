@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+"""
+Event-loop latency benchmark for Prophet forecasting (in-process, synthetic).
+
+Goal:
+- Show what concurrent forecasts do to request latency on the same event loop:
+  a probe coroutine stands in for API traffic and records how late each tick
+  fires while forecasts run either inline (the historical behaviour) or through
+  `run_prophet_fit` (bounded process pool + fit cache).
+- Uses a CPU-bound, Prophet-shaped synthetic model by default so the benchmark
+  runs without Prophet installed; pass `--model prophet` to use the real one.
+
+Example:
+  uv run python scripts/benchmark_forecast_event_loop.py --forecasts 16 \\
+    --out reports/performance/forecast_event_loop.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import math
+import time
+from typing import Any, Awaitable, Callable
+
+import numpy as np
+import pandas as pd
+
+from app.shared.analysis.forecaster_prophet_ops import (
+    fit_prophet_forecast,
+    get_forecast_executor,
+    prophet_fit_cache,
+    run_prophet_fit,
+    shutdown_forecast_executor,
+)
+
+
+class SyntheticProphet:
+    """Prophet-shaped model whose `fit` burns a fixed amount of CPU."""
+
+    FIT_ITERATIONS = 3000
+
+    def __init__(self, **_: Any) -> None:
+        self._history: pd.DataFrame | None = None
+        self._coef = np.zeros(2)
+
+    def fit(self, df: pd.DataFrame) -> "SyntheticProphet":
+        self._history = df.reset_index(drop=True)
+        x = np.arange(len(df), dtype=float)
+        design = np.vstack([x, np.ones_like(x)]).T
+        y = df["y"].to_numpy(dtype=float)
+        coef = np.zeros(2)
+        for _ in range(self.FIT_ITERATIONS):
+            # Re-solving on a widened basis keeps this CPU-bound like Stan's optimizer.
+            wide = np.repeat(design, 64, axis=0)
+            coef = np.linalg.lstsq(wide, np.repeat(y, 64), rcond=None)[0]
+        self._coef = coef
+        return self
+
+    def make_future_dataframe(self, periods: int) -> pd.DataFrame:
+        assert self._history is not None
+        last = pd.Timestamp(self._history["ds"].iloc[-1])
+        future = pd.date_range(last + pd.Timedelta(days=1), periods=periods, freq="D")
+        ds = pd.concat([self._history["ds"], pd.Series(future)], ignore_index=True)
+        return pd.DataFrame({"ds": ds})
+
+    def predict(self, future: pd.DataFrame) -> pd.DataFrame:
+        x = np.arange(len(future), dtype=float)
+        yhat = self._coef[0] * x + self._coef[1]
+        return pd.DataFrame(
+            {
+                "ds": future["ds"],
+                "yhat": yhat,
+                "yhat_lower": yhat * 0.9,
+                "yhat_upper": yhat * 1.1,
+            }
+        )
+
+
+class LightSyntheticProphet(SyntheticProphet):
+    """Cheap variant for smoke tests."""
+
+    FIT_ITERATIONS = 5
+
+
+def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Benchmark event-loop latency while Prophet forecasts run."
+    )
+    parser.add_argument(
+        "--forecasts",
+        dest="forecasts",
+        type=int,
+        default=12,
+        help="Concurrent forecasts per mode",
+    )
+    parser.add_argument(
+        "--history-days",
+        dest="history_days",
+        type=int,
+        default=90,
+        help="Days of training history per forecast",
+    )
+    parser.add_argument(
+        "--horizon", dest="horizon", type=int, default=30, help="Forecast days"
+    )
+    parser.add_argument(
+        "--probe-interval-ms",
+        dest="probe_interval_ms",
+        type=float,
+        default=5.0,
+        help="Simulated request cadence on the event loop",
+    )
+    parser.add_argument(
+        "--model",
+        dest="model",
+        choices=("synthetic", "prophet"),
+        default="synthetic",
+        help="Model implementation to fit",
+    )
+    parser.add_argument(
+        "--workers",
+        dest="workers",
+        type=int,
+        default=2,
+        help="Forecast process-pool size",
+    )
+    parser.add_argument("--seed", dest="seed", type=int, default=7, help="RNG seed")
+    parser.add_argument(
+        "--out",
+        dest="out",
+        default="",
+        help="Write JSON results to this path (optional).",
+    )
+    return parser.parse_args(argv)
+
+
+def build_histories(*, count: int, days: int, seed: int) -> list[pd.DataFrame]:
+    rng = np.random.default_rng(seed)
+    ds = pd.date_range("2026-01-01", periods=max(14, days), freq="D")
+    weekly = 1.0 + 0.15 * np.sin(np.arange(len(ds)) * 2 * math.pi / 7)
+    return [
+        pd.DataFrame(
+            {"ds": ds, "y": 100.0 * weekly + rng.normal(0.0, 3.0, len(ds)) + idx}
+        )
+        for idx in range(max(1, count))
+    ]
+
+
+def _percentile(samples: list[float], pct: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, math.ceil(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+async def _measure(
+    forecasts: list[Callable[[], Awaitable[Any]]], *, probe_interval_s: float
+) -> dict[str, float]:
+    lateness_ms: list[float] = []
+    done = asyncio.Event()
+
+    async def _probe() -> None:
+        while not done.is_set():
+            expected = time.perf_counter() + probe_interval_s
+            await asyncio.sleep(probe_interval_s)
+            lateness_ms.append(max(0.0, time.perf_counter() - expected) * 1000)
+
+    probe = asyncio.create_task(_probe())
+    await asyncio.sleep(probe_interval_s)
+    start = time.perf_counter()
+    await asyncio.gather(*(forecast() for forecast in forecasts))
+    wall = time.perf_counter() - start
+    done.set()
+    await probe
+
+    return {
+        "wall_seconds": round(wall, 4),
+        "probe_samples": len(lateness_ms),
+        "probe_p50_ms": round(_percentile(lateness_ms, 50), 3),
+        "probe_p99_ms": round(_percentile(lateness_ms, 99), 3),
+        "probe_max_ms": round(max(lateness_ms, default=0.0), 3),
+    }
+
+
+async def run_benchmark_async(
+    *,
+    forecasts: int,
+    history_days: int,
+    horizon: int,
+    probe_interval_ms: float,
+    seed: int,
+    workers: int = 2,
+    model_cls: Any = SyntheticProphet,
+) -> dict[str, object]:
+    histories = build_histories(count=forecasts, days=history_days, seed=seed)
+    probe_interval_s = max(0.0005, probe_interval_ms / 1000)
+
+    def _inline(df: pd.DataFrame) -> Callable[[], Awaitable[Any]]:
+        async def _run() -> Any:
+            return fit_prophet_forecast(model_cls, df, None, horizon, len(df))
+
+        return _run
+
+    def _offloaded(df: pd.DataFrame) -> Callable[[], Awaitable[Any]]:
+        async def _run() -> Any:
+            return await run_prophet_fit(model_cls, df, None, horizon, len(df))
+
+        return _run
+
+    prophet_fit_cache.clear()
+    shutdown_forecast_executor(wait=True)
+    get_forecast_executor(max_workers=max(1, workers))
+    try:
+        inline = await _measure(
+            [_inline(df) for df in histories], probe_interval_s=probe_interval_s
+        )
+        # Warm the pool so worker start-up is not billed to the measured window.
+        await run_prophet_fit(model_cls, histories[0], None, horizon + 1, 0)
+        offloaded = await _measure(
+            [_offloaded(df) for df in histories], probe_interval_s=probe_interval_s
+        )
+        cached = await _measure(
+            [_offloaded(df) for df in histories], probe_interval_s=probe_interval_s
+        )
+    finally:
+        shutdown_forecast_executor(wait=True)
+        prophet_fit_cache.clear()
+
+    return {
+        "forecasts": len(histories),
+        "history_days": len(histories[0]),
+        "horizon": horizon,
+        "workers": max(1, workers),
+        "model": getattr(model_cls, "__name__", str(model_cls)),
+        "inline": inline,
+        "offloaded": offloaded,
+        "cached": cached,
+        "p99_improvement_ms": round(
+            inline["probe_p99_ms"] - offloaded["probe_p99_ms"], 3
+        ),
+        "runner": "scripts/benchmark_forecast_event_loop.py",
+    }
+
+
+def run_benchmark(**kwargs: Any) -> dict[str, object]:
+    return asyncio.run(run_benchmark_async(**kwargs))
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _parse_args(argv)
+    model_cls: Any = SyntheticProphet
+    if args.model == "prophet":
+        from prophet import Prophet
+
+        model_cls = Prophet
+    payload = run_benchmark(
+        forecasts=args.forecasts,
+        history_days=args.history_days,
+        horizon=args.horizon,
+        probe_interval_ms=args.probe_interval_ms,
+        seed=args.seed,
+        workers=args.workers,
+        model_cls=model_cls,
+    )
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(payload, f, indent=2, sort_keys=True)
+    print(json.dumps(payload, indent=2, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Batched Holt-Winters forecasting benchmark (in-process, synthetic).
+
+Goal:
+- Compare the per-series Python smoothing loop used by the single-series
+  fallback with `batch_holt_winters_forecast` over a `(series x days)` matrix,
+  both with fixed parameters (parity check) and with per-series grid fitting.
+
+Example:
+  uv run python scripts/benchmark_holt_winters_batch.py --series 10000 --days 365 \\
+    --out reports/performance/holt_winters_batch.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+
+import numpy as np
+
+from app.shared.analysis.holt_winters_batch import (
+    DEFAULT_ALPHA,
+    DEFAULT_BETA,
+    batch_holt_winters_forecast,
+)
+
+
+def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Benchmark per-series vs batched Holt-Winters forecasting."
+    )
+    parser.add_argument(
+        "--series", dest="series", type=int, default=10_000, help="Series count"
+    )
+    parser.add_argument(
+        "--days", dest="days", type=int, default=365, help="History days per series"
+    )
+    parser.add_argument(
+        "--horizon", dest="horizon", type=int, default=30, help="Forecast days"
+    )
+    parser.add_argument(
+        "--loop-sample",
+        dest="loop_sample",
+        type=int,
+        default=500,
+        help="Series timed through the per-series loop (extrapolated to --series)",
+    )
+    parser.add_argument("--seed", dest="seed", type=int, default=7, help="RNG seed")
+    parser.add_argument(
+        "--out",
+        dest="out",
+        default="",
+        help="Write JSON results to this path (optional).",
+    )
+    return parser.parse_args(argv)
+
+
+def build_matrix(*, series: int, days: int, seed: int) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    base = rng.uniform(10.0, 5000.0, size=(max(1, series), 1))
+    drift = rng.normal(0.0, 0.002, size=(max(1, series), 1))
+    steps = np.arange(max(2, days), dtype=np.float64)
+    weekly = 1.0 + 0.1 * np.sin(steps * 2 * np.pi / 7)
+    noise = rng.normal(1.0, 0.05, size=(max(1, series), max(2, days)))
+    return base * (1.0 + drift * steps) * weekly * noise
+
+
+def per_series_forecast(values: np.ndarray, horizon: int) -> list[float]:
+    """The single-series loop the batch engine replaces (alpha=0.3, beta=0.1)."""
+    alpha, beta = DEFAULT_ALPHA, DEFAULT_BETA
+    level = float(values[0])
+    trend = float(values[1] - values[0]) if len(values) > 1 else 0.0
+    for i in range(1, len(values)):
+        last_level = level
+        level = alpha * float(values[i]) + (1 - alpha) * (level + trend)
+        trend = beta * (level - last_level) + (1 - beta) * trend
+    return [max(0.0, level + (i * trend)) for i in range(1, horizon + 1)]
+
+
+def run_benchmark(
+    *, series: int, days: int, horizon: int, loop_sample: int, seed: int
+) -> dict[str, object]:
+    matrix = build_matrix(series=series, days=days, seed=seed)
+    sample = max(1, min(loop_sample, matrix.shape[0]))
+
+    start = time.perf_counter()
+    loop_rows = [per_series_forecast(row, horizon) for row in matrix[:sample]]
+    loop_seconds = time.perf_counter() - start
+    loop_estimate = loop_seconds / sample * matrix.shape[0]
+
+    start = time.perf_counter()
+    fixed = batch_holt_winters_forecast(matrix, horizon)
+    fixed_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    fitted = batch_holt_winters_forecast(matrix, horizon, fit_parameters=True)
+    fitted_seconds = time.perf_counter() - start
+
+    parity = float(np.max(np.abs(fixed.forecast[:sample] - np.asarray(loop_rows))))
+    return {
+        "series": int(matrix.shape[0]),
+        "days": int(matrix.shape[1]),
+        "horizon": horizon,
+        "loop_sample": sample,
+        "loop_seconds_estimated": round(loop_estimate, 4),
+        "batch_fixed_seconds": round(fixed_seconds, 4),
+        "batch_fitted_seconds": round(fitted_seconds, 4),
+        "speedup_fixed": (
+            round(loop_estimate / fixed_seconds, 2) if fixed_seconds else None
+        ),
+        "max_abs_diff_vs_loop": parity,
+        "fitted_alpha_mean": round(float(fitted.alpha.mean()), 4),
+        "fitted_beta_mean": round(float(fitted.beta.mean()), 4),
+        "runner": "scripts/benchmark_holt_winters_batch.py",
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _parse_args(argv)
+    payload = run_benchmark(
+        series=args.series,
+        days=args.days,
+        horizon=args.horizon,
+        loop_sample=args.loop_sample,
+        seed=args.seed,
+    )
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(payload, f, indent=2, sort_keys=True)
+    print(json.dumps(payload, indent=2, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
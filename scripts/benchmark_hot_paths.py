@@ -0,0 +1,318 @@
+#!/usr/bin/env python3
+"""
+Offline hot path regression benchmark suite (synthetic, no HTTP).
+
+Goal:
+- Time the hot paths behind ingestion, reporting and enforcement on fixed,
+  seeded synthetic datasets: CUR Parquet parsing, `bulk_upsert`, attribution
+  rule application, anomaly detection, batched forecasting, gate evaluation
+  and the query cache codec.
+- Store per-repeat samples as a baseline and fail when a benchmark's median
+  slows down beyond its noise budget *and* the slowdown is statistically
+  significant (`compare_benchmark_samples`).
+
+Defaults to a scratch SQLite file; pass `--database-url` to run against a
+disposable PostgreSQL database (tables are created with `create_all`). A
+baseline only compares against runs on the same backend, scale and seed;
+capture it on the host that runs the comparison (timings are not portable).
+
+Example:
+  uv run python scripts/benchmark_hot_paths.py --update-baseline
+  uv run python scripts/benchmark_hot_paths.py \\
+    --baseline reports/performance/hot_paths_baseline.json \\
+    --out reports/performance/hot_paths.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import statistics
+import tempfile
+import time
+from datetime import datetime, timezone
+from typing import Any
+from uuid import uuid4
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+import app.models  # noqa: F401  (registers every ORM table for create_all)
+from app.models.cloud import CloudAccount
+from app.models.tenant import Tenant
+from app.shared.core.performance_regression import (
+    DEFAULT_REGRESSION_ALPHA,
+    BenchmarkComparison,
+    compare_benchmark_samples,
+)
+from app.shared.db.base import Base
+from scripts.benchmark_hot_paths_cases import HOT_PATH_CASES, CaseContext
+
+DEFAULT_BASELINE_PATH = "reports/performance/hot_paths_baseline.json"
+BASELINE_SCHEMA_VERSION = 1
+
+# `create_all` builds cost_records as a bare partitioned parent on PostgreSQL.
+_PG_DEFAULT_COST_PARTITION = text(
+    """
+    DO $$
+    BEGIN
+      IF EXISTS (
+        SELECT 1 FROM pg_partitioned_table
+        WHERE partrelid = 'cost_records'::regclass
+      ) THEN
+        CREATE TABLE IF NOT EXISTS cost_records_hot_path_default
+          PARTITION OF cost_records DEFAULT;
+      END IF;
+    END $$;
+    """
+)
+
+
+def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Run the offline hot path benchmarks and gate on regressions."
+    )
+    parser.add_argument(
+        "--database-url",
+        dest="database_url",
+        default="",
+        help="Async database URL (default: scratch SQLite file)",
+    )
+    parser.add_argument(
+        "--repeats", dest="repeats", type=int, default=15, help="Timed repeats"
+    )
+    parser.add_argument(
+        "--warmup", dest="warmup", type=int, default=2, help="Untimed repeats"
+    )
+    parser.add_argument(
+        "--scale",
+        dest="scale",
+        type=float,
+        default=1.0,
+        help="Dataset size multiplier",
+    )
+    parser.add_argument("--seed", dest="seed", type=int, default=7, help="RNG seed")
+    parser.add_argument(
+        "--only",
+        dest="only",
+        nargs="+",
+        choices=[case.name for case in HOT_PATH_CASES],
+        default=None,
+        help="Run only these benchmarks",
+    )
+    parser.add_argument(
+        "--baseline",
+        dest="baseline",
+        default=DEFAULT_BASELINE_PATH,
+        help="Baseline JSON to compare against (or write with --update-baseline)",
+    )
+    parser.add_argument(
+        "--update-baseline",
+        dest="update_baseline",
+        action="store_true",
+        help="Store this run as the baseline instead of comparing",
+    )
+    parser.add_argument(
+        "--alpha",
+        dest="alpha",
+        type=float,
+        default=DEFAULT_REGRESSION_ALPHA,
+        help="Significance level of the regression test",
+    )
+    parser.add_argument(
+        "--noise-scale",
+        dest="noise_scale",
+        type=float,
+        default=1.0,
+        help="Multiply every per-benchmark noise budget (noisy CI hosts)",
+    )
+    parser.add_argument(
+        "--out",
+        dest="out",
+        default="",
+        help="Write JSON results to this path (optional).",
+    )
+    return parser.parse_args(argv)
+
+
+def backend_name(database_url: str) -> str:
+    return database_url.split("+", 1)[0].split(":", 1)[0]
+
+
+def summarize_samples(samples: list[float]) -> dict[str, Any]:
+    ordered = sorted(samples)
+    stdev = statistics.stdev(ordered) if len(ordered) > 1 else 0.0
+    return {
+        "repeats": len(ordered),
+        "median_seconds": round(statistics.median(ordered), 6),
+        "min_seconds": round(ordered[0], 6),
+        "max_seconds": round(ordered[-1], 6),
+        "stdev_seconds": round(stdev, 6),
+    }
+
+
+async def _seed_owner(
+    session_maker: async_sessionmaker[AsyncSession],
+) -> tuple[Any, Any]:
+    async with session_maker() as session:
+        tenant = Tenant(id=uuid4(), name="Hot path benchmark", plan="pro")
+        session.add(tenant)
+        await session.flush()
+        account = CloudAccount(
+            id=uuid4(), tenant_id=tenant.id, provider="aws", name="Hot path benchmark"
+        )
+        session.add(account)
+        await session.commit()
+        return tenant.id, account.id
+
+
+async def run_suite(
+    *,
+    database_url: str,
+    repeats: int,
+    warmup: int,
+    scale: float,
+    seed: int,
+    only: list[str] | None = None,
+) -> dict[str, Any]:
+    cases = [case for case in HOT_PATH_CASES if not only or case.name in only]
+    scratch_dir = tempfile.TemporaryDirectory()
+    if not database_url:
+        path = os.path.join(scratch_dir.name, "hot_paths.sqlite")
+        database_url = f"sqlite+aiosqlite:///{path}"
+    engine = create_async_engine(database_url)
+    benchmarks: dict[str, Any] = {}
+    try:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+            if engine.dialect.name == "postgresql":
+                await conn.execute(_PG_DEFAULT_COST_PARTITION)
+        session_maker = async_sessionmaker(
+            engine, class_=AsyncSession, expire_on_commit=False
+        )
+        tenant_id, account_id = await _seed_owner(session_maker)
+        ctx = CaseContext(
+            session_maker=session_maker,
+            scratch_dir=scratch_dir.name,
+            tenant_id=tenant_id,
+            account_id=account_id,
+            scale=scale,
+            seed=seed,
+        )
+        for case in cases:
+            run = await case.prepare(ctx)
+            for _ in range(max(0, warmup)):
+                await run()
+            samples: list[float] = []
+            for _ in range(max(1, repeats)):
+                started = time.perf_counter()
+                await run()
+                samples.append(time.perf_counter() - started)
+            benchmarks[case.name] = {
+                "noise_budget": case.noise_budget,
+                "samples_seconds": [round(sample, 6) for sample in samples],
+                **summarize_samples(samples),
+            }
+    finally:
+        await engine.dispose()
+        scratch_dir.cleanup()
+    return {
+        "schema_version": BASELINE_SCHEMA_VERSION,
+        "backend": backend_name(database_url),
+        "scale": scale,
+        "seed": seed,
+        "python": platform.python_version(),
+        "captured_at": datetime.now(timezone.utc).isoformat(),
+        "benchmarks": benchmarks,
+        "runner": "scripts/benchmark_hot_paths.py",
+    }
+
+
+def load_baseline(path: str) -> dict[str, Any] | None:
+    if not path or not os.path.exists(path):
+        return None
+    with open(path, "r", encoding="utf-8") as f:
+        payload = json.load(f)
+    if payload.get("schema_version") != BASELINE_SCHEMA_VERSION:
+        raise ValueError(f"unsupported baseline schema in {path}")
+    return payload
+
+
+def baseline_mismatch(run: dict[str, Any], baseline: dict[str, Any]) -> str | None:
+    for field in ("backend", "scale", "seed"):
+        if run.get(field) != baseline.get(field):
+            return (
+                f"baseline {field}={baseline.get(field)!r} does not match "
+                f"this run ({run.get(field)!r})"
+            )
+    return None
+
+
+def compare_with_baseline(
+    run: dict[str, Any],
+    baseline: dict[str, Any] | None,
+    *,
+    alpha: float = DEFAULT_REGRESSION_ALPHA,
+    noise_scale: float = 1.0,
+) -> list[BenchmarkComparison]:
+    stored = (baseline or {}).get("benchmarks", {})
+    return [
+        compare_benchmark_samples(
+            name,
+            current_samples=result["samples_seconds"],
+            baseline_samples=stored.get(name, {}).get("samples_seconds"),
+            noise_budget=float(result["noise_budget"]) * noise_scale,
+            alpha=alpha,
+        )
+        for name, result in run["benchmarks"].items()
+    ]
+
+
+def _write_json(path: str, payload: dict[str, Any]) -> None:
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(payload, f, indent=2, sort_keys=True)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _parse_args(argv)
+    run = asyncio.run(
+        run_suite(
+            database_url=args.database_url,
+            repeats=args.repeats,
+            warmup=args.warmup,
+            scale=args.scale,
+            seed=args.seed,
+            only=args.only,
+        )
+    )
+    exit_code = 0
+    if args.update_baseline:
+        _write_json(args.baseline, run)
+        run["baseline_written"] = args.baseline
+    else:
+        baseline = load_baseline(args.baseline)
+        mismatch = baseline_mismatch(run, baseline) if baseline else None
+        if mismatch:
+            print(f"[hot-paths] {mismatch}; refresh it with --update-baseline")
+            return 2
+        comparisons = compare_with_baseline(
+            run, baseline, alpha=args.alpha, noise_scale=args.noise_scale
+        )
+        run["comparisons"] = [item.model_dump() for item in comparisons]
+        regressed = [item.name for item in comparisons if item.regressed]
+        run["regressions"] = regressed
+        exit_code = 1 if regressed else 0
+    if args.out:
+        _write_json(args.out, run)
+    print(json.dumps(run, indent=2, sort_keys=True))
+    return exit_code
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
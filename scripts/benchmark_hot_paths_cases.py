@@ -0,0 +1,380 @@
+"""
+Hot path cases and fixed synthetic datasets for `benchmark_hot_paths.py`.
+
+Every dataset is generated from a seeded RNG, so two runs with the same
+`--seed` and `--scale` time exactly the same work. Each case prepares its
+dataset once and returns an async callable that performs one timed repeat.
+"""
+
+from __future__ import annotations
+
+import os
+import random
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+from typing import Any
+from uuid import UUID
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.models.attribution import AttributionRule
+from app.models.cloud import CostRecord
+from app.models.enforcement import EnforcementMode, EnforcementSource
+from app.modules.enforcement.domain.service import (
+    EnforcementService,
+    GateInput,
+    _stable_fingerprint,
+)
+from app.modules.reporting.domain.anomaly_detection_range_ops import (
+    detect_daily_cost_anomalies_range,
+)
+from app.modules.reporting.domain.anomaly_detection_rules import DailyServiceCostRow
+from app.modules.reporting.domain.attribution_engine import AttributionEngine
+from app.modules.reporting.domain.persistence_upsert_ops import bulk_upsert
+from app.shared.adapters.aws_cur import AWSCURAdapter
+from app.shared.analysis.forecaster import SymbolicForecaster
+from app.shared.core.cache import QueryCache
+from app.shared.core.credentials import AWSCredentials
+
+SERVICES: tuple[str, ...] = (
+    "AmazonEC2",
+    "AmazonRDS",
+    "AmazonS3",
+    "AWSLambda",
+    "AmazonEKS",
+    "AmazonDynamoDB",
+    "AmazonCloudFront",
+    "AmazonRedshift",
+)
+REGIONS: tuple[str, ...] = ("us-east-1", "us-west-2", "eu-west-1", "ap-south-1")
+TEAMS: tuple[str, ...] = ("platform", "data", "payments", "search", "growth")
+BASE_DAY = date(2026, 1, 1)
+
+CaseRunner = Callable[[], Awaitable[Any]]
+
+
+def _decimal(rng: random.Random, low: float, high: float, places: int = 6) -> Decimal:
+    return Decimal(str(round(rng.uniform(low, high), places)))
+
+
+def _seeded_uuid(rng: random.Random) -> UUID:
+    return UUID(int=rng.getrandbits(128), version=4)
+
+
+@dataclass(frozen=True)
+class CaseContext:
+    session_maker: async_sessionmaker[AsyncSession]
+    scratch_dir: str
+    tenant_id: UUID
+    account_id: UUID
+    scale: float
+    seed: int
+
+    def size(self, base: int) -> int:
+        return max(1, int(base * self.scale))
+
+    def rng(self, case_name: str) -> random.Random:
+        return random.Random(f"{self.seed}:{case_name}")
+
+
+@dataclass(frozen=True)
+class HotPathCase:
+    name: str
+    # Relative median slowdown tolerated before significance is tested.
+    noise_budget: float
+    prepare: Callable[[CaseContext], Awaitable[CaseRunner]]
+
+
+async def prepare_cur_parquet_parse(ctx: CaseContext) -> CaseRunner:
+    rng = ctx.rng("cur_parquet_parse")
+    rows = ctx.size(5000)
+    start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    table = pa.table(
+        {
+            "lineItem/UsageStartDate": [
+                start + timedelta(hours=rng.randrange(24 * 30)) for _ in range(rows)
+            ],
+            "lineItem/UnblendedCost": [
+                round(rng.uniform(0.01, 250.0), 6) for _ in range(rows)
+            ],
+            "lineItem/CurrencyCode": ["USD"] * rows,
+            "lineItem/ProductCode": [rng.choice(SERVICES) for _ in range(rows)],
+            "product/region": [rng.choice(REGIONS) for _ in range(rows)],
+            "lineItem/UsageType": [
+                f"BoxUsage:m5.{rng.choice(('large', 'xlarge'))}" for _ in range(rows)
+            ],
+            "resourceTags/user:team": [rng.choice(TEAMS) for _ in range(rows)],
+        }
+    )
+    path = os.path.join(ctx.scratch_dir, "cur_sample.parquet")
+    pq.write_table(table, path, row_group_size=max(1, rows // 4))
+    adapter = AWSCURAdapter(
+        AWSCredentials(
+            account_id="123456789012",
+            role_arn="arn:aws:iam::123456789012:role/ValdricsBenchmark",
+            external_id="benchmark",
+            region="us-east-1",
+        )
+    )
+
+    async def _run() -> Any:
+        return adapter._process_parquet_streamingly(path)
+
+    return _run
+
+
+async def prepare_bulk_upsert(ctx: CaseContext) -> CaseRunner:
+    rng = ctx.rng("bulk_upsert")
+    values = [
+        {
+            "tenant_id": ctx.tenant_id,
+            "account_id": ctx.account_id,
+            "service": rng.choice(SERVICES),
+            "region": rng.choice(REGIONS),
+            "resource_id": f"i-{index:08x}",
+            "usage_amount": _decimal(rng, 1, 100, 4),
+            "usage_unit": "Hrs",
+            "cost_usd": _decimal(rng, 0.01, 250.0),
+            "amount_raw": None,
+            "currency": "USD",
+            "recorded_at": BASE_DAY + timedelta(days=index % 28),
+            "timestamp": datetime(2026, 1, 1, tzinfo=timezone.utc)
+            + timedelta(days=index % 28),
+            "usage_type": "BoxUsage",
+            "canonical_charge_category": "compute",
+            "canonical_charge_subcategory": None,
+            "canonical_mapping_version": "focus-1.3",
+            "is_preliminary": True,
+            "cost_status": "PRELIMINARY",
+            "reconciliation_run_id": None,
+            "ingestion_metadata": {"source_adapter": "benchmark"},
+            "tags": {"team": rng.choice(TEAMS)},
+        }
+        for index in range(ctx.size(500))
+    ]
+
+    async def _run() -> None:
+        # Rolled back so every repeat writes into an identical table.
+        async with ctx.session_maker() as session:
+            await bulk_upsert(session, [dict(value) for value in values])
+            await session.flush()
+            await session.rollback()
+
+    return _run
+
+
+async def prepare_attribution_rules(ctx: CaseContext) -> CaseRunner:
+    rng = ctx.rng("attribution_rules")
+    rules: list[AttributionRule] = []
+    for priority in range(40):
+        conditions: dict[str, Any] = {"service": rng.choice(SERVICES)}
+        if priority % 2:
+            conditions["region"] = rng.choice(REGIONS)
+        if priority % 3 == 0:
+            conditions["tags"] = {"team": rng.choice(TEAMS)}
+        rule_type = ("DIRECT", "PERCENTAGE", "FIXED")[priority % 3]
+        allocation: Any = [{"bucket": f"bucket-{priority}", "amount": 10}]
+        if rule_type == "PERCENTAGE":
+            allocation = [
+                {"bucket": "shared", "percentage": 60},
+                {"bucket": "owner", "percentage": 40},
+            ]
+        rules.append(
+            AttributionRule(
+                id=_seeded_uuid(rng),
+                tenant_id=ctx.tenant_id,
+                name=f"rule-{priority}",
+                priority=priority,
+                rule_type=rule_type,
+                conditions=conditions,
+                allocation=allocation,
+                is_active=True,
+            )
+        )
+    records = [
+        CostRecord(
+            id=_seeded_uuid(rng),
+            tenant_id=ctx.tenant_id,
+            account_id=ctx.account_id,
+            service=rng.choice(SERVICES),
+            region=rng.choice(REGIONS),
+            cost_usd=_decimal(rng, 0.01, 250.0),
+            recorded_at=BASE_DAY,
+            tags={"team": rng.choice(TEAMS)},
+        )
+        for _ in range(ctx.size(5000))
+    ]
+
+    async def _run() -> int:
+        async with ctx.session_maker() as session:
+            engine = AttributionEngine(session)
+            allocated = 0
+            for record in records:
+                allocated += len(await engine.apply_rules(record, rules))
+            return allocated
+
+    return _run
+
+
+async def prepare_anomaly_detection(ctx: CaseContext) -> CaseRunner:
+    rng = ctx.rng("anomaly_detection")
+    lookback_days, detect_days = 28, 7
+    end_date = BASE_DAY + timedelta(days=lookback_days + detect_days - 1)
+    start_date = end_date - timedelta(days=detect_days - 1)
+    series_per_service = max(1, ctx.size(2000) // len(SERVICES))
+    accounts = [_seeded_uuid(rng) for _ in range(series_per_service)]
+    rows: list[DailyServiceCostRow] = []
+    for account_id in accounts:
+        for service in SERVICES:
+            baseline = rng.uniform(20.0, 2000.0)
+            for offset in range(lookback_days + detect_days):
+                day = BASE_DAY + timedelta(days=offset)
+                spike = 3.0 if rng.random() < 0.02 else 1.0
+                cost = baseline * spike * rng.uniform(0.85, 1.15)
+                rows.append(
+                    DailyServiceCostRow(
+                        day=day,
+                        provider="aws",
+                        account_id=account_id,
+                        account_name=None,
+                        service=service,
+                        cost_usd=Decimal(str(round(cost, 4))),
+                    )
+                )
+
+    async def _run() -> Any:
+        return detect_daily_cost_anomalies_range(
+            rows,
+            start_date=start_date,
+            end_date=end_date,
+            lookback_days=lookback_days,
+        )
+
+    return _run
+
+
+@dataclass(frozen=True)
+class _DailyPoint:
+    date: date
+    amount: Decimal
+
+
+async def prepare_forecasting(ctx: CaseContext) -> CaseRunner:
+    rng = ctx.rng("forecasting")
+    histories: dict[str, list[_DailyPoint]] = {}
+    for index in range(ctx.size(1000)):
+        level = rng.uniform(10.0, 5000.0)
+        histories[f"series-{index}"] = [
+            _DailyPoint(
+                BASE_DAY + timedelta(days=offset),
+                Decimal(str(round(level * rng.uniform(0.9, 1.1), 4))),
+            )
+            for offset in range(120)
+        ]
+
+    async def _run() -> Any:
+        return SymbolicForecaster.forecast_batch(histories, days=30)
+
+    return _run
+
+
+async def prepare_gate_evaluation(ctx: CaseContext) -> CaseRunner:
+    rng = ctx.rng("gate_evaluation")
+    modes = (EnforcementMode.SHADOW, EnforcementMode.SOFT, EnforcementMode.HARD)
+    gates = [
+        (
+            GateInput(
+                project_id=f"project-{index % 50}",
+                environment=rng.choice(("prod", "staging", "dev")),
+                action="terraform.apply",
+                resource_reference=f"module.service_{index}",
+                estimated_monthly_delta_usd=_decimal(rng, 1, 5000, 4),
+                estimated_hourly_delta_usd=_decimal(rng, 0, 7),
+                metadata={"change_id": index, "team": rng.choice(TEAMS)},
+            ),
+            rng.choice(modes),
+            _decimal(rng, 0, 4000, 4),
+            _decimal(rng, 0, 1000, 4),
+        )
+        for index in range(ctx.size(2000))
+    ]
+
+    async def _run() -> int:
+        async with ctx.session_maker() as session:
+            service = EnforcementService(session)
+            allowed = 0
+            for gate_input, mode, allocation, credits in gates:
+                _stable_fingerprint(EnforcementSource.TERRAFORM, gate_input)
+                result = service._evaluate_entitlement_waterfall(
+                    mode=mode,
+                    monthly_delta=gate_input.estimated_monthly_delta_usd,
+                    plan_headroom=Decimal("10000"),
+                    allocation_headroom=allocation,
+                    reserved_credit_headroom=credits,
+                    emergency_credit_headroom=Decimal("250"),
+                    enterprise_headroom=None,
+                )
+                allowed += result.reason_code is None
+            return allowed
+
+    return _run
+
+
+class _MemoryRedis:
+    """In-process stand-in for the Redis client, keeping only the codec path."""
+
+    def __init__(self) -> None:
+        self._values: dict[str, str] = {}
+
+    async def get(self, key: str) -> str | None:
+        return self._values.get(key)
+
+    async def set(self, key: str, value: str, ex: int | None = None) -> None:
+        self._values[key] = value
+
+
+async def prepare_cache_codecs(ctx: CaseContext) -> CaseRunner:
+    rng = ctx.rng("cache_codecs")
+    payload = {
+        "tenant_id": ctx.tenant_id,
+        "generated_at": datetime(2026, 2, 1, tzinfo=timezone.utc),
+        "breakdown": [
+            {
+                "service": rng.choice(SERVICES),
+                "region": rng.choice(REGIONS),
+                "day": BASE_DAY + timedelta(days=index % 28),
+                "cost_usd": _decimal(rng, 0.01, 250.0),
+                "tags": {"team": rng.choice(TEAMS)},
+            }
+            for index in range(500)
+        ],
+    }
+    cache = QueryCache(redis_client=_MemoryRedis())
+    keys = [
+        cache._make_cache_key("cost_breakdown", {"page": page}, str(ctx.tenant_id))
+        for page in range(ctx.size(100))
+    ]
+
+    async def _run() -> int:
+        decoded = 0
+        for key in keys:
+            await cache.set_cached_result(key, payload)
+            decoded += len((await cache.get_cached_result(key))["breakdown"])
+        return decoded
+
+    return _run
+
+
+HOT_PATH_CASES: tuple[HotPathCase, ...] = (
+    HotPathCase("cur_parquet_parse", 0.10, prepare_cur_parquet_parse),
+    HotPathCase("bulk_upsert", 0.20, prepare_bulk_upsert),
+    HotPathCase("attribution_rules", 0.10, prepare_attribution_rules),
+    HotPathCase("anomaly_detection", 0.10, prepare_anomaly_detection),
+    HotPathCase("forecasting", 0.10, prepare_forecasting),
+    HotPathCase("gate_evaluation", 0.15, prepare_gate_evaluation),
+    HotPathCase("cache_codecs", 0.10, prepare_cache_codecs),
+)
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+HTTP middleware request-overhead benchmark (in-process, synthetic).
+
+Goal:
+- Measure per-request overhead of the core middleware stack against an empty
+  handler, comparing the pure-ASGI middlewares with an equivalent stack of
+  `BaseHTTPMiddleware` layers (the previous implementation style).
+
+Notes:
+- Requests are driven straight through the ASGI callable (no sockets, no HTTP
+  client), so the numbers isolate middleware cost.
+- The legacy stack uses pass-through `BaseHTTPMiddleware` layers; it is a lower
+  bound for the old per-request cost because it skips the header work.
+
+Example:
+  uv run python scripts/benchmark_middleware_overhead.py --requests 20000 \\
+    --out reports/performance/middleware_overhead.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import time
+from collections.abc import Awaitable, Callable
+
+from starlette.applications import Starlette
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse, Response
+from starlette.routing import Route
+from starlette.types import ASGIApp, Message
+
+from app.shared.core.middleware import (
+    RequestIDMiddleware,
+    SecurityHeadersMiddleware,
+    TrustedProxyHeadersMiddleware,
+)
+from app.shared.core.timeout import TimeoutMiddleware
+
+LEGACY_LAYER_COUNT = 4
+
+
+class _PassThroughHTTPMiddleware(BaseHTTPMiddleware):
+    async def dispatch(
+        self, request: Request, call_next: Callable[[Request], Awaitable[Response]]
+    ) -> Response:
+        return await call_next(request)
+
+
+def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Benchmark middleware request overhead with an empty handler."
+    )
+    parser.add_argument(
+        "--requests",
+        dest="requests",
+        type=int,
+        default=10_000,
+        help="Requests per stack",
+    )
+    parser.add_argument(
+        "--warmup", dest="warmup", type=int, default=500, help="Warmup requests"
+    )
+    parser.add_argument(
+        "--min-speedup",
+        dest="min_speedup",
+        type=float,
+        default=None,
+        help="Fail if ASGI req/s < legacy req/s * this",
+    )
+    parser.add_argument(
+        "--out",
+        dest="out",
+        default="",
+        help="Write JSON results to this path (optional).",
+    )
+    return parser.parse_args(argv)
+
+
+async def _empty_handler(_request: Request) -> Response:
+    return PlainTextResponse("")
+
+
+def build_app(stack: str) -> ASGIApp:
+    app = Starlette(routes=[Route("/bench", _empty_handler)])
+    if stack == "asgi":
+        app.add_middleware(TimeoutMiddleware, timeout_seconds=300)
+        app.add_middleware(SecurityHeadersMiddleware)
+        app.add_middleware(RequestIDMiddleware)
+        app.add_middleware(TrustedProxyHeadersMiddleware)
+    elif stack == "legacy":
+        for _ in range(LEGACY_LAYER_COUNT):
+            app.add_middleware(_PassThroughHTTPMiddleware)
+    return app
+
+
+async def _drive(app: ASGIApp, count: int) -> float:
+    scope_template = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "scheme": "http",
+        "method": "GET",
+        "path": "/bench",
+        "raw_path": b"/bench",
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"bench")],
+        "client": ("127.0.0.1", 50000),
+        "server": ("bench", 80),
+    }
+
+    async def receive() -> Message:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(_message: Message) -> None:
+        return None
+
+    start = time.perf_counter()
+    for _ in range(count):
+        await app(dict(scope_template), receive, send)
+    return time.perf_counter() - start
+
+
+async def run_benchmark(*, requests: int, warmup: int) -> dict[str, object]:
+    results: dict[str, dict[str, float]] = {}
+    for stack in ("bare", "legacy", "asgi"):
+        app = build_app(stack)
+        await _drive(app, warmup)
+        duration = await _drive(app, requests)
+        results[stack] = {
+            "duration_seconds": round(duration, 4),
+            "requests_per_second": round(requests / duration, 2) if duration else 0.0,
+            "microseconds_per_request": round(duration / requests * 1e6, 2),
+        }
+
+    bare_us = results["bare"]["microseconds_per_request"]
+    legacy_rps = results["legacy"]["requests_per_second"]
+    asgi_rps = results["asgi"]["requests_per_second"]
+    return {
+        "requests": requests,
+        "stacks": results,
+        "overhead_microseconds": {
+            "legacy": round(results["legacy"]["microseconds_per_request"] - bare_us, 2),
+            "asgi": round(results["asgi"]["microseconds_per_request"] - bare_us, 2),
+        },
+        "asgi_speedup_vs_legacy": round(asgi_rps / legacy_rps, 3)
+        if legacy_rps
+        else None,
+        "runner": "scripts/benchmark_middleware_overhead.py",
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _parse_args(argv)
+    payload = asyncio.run(
+        run_benchmark(requests=max(1, args.requests), warmup=max(0, args.warmup))
+    )
+    meets_targets: bool | None = None
+    if args.min_speedup is not None:
+        speedup = payload["asgi_speedup_vs_legacy"]
+        meets_targets = isinstance(speedup, float) and speedup >= args.min_speedup
+        payload["thresholds"] = {"min_speedup": float(args.min_speedup)}
+        payload["meets_targets"] = meets_targets
+
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(payload, f, indent=2, sort_keys=True)
+    print(json.dumps(payload, indent=2, sort_keys=True))
+    return 1 if meets_targets is False else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
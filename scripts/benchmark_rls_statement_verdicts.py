@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+RLS statement-classification microbenchmark (in-process, synthetic).
+
+Goal:
+- Compare the uncached `classify_rls_statement` path with the bounded
+  `RLSStatementVerdictCache` used by the `before_cursor_execute` RLS hook, at
+  realistic SQLAlchemy statement sizes and a configurable statement-shape mix.
+
+Example:
+  uv run python scripts/benchmark_rls_statement_verdicts.py --executions 200000 \\
+    --shapes 300 --out reports/performance/rls_statement_verdicts.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import time
+
+from app.shared.db.session import _RLS_EXEMPT_TABLE_PATTERN
+from app.shared.db.session_rls_ops import (
+    RLSStatementVerdictCache,
+    classify_rls_statement,
+)
+
+
+def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Benchmark cached vs uncached RLS statement classification."
+    )
+    parser.add_argument(
+        "--executions",
+        dest="executions",
+        type=int,
+        default=100_000,
+        help="Statement executions to classify",
+    )
+    parser.add_argument(
+        "--shapes",
+        dest="shapes",
+        type=int,
+        default=250,
+        help="Distinct compiled statement shapes in the workload",
+    )
+    parser.add_argument(
+        "--columns",
+        dest="columns",
+        type=int,
+        default=30,
+        help="Selected columns per statement (drives statement length)",
+    )
+    parser.add_argument("--seed", dest="seed", type=int, default=7, help="RNG seed")
+    parser.add_argument(
+        "--out",
+        dest="out",
+        default="",
+        help="Write JSON results to this path (optional).",
+    )
+    return parser.parse_args(argv)
+
+
+def build_statements(*, shapes: int, columns: int) -> list[str]:
+    statements: list[str] = []
+    for idx in range(max(1, shapes)):
+        table = f"table_{idx % 40}"
+        cols = ", ".join(
+            f"{table}.column_{col} AS {table}_column_{col}" for col in range(columns)
+        )
+        if idx % 5 == 0:
+            statements.append(
+                f"UPDATE {table} SET column_1=$1::VARCHAR, updated_at=now() "
+                f"WHERE {table}.id = $2::UUID AND {table}.tenant_id = $3::UUID"
+            )
+        else:
+            statements.append(
+                f"SELECT {cols} \nFROM {table} \nWHERE {table}.tenant_id = $1::UUID "
+                f"AND {table}.recorded_at >= $2::DATE ORDER BY {table}.recorded_at DESC \n"
+                f" LIMIT $3::INTEGER"
+            )
+    return statements
+
+
+def run_benchmark(
+    *, executions: int, shapes: int, columns: int, seed: int
+) -> dict[str, object]:
+    statements = build_statements(shapes=shapes, columns=columns)
+    rng = random.Random(seed)
+    # Zipf-like skew: a handful of hot shapes dominate real request traffic.
+    weights = [1.0 / (rank + 1) for rank in range(len(statements))]
+    workload = rng.choices(statements, weights=weights, k=max(1, executions))
+
+    start = time.perf_counter()
+    for statement in workload:
+        classify_rls_statement(statement, _RLS_EXEMPT_TABLE_PATTERN)
+    uncached = time.perf_counter() - start
+
+    cache = RLSStatementVerdictCache(_RLS_EXEMPT_TABLE_PATTERN)
+    start = time.perf_counter()
+    for statement in workload:
+        cache.classify(statement)
+    cached = time.perf_counter() - start
+
+    return {
+        "executions": len(workload),
+        "shapes": len(statements),
+        "avg_statement_chars": round(
+            sum(len(s) for s in statements) / len(statements), 1
+        ),
+        "uncached_ns_per_statement": round(uncached / len(workload) * 1e9, 1),
+        "cached_ns_per_statement": round(cached / len(workload) * 1e9, 1),
+        "speedup": round(uncached / cached, 3) if cached else None,
+        "cache_hit_ratio": round(cache.hit_ratio, 4),
+        "cache_entries": len(cache),
+        "runner": "scripts/benchmark_rls_statement_verdicts.py",
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _parse_args(argv)
+    payload = run_benchmark(
+        executions=args.executions,
+        shapes=args.shapes,
+        columns=args.columns,
+        seed=args.seed,
+    )
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(payload, f, indent=2, sort_keys=True)
+    print(json.dumps(payload, indent=2, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
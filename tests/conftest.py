@@ -197,6 +197,49 @@ async def db_session(async_engine) -> AsyncGenerator["AsyncSession", None]:
             await session.close()
 
 
+@pytest_asyncio.fixture
+async def postgres_engine():
+    """
+    Async engine on a throwaway schema of the `TEST_POSTGRES_URL` database.
+
+    For `postgres`-marked tests that depend on real PostgreSQL locking and
+    isolation; skipped when the variable is not set.
+    """
+    from sqlalchemy import text
+    from sqlalchemy.ext.asyncio import create_async_engine
+    from app.shared.db.base import Base
+
+    url = os.environ.get("TEST_POSTGRES_URL", "").strip()
+    if not url:
+        pytest.skip("TEST_POSTGRES_URL is not set")
+
+    schema = f"test_{uuid4().hex[:12]}"
+    admin_engine = create_async_engine(url, echo=False)
+    async with admin_engine.begin() as conn:
+        await conn.execute(text(f'CREATE SCHEMA "{schema}"'))
+    engine = create_async_engine(
+        url, echo=False, connect_args={"server_settings": {"search_path": schema}}
+    )
+    try:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+            # Partitioned tables need somewhere to put rows.
+            for table in Base.metadata.sorted_tables:
+                if table.dialect_kwargs.get("postgresql_partition_by"):
+                    await conn.execute(
+                        text(
+                            f'CREATE TABLE "{table.name}_default" '
+                            f'PARTITION OF "{table.name}" DEFAULT'
+                        )
+                    )
+        yield engine
+    finally:
+        await engine.dispose()
+        async with admin_engine.begin() as conn:
+            await conn.execute(text(f'DROP SCHEMA "{schema}" CASCADE'))
+        await admin_engine.dispose()
+
+
 # ============================================================================
 # FastAPI Test Client Fixtures
 # ============================================================================
@@ -229,7 +272,9 @@ async def async_client(
     async_engine,
 ) -> AsyncGenerator["AsyncClient", None]:
     """Async test client for FastAPI. Overrides get_db to share test session."""
+    from contextlib import asynccontextmanager
     from httpx import AsyncClient, ASGITransport
+    from app.shared.db.read_replica import get_primary_session_opener
     from app.shared.db.session import get_db, get_system_db
 
     # Create test global session maker
@@ -270,6 +315,15 @@ async def async_client(
         app.dependency_overrides[get_db] = lambda: db
         app.dependency_overrides[get_system_db] = lambda: db
 
+        @asynccontextmanager
+        async def _shared_primary_session():
+            yield db
+
+        # Read routes open the primary lazily instead of depending on get_db.
+        app.dependency_overrides[get_primary_session_opener] = (
+            lambda: _shared_primary_session
+        )
+
         transport = ASGITransport(app=app)
         async with AsyncClient(transport=transport, base_url="http://test") as ac:
             setattr(ac, "app", app)  # SEC: Attach app for dependency overrides in tests
@@ -285,6 +339,7 @@ async def async_client(
             app.dependency_overrides[get_system_db] = old_system_override
         else:
             app.dependency_overrides.pop(get_system_db, None)
+        app.dependency_overrides.pop(get_primary_session_opener, None)
 
 
 @pytest_asyncio.fixture
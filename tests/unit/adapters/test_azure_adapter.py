@@ -91,19 +91,46 @@ async def test_azure_adapter_get_cost_and_usage_failure(azure_adapter):
             await azure_adapter.get_cost_and_usage(start, end)
 
 
+class _FakePagedQuery:
+    """Query API fake that serves one page per call and links to the next."""
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.calls = []
+
+    async def usage(self, *, scope, parameters, params=None):
+        self.calls.append(dict(params or {}))
+        idx = int((params or {}).get("$skiptoken", 0))
+        next_link = (
+            f"https://management.azure.com/{scope}/query?$skiptoken={idx + 1}"
+            if idx + 1 < len(self.pages)
+            else None
+        )
+        return MagicMock(rows=self.pages[idx], next_link=next_link)
+
+
 @pytest.mark.asyncio
-async def test_azure_adapter_stream_cost_and_usage(azure_adapter):
-    mock_records = [{"cost_usd": 5.0, "service": "S3"}]
-    with patch.object(azure_adapter, "get_cost_and_usage", return_value=mock_records):
+async def test_azure_adapter_stream_cost_and_usage_follows_next_link(azure_adapter):
+    pages = [
+        [[float(p * 10 + i), f"svc-{p}", "eastus", "Usage", "2026-01-01"] for i in range(3)]
+        for p in range(3)
+    ]
+    fake_client = MagicMock()
+    fake_client.query = _FakePagedQuery(pages)
+
+    with patch.object(azure_adapter, "_get_cost_client", return_value=fake_client):
         start = datetime(2026, 1, 1, tzinfo=timezone.utc)
         end = datetime(2026, 1, 2, tzinfo=timezone.utc)
-
-        results = []
-        async for r in azure_adapter.stream_cost_and_usage(start, end):
-            results.append(r)
-
-        assert len(results) == 1
-        assert results[0]["cost_usd"] == 5.0
+        stream = azure_adapter.stream_cost_and_usage(start, end)
+        first = await stream.__anext__()
+        # Only the first page has been requested when its first row is yielded.
+        assert fake_client.query.calls == [{}]
+        results = [first] + [r async for r in stream]
+
+    assert [r["cost_usd"] for r in results] == [
+        0.0, 1.0, 2.0, 10.0, 11.0, 12.0, 20.0, 21.0, 22.0
+    ]
+    assert fake_client.query.calls == [{}, {"$skiptoken": "1"}, {"$skiptoken": "2"}]
 
 
 @pytest.mark.asyncio
@@ -1,3 +1,5 @@
+import threading
+
 import pytest
 from unittest.mock import MagicMock, patch
 from datetime import datetime, timezone
@@ -76,6 +78,53 @@ async def test_gcp_adapter_get_cost_and_usage_error(gcp_adapter):
             await gcp_adapter.get_cost_and_usage(start, end)
 
 
+class _FakeRowIterator:
+    """BigQuery RowIterator fake: rows are fetched lazily, one page per request."""
+
+    def __init__(self, total_rows, page_size):
+        self.total_rows = total_rows
+        self.page_size = page_size
+        self.fetched = 0
+        self.fetch_threads = set()
+
+    def __iter__(self):
+        while self.fetched < self.total_rows:
+            self.fetch_threads.add(threading.get_ident())
+            start = self.fetched
+            self.fetched = min(self.total_rows, start + self.page_size)
+            for idx in range(start, self.fetched):
+                row = MagicMock()
+                row.service = f"svc-{idx}"
+                row.cost_usd = float(idx)
+                row.total_credits = None
+                row.currency = "USD"
+                row.timestamp = datetime(2026, 1, 1, tzinfo=timezone.utc)
+                yield row
+
+
+@pytest.mark.asyncio
+async def test_gcp_adapter_stream_reads_pages_off_the_event_loop(gcp_adapter):
+    rows = _FakeRowIterator(total_rows=10, page_size=2)
+    mock_client = MagicMock()
+    mock_client.query.return_value.result.return_value = rows
+
+    with (
+        patch("google.cloud.bigquery.Client", return_value=mock_client),
+        patch("app.shared.adapters.gcp.GCP_BQ_PAGE_SIZE", 2),
+    ):
+        start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        end = datetime(2026, 1, 2, tzinfo=timezone.utc)
+        stream = gcp_adapter.stream_cost_and_usage(start, end)
+        first = await stream.__anext__()
+        # Bounded buffering: the current page plus at most one prefetched page.
+        assert rows.fetched <= 4
+        results = [first] + [r async for r in stream]
+
+    assert [r["cost_usd"] for r in results] == [float(i) for i in range(10)]
+    mock_client.query.return_value.result.assert_called_once_with(page_size=2)
+    assert threading.get_ident() not in rows.fetch_threads
+
+
 @pytest.mark.asyncio
 async def test_gcp_adapter_discover_resources(gcp_adapter):
     mock_client = MagicMock()
@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from app.shared.analysis import forecaster_prophet_ops
+
+
+@pytest.fixture(autouse=True)
+def _thread_forecast_executor(monkeypatch) -> Iterator[ThreadPoolExecutor]:
+    """Mocked Prophet classes cannot be pickled into the process pool."""
+    executor = ThreadPoolExecutor(max_workers=1)
+    monkeypatch.setattr(forecaster_prophet_ops, "_executor", executor)
+    yield executor
+    executor.shutdown(wait=True)
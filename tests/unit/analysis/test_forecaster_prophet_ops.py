@@ -0,0 +1,142 @@
+from datetime import date
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.shared.analysis.forecaster import SymbolicForecaster
+from app.shared.analysis.forecaster_prophet_ops import (
+    ProphetFitCache,
+    ProphetFitResult,
+    prophet_fit_cache,
+    prophet_fit_cache_key,
+)
+
+
+@pytest.fixture(autouse=True)
+def _clear_fit_cache():
+    prophet_fit_cache.clear()
+    yield
+    prophet_fit_cache.clear()
+
+
+def _history(days: int = 20) -> list[SimpleNamespace]:
+    return [
+        SimpleNamespace(date=date(2024, 1, i), amount=100.0 + (i % 7) * 3)
+        for i in range(1, days + 1)
+    ]
+
+
+def _mock_prophet(days: int, history_len: int) -> MagicMock:
+    ds = pd.date_range("2024-01-01", periods=history_len + days, freq="D")
+    yhat = np.linspace(-5.0, 140.123456, len(ds))
+    forecast = pd.DataFrame(
+        {
+            "ds": ds,
+            "yhat": yhat,
+            "yhat_lower": yhat - 7.777,
+            "yhat_upper": yhat + 7.777,
+        }
+    )
+    model_cls = MagicMock()
+    model_cls.return_value.make_future_dataframe.return_value = pd.DataFrame()
+    model_cls.return_value.predict.return_value = forecast
+    return model_cls
+
+
+def _legacy_entries(forecast: pd.DataFrame, days: int) -> list[dict]:
+    entries = []
+    for _, row in forecast.tail(days).iterrows():
+        amount = Decimal(str(max(0.0, float(row["yhat"]))))
+        entries.append(
+            {
+                "date": row["ds"].date(),
+                "amount": amount.quantize(Decimal("0.01")),
+                "confidence_lower": Decimal(
+                    str(max(0.0, float(row["yhat_lower"])))
+                ).quantize(Decimal("0.01")),
+                "confidence_upper": Decimal(str(float(row["yhat_upper"]))).quantize(
+                    Decimal("0.01")
+                ),
+            }
+        )
+    return entries
+
+
+@pytest.mark.asyncio
+async def test_prophet_output_matches_row_wise_extraction_and_is_cached() -> None:
+    model_cls = _mock_prophet(days=10, history_len=20)
+    expected = _legacy_entries(model_cls.return_value.predict.return_value, 10)
+
+    with (
+        patch("app.shared.analysis.forecaster.PROPHET_AVAILABLE", True),
+        patch("app.shared.analysis.forecaster.Prophet", model_cls, create=True),
+    ):
+        first = await SymbolicForecaster.forecast(_history(), days=10)
+        second = await SymbolicForecaster.forecast(_history(), days=10)
+        await SymbolicForecaster.forecast(_history(), days=9)
+
+    assert first["model"] == "Prophet"
+    assert first["forecast"] == expected
+    tail = model_cls.return_value.predict.return_value.tail(10)
+    expected_total = sum(
+        (Decimal(str(max(0.0, float(v)))) for v in tail["yhat"]), Decimal("0")
+    )
+    assert first["total_forecasted_cost"] == expected_total.quantize(Decimal("0.01"))
+    assert second == first
+    # Same history and horizon reuse the fit; a new horizon refits.
+    assert model_cls.return_value.fit.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_fit_cache_is_scoped_to_the_model_implementation() -> None:
+    first_cls = _mock_prophet(days=5, history_len=20)
+    second_cls = _mock_prophet(days=5, history_len=20)
+
+    with patch("app.shared.analysis.forecaster.PROPHET_AVAILABLE", True):
+        for model_cls in (first_cls, second_cls):
+            with patch(
+                "app.shared.analysis.forecaster.Prophet", model_cls, create=True
+            ):
+                await SymbolicForecaster.forecast(_history(), days=5)
+
+    assert first_cls.return_value.fit.call_count == 1
+    assert second_cls.return_value.fit.call_count == 1
+
+
+def test_cache_key_tracks_history_horizon_and_markers() -> None:
+    train = pd.DataFrame(
+        {"ds": pd.date_range("2024-01-01", periods=14), "y": np.arange(14.0)}
+    )
+    holidays = pd.DataFrame(
+        {
+            "holiday": ["deploy", "maintenance"],
+            "ds": pd.to_datetime(["2024-01-05", "2024-01-03"]),
+            "lower_window": 0,
+            "upper_window": 0,
+        }
+    )
+    base = prophet_fit_cache_key(train, holidays, 30, 14)
+
+    assert base == prophet_fit_cache_key(train, holidays.iloc[::-1], 30, 14)
+    assert base != prophet_fit_cache_key(train, None, 30, 14)
+    assert base != prophet_fit_cache_key(train, holidays, 31, 14)
+    changed = train.assign(y=train["y"] + 0.01)
+    assert base != prophet_fit_cache_key(changed, holidays, 30, 14)
+
+
+def test_fit_cache_evicts_least_recently_used() -> None:
+    cache = ProphetFitCache(max_entries=2)
+    result = ProphetFitResult(*(np.zeros(1) for _ in range(5)))
+    cache.put("a", object, result)
+    cache.put("b", object, result)
+    assert cache.get("a", object) is result
+    cache.put("c", object, result)
+
+    assert cache.get("b", object) is None
+    assert cache.get("a", object) is result
+    assert cache.get("a", dict) is None
+    assert len(cache) == 2
@@ -0,0 +1,155 @@
+from datetime import date, timedelta
+from decimal import Decimal
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.shared.analysis.forecaster import SymbolicForecaster
+from app.shared.analysis.holt_winters_batch import (
+    align_daily_series,
+    batch_holt_winters_forecast,
+    fit_holt_parameters,
+    holt_linear_smooth,
+)
+
+
+def _loop_holt(values: list[float], alpha: float, beta: float) -> tuple[float, float]:
+    level = values[0]
+    trend = values[1] - values[0] if len(values) > 1 else 0
+    for i in range(1, len(values)):
+        last_level = level
+        level = alpha * values[i] + (1 - alpha) * (level + trend)
+        trend = beta * (level - last_level) + (1 - beta) * trend
+    return level, trend
+
+
+def test_batch_smoothing_matches_single_series_loop_exactly() -> None:
+    rng = np.random.default_rng(3)
+    matrix = rng.uniform(50.0, 150.0, size=(6, 40))
+    alphas = np.array([0.3, 0.1, 0.5, 0.9, 0.3, 0.2])
+    betas = np.array([0.1, 0.05, 0.3, 0.2, 0.1, 0.1])
+
+    level, trend, _sse = holt_linear_smooth(matrix, alphas, betas)
+
+    for row in range(matrix.shape[0]):
+        expected = _loop_holt(matrix[row].tolist(), alphas[row], betas[row])
+        assert (level[row], trend[row]) == expected
+
+
+def test_forecast_clips_at_zero_and_widens_bands() -> None:
+    falling = np.linspace(100.0, 10.0, 20)
+    result = batch_holt_winters_forecast(np.vstack([falling, falling[::-1]]), 60)
+
+    assert result.forecast.shape == (2, 60)
+    assert result.forecast[0, -1] == 0.0
+    assert np.all(result.forecast >= 0.0)
+    widths = result.upper[1] - result.lower[1]
+    assert np.all(np.diff(widths / result.forecast[1]) > 0)
+
+
+def test_missing_days_carry_the_trend_forward() -> None:
+    values = np.array([[np.nan, np.nan, 10.0, 12.0, np.nan, 16.0, 18.0]])
+    level, trend, _ = holt_linear_smooth(values, 1.0, 1.0)
+
+    # alpha=beta=1 tracks observations exactly; the gap is bridged by the trend.
+    assert level[0] == pytest.approx(18.0)
+    assert trend[0] == pytest.approx(2.0)
+    with pytest.raises(ValueError):
+        holt_linear_smooth(np.array([[np.nan, np.nan]]))
+
+
+def test_fit_parameters_prefers_responsive_smoothing_for_level_shifts() -> None:
+    steady = np.full(60, 100.0) + np.tile([1.0, -1.0], 30)
+    shifted = np.concatenate([np.full(30, 100.0), np.full(30, 300.0)])
+    alpha, beta = fit_holt_parameters(np.vstack([steady, shifted]))
+
+    assert alpha[1] > alpha[0]
+    assert beta.shape == (2,)
+
+
+def test_align_daily_series_sums_duplicates_and_marks_gaps() -> None:
+    day = date(2026, 1, 1)
+    keys, dates, matrix = align_daily_series(
+        {
+            "a": [
+                SimpleNamespace(date=day, amount=1),
+                SimpleNamespace(date=day, amount=2),
+            ],
+            "b": [SimpleNamespace(date=day + timedelta(days=2), amount=Decimal("5"))],
+        }
+    )
+
+    assert keys == ["a", "b"]
+    assert dates == [day, day + timedelta(days=1), day + timedelta(days=2)]
+    assert matrix[0, 0] == 3.0
+    assert np.isnan(matrix[0, 1]) and np.isnan(matrix[1, 0])
+    assert matrix[1, 2] == 5.0
+
+
+@pytest.mark.asyncio
+async def test_fallback_forecast_is_unchanged_by_batch_engine() -> None:
+    history = [
+        SimpleNamespace(date=date(2024, 1, i), amount=100.0 + i * 3.7)
+        for i in range(1, 11)
+    ]
+    result = await SymbolicForecaster.forecast(history, days=5)
+
+    level, trend = _loop_holt([100.0 + i * 3.7 for i in range(1, 11)], 0.3, 0.1)
+    first = Decimal(str(max(0.0, level + trend)))
+    assert result["model"] == "Holt-Winters Fallback"
+    assert result["forecast"][0]["amount"] == first.quantize(Decimal("0.01"))
+    assert result["forecast"][0]["confidence_lower"] == (
+        first - Decimal("0.12") * first
+    ).quantize(Decimal("0.01"))
+
+
+def test_forecast_batch_returns_per_series_payloads_with_carbon() -> None:
+    start = date(2026, 1, 1)
+    histories = {
+        ("t1", "ec2"): [
+            SimpleNamespace(date=start + timedelta(days=i), amount=50 + i)
+            for i in range(20)
+        ],
+        ("t2", "s3"): [
+            SimpleNamespace(date=start + timedelta(days=i), amount=5)
+            for i in range(5, 20)
+        ],
+    }
+    results = SymbolicForecaster.forecast_batch(
+        histories, days=7, regions={("t1", "ec2"): "us-east-1"}
+    )
+
+    ec2 = results[("t1", "ec2")]
+    assert ec2["model"] == "Holt-Winters Batch"
+    assert ec2["confidence"] == "medium"
+    assert len(ec2["forecast"]) == 7
+    assert ec2["forecast"][0]["date"] == pd.Timestamp(start + timedelta(days=20)).date()
+    assert ec2["forecast"][0]["amount"] > Decimal("60")
+    assert ec2["region"] == "us-east-1"
+    assert results[("t2", "s3")]["region"] == "global"
+    assert results[("t2", "s3")]["forecast"][0]["amount"] == Decimal("5.00")
+    assert SymbolicForecaster.forecast_batch({}) == {}
+
+
+def test_forecast_batch_skips_series_without_observations() -> None:
+    start = date(2026, 1, 1)
+    histories = {
+        "a": [
+            SimpleNamespace(date=start + timedelta(days=i), amount=10)
+            for i in range(20)
+        ],
+        "b": [],
+        "c": [SimpleNamespace(date=start, amount=float("nan"))],
+    }
+    results = SymbolicForecaster.forecast_batch(histories, days=3)
+
+    assert results["a"]["model"] == "Holt-Winters Batch"
+    assert results["a"]["forecast"][0]["amount"] == Decimal("10.00")
+    for key in ("b", "c"):
+        assert results[key]["model"] == "None"
+        assert results[key]["confidence"] == "low"
+        assert results[key]["forecast"] == []
+        assert results[key]["total_forecasted_cost"] == Decimal("0")
+    assert SymbolicForecaster.forecast_batch({"b": []})["b"]["forecast"] == []
@@ -1,6 +1,6 @@
 import pytest
 from unittest.mock import AsyncMock, MagicMock
-from fastapi import HTTPException
+from fastapi import HTTPException, Response
 from sqlalchemy.exc import SQLAlchemyError
 from uuid import uuid4
 from datetime import datetime, timezone
@@ -54,6 +54,7 @@ async def test_get_audit_logs_success(mock_db, admin_user):
     logs = await get_audit_logs(
         admin_user,
         mock_db,
+        response=Response(),
         limit=50,
         offset=0,
         event_type="login",
@@ -68,7 +69,7 @@ async def test_get_audit_logs_success(mock_db, admin_user):
 async def test_get_audit_logs_error(mock_db, admin_user):
     mock_db.execute.side_effect = SQLAlchemyError("DB error")
     with pytest.raises(HTTPException) as exc:
-        await get_audit_logs(admin_user, mock_db)
+        await get_audit_logs(admin_user, mock_db, response=Response())
     assert exc.value.status_code == 500
 
 
@@ -78,11 +79,93 @@ async def test_get_audit_logs_rejects_actor_email_sort(mock_db, admin_user):
         await get_audit_logs(
             admin_user,
             mock_db,
+            response=Response(),
             sort_by="actor_email",
         )
     assert exc.value.status_code == 400
 
 
+@pytest.mark.asyncio
+async def test_get_audit_logs_emits_next_cursor_and_accepts_it(mock_db, admin_user):
+    logs = []
+    for index in range(3):
+        mock_log = MagicMock(spec=AuditLog)
+        mock_log.id = uuid4()
+        mock_log.event_type = "login"
+        mock_log.event_timestamp = datetime(2026, 1, 1, 12, index, tzinfo=timezone.utc)
+        mock_log.actor_email = "test@test.com"
+        mock_log.resource_type = "user"
+        mock_log.resource_id = None
+        mock_log.success = True
+        mock_log.correlation_id = None
+        logs.append(mock_log)
+
+    mock_res = MagicMock()
+    mock_res.scalars.return_value.all.return_value = logs
+    mock_db.execute.return_value = mock_res
+    response = Response()
+
+    page = await get_audit_logs(
+        admin_user,
+        mock_db,
+        limit=2,
+        offset=0,
+        event_type=None,
+        sort_by="event_timestamp",
+        order="desc",
+        response=response,
+    )
+    assert len(page) == 2
+    cursor = response.headers["X-Next-Cursor"]
+
+    mock_res.scalars.return_value.all.return_value = logs[2:]
+    follow_up = Response()
+    page = await get_audit_logs(
+        admin_user,
+        mock_db,
+        limit=2,
+        offset=0,
+        event_type=None,
+        sort_by="event_timestamp",
+        order="desc",
+        cursor=cursor,
+        response=follow_up,
+    )
+    assert [item.id for item in page] == [logs[2].id]
+    assert "X-Next-Cursor" not in follow_up.headers
+    compiled = str(mock_db.execute.await_args.args[0])
+    assert "OFFSET" not in compiled.upper()
+    assert "audit_logs.event_timestamp <=" in compiled
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("cursor", "offset", "sort_by"),
+    [
+        ("garbage", 0, "event_timestamp"),
+        ("garbage", 10, "event_timestamp"),
+        ("garbage", 0, "event_type"),
+    ],
+)
+async def test_get_audit_logs_rejects_invalid_cursor_usage(
+    mock_db, admin_user, cursor, offset, sort_by
+):
+    with pytest.raises(HTTPException) as exc:
+        await get_audit_logs(
+            admin_user,
+            mock_db,
+            response=Response(),
+            limit=10,
+            offset=offset,
+            event_type=None,
+            sort_by=sort_by,
+            order="desc",
+            cursor=cursor,
+        )
+    assert exc.value.status_code == 400
+    mock_db.execute.assert_not_called()
+
+
 @pytest.mark.asyncio
 async def test_get_audit_log_detail_success(mock_db, admin_user):
     mock_log = MagicMock(spec=AuditLog)
@@ -162,6 +245,46 @@ async def test_export_audit_logs_success(mock_db, admin_user):
     assert response.media_type == "text/csv"
 
 
+@pytest.mark.asyncio
+async def test_export_audit_logs_streams_keyset_pages(mock_db, admin_user, monkeypatch):
+    from app.modules.governance.api.v1 import audit_access
+
+    monkeypatch.setattr(audit_access, "AUDIT_LOG_EXPORT_PAGE_SIZE", 2)
+    pages = []
+    for page_index, size in enumerate((2, 2, 1)):
+        rows = []
+        for index in range(size):
+            mock_log = MagicMock(spec=AuditLog)
+            mock_log.id = uuid4()
+            mock_log.event_type = f"event-{page_index}-{index}"
+            mock_log.event_timestamp = datetime.now(timezone.utc)
+            mock_log.actor_email = None
+            mock_log.resource_type = None
+            mock_log.resource_id = None
+            mock_log.success = True
+            mock_log.correlation_id = None
+            rows.append(mock_log)
+        page_res = MagicMock()
+        page_res.scalars.return_value.all.return_value = rows
+        pages.append(page_res)
+    mock_db.execute.side_effect = pages
+
+    response = await export_audit_logs(
+        admin_user, mock_db, start_date=None, end_date=None, event_type=None
+    )
+    # Only the first page is read before the response starts streaming.
+    assert mock_db.execute.await_count == 1
+
+    body = "".join([chunk async for chunk in response.body_iterator])
+    lines = body.strip().splitlines()
+    assert lines[0].startswith("id,event_type,event_timestamp")
+    assert len(lines) == 6
+    assert mock_db.execute.await_count == 3
+    assert "audit_logs.event_timestamp <=" in str(
+        mock_db.execute.await_args_list[1].args[0]
+    )
+
+
 @pytest.mark.asyncio
 async def test_export_audit_logs_error(mock_db, admin_user):
     mock_db.execute.side_effect = SQLAlchemyError("DB error")
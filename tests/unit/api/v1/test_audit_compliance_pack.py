@@ -1,3 +1,4 @@
+import hashlib
 import io
 import json
 import zipfile
@@ -120,6 +121,14 @@ async def test_export_compliance_pack_returns_zip(async_client, app, db, test_te
     assert manifest["actor_email"] == owner_user.email
     assert "factor_sets_count" in manifest["carbon_factors"]
     assert "update_logs_count" in manifest["carbon_factors"]
+    assert manifest["audit_logs"]["rows_written"] >= 1
+    assert (
+        "settings_snapshots" in manifest["evidence_collection"]["collector_timings_ms"]
+    )
+    assert (
+        manifest["artifact_sha256"]["audit_logs.csv"]
+        == hashlib.sha256(zf.read("audit_logs.csv")).hexdigest()
+    )
 
     factor_sets = json.loads(zf.read("carbon_factor_sets.json").decode("utf-8"))
     factor_updates = json.loads(
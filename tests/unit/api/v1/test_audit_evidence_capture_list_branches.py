@@ -1,6 +1,7 @@
 import io
 import json
 import zipfile
+from contextlib import asynccontextmanager
 from datetime import date, datetime, timezone
 from types import SimpleNamespace
 from unittest.mock import AsyncMock
@@ -37,6 +38,15 @@ class _ScalarsResult:
         return iter(self._rows)
 
 
+class _StreamedScalars:
+    def __init__(self, rows: list[object]) -> None:
+        self._rows = rows
+
+    async def partitions(self, size: int):
+        for index in range(0, len(self._rows), size):
+            yield self._rows[index : index + size]
+
+
 class _RowsResult:
     def __init__(self, rows: list[tuple[object, ...]]) -> None:
         self._rows = rows
@@ -611,6 +621,9 @@ async def test_capture_carbon_assurance_falls_back_when_factor_service_fails(
 @pytest.mark.asyncio
 async def test_export_compliance_pack_optional_exports_success_paths(monkeypatch) -> None:
     from app.modules.governance.domain.security import audit_log as audit_log_module
+    from app.modules.governance.domain.security import (
+        compliance_pack_bundle as compliance_pack_bundle_module,
+    )
     from app.modules.reporting.domain import focus_export as focus_export_module
     from app.modules.reporting.domain import reconciliation as reconciliation_module
     from app.modules.reporting.domain import savings_proof as savings_proof_module
@@ -727,6 +740,8 @@ async def test_export_compliance_pack_optional_exports_success_paths(monkeypatch
                 )
             ]
         ),
+        _ScalarsResult([factor_set]),
+        _ScalarsResult([factor_update]),
         _ScalarsResult(
             [_audit_row(details={"thresholds": {}, "acceptance_kpis": {"passed": True}})]
         ),
@@ -808,9 +823,6 @@ async def test_export_compliance_pack_optional_exports_success_paths(monkeypatch
                 )
             ]
         ),
-        _ScalarsResult([factor_set]),
-        _ScalarsResult([factor_update]),
-        _ScalarsResult([_audit_row(details={"audit": True})]),
         _RowsResult([(realized_event, now)]),
     ]
 
@@ -821,11 +833,27 @@ async def test_export_compliance_pack_optional_exports_success_paths(monkeypatch
 
     mock_db = AsyncMock()
     mock_db.execute = AsyncMock(side_effect=_execute)
+    mock_db.stream_scalars = AsyncMock(
+        return_value=_StreamedScalars([_audit_row(details={"audit": True})])
+    )
     mock_db.commit = AsyncMock()
     mock_db.rollback = AsyncMock()
 
+    @asynccontextmanager
+    async def _mock_session_opener(db: object, _tenant_id: object):
+        @asynccontextmanager
+        async def _open():
+            yield db
+
+        yield _open
+
     _RecordingAuditLogger.calls.clear()
     monkeypatch.setattr(audit_log_module, "AuditLogger", _RecordingAuditLogger)
+    # Collectors share the mocked session; they run in build order here because
+    # the mocked queries never suspend.
+    monkeypatch.setattr(
+        compliance_pack_bundle_module, "snapshot_session_opener", _mock_session_opener
+    )
     monkeypatch.setattr(
         focus_export_module,
         "FocusV13ExportService",
@@ -871,7 +899,8 @@ async def test_export_compliance_pack_optional_exports_success_paths(monkeypatch
         close_max_restatements=5000,
     )
 
-    archive = zipfile.ZipFile(io.BytesIO(response.body))
+    body = b"".join([chunk async for chunk in response.body_iterator])
+    archive = zipfile.ZipFile(io.BytesIO(body))
     names = set(archive.namelist())
 
     assert "exports/focus-v1.3-core.csv" in names
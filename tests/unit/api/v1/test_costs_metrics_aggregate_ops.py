@@ -0,0 +1,194 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.models.aws_connection import AWSConnection
+from app.models.background_job import BackgroundJob, JobStatus, JobType
+from app.models.license_connection import LicenseConnection
+from app.models.saas_connection import SaaSConnection
+from app.models.tenant import Tenant
+from app.modules.reporting.api.v1 import costs_metrics
+from app.modules.reporting.api.v1.costs_metrics_aggregate_ops import (
+    load_ingestion_sla_aggregates,
+    load_provider_recency_aggregates,
+)
+
+
+async def _tenant(db) -> Tenant:
+    tenant = Tenant(id=uuid4(), name="metrics", plan="pro")
+    db.add(tenant)
+    await db.commit()
+    return tenant
+
+
+def _job(tenant_id, status, *, minutes=None, result=None, **overrides):
+    now = datetime.now(timezone.utc)
+    started = now - timedelta(hours=1)
+    values = dict(
+        job_type=JobType.COST_INGESTION.value,
+        tenant_id=tenant_id,
+        status=status.value,
+        scheduled_for=started,
+        created_at=now - timedelta(hours=2),
+        started_at=started if minutes is not None else None,
+        completed_at=started + timedelta(minutes=minutes)
+        if minutes is not None
+        else None,
+        result=result,
+    )
+    values.update(overrides)
+    return BackgroundJob(**values)
+
+
+@pytest.mark.asyncio
+async def test_ingestion_sla_aggregate_matches_row_by_row(db_session) -> None:
+    tenant = await _tenant(db_session)
+    tid = tenant.id
+    completed = JobStatus.COMPLETED
+    db_session.add_all(
+        [
+            _job(tid, completed, minutes=minutes, result={"ingested": ingested})
+            for minutes, ingested in (
+                (1, 10),
+                (2, 12.9),
+                (3, -4.5),
+                (4, True),
+                (5, "bad"),
+                (7, None),
+                (30, 1000),
+            )
+        ]
+    )
+    db_session.add_all(
+        [
+            _job(tid, completed, minutes=-2, result={"rows": 5}),
+            _job(tid, JobStatus.FAILED, result={"ingested": 99}),
+            _job(tid, JobStatus.DEAD_LETTER, minutes=9, result=None),
+            _job(tid, JobStatus.PENDING),
+            _job(tid, completed, minutes=1, job_type=JobType.ZOMBIE_SCAN.value),
+            _job(
+                tid,
+                completed,
+                minutes=1,
+                created_at=datetime.now(timezone.utc) - timedelta(days=3),
+            ),
+        ]
+    )
+    await db_session.commit()
+
+    async def _compute():
+        return await costs_metrics.compute_ingestion_sla_metrics(
+            db_session, tid, window_hours=24, target_success_rate_percent=50.0
+        )
+
+    with patch.object(
+        costs_metrics, "load_ingestion_sla_aggregates", new=AsyncMock(return_value=None)
+    ):
+        row_by_row = await _compute()
+    pushed_down = await _compute()
+
+    assert pushed_down == row_by_row
+    assert pushed_down.total_jobs == 11
+    assert pushed_down.records_ingested == 10 + 12 - 4 + 1 + 1000
+    assert pushed_down.p95_duration_seconds == 1800.0
+
+    empty = await load_ingestion_sla_aggregates(
+        db_session, tenant_id=uuid4(), window_start=datetime.now(timezone.utc)
+    )
+    assert empty is not None and empty.total_jobs == 0
+    assert empty.p95_duration_seconds is None
+
+
+@pytest.mark.asyncio
+async def test_provider_recency_union_matches_row_by_row(db_session) -> None:
+    tenant = await _tenant(db_session)
+    now = datetime.now(timezone.utc)
+    recent, stale = now - timedelta(hours=1), now - timedelta(hours=60)
+
+    def aws(status, last):
+        return AWSConnection(
+            tenant_id=tenant.id,
+            aws_account_id=str(uuid4().int)[:12],
+            role_arn="arn:aws:iam::123456789012:role/Test",
+            status=status,
+            last_ingested_at=last,
+        )
+
+    def vendor(model, active, last):
+        return model(
+            tenant_id=tenant.id,
+            name=f"vendor-{uuid4().hex[:8]}",
+            vendor="acme",
+            is_active=active,
+            last_ingested_at=last,
+        )
+
+    db_session.add_all(
+        [
+            aws("active", recent),
+            aws("Active ", stale),
+            aws("disabled", recent),
+            vendor(SaaSConnection, True, None),
+            vendor(SaaSConnection, False, recent),
+            vendor(LicenseConnection, True, recent),
+        ]
+    )
+    await db_session.commit()
+
+    async def _compute():
+        return await costs_metrics.compute_provider_recency_summaries(
+            db_session, tenant.id, recency_target_hours=24
+        )
+
+    with patch.object(
+        costs_metrics,
+        "load_provider_recency_aggregates",
+        new=AsyncMock(return_value=None),
+    ):
+        row_by_row = await _compute()
+    pushed_down = await _compute()
+
+    assert pushed_down == row_by_row
+    by_provider = {item.provider: item for item in pushed_down}
+    assert by_provider["aws"].active_connections == 2
+    assert by_provider["aws"].stale_connections == 1
+    assert by_provider["saas"].never_ingested == 1
+    assert by_provider["license"].meets_recency_target is True
+    assert by_provider["gcp"].active_connections == 0
+
+
+@pytest.mark.asyncio
+async def test_postgres_statements_are_single_aggregate_queries() -> None:
+    db = MagicMock()
+    db.bind.dialect.name = "postgresql"
+    sla_result = MagicMock()
+    sla_result.one.return_value = (3, 2, 1, None, 2, 90.0, 15, 60.0)
+    recency_result = MagicMock()
+    recency_result.all.return_value = [("aws", 1, 1, 0, 0, None)]
+    db.execute = AsyncMock(side_effect=[sla_result, recency_result])
+
+    sla = await load_ingestion_sla_aggregates(
+        db, tenant_id=uuid4(), window_start=datetime.now(timezone.utc)
+    )
+    recency = await load_provider_recency_aggregates(
+        db,
+        tenant_id=uuid4(),
+        provider_models=[("aws", AWSConnection), ("saas", SaaSConnection)],
+        threshold=datetime.now(timezone.utc),
+    )
+
+    assert sla is not None and sla.p95_duration_seconds == 60.0
+    assert recency is not None and recency["aws"].recently_ingested == 1
+    assert db.execute.await_count == 2
+    sla_sql, recency_sql = (
+        str(call.args[0].compile(dialect=postgresql.dialect()))
+        for call in db.execute.await_args_list
+    )
+    assert "percentile_disc" in sla_sql and "WITHIN GROUP" in sla_sql
+    assert "jsonb_typeof" in sla_sql
+    assert recency_sql.count("UNION ALL") == 1
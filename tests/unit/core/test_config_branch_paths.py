@@ -386,7 +386,7 @@ def test_config_environment_safety_branch_paths() -> None:
         ("ENFORCEMENT_EXPORT_MAX_DAYS", 0, "ENFORCEMENT_EXPORT_MAX_DAYS must be >= 1"),
         ("ENFORCEMENT_EXPORT_MAX_DAYS", 3651, "ENFORCEMENT_EXPORT_MAX_DAYS must be <= 3650"),
         ("ENFORCEMENT_EXPORT_MAX_ROWS", 0, "ENFORCEMENT_EXPORT_MAX_ROWS must be >= 1"),
-        ("ENFORCEMENT_EXPORT_MAX_ROWS", 50001, "ENFORCEMENT_EXPORT_MAX_ROWS must be <= 50000"),
+        ("ENFORCEMENT_EXPORT_MAX_ROWS", 1_000_001, "ENFORCEMENT_EXPORT_MAX_ROWS must be <= 1000000"),
     ],
 )
 def test_config_enforcement_guardrail_bounds(field_name: str, value: object, expected: str) -> None:
@@ -0,0 +1,131 @@
+from datetime import datetime, timezone
+from decimal import Decimal
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.shared.adapters.saas import SaaSAdapter
+from app.shared.core.credentials import SaaSCredentials
+from app.shared.core.currency import ExchangeRateUnavailableError, convert_to_usd
+from app.shared.core.currency_snapshot import FxRateSnapshot
+
+RATES = {"EUR": Decimal("0.92"), "GBP": Decimal("0.79"), "JPY": Decimal("151.3")}
+
+
+@pytest.mark.asyncio
+async def test_snapshot_resolves_each_currency_once_and_matches_convert_to_usd() -> (
+    None
+):
+    rate_fn = AsyncMock(side_effect=lambda code: RATES[code])
+    snapshot = await FxRateSnapshot.capture(
+        ["eur", "EUR", None, "gbp"], rate_fn=rate_fn
+    )
+    await snapshot.resolve(["EUR", "JPY", "USD", "JPY"])
+
+    assert sorted(call.args[0] for call in rate_fn.await_args_list) == [
+        "EUR",
+        "GBP",
+        "JPY",
+    ]
+    assert dict(snapshot.rates) == {"USD": Decimal("1.0"), **RATES}
+    with pytest.raises(TypeError):
+        snapshot.rates["EUR"] = Decimal("1")  # type: ignore[index]
+
+    with patch(
+        "app.shared.core.currency.get_exchange_rate",
+        new=AsyncMock(side_effect=lambda code, strict=False: RATES[code]),
+    ):
+        for amount in (0.01, 92.0, 1234.5678, 10**7 + 0.33):
+            for code in ("USD", "EUR", "GBP", "JPY"):
+                assert snapshot.convert_to_usd(amount, code) == await convert_to_usd(
+                    amount, code
+                )
+
+    assert snapshot.row_metadata("eur") == {
+        "snapshot_id": snapshot.snapshot_id,
+        "captured_at": snapshot.captured_at.isoformat(),
+        "currency": "EUR",
+        "rate": "0.92",
+    }
+
+
+@pytest.mark.asyncio
+async def test_snapshot_failed_lookup_is_not_retried_and_raises_per_row() -> None:
+    rate_fn = AsyncMock(side_effect=RuntimeError("fx down"))
+    snapshot = await FxRateSnapshot.capture(["EUR"], rate_fn=rate_fn)
+    await snapshot.resolve(["EUR"])
+
+    assert rate_fn.await_count == 1
+    with pytest.raises(ExchangeRateUnavailableError, match="fx down"):
+        snapshot.convert_to_usd(10.0, "EUR")
+    with pytest.raises(ExchangeRateUnavailableError, match="not resolved"):
+        snapshot.convert_to_usd(10.0, "CHF")
+    assert snapshot.row_metadata("EUR")["rate"] is None
+
+    with pytest.raises(KeyError):
+        await FxRateSnapshot.capture(
+            ["EUR"], rate_fn=AsyncMock(side_effect=KeyError("bug"))
+        )
+
+
+@pytest.mark.asyncio
+async def test_stripe_stream_converts_against_one_snapshot_per_run() -> None:
+    adapter = SaaSAdapter(
+        SaaSCredentials(
+            platform="stripe",
+            auth_method="api_key",
+            api_key="sk_test_123",
+            connector_config={},
+            spend_feed=[],
+        )
+    )
+    created = int(datetime(2026, 1, 10, tzinfo=timezone.utc).timestamp())
+    pages = [
+        {
+            "data": [
+                {
+                    "id": f"in_{idx}",
+                    "created": created,
+                    "total": 100 * idx,
+                    "currency": cur,
+                }
+                for idx, cur in enumerate(("eur", "gbp", "eur", "usd"), start=1)
+            ],
+            "has_more": True,
+        },
+        {
+            "data": [
+                {"id": "in_5", "created": created, "total": 500, "currency": "eur"}
+            ],
+            "has_more": False,
+        },
+    ]
+    rate_fn = AsyncMock(side_effect=lambda code, strict=False: RATES[code])
+    with (
+        patch.object(adapter, "_get_json", new=AsyncMock(side_effect=pages)),
+        patch("app.shared.core.currency.get_exchange_rate", new=rate_fn),
+    ):
+        rows = [
+            row
+            async for row in adapter._stream_stripe_cost_and_usage(
+                datetime(2026, 1, 1, tzinfo=timezone.utc),
+                datetime(2026, 1, 31, tzinfo=timezone.utc),
+            )
+        ]
+
+    assert rate_fn.await_count == 2
+    assert [row["cost_usd"] for row in rows] == [
+        float(Decimal("1.0") / RATES["EUR"]),
+        float(Decimal("2.0") / RATES["GBP"]),
+        float(Decimal("3.0") / RATES["EUR"]),
+        4.0,
+        float(Decimal("5.0") / RATES["EUR"]),
+    ]
+    assert len({row["fx_snapshot"]["snapshot_id"] for row in rows}) == 1
+    assert [row["fx_snapshot"]["rate"] for row in rows] == [
+        "0.92",
+        "0.79",
+        "0.92",
+        "1.0",
+        "0.92",
+    ]
@@ -0,0 +1,137 @@
+import asyncio
+import random
+import time
+import traceback
+from types import SimpleNamespace
+
+import pytest
+
+from app.shared.core import event_loop_monitor as monitor_module
+from app.shared.core.event_loop_monitor import (
+    EventLoopMonitor,
+    build_event_loop_monitor,
+    offending_site,
+)
+from app.shared.core.ops_metrics_runtime import (
+    EVENT_LOOP_BLOCKED_TOTAL,
+    EVENT_LOOP_LAG_SECONDS,
+)
+
+
+def _lag_histogram() -> tuple[float, float]:
+    samples = {
+        sample.name: sample.value
+        for metric in EVENT_LOOP_LAG_SECONDS.collect()
+        for sample in metric.samples
+    }
+    return (
+        samples["valdrics_ops_event_loop_lag_seconds_count"],
+        samples["valdrics_ops_event_loop_lag_seconds_sum"],
+    )
+
+
+def _blocked_total(stack_captured: str) -> float:
+    return EVENT_LOOP_BLOCKED_TOTAL.labels(stack_captured=stack_captured)._value.get()
+
+
+def _parse_report_synchronously(seconds: float) -> None:
+    # Stands in for a Prophet fit or BigQuery `result()` called from a coroutine.
+    time.sleep(seconds)
+
+
+async def _run_blocking_request(seconds: float) -> None:
+    await asyncio.sleep(0)
+    _parse_report_synchronously(seconds)
+
+
+async def _monitor_blocking(monitor: EventLoopMonitor, *, stalls: int = 1) -> None:
+    monitor.start()
+    try:
+        await asyncio.sleep(monitor.tick_seconds * 2)
+        for _ in range(stalls):
+            await _run_blocking_request(0.4)
+            await asyncio.sleep(monitor.tick_seconds * 2)
+    finally:
+        await monitor.stop()
+
+
+@pytest.mark.asyncio
+async def test_full_mode_records_lag_and_names_the_blocking_call() -> None:
+    monitor = EventLoopMonitor(mode="full", blocking_threshold_seconds=0.1)
+    count_before, sum_before = _lag_histogram()
+    captured_before = _blocked_total("true")
+
+    await _monitor_blocking(monitor)
+
+    count_after, sum_after = _lag_histogram()
+    assert count_after > count_before
+    assert sum_after - sum_before >= 0.2
+    assert _blocked_total("true") == captured_before + 1
+    [stall] = monitor.recent_stalls
+    assert stall.overdue_seconds >= 0.1
+    assert stall.site is not None and "_parse_report_synchronously" in stall.site
+    assert any("_run_blocking_request" in line for line in stall.stack)
+    assert not monitor.running
+
+
+@pytest.mark.asyncio
+async def test_sampled_mode_counts_every_stall_but_rate_limits_stacks() -> None:
+    monitor = EventLoopMonitor(
+        mode="sampled",
+        blocking_threshold_seconds=0.1,
+        stack_sample_rate=1.0,
+        min_capture_interval_seconds=60.0,
+        rng=random.Random(0),
+    )
+    uncaptured_before = _blocked_total("false")
+
+    await _monitor_blocking(monitor, stalls=2)
+
+    first, second = monitor.recent_stalls
+    assert first.stack_captured and "_parse_report_synchronously" in str(first.site)
+    assert not second.stack_captured and second.site is None
+    assert _blocked_total("false") == uncaptured_before + 1
+
+
+@pytest.mark.asyncio
+async def test_lag_mode_skips_stall_detection_and_short_awaits_are_not_stalls() -> None:
+    lag_only = EventLoopMonitor(mode="lag", lag_interval_seconds=0.05)
+    await _monitor_blocking(lag_only)
+    assert lag_only.tick_seconds == 0.05
+    assert not lag_only.recent_stalls
+
+    healthy = EventLoopMonitor(mode="full", blocking_threshold_seconds=0.2)
+    healthy.start()
+    for _ in range(5):
+        await asyncio.sleep(0.05)
+    await healthy.stop()
+    assert not healthy.recent_stalls
+
+
+def test_offending_site_prefers_the_innermost_application_frame() -> None:
+    app_file = monitor_module._APP_PACKAGE_DIR + "shared/analysis/forecaster.py"
+    frames = [
+        traceback.FrameSummary("/usr/lib/asyncio/events.py", 80, "_run"),
+        traceback.FrameSummary(app_file, 120, "forecast"),
+        traceback.FrameSummary("/site-packages/prophet/forecaster.py", 1200, "fit"),
+    ]
+    assert offending_site(frames) == f"{app_file}:120 in forecast"
+    assert offending_site(frames[:1]) == "/usr/lib/asyncio/events.py:80 in _run"
+    assert offending_site([]) is None
+
+
+def test_build_event_loop_monitor_falls_back_on_invalid_settings() -> None:
+    monitor = build_event_loop_monitor(
+        SimpleNamespace(
+            EVENT_LOOP_MONITOR_MODE=" Bogus ",
+            EVENT_LOOP_BLOCKING_THRESHOLD_SECONDS=0,
+            EVENT_LOOP_STACK_SAMPLE_RATE=5,
+        )
+    )
+    assert monitor.mode == "sampled"
+    assert monitor.blocking_threshold_seconds == 0.25
+    assert monitor.stack_sample_rate == 1.0
+    assert monitor.tick_seconds == 0.125
+
+    with pytest.raises(ValueError, match="unsupported event loop monitor mode"):
+        EventLoopMonitor(mode="verbose")
@@ -135,3 +135,42 @@ async def test_archive_partition_upserts_and_drops_source_partition() -> None:
     assert "ON CONFLICT (id, recorded_at)" in statements[0]
     assert "DELETE FROM cost_records_2024_01" in statements[1]
     assert "DROP TABLE IF EXISTS cost_records_2024_01" in statements[2]
+
+
+@pytest.mark.asyncio
+async def test_list_cost_record_partition_ranges_parses_bounds_and_skips_default() -> None:
+    rows = [
+        type("Row", (), {
+            "partition_name": "cost_records_2026_02",
+            "partition_bound": "FOR VALUES FROM ('2026-02-01') TO ('2026-03-01')",
+        })(),
+        type("Row", (), {"partition_name": "cost_records_default", "partition_bound": "DEFAULT"})(),
+        type("Row", (), {
+            "partition_name": "cost_records_2026_01",
+            "partition_bound": "FOR VALUES FROM ('2026-01-01') TO ('2026-02-01')",
+        })(),
+    ]
+    db = _db(exists_sequence=[], execute_side_effect=[rows])
+
+    ranges = await PartitionMaintenanceService(db).list_cost_record_partition_ranges()
+
+    assert ranges == [
+        ("cost_records_2026_01", date(2026, 1, 1), date(2026, 2, 1)),
+        ("cost_records_2026_02", date(2026, 2, 1), date(2026, 3, 1)),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_detach_and_drop_cost_record_partition_rejects_unsafe_names() -> None:
+    db = _db(exists_sequence=[])
+    service = PartitionMaintenanceService(db)
+
+    await service.detach_and_drop_cost_record_partition("cost_records_2024_01")
+    statements = [str(call.args[0]) for call in db.execute.await_args_list]
+    assert statements == [
+        "ALTER TABLE cost_records DETACH PARTITION cost_records_2024_01",
+        "DROP TABLE IF EXISTS cost_records_2024_01",
+    ]
+
+    with pytest.raises(ValueError):
+        await service.detach_and_drop_cost_record_partition("x; DROP TABLE tenants")
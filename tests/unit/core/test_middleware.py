@@ -1,6 +1,9 @@
 import pytest
-from unittest.mock import MagicMock, patch
-from starlette.responses import Response
+from unittest.mock import patch
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from starlette.datastructures import Headers
+from starlette.responses import Response, StreamingResponse
 from app.shared.core.middleware import (
     RequestIDMiddleware,
     SecurityHeadersMiddleware,
@@ -17,14 +20,38 @@ def mock_app():
     return app
 
 
-@pytest.mark.asyncio
-async def test_security_headers_middleware():
-    """Test HSTS, CSP, and security headers injection."""
+async def _call(middleware, scope):
+    messages: list[dict] = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    await middleware(scope, receive, send)
+    start = next(m for m in messages if m["type"] == "http.response.start")
+    return Headers(raw=start["headers"]), messages
 
-    async def call_next(request):
-        return Response("ok")
 
-    middleware = SecurityHeadersMiddleware(MagicMock())
+def _scope(**overrides):
+    scope = {
+        "type": "http",
+        "scheme": "http",
+        "method": "GET",
+        "path": "/api/v1/test",
+        "query_string": b"",
+        "headers": [],
+        "server": ("testserver", 80),
+    }
+    scope.update(overrides)
+    return scope
+
+
+@pytest.mark.asyncio
+async def test_security_headers_middleware(mock_app):
+    """Test HSTS, CSP, and security headers injection."""
+    middleware = SecurityHeadersMiddleware(mock_app)
 
     # Mock settings
     with patch("app.shared.core.middleware.get_settings") as mock_settings:
@@ -32,100 +59,121 @@ async def test_security_headers_middleware():
         mock_settings.return_value.CORS_ORIGINS = ["https://example.com"]
 
         # HTTPS Request
-        request = MagicMock()
-        request.url.scheme = "https"
-        request.url.path = "/api/v1/test"
+        headers, _ = await _call(middleware, _scope(scheme="https"))
 
-        response = await middleware.dispatch(request, call_next)
-
-        headers = response.headers
         assert (
             headers["Strict-Transport-Security"]
             == "max-age=31536000; includeSubDomains; preload"
         )
         assert headers["X-Content-Type-Options"] == "nosniff"
         assert headers["X-Frame-Options"] == "DENY"
-        assert (
-            "content-security-policy" in headers.keys()
-            or "Content-Security-Policy" in headers.keys()
-        )
-        csp = headers.get("Content-Security-Policy") or headers.get("content-security-policy")
+        csp = headers.get("Content-Security-Policy")
         assert csp is not None
         assert "'unsafe-inline'" not in csp
         assert "style-src-attr 'none'" in csp
 
 
 @pytest.mark.asyncio
-async def test_request_id_middleware():
-    """Test request ID injection and correlation."""
+async def test_security_headers_middleware_preserves_handler_headers():
+    async def app(scope, receive, send):
+        response = Response("ok", headers={"X-Frame-Options": "SAMEORIGIN"})
+        await response(scope, receive, send)
+
+    middleware = SecurityHeadersMiddleware(app)
+
+    with patch("app.shared.core.middleware.get_settings") as mock_settings:
+        mock_settings.return_value.DEBUG = False
+        mock_settings.return_value.CORS_ORIGINS = []
 
-    async def call_next(request):
-        assert hasattr(request.state, "request_id")
-        return Response("ok")
+        headers, _ = await _call(middleware, _scope())
 
-    middleware = RequestIDMiddleware(MagicMock())
+    assert headers.getlist("X-Frame-Options") == ["SAMEORIGIN"]
 
-    request = MagicMock()
-    request.headers = {}
-    request.state = MagicMock()
+
+@pytest.mark.asyncio
+async def test_request_id_middleware(mock_app):
+    """Test request ID injection and correlation."""
+    seen_state: dict[str, str] = {}
+
+    async def app(scope, receive, send):
+        seen_state.update(scope["state"])
+        await mock_app(scope, receive, send)
+
+    middleware = RequestIDMiddleware(app)
 
     with patch("app.shared.core.middleware.set_correlation_id") as mock_set_id:
-        response = await middleware.dispatch(request, call_next)
+        headers, _ = await _call(middleware, _scope())
 
-        assert "X-Request-ID" in response.headers
+        assert "X-Request-ID" in headers
+        assert seen_state["request_id"] == headers["X-Request-ID"]
         mock_set_id.assert_called_once()
 
 
 @pytest.mark.asyncio
-async def test_request_id_middleware_replaces_invalid_client_value():
-    async def call_next(request):
-        assert hasattr(request.state, "request_id")
-        return Response("ok")
-
-    middleware = RequestIDMiddleware(MagicMock())
-
-    request = MagicMock()
-    request.headers = {"X-Request-ID": "bad\nrequest"}
-    request.state = MagicMock()
+async def test_request_id_middleware_replaces_invalid_client_value(mock_app):
+    middleware = RequestIDMiddleware(mock_app)
 
     with patch("app.shared.core.middleware.set_correlation_id") as mock_set_id:
-        response = await middleware.dispatch(request, call_next)
+        headers, _ = await _call(
+            middleware, _scope(headers=[(b"x-request-id", b"bad\nrequest")])
+        )
 
-        assert response.headers["X-Request-ID"] != "bad\nrequest"
-        mock_set_id.assert_called_once_with(response.headers["X-Request-ID"])
+        assert headers["X-Request-ID"] != "bad\nrequest"
+        mock_set_id.assert_called_once_with(headers["X-Request-ID"])
 
 
 @pytest.mark.asyncio
 async def test_trusted_proxy_headers_middleware_normalizes_client_and_scheme():
-    async def call_next(request):
-        assert request.client is not None
-        assert request.client.host == "198.51.100.21"
-        assert request.scope["scheme"] == "https"
-        return Response("ok")
+    observed: dict[str, object] = {}
+
+    async def app(scope, receive, send):
+        observed["client"] = scope["client"]
+        observed["scheme"] = scope["scheme"]
+        await Response("ok")(scope, receive, send)
 
-    middleware = TrustedProxyHeadersMiddleware(MagicMock())
+    middleware = TrustedProxyHeadersMiddleware(app)
 
     with patch("app.shared.core.middleware.get_settings") as mock_settings:
         mock_settings.return_value.TRUST_PROXY_HEADERS = True
         mock_settings.return_value.TRUSTED_PROXY_HOPS = 1
         mock_settings.return_value.TRUSTED_PROXY_CIDRS = ["203.0.113.10/32"]
 
-        from fastapi import Request
-
-        request = Request(
-            {
-                "type": "http",
-                "scheme": "http",
-                "method": "GET",
-                "path": "/api/v1/test",
-                "headers": [
+        _, messages = await _call(
+            middleware,
+            _scope(
+                headers=[
                     (b"x-forwarded-for", b"198.51.100.20, 198.51.100.21"),
                     (b"x-forwarded-proto", b"http, https"),
                 ],
-                "client": ("203.0.113.10", 44321),
-            }
+                client=("203.0.113.10", 44321),
+            ),
         )
 
-        response = await middleware.dispatch(request, call_next)
+    assert messages[0]["status"] == 200
+    assert observed["client"] == ("198.51.100.21", 44321)
+    assert observed["scheme"] == "https"
+
+
+def test_middleware_stack_streams_response_chunks_unbuffered():
+    app = FastAPI()
+    app.add_middleware(SecurityHeadersMiddleware)
+    app.add_middleware(RequestIDMiddleware)
+    app.add_middleware(TrustedProxyHeadersMiddleware)
+
+    @app.get("/export.csv")
+    async def export_csv():
+        async def rows():
+            yield "id,cost\n"
+            for idx in range(3):
+                yield f"{idx},1.00\n"
+
+        return StreamingResponse(rows(), media_type="text/csv")
+
+    with TestClient(app) as client:
+        with client.stream("GET", "/export.csv") as response:
+            chunks = list(response.iter_text())
 
     assert response.status_code == 200
+    assert response.headers["x-request-id"]
+    assert response.headers["x-content-type-options"] == "nosniff"
+    assert "".join(chunks) == "id,cost\n0,1.00\n1,1.00\n2,1.00\n"
@@ -1,6 +1,7 @@
 import pytest
 from unittest.mock import MagicMock, patch
-from fastapi import Request, Response
+from starlette.datastructures import Headers
+from starlette.responses import Response
 from app.shared.core.middleware import (
     RequestIDMiddleware,
     SecurityHeadersMiddleware,
@@ -18,17 +19,27 @@ def mock_settings():
         yield mock.return_value
 
 
-@pytest.fixture
-def mock_call_next():
-    async def _call_next(request: Request):
-        return Response(content=b"OK", media_type="text/plain")
+async def _ok_app(scope, receive, send):
+    await Response(content=b"OK", media_type="text/plain")(scope, receive, send)
+
+
+async def _run(middleware, scope) -> Headers:
+    messages: list[dict] = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
 
-    return _call_next
+    async def send(message):
+        messages.append(message)
+
+    await middleware(scope, receive, send)
+    start = next(m for m in messages if m["type"] == "http.response.start")
+    return Headers(raw=start["headers"])
 
 
 @pytest.mark.asyncio
-async def test_security_headers_prod(mock_settings, mock_call_next):
-    middleware = SecurityHeadersMiddleware(app=MagicMock())
+async def test_security_headers_prod(mock_settings):
+    middleware = SecurityHeadersMiddleware(app=_ok_app)
 
     scope = {
         "type": "http",
@@ -39,11 +50,9 @@ async def test_security_headers_prod(mock_settings, mock_call_next):
         "query_string": b"",
         "headers": [],
     }
-    request = Request(scope=scope)
 
-    response = await middleware.dispatch(request, mock_call_next)
+    headers = await _run(middleware, scope)
 
-    headers = response.headers
     # HSTS
     assert (
         headers["Strict-Transport-Security"]
@@ -64,9 +73,9 @@ async def test_security_headers_prod(mock_settings, mock_call_next):
 
 
 @pytest.mark.asyncio
-async def test_security_headers_debug(mock_settings, mock_call_next):
+async def test_security_headers_debug(mock_settings):
     mock_settings.DEBUG = True
-    middleware = SecurityHeadersMiddleware(app=MagicMock())
+    middleware = SecurityHeadersMiddleware(app=_ok_app)
 
     scope = {
         "type": "http",
@@ -77,17 +86,37 @@ async def test_security_headers_debug(mock_settings, mock_call_next):
         "query_string": b"",
         "headers": [],
     }
-    request = Request(scope=scope)
 
-    response = await middleware.dispatch(request, mock_call_next)
+    headers = await _run(middleware, scope)
 
     # HSTS disabled in debug
-    assert response.headers["Strict-Transport-Security"] == "max-age=0"
+    assert headers["Strict-Transport-Security"] == "max-age=0"
+
+
+@pytest.mark.asyncio
+async def test_security_headers_skip_csp_for_docs(mock_settings):
+    middleware = SecurityHeadersMiddleware(app=_ok_app)
+
+    scope = {
+        "type": "http",
+        "scheme": "http",
+        "server": ("testserver", 80),
+        "method": "GET",
+        "path": "/docs",
+        "query_string": b"",
+        "headers": [],
+    }
+
+    headers = await _run(middleware, scope)
+
+    assert headers["X-Frame-Options"] == "DENY"
+    assert "Content-Security-Policy" not in headers
+    assert "Strict-Transport-Security" not in headers
 
 
 @pytest.mark.asyncio
-async def test_request_id_generation(mock_call_next):
-    middleware = RequestIDMiddleware(app=MagicMock())
+async def test_request_id_generation():
+    middleware = RequestIDMiddleware(app=_ok_app)
 
     scope = {
         "type": "http",
@@ -95,19 +124,19 @@ async def test_request_id_generation(mock_call_next):
         "path": "/api/test",
         "headers": [],
     }
-    request = Request(scope=scope)
 
     with patch("app.shared.core.middleware.set_correlation_id") as mock_set_ctx:
-        response = await middleware.dispatch(request, mock_call_next)
+        headers = await _run(middleware, scope)
 
-        req_id = response.headers["X-Request-ID"]
+        req_id = headers["X-Request-ID"]
         assert req_id is not None
         mock_set_ctx.assert_called_with(req_id)
+    assert scope["state"]["request_id"] == req_id
 
 
 @pytest.mark.asyncio
-async def test_request_id_propagation(mock_call_next):
-    middleware = RequestIDMiddleware(app=MagicMock())
+async def test_request_id_propagation():
+    middleware = RequestIDMiddleware(app=_ok_app)
 
     scope = {
         "type": "http",
@@ -115,18 +144,15 @@ async def test_request_id_propagation(mock_call_next):
         "path": "/api/test",
         "headers": [(b"x-request-id", b"custom-trace-123")],
     }
-    request = Request(scope=scope)
 
-    response = await middleware.dispatch(request, mock_call_next)
+    headers = await _run(middleware, scope)
 
-    assert response.headers["X-Request-ID"] == "custom-trace-123"
+    assert headers["X-Request-ID"] == "custom-trace-123"
 
 
 @pytest.mark.asyncio
-async def test_trusted_proxy_headers_middleware_ignores_untrusted_forwarded_headers(
-    mock_call_next,
-):
-    middleware = TrustedProxyHeadersMiddleware(app=MagicMock())
+async def test_trusted_proxy_headers_middleware_ignores_untrusted_forwarded_headers():
+    middleware = TrustedProxyHeadersMiddleware(app=_ok_app)
 
     scope = {
         "type": "http",
@@ -141,15 +167,30 @@ async def test_trusted_proxy_headers_middleware_ignores_untrusted_forwarded_head
         ],
         "client": ("203.0.113.10", 44321),
     }
-    request = Request(scope=scope)
 
     with patch("app.shared.core.middleware.get_settings") as mock_settings:
         mock_settings.return_value.TRUST_PROXY_HEADERS = False
         mock_settings.return_value.TRUSTED_PROXY_HOPS = 1
         mock_settings.return_value.TRUSTED_PROXY_CIDRS = ["203.0.113.10/32"]
 
-        await middleware.dispatch(request, mock_call_next)
+        await _run(middleware, scope)
+
+    assert scope["client"][0] == "203.0.113.10"
+    assert scope["scheme"] == "http"
+
+
+@pytest.mark.asyncio
+async def test_middlewares_pass_through_non_http_scopes():
+    inner = MagicMock()
+
+    async def app(scope, receive, send):
+        inner(scope["type"])
+
+    for middleware_cls in (
+        SecurityHeadersMiddleware,
+        RequestIDMiddleware,
+        TrustedProxyHeadersMiddleware,
+    ):
+        await middleware_cls(app)({"type": "lifespan"}, None, None)
 
-    assert request.client is not None
-    assert request.client.host == "203.0.113.10"
-    assert request.url.scheme == "http"
+    assert inner.call_count == 3
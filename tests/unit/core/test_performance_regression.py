@@ -0,0 +1,72 @@
+import pytest
+
+from app.shared.core.performance_regression import compare_benchmark_samples
+
+BASELINE = [0.100, 0.101, 0.099, 0.102, 0.100, 0.098, 0.101, 0.100]
+
+
+def test_significant_slowdown_beyond_noise_budget_regresses() -> None:
+    result = compare_benchmark_samples(
+        "forecasting",
+        current_samples=[sample * 1.5 for sample in BASELINE],
+        baseline_samples=BASELINE,
+        noise_budget=0.10,
+    )
+
+    assert result.status == "regressed"
+    assert result.regressed
+    assert result.change_ratio == pytest.approx(1.5, rel=1e-3)
+    assert result.p_value is not None and result.p_value < 0.01
+
+
+def test_slowdown_within_noise_budget_is_unchanged() -> None:
+    result = compare_benchmark_samples(
+        "bulk_upsert",
+        current_samples=[sample * 1.15 for sample in BASELINE],
+        baseline_samples=BASELINE,
+        noise_budget=0.20,
+    )
+
+    assert result.status == "unchanged"
+    assert result.p_value is None
+
+
+def test_too_few_samples_never_regress() -> None:
+    # Three repeats cannot make any median shift statistically significant.
+    result = compare_benchmark_samples(
+        "cache_codecs",
+        current_samples=[0.100, 0.300, 0.300],
+        baseline_samples=[0.100, 0.100, 0.100],
+        noise_budget=0.10,
+    )
+
+    assert result.status == "unchanged"
+    assert result.p_value is None
+
+
+def test_significant_speedup_is_reported_as_improved() -> None:
+    result = compare_benchmark_samples(
+        "gate_evaluation",
+        current_samples=[sample * 0.5 for sample in BASELINE],
+        baseline_samples=BASELINE,
+        noise_budget=0.10,
+    )
+
+    assert result.status == "improved"
+    assert not result.regressed
+
+
+def test_missing_baseline_marks_benchmark_new_and_empty_run_raises() -> None:
+    result = compare_benchmark_samples(
+        "anomaly_detection",
+        current_samples=[0.2, 0.1, 0.3],
+        baseline_samples=None,
+        noise_budget=0.10,
+    )
+
+    assert result.status == "new"
+    assert result.model_dump()["current_median_seconds"] == 0.2
+    with pytest.raises(ValueError, match="no samples"):
+        compare_benchmark_samples(
+            "x", current_samples=[], baseline_samples=BASELINE, noise_budget=0.1
+        )
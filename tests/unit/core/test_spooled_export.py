@@ -0,0 +1,54 @@
+import csv
+import hashlib
+import io
+
+from app.shared.core.spooled_export import (
+    SpooledCsvArtifact,
+    iter_artifact_chunks,
+    iter_file_chunks,
+    new_spooled_archive,
+)
+
+
+def _reference_csv(rows: list[list[str]]) -> str:
+    out = io.StringIO()
+    writer = csv.writer(out)
+    for row in rows:
+        writer.writerow(row)
+    return out.getvalue()
+
+
+def test_spooled_csv_artifact_matches_in_memory_csv_bytes_and_digest() -> None:
+    rows = [["id", "note"], ["1", 'has "quotes", commas'], ["2", "multi\nline"]]
+    artifact = SpooledCsvArtifact(rows[0])
+    artifact.writerows(rows[1:])
+
+    expected = _reference_csv(rows)
+    assert artifact.read_text() == expected
+    assert artifact.sha256 == hashlib.sha256(expected.encode("utf-8")).hexdigest()
+    assert artifact.size == len(expected.encode("utf-8"))
+    assert artifact.row_count == 2
+
+
+def test_spooled_csv_artifact_rolls_to_disk_and_keeps_appending() -> None:
+    artifact = SpooledCsvArtifact(["id"], max_memory_bytes=64)
+    for index in range(100):
+        artifact.writerow([f"row-{index}"])
+    assert artifact.rolled_to_disk is True
+
+    # Reading back must not reset the append position.
+    first_pass = b"".join(artifact.iter_chunks(chunk_size=7))
+    artifact.writerow(["tail"])
+    assert artifact.read_text() == first_pass.decode("utf-8") + "tail\r\n"
+
+
+def test_iter_helpers_stream_from_start_and_close() -> None:
+    artifact = SpooledCsvArtifact(["id"])
+    artifact.writerow(["1"])
+    assert b"".join(iter_artifact_chunks(artifact, chunk_size=2)) == b"id\r\n1\r\n"
+    assert artifact.fileobj.closed
+
+    archive = new_spooled_archive()
+    archive.write(b"zip-bytes")
+    assert list(iter_file_chunks(archive, chunk_size=4)) == [b"zip-", b"byte", b"s"]
+    assert archive.closed
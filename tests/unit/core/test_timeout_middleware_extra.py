@@ -1,23 +1,13 @@
 import asyncio
 
 import pytest
-from fastapi import FastAPI
-from starlette.requests import Request
-from starlette.responses import Response
+from starlette.responses import Response, StreamingResponse
 
 from app.shared.core.timeout import TimeoutMiddleware
 
 
-@pytest.mark.asyncio
-async def test_timeout_middleware_returns_504_on_timeout():
-    app = FastAPI()
-    middleware = TimeoutMiddleware(app, timeout_seconds=0.001)
-
-    async def call_next(_request: Request) -> Response:
-        await asyncio.sleep(0.01)
-        return Response("ok")
-
-    scope = {
+def _scope() -> dict:
+    return {
         "type": "http",
         "method": "GET",
         "path": "/slow",
@@ -27,7 +17,67 @@ async def test_timeout_middleware_returns_504_on_timeout():
         "scheme": "http",
         "server": ("testserver", 80),
     }
-    request = Request(scope)
-    response = await middleware.dispatch(request, call_next)
 
-    assert response.status_code == 504
+
+async def _call(middleware: TimeoutMiddleware) -> list[dict]:
+    messages: list[dict] = []
+    request_sent = False
+    never_disconnects = asyncio.Event()
+
+    async def receive():
+        nonlocal request_sent
+        if not request_sent:
+            request_sent = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await never_disconnects.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        messages.append(message)
+
+    await middleware(_scope(), receive, send)
+    return messages
+
+
+@pytest.mark.asyncio
+async def test_timeout_middleware_returns_504_on_timeout():
+    async def slow_app(scope, receive, send):
+        await asyncio.sleep(0.01)
+        await Response("ok")(scope, receive, send)
+
+    middleware = TimeoutMiddleware(slow_app, timeout_seconds=0.001)
+
+    messages = await _call(middleware)
+
+    assert messages[0]["status"] == 504
+
+
+@pytest.mark.asyncio
+async def test_timeout_middleware_does_not_cut_off_started_stream():
+    async def slow_body():
+        yield b"head,"
+        await asyncio.sleep(0.03)
+        yield b"tail"
+
+    async def streaming_app(scope, receive, send):
+        await StreamingResponse(slow_body())(scope, receive, send)
+
+    middleware = TimeoutMiddleware(streaming_app, timeout_seconds=0.01)
+
+    messages = await _call(middleware)
+
+    assert messages[0]["status"] == 200
+    body = b"".join(m.get("body", b"") for m in messages[1:])
+    assert body == b"head,tail"
+
+
+@pytest.mark.asyncio
+async def test_timeout_middleware_passes_through_non_http_scope():
+    seen: list[str] = []
+
+    async def app(scope, receive, send):
+        seen.append(scope["type"])
+
+    await TimeoutMiddleware(app, timeout_seconds=1)({"type": "lifespan"}, None, None)
+
+    assert seen == ["lifespan"]
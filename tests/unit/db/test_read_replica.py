@@ -0,0 +1,237 @@
+from __future__ import annotations
+
+import asyncio
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+import app.shared.db.read_replica as read_replica
+from app.models.tenant import Tenant
+from app.shared.db.base import Base
+
+
+def _settings(url: str, **overrides: object) -> SimpleNamespace:
+    base: dict[str, object] = {
+        "DATABASE_READ_REPLICA_URL": url,
+        "DB_READ_REPLICA_MAX_LAG_SECONDS": 5.0,
+        "ALLOW_TEST_DATABASE_URL": False,
+        "DB_USE_NULL_POOL": False,
+        "DB_EXTERNAL_POOLER": False,
+        "DB_SSL_MODE": "disable",
+        "TESTING": True,
+    }
+    base.update(overrides)
+    return SimpleNamespace(**base)
+
+
+@pytest.fixture(autouse=True)
+def _reset_runtime():
+    read_replica.reset_read_replica_runtime()
+    yield
+    read_replica.reset_read_replica_runtime()
+
+
+def _install(runtime: object) -> None:
+    read_replica._read_replica_runtime = runtime  # type: ignore[assignment]
+    read_replica._read_replica_configured = True
+
+
+def _opener(primary: object, opened: list[object] | None = None):
+    @asynccontextmanager
+    async def _open():
+        if opened is not None:
+            opened.append(primary)
+        yield primary
+
+    return _open
+
+
+async def _drain(user: object, primary: object) -> list[object]:
+    return [
+        session async for session in read_replica.get_read_db(user, _opener(primary))
+    ]
+
+
+def test_replica_url_resolution_keeps_tests_off_real_databases() -> None:
+    assert read_replica._resolve_read_replica_url(_settings("")) is None
+    assert (
+        read_replica._resolve_read_replica_url(_settings("postgresql://r/db")) is None
+    )
+    assert (
+        read_replica._resolve_read_replica_url(
+            _settings("postgresql://r/db", ALLOW_TEST_DATABASE_URL=True)
+        )
+        == "postgresql+asyncpg://r/db"
+    )
+    assert read_replica._build_read_replica_runtime(_settings("")) is None
+
+
+@pytest.mark.asyncio
+async def test_get_read_db_serves_tenant_scoped_reads_from_second_engine(
+    tmp_path,
+) -> None:
+    url = f"sqlite+aiosqlite:///{tmp_path / 'replica.sqlite'}"
+    primary_engine = create_async_engine(url)
+    async with primary_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    primary_maker = async_sessionmaker(primary_engine, class_=AsyncSession)
+    tenant_id = uuid4()
+    runtime = read_replica._build_read_replica_runtime(_settings(url))
+    assert runtime is not None
+    _install(runtime)
+    try:
+        async with primary_maker() as primary:
+            primary.add(Tenant(id=tenant_id, name="Replica Tenant", plan="pro"))
+            await primary.commit()
+
+            user = SimpleNamespace(tenant_id=tenant_id)
+            opened: list[object] = []
+            async for session in read_replica.get_read_db(
+                user, _opener(primary, opened)
+            ):
+                assert session is not primary
+                assert session.bind is runtime.engine
+                assert session.info["tenant_id"] == tenant_id
+                assert session.info["rls_context_set"] is True
+                names = (await session.execute(select(Tenant.name))).scalars().all()
+                assert names == ["Replica Tenant"]
+            assert opened == []  # replica reads never check out a primary session
+
+            assert await _drain(SimpleNamespace(tenant_id=None), primary) == [primary]
+    finally:
+        await runtime.engine.dispose()
+        await primary_engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_get_read_db_falls_back_to_primary_when_lagging_or_unconfigured() -> None:
+    primary = object()
+    user = SimpleNamespace(tenant_id=uuid4())
+    _install(None)
+    assert await _drain(user, primary) == [primary]
+
+    replica_maker = AsyncMock()
+    for lag in (30.0, None):
+        monitor = read_replica.ReplicaLagMonitor(
+            AsyncMock(return_value=lag), max_lag_seconds=5.0
+        )
+        _install(
+            SimpleNamespace(
+                engine=None,
+                session_maker=replica_maker,
+                effective_url="",
+                lag_monitor=monitor,
+            )
+        )
+        assert await _drain(user, primary) == [primary]
+    replica_maker.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_lag_monitor_probes_at_most_once_per_interval() -> None:
+    now = [100.0]
+    probe = AsyncMock(side_effect=[1.0, 9.0])
+    monitor = read_replica.ReplicaLagMonitor(
+        probe, max_lag_seconds=5.0, check_interval_seconds=10.0, clock=lambda: now[0]
+    )
+
+    assert await monitor.fallback_reason() is None
+    now[0] += 9.0
+    assert await monitor.fallback_reason() is None
+    assert probe.await_count == 1
+
+    now[0] += 1.0
+    assert await monitor.fallback_reason() == "replica_lag"
+    assert await monitor.lag_seconds() == 9.0
+    assert probe.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_lag_monitor_lets_one_concurrent_caller_probe() -> None:
+    release = asyncio.Event()
+
+    async def _slow_probe() -> float:
+        await release.wait()
+        return 1.0
+
+    probe = AsyncMock(side_effect=_slow_probe)
+    monitor = read_replica.ReplicaLagMonitor(probe, max_lag_seconds=5.0)
+    callers = [asyncio.ensure_future(monitor.fallback_reason()) for _ in range(10)]
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await asyncio.gather(*callers) == [None] * 10
+    assert probe.await_count == 1
+
+
+def _postgres_probe_factory(lag: object):
+    session = AsyncMock()
+    session.bind = SimpleNamespace(dialect=SimpleNamespace(name="postgresql"))
+    session.scalar = AsyncMock(return_value=lag)
+
+    @asynccontextmanager
+    async def _factory():
+        yield session
+
+    return _factory, session
+
+
+@pytest.mark.asyncio
+async def test_probe_treats_a_replica_without_streaming_receiver_as_unavailable(
+    monkeypatch,
+) -> None:
+    monkeypatch.setattr(read_replica, "mark_session_system_context", AsyncMock())
+    disconnected, session = _postgres_probe_factory(None)
+    assert await read_replica.probe_replica_lag(disconnected) is None
+    assert "pg_stat_wal_receiver" in str(session.scalar.await_args.args[0])
+
+    streaming, _ = _postgres_probe_factory(2.5)
+    assert await read_replica.probe_replica_lag(streaming) == 2.5
+
+    monitor = read_replica.ReplicaLagMonitor(
+        lambda: read_replica.probe_replica_lag(disconnected), max_lag_seconds=5.0
+    )
+    assert await monitor.fallback_reason() == "replica_unavailable"
+
+
+@pytest.mark.asyncio
+async def test_probe_reports_zero_lag_off_postgres_and_none_on_errors(tmp_path) -> None:
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'probe.sqlite'}")
+    try:
+        maker = async_sessionmaker(engine, class_=AsyncSession)
+        assert await read_replica.probe_replica_lag(maker) == 0.0
+    finally:
+        await engine.dispose()
+
+    def _broken_factory() -> object:
+        raise OSError("replica down")
+
+    assert await read_replica.probe_replica_lag(_broken_factory) is None
+
+
+@pytest.mark.asyncio
+async def test_primary_session_opener_defers_get_db_until_entered(monkeypatch) -> None:
+    calls: list[object] = []
+    closed: list[bool] = []
+
+    async def _fake_get_db(request):
+        calls.append(request)
+        try:
+            yield "primary-session"
+        finally:
+            closed.append(True)
+
+    monkeypatch.setattr(read_replica, "get_db", _fake_get_db)
+    request = object()
+    open_primary = read_replica.get_primary_session_opener(request)
+    assert calls == []
+
+    async with open_primary() as session:
+        assert session == "primary-session"
+    assert calls == [request]
+    assert closed == [True]
@@ -7,6 +7,7 @@ from uuid import uuid4
 import pytest
 
 import app.shared.db.session as session_mod
+import app.shared.db.statement_cache_ops as statement_cache_ops
 from app.shared.core.exceptions import ValdricsException
 
 
@@ -152,7 +153,12 @@ def test_register_engine_event_listeners_real_target() -> None:
     with patch("app.shared.db.session.event.listen") as mock_listen:
         session_mod._register_engine_event_listeners(engine)  # type: ignore[arg-type]
 
-    assert mock_listen.call_count == 3
+    assert mock_listen.call_count == 4
+    mock_listen.assert_any_call(
+        engine.sync_engine,
+        "handle_error",
+        statement_cache_ops._invalidate_pool_on_stale_statement,
+    )
     mock_listen.assert_any_call(
         engine.sync_engine,
         "before_cursor_execute",
@@ -0,0 +1,97 @@
+import re
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.shared.core.exceptions import ValdricsException
+from app.shared.db.session_rls_ops import (
+    RLSStatementVerdictCache,
+    check_rls_policy,
+    classify_rls_statement,
+)
+
+PATTERN = re.compile(r"\b(tenants|exchange_rates)\b")
+
+
+@pytest.mark.parametrize(
+    ("statement", "requires_context", "statement_type"),
+    [
+        ("SELECT * FROM cost_records WHERE tenant_id = $1", True, "SELECT"),
+        ("  with x as (select 2) select * from x", True, "WITH"),
+        ("BEGIN", False, "BEGIN"),
+        ("SET app.current_tenant_id = 'x'", False, "SET"),
+        ("SELECT 1", False, "SELECT"),
+        ("select pg_is_in_recovery()", False, "SELECT"),
+        ("SELECT * FROM Tenants WHERE id = $1", False, "SELECT"),
+        ("   ", True, ""),
+    ],
+)
+def test_classify_rls_statement_matches_policy_rules(
+    statement: str, requires_context: bool, statement_type: str
+) -> None:
+    verdict = classify_rls_statement(statement, PATTERN)
+
+    assert verdict.requires_context is requires_context
+    assert verdict.statement_type == statement_type
+
+
+def test_verdict_cache_counts_hits_and_evicts_least_recent() -> None:
+    hits, misses = MagicMock(), MagicMock()
+    cache = RLSStatementVerdictCache(
+        PATTERN, max_entries=2, hit_metric=hits, miss_metric=misses
+    )
+
+    cache.classify("SELECT a FROM t1")
+    cache.classify("SELECT a FROM t2")
+    cache.classify("SELECT a FROM t1")
+    cache.classify("SELECT a FROM t3")
+
+    assert len(cache) == 2
+    assert cache.hits == 1
+    assert cache.misses == 3
+    assert cache.hit_ratio == pytest.approx(0.25)
+    assert hits.inc.call_count == 1
+    assert misses.inc.call_count == 3
+
+    # t2 was least recently used and has been evicted.
+    cache.classify("SELECT a FROM t2")
+    assert cache.misses == 4
+
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.hit_ratio == 0.0
+
+
+def test_verdict_cache_skips_oversized_statements() -> None:
+    cache = RLSStatementVerdictCache(PATTERN)
+    statement = "INSERT INTO cost_records VALUES " + ", ".join(["($1)"] * 5000)
+
+    assert cache.classify(statement).requires_context is True
+    assert len(cache) == 0
+
+
+def test_check_rls_policy_with_cache_keeps_connection_checks_per_call() -> None:
+    cache = RLSStatementVerdictCache(PATTERN)
+    settings = SimpleNamespace(TESTING=False, ENFORCE_RLS_IN_TESTS=True)
+    metric = MagicMock()
+    kwargs = dict(
+        statement="SELECT * FROM cost_records",
+        parameters={},
+        settings_obj=settings,
+        rls_exempt_table_pattern=PATTERN,
+        rls_context_missing_metric=metric,
+        rls_metric_recoverable_errors=(RuntimeError,),
+        logger_obj=MagicMock(),
+        statement_verdict_cache=cache,
+    )
+
+    ok_conn = SimpleNamespace(info={"rls_context_set": True})
+    assert check_rls_policy(conn=ok_conn, **kwargs)[0] == "SELECT * FROM cost_records"
+
+    missing_conn = SimpleNamespace(info={"rls_context_set": False})
+    with pytest.raises(ValdricsException):
+        check_rls_policy(conn=missing_conn, **kwargs)
+
+    assert cache.hits == 1
+    metric.labels.assert_called_once_with(statement_type="SELECT")
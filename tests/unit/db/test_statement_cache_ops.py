@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import create_async_engine
+
+import app.shared.db.session as session_mod
+import app.shared.db.statement_cache_ops as cache_ops
+
+
+def _settings(**overrides: object) -> SimpleNamespace:
+    base: dict[str, object] = {
+        "DB_POOLER_MODE": "auto",
+        "DB_EXTERNAL_POOLER": False,
+        "DB_STATEMENT_CACHE_SIZE": 128,
+        "DB_SSL_MODE": "disable",
+    }
+    base.update(overrides)
+    return SimpleNamespace(**base)
+
+
+@pytest.mark.parametrize(
+    ("overrides", "expected"),
+    [
+        ({}, "transaction"),
+        ({"DB_POOLER_MODE": None}, "transaction"),
+        ({"DB_POOLER_MODE": "direct"}, "direct"),
+        ({"DB_POOLER_MODE": " Session ", "DB_EXTERNAL_POOLER": True}, "session"),
+        ({"DB_POOLER_MODE": "pgbouncer"}, "transaction"),
+    ],
+)
+def test_resolve_pooler_mode(overrides: dict[str, object], expected: str) -> None:
+    assert cache_ops.resolve_pooler_mode(_settings(**overrides)) == expected
+
+
+@pytest.mark.parametrize("port", [5432, 6432, 6543])
+def test_auto_mode_keeps_statement_cache_disabled_on_any_port(port: int) -> None:
+    url = f"postgresql+asyncpg://h:{port}/db"
+    assert session_mod._build_connect_args(_settings(), url) == {
+        "statement_cache_size": 0,
+        "ssl": False,
+    }
+
+
+def test_connect_args_enable_bounded_cache_only_for_explicit_modes() -> None:
+    direct = session_mod._build_connect_args(
+        _settings(DB_POOLER_MODE="direct"), "postgresql+asyncpg://h:5432/db"
+    )
+    assert direct == {
+        "statement_cache_size": 128,
+        "prepared_statement_cache_size": 128,
+        "max_cached_statement_lifetime": cache_ops.STATEMENT_CACHE_MAX_LIFETIME_SECONDS,
+        "ssl": False,
+    }
+    defaulted = cache_ops.statement_cache_connect_args(
+        SimpleNamespace(DB_POOLER_MODE="session"), "postgresql+asyncpg://h/db"
+    )
+    assert defaulted["statement_cache_size"] == cache_ops.DEFAULT_STATEMENT_CACHE_SIZE
+    assert cache_ops.statement_cache_connect_args(_settings(), "sqlite://") == {}
+
+
+def test_stale_statement_errors_invalidate_the_pool() -> None:
+    class InvalidCachedStatementError(Exception):
+        pass
+
+    stale = DBAPIError("SELECT 1", {}, InvalidCachedStatementError("plan changed"))
+    assert cache_ops.is_stale_statement_error(stale) is True
+    assert cache_ops.is_stale_statement_error(
+        RuntimeError("cache lookup failed for type 81234")
+    )
+    assert cache_ops.is_stale_statement_error(ValueError("syntax error")) is False
+
+    context = SimpleNamespace(original_exception=stale.orig, is_disconnect=False)
+    cache_ops._invalidate_pool_on_stale_statement(context)  # type: ignore[arg-type]
+    assert context.is_disconnect is True
+
+    other = SimpleNamespace(original_exception=ValueError("boom"), is_disconnect=False)
+    cache_ops._invalidate_pool_on_stale_statement(other)  # type: ignore[arg-type]
+    assert other.is_disconnect is False
+
+
+def test_engine_listeners_include_statement_cache_invalidation() -> None:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    session_mod._register_engine_event_listeners(engine)
+    assert event.contains(
+        engine.sync_engine,
+        "handle_error",
+        cache_ops._invalidate_pool_on_stale_statement,
+    )
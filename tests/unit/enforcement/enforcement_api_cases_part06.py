@@ -246,8 +246,8 @@ def test_export_limit_helper_fallback_branches() -> None:
         "app.modules.enforcement.api.v1.exports.get_settings",
         return_value=SimpleNamespace(
             ENFORCEMENT_EXPORT_MAX_DAYS=0,
-            ENFORCEMENT_EXPORT_MAX_ROWS=999999,
+            ENFORCEMENT_EXPORT_MAX_ROWS=9_999_999,
         ),
     ):
         assert _export_max_days() == 1
-        assert _export_max_rows() == 50000
+        assert _export_max_rows() == 1_000_000
@@ -314,7 +314,7 @@ async def test_build_export_bundle_rejects_max_rows_upper_bound_and_invalid_wind
             tenant_id=tenant.id,
             window_start=now - timedelta(days=1),
             window_end=now + timedelta(days=1),
-            max_rows=50001,
+            max_rows=1_000_001,
         )
     assert max_rows_exc.value.status_code == 422
     assert "max_rows must be <=" in str(max_rows_exc.value.detail)
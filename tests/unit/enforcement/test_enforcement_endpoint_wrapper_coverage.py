@@ -51,6 +51,7 @@ from app.modules.enforcement.api.v1.schemas import (
 from app.modules.enforcement.domain.policy_document import PolicyDocument
 from app.shared.core.auth import CurrentUser
 from app.shared.core.pricing import PricingTier
+from app.shared.core.spooled_export import SpooledCsvArtifact
 
 
 def _request(method: str = "POST") -> Request:
@@ -526,6 +527,10 @@ async def test_policy_budget_credit_endpoint_wrappers_cover_response_paths(monke
 @pytest.mark.asyncio
 async def test_exports_endpoint_wrappers_cover_limits_and_archive_contract(monkeypatch) -> None:
     now = datetime.now(timezone.utc)
+    decisions_artifact = SpooledCsvArtifact(["decision_id"])
+    decisions_artifact.writerow(["1"])
+    approvals_artifact = SpooledCsvArtifact(["approval_id"])
+    approvals_artifact.writerow(["1"])
     bundle = SimpleNamespace(
         generated_at=now,
         window_start=now,
@@ -541,8 +546,9 @@ async def test_exports_endpoint_wrappers_cover_limits_and_archive_contract(monke
         computed_context_lineage_sha256="1" * 64,
         computed_context_lineage=[{"decision_id": str(uuid4())}],
         parity_ok=True,
-        decisions_csv="decision_id\n1\n",
-        approvals_csv="approval_id\n1\n",
+        decisions_artifact=decisions_artifact,
+        approvals_artifact=approvals_artifact,
+        close=lambda: None,
     )
 
     class _SignedManifest:
@@ -592,11 +598,11 @@ async def test_exports_endpoint_wrappers_cover_limits_and_archive_contract(monke
         "get_settings",
         lambda: SimpleNamespace(
             ENFORCEMENT_EXPORT_MAX_DAYS=100_000,
-            ENFORCEMENT_EXPORT_MAX_ROWS=100_000,
+            ENFORCEMENT_EXPORT_MAX_ROWS=5_000_000,
         ),
     )
     assert exports_api._export_max_days() == 3650
-    assert exports_api._export_max_rows() == 50000
+    assert exports_api._export_max_rows() == 1_000_000
 
     user = _actor(UserRole.ADMIN)
     parity = await exports_api.get_export_parity(
@@ -619,7 +625,10 @@ async def test_exports_endpoint_wrappers_cover_limits_and_archive_contract(monke
     assert archive_response.media_type == "application/zip"
     assert "attachment; filename=" in archive_response.headers["Content-Disposition"]
 
-    with zipfile.ZipFile(io.BytesIO(archive_response.body), mode="r") as zf:
+    archive_body = b"".join(
+        [chunk async for chunk in archive_response.body_iterator]
+    )
+    with zipfile.ZipFile(io.BytesIO(archive_body), mode="r") as zf:
         names = set(zf.namelist())
         assert {
             "manifest.json",
@@ -631,6 +640,7 @@ async def test_exports_endpoint_wrappers_cover_limits_and_archive_contract(monke
         }.issubset(names)
         manifest = json.loads(zf.read("manifest.json").decode("utf-8"))
         assert manifest["signature_key_id"] == "kid-1"
+        assert zf.read("decisions.csv").decode("utf-8") == "decision_id\r\n1\r\n"
 
     assert counter.calls[-1]["artifact"] == "archive"
 
@@ -0,0 +1,266 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.models.enforcement import (
+    EnforcementDecision,
+    EnforcementDecisionType,
+    EnforcementMode,
+    EnforcementSource,
+)
+from app.models.tenant import Tenant
+from app.modules.enforcement.domain.service import EnforcementService, GateInput
+from app.modules.enforcement.domain.service_runtime_gate_lock_ops import (
+    GateLockPlan,
+    acquire_gate_evaluation_lock,
+    acquire_gate_reservation_lock,
+    advisory_lock_key,
+    build_gate_lock_plan,
+    reservation_lock_key,
+)
+
+
+async def _seed_budgets(db: AsyncSession, *scopes: str) -> Tenant:
+    tenant = Tenant(id=uuid4(), name="Gate Lock Tenant", plan="pro")
+    db.add(tenant)
+    await db.commit()
+    service = EnforcementService(db)
+    policy = await service.get_or_create_policy(tenant.id)
+    policy.terraform_mode = EnforcementMode.HARD
+    policy.terraform_mode_nonprod = EnforcementMode.HARD
+    await db.commit()
+    for scope_key in scopes:
+        await service.upsert_budget(
+            tenant_id=tenant.id,
+            actor_id=uuid4(),
+            scope_key=scope_key,
+            monthly_limit_usd=Decimal("100"),
+            active=True,
+        )
+    return tenant
+
+
+def _lock_service(db):
+    return SimpleNamespace(db=db, _gate_lock_timeout_seconds=lambda: 1.0)
+
+
+def _session_mock(dialect: str = "postgresql") -> MagicMock:
+    db = MagicMock()
+    db.bind.dialect.name = dialect
+    db.execute = AsyncMock(return_value=MagicMock(rowcount=0))
+    return db
+
+
+def _compiled(db: MagicMock) -> list[str]:
+    return [
+        str(
+            call.args[0].compile(
+                dialect=postgresql.dialect(),
+                compile_kwargs={"literal_binds": True},
+            )
+        )
+        for call in db.execute.await_args_list
+    ]
+
+
+def _gate_input(project_id: str, idx: int, **overrides) -> GateInput:
+    values = dict(
+        project_id=project_id,
+        environment="nonprod",
+        action="terraform.apply",
+        resource_reference=f"module.ec2.aws_instance.{project_id}-{idx}",
+        estimated_monthly_delta_usd=Decimal("30"),
+        estimated_hourly_delta_usd=Decimal("0.04"),
+        metadata={"resource_type": "aws_instance", "idx": idx},
+        idempotency_key=f"gate-lock-{project_id}-{idx}",
+    )
+    values.update(overrides)
+    return GateInput(**values)
+
+
+def test_gate_lock_plan_depends_only_on_the_scope() -> None:
+    tenant_id = uuid4()
+
+    scoped = build_gate_lock_plan(tenant_id=tenant_id, scope_key=" Team-A ")
+    assert not scoped.tenant_exclusive
+    assert scoped.project_scope == "team-a"
+    assert scoped.tenant_lock_key == advisory_lock_key(str(tenant_id))
+    assert scoped.scope_lock_key == advisory_lock_key(str(tenant_id), "team-a")
+    assert build_gate_lock_plan(tenant_id=tenant_id, scope_key="").project_scope == (
+        "default"
+    )
+
+    unscoped = build_gate_lock_plan(tenant_id=tenant_id, scope_key=None)
+    assert unscoped.tenant_exclusive
+
+
+def test_advisory_lock_keys_are_stable_signed_bigints() -> None:
+    tenant_id = uuid4()
+    key = advisory_lock_key(str(tenant_id), "team-a")
+    assert key == advisory_lock_key(str(tenant_id), "team-a")
+    assert key != advisory_lock_key(str(tenant_id), "team-b")
+    assert -(2**63) <= key < 2**63
+    assert GateLockPlan(tenant_lock_key=key).tenant_exclusive
+    # A project literally named "reservations" keeps its own key.
+    assert reservation_lock_key(tenant_id) != advisory_lock_key(
+        str(tenant_id), "reservations"
+    )
+    assert reservation_lock_key(tenant_id) != reservation_lock_key(uuid4())
+
+
+@pytest.mark.asyncio
+async def test_postgres_gate_lock_takes_shared_tenant_and_exclusive_scope_locks() -> (
+    None
+):
+    db = _session_mock()
+    policy = SimpleNamespace(id=uuid4(), tenant_id=uuid4())
+
+    await acquire_gate_evaluation_lock(
+        _lock_service(db),
+        policy=policy,
+        source=EnforcementSource.TERRAFORM,
+        scope_key="team-a",
+    )
+
+    sql = _compiled(db)
+    tenant_key = advisory_lock_key(str(policy.tenant_id))
+    scope_key = advisory_lock_key(str(policy.tenant_id), "team-a")
+    # No read happens before the locks; budgets do not change the plan.
+    assert len(sql) == 2
+    assert f"pg_advisory_xact_lock_shared({tenant_key})" in sql[0]
+    assert f"pg_advisory_xact_lock({scope_key})" in sql[1]
+
+
+@pytest.mark.asyncio
+async def test_reservation_lock_is_postgres_only() -> None:
+    tenant_id = uuid4()
+    pg_db = _session_mock()
+
+    await acquire_gate_reservation_lock(
+        _lock_service(pg_db), tenant_id=tenant_id, source=EnforcementSource.TERRAFORM
+    )
+    assert _compiled(pg_db) == [
+        f"SELECT pg_advisory_xact_lock({reservation_lock_key(tenant_id)}) AS "
+        "pg_advisory_xact_lock_1"
+    ]
+
+    sqlite_db = _session_mock("sqlite")
+    await acquire_gate_reservation_lock(
+        _lock_service(sqlite_db),
+        tenant_id=tenant_id,
+        source=EnforcementSource.TERRAFORM,
+    )
+    sqlite_db.execute.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_gate_reads_reservation_total_only_under_the_reservation_lock(
+    db: AsyncSession, monkeypatch
+) -> None:
+    tenant = await _seed_budgets(db, "team-a")
+    service = EnforcementService(db)
+    events: list[str] = []
+    read_totals = service._get_reserved_totals
+
+    async def reservation_lock(**kwargs) -> None:
+        events.append("reservation_lock")
+
+    async def reserved_totals(**kwargs):
+        events.append("reserved_totals")
+        return await read_totals(**kwargs)
+
+    monkeypatch.setattr(service, "_acquire_gate_reservation_lock", reservation_lock)
+    monkeypatch.setattr(service, "_get_reserved_totals", reserved_totals)
+
+    await service.evaluate_gate(
+        tenant_id=tenant.id,
+        actor_id=uuid4(),
+        source=EnforcementSource.TERRAFORM,
+        gate_input=_gate_input("team-a", 0),
+    )
+    assert events == ["reservation_lock", "reserved_totals"]
+
+    events.clear()
+    await service.evaluate_gate(
+        tenant_id=tenant.id,
+        actor_id=uuid4(),
+        source=EnforcementSource.TERRAFORM,
+        gate_input=_gate_input("team-a", 1, dry_run=True),
+    )
+    # Dry runs reserve nothing, so they never wait on other gates.
+    assert events == ["reserved_totals"]
+
+
+@pytest.mark.postgres
+@pytest.mark.asyncio
+async def test_postgres_gates_of_other_projects_run_in_parallel_without_overspend(
+    postgres_engine,
+) -> None:
+    projects = [f"team-{idx}" for idx in range(8)]
+    sessions = async_sessionmaker(
+        postgres_engine, class_=AsyncSession, expire_on_commit=False
+    )
+    async with sessions() as setup:
+        tenant = await _seed_budgets(setup, *projects)
+        policy = await EnforcementService(setup).get_or_create_policy(tenant.id)
+    actor_id = uuid4()
+
+    async def evaluate(project_id: str, idx: int) -> EnforcementDecisionType:
+        async with sessions() as session:
+            result = await EnforcementService(session).evaluate_gate(
+                tenant_id=tenant.id,
+                actor_id=actor_id,
+                source=EnforcementSource.TERRAFORM,
+                gate_input=_gate_input(project_id, idx),
+            )
+            return result.decision.decision
+
+    # A gate still holding team-0's lock does not hold up team-1.
+    async with sessions() as holder:
+        await acquire_gate_evaluation_lock(
+            EnforcementService(holder),
+            policy=policy,
+            source=EnforcementSource.TERRAFORM,
+            scope_key=projects[0],
+        )
+        started = time.perf_counter()
+        await asyncio.wait_for(evaluate(projects[1], 99), timeout=5)
+        assert time.perf_counter() - started < 1.0
+        await holder.rollback()
+
+    decisions = await asyncio.gather(
+        *(evaluate(project_id, idx) for idx in range(4) for project_id in projects)
+    )
+
+    async with sessions() as check:
+        reserved = Decimal(
+            str(
+                (
+                    await check.execute(
+                        select(
+                            func.coalesce(
+                                func.sum(EnforcementDecision.reserved_allocation_usd),
+                                0,
+                            )
+                        )
+                        .where(EnforcementDecision.tenant_id == tenant.id)
+                        .where(EnforcementDecision.reservation_active.is_(True))
+                    )
+                ).scalar_one()
+            )
+        )
+    # Every allocation is net of the tenant-wide total: 30 USD gates fit three
+    # times into 100 USD (one of them the team-1 gate above), never more.
+    assert reserved <= Decimal("100")
+    assert decisions.count(EnforcementDecisionType.ALLOW) == 2
+    assert reserved == Decimal("90")
@@ -343,6 +343,76 @@ async def test_concurrency_distinct_keys_do_not_oversubscribe_budget_reservation
     assert decisions.count(EnforcementDecisionType.DENY) == 1
 
 
+@pytest.mark.asyncio
+async def test_concurrency_budget_scopes_share_tenant_allocation_headroom(
+    db: AsyncSession,
+    async_engine,
+) -> None:
+    tenant = await _seed_tenant(db)
+    actor_id = uuid4()
+    seed_service = EnforcementService(db)
+
+    policy = await seed_service.get_or_create_policy(tenant.id)
+    policy.terraform_mode = EnforcementMode.HARD
+    policy.terraform_mode_nonprod = EnforcementMode.HARD
+    await db.commit()
+
+    for scope_key in ("team-a", "team-b"):
+        await seed_service.upsert_budget(
+            tenant_id=tenant.id,
+            actor_id=actor_id,
+            scope_key=scope_key,
+            monthly_limit_usd=Decimal("100"),
+            active=True,
+        )
+
+    session_maker = async_sessionmaker(
+        bind=async_engine,
+        class_=AsyncSession,
+        expire_on_commit=False,
+    )
+
+    async def invoke_once(scope_key: str, idx: int) -> EnforcementDecisionType:
+        async with session_maker() as session:
+            service = EnforcementService(session)
+            result = await service.evaluate_gate(
+                tenant_id=tenant.id,
+                actor_id=actor_id,
+                source=EnforcementSource.TERRAFORM,
+                gate_input=GateInput(
+                    project_id=scope_key,
+                    environment="nonprod",
+                    action="terraform.apply",
+                    resource_reference=f"module.ec2.aws_instance.{scope_key}-{idx}",
+                    estimated_monthly_delta_usd=Decimal("60"),
+                    estimated_hourly_delta_usd=Decimal("0.08"),
+                    metadata={"resource_type": "aws_instance", "idx": idx},
+                    idempotency_key=f"scoped-{scope_key}-{idx}",
+                ),
+            )
+            return result.decision.decision
+
+    scopes = ("team-a", "team-a", "team-b", "team-b")
+    decisions = await asyncio.gather(
+        *(invoke_once(scope_key, idx) for idx, scope_key in enumerate(scopes))
+    )
+
+    # Each allocation's headroom is net of every active reservation of the
+    # tenant, so only one 60 USD gate fits even though the scopes differ.
+    assert decisions.count(EnforcementDecisionType.ALLOW) == 1
+    assert decisions.count(EnforcementDecisionType.DENY) == 3
+    reserved = (
+        await db.execute(
+            select(
+                func.coalesce(func.sum(EnforcementDecision.reserved_allocation_usd), 0)
+            )
+            .where(EnforcementDecision.tenant_id == tenant.id)
+            .where(EnforcementDecision.reservation_active.is_(True))
+        )
+    ).scalar_one()
+    assert Decimal(str(reserved)) <= Decimal("100.0000")
+
+
 @pytest.mark.asyncio
 async def test_concurrency_reconcile_same_idempotency_key_settles_credit_once(
     db: AsyncSession,
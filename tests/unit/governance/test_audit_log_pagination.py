@@ -0,0 +1,119 @@
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import select
+
+from app.modules.governance.domain.security.audit_log import AuditEventType, AuditLog
+from app.modules.governance.domain.security.audit_log_pagination import (
+    InvalidAuditLogCursorError,
+    apply_audit_log_keyset,
+    decode_audit_log_cursor,
+    encode_audit_log_cursor,
+    fetch_audit_log_export_page,
+    iter_audit_log_export_pages,
+    next_audit_log_cursor,
+    render_audit_log_csv,
+)
+
+
+def test_cursor_round_trip_and_order_binding() -> None:
+    ts = datetime(2026, 1, 1, 12, 30, tzinfo=timezone.utc)
+    log_id = uuid4()
+    token = encode_audit_log_cursor(ts, log_id, order="desc")
+
+    assert "=" not in token
+    assert decode_audit_log_cursor(token, order="desc") == (ts, log_id)
+    with pytest.raises(InvalidAuditLogCursorError):
+        decode_audit_log_cursor(token, order="asc")
+
+
+@pytest.mark.parametrize("token", ["", "not-base64!", "bnVsbA", "e30"])
+def test_decode_rejects_malformed_cursors(token: str) -> None:
+    with pytest.raises(InvalidAuditLogCursorError):
+        decode_audit_log_cursor(token, order="desc")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("order", ["desc", "asc"])
+async def test_keyset_pages_cover_every_row_once_with_timestamp_ties(
+    db, test_tenant, order
+) -> None:
+    base = datetime(2026, 1, 1)
+    for index in range(11):
+        db.add(
+            AuditLog(
+                tenant_id=test_tenant.id,
+                event_type=AuditEventType.SETTINGS_UPDATED.value,
+                # Pairs of rows share a timestamp so the id tiebreaker matters.
+                event_timestamp=base + timedelta(minutes=index // 2),
+                actor_email=f"user{index}@valdrics.io",
+                success=True,
+            )
+        )
+    await db.commit()
+
+    base_query = select(AuditLog).where(AuditLog.tenant_id == test_tenant.id)
+    seen: list[tuple[datetime, str]] = []
+    cursor = None
+    for _ in range(10):
+        after = decode_audit_log_cursor(cursor, order=order) if cursor else None
+        rows = list(
+            (
+                await db.execute(
+                    apply_audit_log_keyset(base_query, order=order, after=after).limit(
+                        4
+                    )
+                )
+            )
+            .scalars()
+            .all()
+        )
+        seen.extend((row.event_timestamp, str(row.id)) for row in rows[:3])
+        cursor = next_audit_log_cursor(rows, limit=3, order=order)
+        if cursor is None:
+            break
+
+    assert len(seen) == 11
+    assert len(set(seen)) == 11
+    assert seen == sorted(seen, reverse=order == "desc")
+
+
+@pytest.mark.asyncio
+async def test_export_pages_stop_after_the_first_short_page(db, test_tenant) -> None:
+    base = datetime(2026, 1, 1)
+    for index in range(5):
+        db.add(
+            AuditLog(
+                tenant_id=test_tenant.id,
+                event_type=AuditEventType.SETTINGS_UPDATED.value,
+                event_timestamp=base + timedelta(minutes=index),
+                actor_email=f"=user{index}@valdrics.io",
+                success=True,
+            )
+        )
+    await db.commit()
+
+    base_query = select(AuditLog).where(AuditLog.tenant_id == test_tenant.id)
+    first_page = await fetch_audit_log_export_page(db, base_query, page_size=2)
+    later_pages = [
+        page
+        async for page in iter_audit_log_export_pages(
+            db, base_query, first_page, page_size=2
+        )
+    ]
+
+    assert [len(page) for page in [first_page, *later_pages]] == [2, 2, 1]
+    timestamps = [
+        row.event_timestamp for page in [first_page, *later_pages] for row in page
+    ]
+    assert timestamps == sorted(timestamps, reverse=True)
+
+    csv_text = render_audit_log_csv(
+        first_page, lambda value: f"'{value}", include_header=True
+    )
+    lines = csv_text.strip().splitlines()
+    assert lines[0].startswith("id,event_type,event_timestamp")
+    assert len(lines) == 3
+    assert "'=user4@valdrics.io" in lines[1]
+    assert render_audit_log_csv([], str) == ""
@@ -0,0 +1,254 @@
+import asyncio
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import event, func, select
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.models.tenant import Tenant
+from app.modules.governance.domain.security.audit_log import (
+    AuditEventType,
+    AuditLog,
+    AuditLogger,
+)
+from app.modules.governance.domain.security.audit_log_writer import (
+    AuditLogBatchWriteError,
+    AuditLogBatcher,
+    pending_audit_entries,
+)
+
+
+def _capture_inserts(engine) -> list[tuple[str, int]]:
+    inserts: list[tuple[str, int]] = []
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("INSERT INTO AUDIT_LOGS"):
+            rows = len(parameters) if executemany else 1
+            inserts.append((statement, rows))
+
+    return inserts
+
+
+async def _tenant(db: AsyncSession) -> Tenant:
+    tenant = Tenant(id=uuid4(), name="Audit Writer Tenant", plan="pro")
+    db.add(tenant)
+    await db.flush()
+    return tenant
+
+
+@pytest.mark.asyncio
+async def test_unit_of_work_events_are_written_in_one_insert_at_commit(
+    db_session, async_engine
+) -> None:
+    tenant = await _tenant(db_session)
+    inserts = _capture_inserts(async_engine)
+    audit = AuditLogger(db_session, tenant.id)
+
+    entries = [
+        await audit.log(
+            event_type=AuditEventType.RESOURCE_UPDATE,
+            resource_id=f"res-{idx}",
+            actor_email="ops@example.com",
+            details={"api_key": "secret", "idx": idx},
+        )
+        for idx in range(25)
+    ]
+    assert pending_audit_entries(db_session) == 25
+    assert inserts == []
+    await db_session.commit()
+
+    assert pending_audit_entries(db_session) == 0
+    assert sum(rows for _, rows in inserts) == 25
+    assert len({statement for statement, _ in inserts}) == 1
+    stored = (
+        (
+            await db_session.execute(
+                select(AuditLog).order_by(
+                    AuditLog.event_timestamp, AuditLog.resource_id
+                )
+            )
+        )
+        .scalars()
+        .all()
+    )
+    assert [row.id for row in stored] == [entry.id for entry in entries]
+    assert stored[0].actor_email == "ops@example.com"
+    assert stored[0].details == {"api_key": "***REDACTED***", "idx": 0}
+
+
+@pytest.mark.asyncio
+async def test_buffered_events_are_visible_to_reads_and_dropped_on_rollback(
+    db_session,
+) -> None:
+    tenant = await _tenant(db_session)
+    await db_session.commit()
+    audit = AuditLogger(db_session, tenant.id)
+
+    await audit.log(event_type=AuditEventType.SETTINGS_UPDATED)
+    await audit.log(event_type=AuditEventType.SETTINGS_UPDATED)
+    count = select(func.count()).select_from(AuditLog)
+    assert await db_session.scalar(count) == 2
+
+    await audit.log(event_type=AuditEventType.SETTINGS_UPDATED)
+    await db_session.rollback()
+    assert pending_audit_entries(db_session) == 0
+    assert await db_session.scalar(count) == 0
+
+    await audit.log(event_type=AuditEventType.SETTINGS_UPDATED)
+    assert await audit.flush() == 1
+    assert await audit.flush() == 0
+
+
+@pytest.mark.asyncio
+async def test_background_batcher_writes_bounded_fifo_batches(
+    db_session, async_engine
+) -> None:
+    tenant = await _tenant(db_session)
+    await db_session.commit()
+    inserts = _capture_inserts(async_engine)
+    session_factory = async_sessionmaker(
+        async_engine, class_=AsyncSession, expire_on_commit=False
+    )
+    batcher = AuditLogBatcher(
+        session_factory, max_pending=8, batch_size=5, flush_interval_seconds=0.01
+    )
+    # Before start the batcher refuses entries and the logger writes inline.
+    with pytest.raises(AuditLogBatchWriteError):
+        await batcher.submit(object())
+    early = await AuditLogger(db_session, tenant.id, batcher=batcher).log(
+        event_type=AuditEventType.SYSTEM_MAINTENANCE
+    )
+    assert pending_audit_entries(db_session) == 1
+
+    batcher.start()
+    audit = AuditLogger(db_session, tenant.id, batcher=batcher)
+    entries = await asyncio.gather(
+        *(
+            audit.log(event_type=AuditEventType.SYSTEM_MAINTENANCE, resource_id=str(i))
+            for i in range(12)
+        )
+    )
+    await batcher.stop()
+
+    assert batcher.written == 12 and batcher.failed_entries == []
+    assert all(rows <= 5 for _, rows in inserts)
+    stored = (
+        (
+            await db_session.execute(
+                select(AuditLog.id).where(AuditLog.tenant_id == tenant.id)
+            )
+        )
+        .scalars()
+        .all()
+    )
+    assert set(stored) == {entry.id for entry in [early, *entries]}
+
+
+@pytest.mark.asyncio
+async def test_background_batcher_retries_then_fails_loudly(
+    db_session, async_engine
+) -> None:
+    tenant = await _tenant(db_session)
+    await db_session.commit()
+    session_factory = async_sessionmaker(
+        async_engine, class_=AsyncSession, expire_on_commit=False
+    )
+    failures = {"remaining": 1}
+
+    async def flaky_set_tenant(session: AsyncSession, tenant_id) -> None:
+        if failures["remaining"] > 0:
+            failures["remaining"] -= 1
+            raise OperationalError("INSERT", {}, Exception("connection reset"))
+
+    batcher = AuditLogBatcher(
+        session_factory,
+        batch_size=5,
+        flush_interval_seconds=0.01,
+        max_write_attempts=2,
+        retry_backoff_seconds=0,
+        set_tenant_fn=flaky_set_tenant,
+    )
+    batcher.start()
+    audit = AuditLogger(db_session, tenant.id, batcher=batcher)
+    retried = await audit.log(event_type=AuditEventType.SYSTEM_MAINTENANCE)
+    await batcher.stop()
+    assert batcher.written == 1 and batcher.failure is None
+
+    # Every attempt fails: the events are kept, not dropped, and later
+    # events are written through the caller's own session.
+    failures["remaining"] = 10
+    batcher.start()
+    lost = await audit.log(event_type=AuditEventType.SYSTEM_MAINTENANCE)
+    with pytest.raises(AuditLogBatchWriteError):
+        await batcher.stop()
+    assert batcher.failed_entries == [lost]
+
+    inline = await audit.log(event_type=AuditEventType.SYSTEM_MAINTENANCE)
+    assert pending_audit_entries(db_session) == 1
+    await db_session.commit()
+    stored = set(
+        (
+            await db_session.execute(
+                select(AuditLog.id).where(AuditLog.tenant_id == tenant.id)
+            )
+        ).scalars()
+    )
+    assert stored == {retried.id, inline.id}
+
+
+@pytest.mark.asyncio
+async def test_background_batcher_crash_keeps_queued_entries_and_never_hangs(
+    db_session, async_engine
+) -> None:
+    tenant = await _tenant(db_session)
+    await db_session.commit()
+    session_factory = async_sessionmaker(
+        async_engine, class_=AsyncSession, expire_on_commit=False
+    )
+    writing = asyncio.Event()
+    crash = asyncio.Event()
+
+    async def crashing_set_tenant(session: AsyncSession, tenant_id) -> None:
+        writing.set()
+        await crash.wait()
+        raise KeyError("tenant context missing")
+
+    batcher = AuditLogBatcher(
+        session_factory,
+        batch_size=1,
+        flush_interval_seconds=0,
+        set_tenant_fn=crashing_set_tenant,
+    )
+    batcher.start()
+    audit = AuditLogger(db_session, tenant.id, batcher=batcher)
+    first = await audit.log(event_type=AuditEventType.SYSTEM_MAINTENANCE)
+    await asyncio.wait_for(writing.wait(), timeout=1)
+    queued = [
+        await audit.log(event_type=AuditEventType.SYSTEM_MAINTENANCE) for _ in range(2)
+    ]
+    # An error outside the retried set kills the consumer mid-batch.
+    crash.set()
+    for _ in range(100):
+        if not batcher.running:
+            break
+        await asyncio.sleep(0.01)
+    assert isinstance(batcher.failure, KeyError)
+    assert batcher.failed_entries == [first, *queued]
+
+    inline = await audit.log(event_type=AuditEventType.SYSTEM_MAINTENANCE)
+    assert pending_audit_entries(db_session) == 1
+    with pytest.raises(AuditLogBatchWriteError):
+        await asyncio.wait_for(batcher.stop(), timeout=1)
+    await db_session.commit()
+    stored = (
+        (
+            await db_session.execute(
+                select(AuditLog.id).where(AuditLog.tenant_id == tenant.id)
+            )
+        )
+        .scalars()
+        .all()
+    )
+    assert stored == [inline.id]
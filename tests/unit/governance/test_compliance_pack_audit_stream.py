@@ -0,0 +1,57 @@
+import csv
+import hashlib
+import io
+import zipfile
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.modules.governance.domain.security.audit_log import AuditEventType, AuditLog
+from app.modules.governance.domain.security.compliance_pack_audit_stream import (
+    AUDIT_LOG_CSV_COLUMNS,
+    AUDIT_LOG_CSV_PATH,
+    stream_audit_logs_csv,
+)
+
+
+@pytest.mark.asyncio
+async def test_stream_audit_logs_csv_exports_every_row_with_digest(
+    db, test_tenant
+) -> None:
+    base = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    for index in range(25):
+        db.add(
+            AuditLog(
+                tenant_id=test_tenant.id,
+                event_type=AuditEventType.SETTINGS_UPDATED.value,
+                event_timestamp=base + timedelta(minutes=index),
+                actor_email=f"user{index}@valdrics.io",
+                success=True,
+            )
+        )
+    await db.commit()
+
+    bundle = io.BytesIO()
+    with zipfile.ZipFile(bundle, mode="w", compression=zipfile.ZIP_DEFLATED) as zf:
+        info = await stream_audit_logs_csv(
+            zf=zf,
+            db=db,
+            tenant_id=test_tenant.id,
+            start_date=base + timedelta(minutes=5),
+            end_date=None,
+            sanitize_csv_cell=str,
+            batch_size=4,
+        )
+
+    with zipfile.ZipFile(io.BytesIO(bundle.getvalue())) as zf:
+        raw = zf.read(AUDIT_LOG_CSV_PATH)
+
+    rows = list(csv.reader(io.StringIO(raw.decode("utf-8"))))
+    assert tuple(rows[0]) == AUDIT_LOG_CSV_COLUMNS
+    assert len(rows) == 21
+    # Newest first, mirroring the audit log API ordering.
+    assert rows[1][3] == "user24@valdrics.io"
+    assert rows[-1][3] == "user5@valdrics.io"
+    assert info["rows_written"] == 20
+    assert info["bytes"] == len(raw)
+    assert info["sha256"] == hashlib.sha256(raw).hexdigest()
@@ -13,10 +13,12 @@ from app.modules.governance.domain.security.compliance_pack_contracts import (
     CompliancePackActor,
 )
 from app.modules.governance.domain.security.compliance_pack_bundle_exports import (
-    build_manifest,
     run_focus_export,
     write_core_artifacts,
 )
+from app.modules.governance.domain.security.compliance_pack_manifest import (
+    build_manifest,
+)
 
 
 def test_build_manifest_tracks_counts_and_window() -> None:
@@ -52,9 +54,17 @@ def test_build_manifest_tracks_counts_and_window() -> None:
         carbon_assurance_evidence=[],
         carbon_factor_sets=[{"set": 1}],
         carbon_factor_update_logs=[{"log": 1}],
+        snapshot_at=datetime(2026, 3, 4, 23, 59, tzinfo=timezone.utc),
+        collector_concurrency=4,
+        collector_timings_ms={"carbon_factors": 2.5, "settings": 1.25},
     )
 
     assert manifest["run_id"] == "run-1"
+    assert manifest["evidence_collection"] == {
+        "snapshot_at": "2026-03-04T23:59:00+00:00",
+        "concurrency": 4,
+        "collector_timings_ms": {"carbon_factors": 2.5, "settings": 1.25},
+    }
     assert manifest["window"]["start_date"] == "2026-02-01T00:00:00+00:00"
     assert manifest["leadership_kpis"]["count"] == 1
     assert manifest["quarterly_commercial_proof_reports"]["count"] == 2
@@ -0,0 +1,108 @@
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+import pytest
+
+from app.modules.governance.domain.security.audit_log import AuditEventType, AuditLog
+from app.modules.governance.domain.security.compliance_pack_collectors import (
+    PAYLOAD_EVIDENCE_SPECS,
+    EvidenceCollector,
+    build_evidence_collectors,
+    evidence_json_payloads,
+    manifest_evidence_kwargs,
+    run_evidence_collectors,
+    snapshot_session_opener,
+)
+
+
+@asynccontextmanager
+async def _no_session():
+    yield None
+
+
+@pytest.mark.asyncio
+async def test_run_evidence_collectors_bounds_parallelism_and_times_each() -> None:
+    in_flight = 0
+    peak = 0
+
+    async def _collect(_session: Any) -> str:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return "ok"
+
+    collectors = [EvidenceCollector(f"c{index:02d}", _collect) for index in range(10)]
+    results, timings_ms = await run_evidence_collectors(
+        collectors, open_session=_no_session, concurrency=3
+    )
+
+    assert peak == 3
+    assert results == {collector.name: "ok" for collector in collectors}
+    assert list(timings_ms) == sorted(collector.name for collector in collectors)
+    assert all(value >= 0 for value in timings_ms.values())
+
+
+@pytest.mark.asyncio
+async def test_run_evidence_collectors_cancels_siblings_on_failure() -> None:
+    cancelled: list[str] = []
+
+    async def _slow(_session: Any) -> None:
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append("slow")
+            raise
+
+    async def _broken(_session: Any) -> None:
+        raise RuntimeError("collector failed")
+
+    with pytest.raises(RuntimeError, match="collector failed"):
+        await run_evidence_collectors(
+            [EvidenceCollector("slow", _slow), EvidenceCollector("broken", _broken)],
+            open_session=_no_session,
+            concurrency=2,
+        )
+    assert cancelled == ["slow"]
+
+
+@pytest.mark.asyncio
+async def test_collected_evidence_is_identical_across_concurrency_and_as_of(
+    db, test_tenant
+) -> None:
+    snapshot_at = datetime(2026, 3, 1, tzinfo=timezone.utc)
+    for offset, label in ((-1, "before"), (1, "after")):
+        db.add(
+            AuditLog(
+                tenant_id=test_tenant.id,
+                event_type=AuditEventType.LEADERSHIP_KPIS_CAPTURED.value,
+                event_timestamp=snapshot_at + timedelta(hours=offset),
+                actor_email="owner@valdrics.io",
+                details={"leadership_kpis": {"label": label}, "thresholds": {}},
+                success=True,
+            )
+        )
+    await db.commit()
+
+    async def _collect(concurrency: int) -> dict[str, Any]:
+        async with snapshot_session_opener(db, test_tenant.id) as open_session:
+            results, timings_ms = await run_evidence_collectors(
+                build_evidence_collectors(
+                    tenant_id=test_tenant.id, evidence_limit=10, as_of=snapshot_at
+                ),
+                open_session=open_session,
+                concurrency=concurrency,
+            )
+        assert set(timings_ms) == set(results)
+        return results
+
+    sequential = await _collect(1)
+    concurrent = await _collect(8)
+
+    assert evidence_json_payloads(sequential) == evidence_json_payloads(concurrent)
+    assert len(sequential) == 3 + len(PAYLOAD_EVIDENCE_SPECS)
+    leadership = manifest_evidence_kwargs(concurrent)["leadership_kpi_evidence"]
+    assert [item["leadership_kpis"]["label"] for item in leadership] == ["before"]
@@ -0,0 +1,249 @@
+import asyncio
+import json
+from datetime import date
+from decimal import Decimal
+from typing import Any
+from unittest.mock import AsyncMock, patch
+from uuid import uuid4
+
+import pytest
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+
+from app.schemas.costs import CloudUsageSummary, CostRecord
+from app.shared.core.exceptions import AIAnalysisError
+from app.shared.llm.analyzer import FinOpsAnalyzer
+from app.shared.llm.analyzer_singleflight import (
+    AnalysisSingleFlight,
+    analysis_content_key,
+    analysis_single_flight,
+)
+
+
+class CountingChatModel(BaseChatModel):
+    """Fake provider that records how many times it was actually invoked."""
+
+    calls: int = 0
+    delay_seconds: float = 0.05
+
+    @property
+    def _llm_type(self) -> str:
+        return "counting-fake"
+
+    def _generate(self, messages: list[BaseMessage], *args: Any, **kwargs: Any) -> Any:
+        raise NotImplementedError
+
+    async def _agenerate(
+        self, messages: list[BaseMessage], *args: Any, **kwargs: Any
+    ) -> ChatResult:
+        self.calls += 1
+        await asyncio.sleep(self.delay_seconds)
+        content = json.dumps({"insights": ["steady spend"], "recommendations": []})
+        message = AIMessage(content=content)
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+
+def _summary(amount: str = "100.50") -> CloudUsageSummary:
+    return CloudUsageSummary(
+        tenant_id=str(uuid4()),
+        provider="aws",
+        start_date=date(2026, 1, 1),
+        end_date=date(2026, 1, 31),
+        records=[
+            CostRecord(
+                date=date(2026, 1, 1),
+                amount=Decimal(amount),
+                service="EC2",
+                region="us-east-1",
+            )
+        ],
+        total_cost=Decimal(amount),
+        currency="USD",
+    )
+
+
+def test_content_key_is_canonical_and_scoped() -> None:
+    tenant_id = uuid4()
+    base = dict(tenant_id=tenant_id, prompt_version="v1", provider="groq", model="m")
+
+    key = analysis_content_key(payload={"a": 1, "b": [1, 2]}, **base)
+
+    assert key == analysis_content_key(payload={"b": [1, 2], "a": 1}, **base)
+    assert key.startswith(f"analysis:{tenant_id}:content:")
+    assert key != analysis_content_key(payload={"a": 2, "b": [1, 2]}, **base)
+    assert key != analysis_content_key(
+        payload={"a": 1, "b": [1, 2]}, **{**base, "prompt_version": "v2"}
+    )
+    assert key != analysis_content_key(
+        payload={"a": 1, "b": [1, 2]}, **{**base, "model": "other"}
+    )
+    assert key != analysis_content_key(
+        payload={"a": 1, "b": [1, 2]}, **{**base, "tenant_id": uuid4()}
+    )
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_runs_share_one_computation() -> None:
+    flight = AnalysisSingleFlight()
+    calls = 0
+
+    async def compute() -> dict[str, Any]:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.02)
+        return {"insights": ["x"]}
+
+    results = await asyncio.gather(*(flight.run("k", compute) for _ in range(8)))
+
+    assert calls == 1
+    assert results == [{"insights": ["x"]}] * 8
+    results[0]["insights"].append("mutated")
+    assert await flight.run("k", compute) == {"insights": ["x"]}
+    assert calls == 1
+
+    await flight.run("k", compute, use_cached=False)
+    assert calls == 2
+
+
+@pytest.mark.asyncio
+async def test_failures_are_shared_and_negatively_cached() -> None:
+    now = [100.0]
+    flight = AnalysisSingleFlight(negative_ttl_seconds=30, clock=lambda: now[0])
+    calls = 0
+
+    async def compute() -> dict[str, Any]:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        raise AIAnalysisError("All LLM providers failed.")
+
+    outcomes = await asyncio.gather(
+        *(flight.run("k", compute) for _ in range(3)), return_exceptions=True
+    )
+    assert calls == 1
+    assert all(isinstance(item, AIAnalysisError) for item in outcomes)
+
+    with pytest.raises(AIAnalysisError, match="All LLM providers failed"):
+        await flight.run("k", compute)
+    assert calls == 1
+
+    now[0] += 31
+    with pytest.raises(AIAnalysisError):
+        await flight.run("k", compute)
+    assert calls == 2
+
+
+@pytest.mark.asyncio
+async def test_follower_takes_over_when_leader_is_cancelled() -> None:
+    flight = AnalysisSingleFlight()
+    started = asyncio.Event()
+    calls = 0
+
+    async def compute() -> dict[str, Any]:
+        nonlocal calls
+        calls += 1
+        started.set()
+        await asyncio.sleep(0.05)
+        return {"run": calls}
+
+    leader = asyncio.create_task(flight.run("k", compute))
+    await started.wait()
+    follower = asyncio.create_task(flight.run("k", compute))
+    await asyncio.sleep(0)
+    leader.cancel()
+
+    assert await follower == {"run": 2}
+    with pytest.raises(asyncio.CancelledError):
+        await leader
+
+
+@pytest.mark.asyncio
+async def test_analyzer_coalesces_identical_requests_into_one_provider_call() -> None:
+    analysis_single_flight.clear()
+    llm = CountingChatModel()
+    analyzer = FinOpsAnalyzer(llm)
+    tenant_id = uuid4()
+    summary = _summary()
+
+    with (
+        patch.object(analyzer, "_check_cache_and_delta", return_value=(None, False)),
+        patch(
+            "app.shared.llm.analyzer.SymbolicForecaster.forecast",
+            new_callable=AsyncMock,
+            return_value={"model": "fake"},
+        ),
+    ):
+        results = await asyncio.gather(
+            *(analyzer.analyze(summary, tenant_id=tenant_id) for _ in range(5))
+        )
+        assert llm.calls == 1
+        assert all(item["insights"] == ["steady spend"] for item in results)
+
+        # Same payload later is served from the content cache ...
+        await analyzer.analyze(summary, tenant_id=tenant_id)
+        assert llm.calls == 1
+        # ... while a changed payload or another tenant pays for a new call.
+        await analyzer.analyze(_summary("250.00"), tenant_id=tenant_id)
+        await analyzer.analyze(summary, tenant_id=uuid4())
+        assert llm.calls == 3
+
+
+@pytest.mark.asyncio
+async def test_unexpected_errors_reach_followers_without_rerunning() -> None:
+    flight = AnalysisSingleFlight()
+    calls = 0
+
+    class ProviderPayloadError(Exception):
+        pass
+
+    async def compute() -> dict[str, Any]:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        raise ProviderPayloadError("unexpected payload")
+
+    outcomes = await asyncio.gather(
+        *(flight.run("k", compute) for _ in range(4)), return_exceptions=True
+    )
+
+    assert calls == 1
+    assert all(isinstance(item, ProviderPayloadError) for item in outcomes)
+
+
+@pytest.mark.asyncio
+async def test_result_is_stored_before_the_flight_is_released() -> None:
+    flight = AnalysisSingleFlight()
+    stored = asyncio.Event()
+    release = asyncio.Event()
+    calls = 0
+
+    class SlowStoreCache:
+        async def get(self, key: str) -> None:
+            return None
+
+        async def set(self, *args: Any) -> None:
+            stored.set()
+            await release.wait()
+
+    async def compute() -> dict[str, Any]:
+        nonlocal calls
+        calls += 1
+        return {"run": calls}
+
+    with patch(
+        "app.shared.llm.analyzer_singleflight._shared_cache",
+        side_effect=lambda cache: cache,
+    ):
+        leader = asyncio.create_task(
+            flight.run("k", compute, cache_service=SlowStoreCache())
+        )
+        await asyncio.wait_for(stored.wait(), timeout=1)
+        # Mid-store the key is still in flight, so a new caller joins it.
+        assert "k" in flight._inflight
+        late = asyncio.create_task(flight.run("k", compute))
+        await asyncio.sleep(0)
+        release.set()
+        assert await leader == {"run": 1}
+        assert await late == {"run": 1}
+    assert calls == 1
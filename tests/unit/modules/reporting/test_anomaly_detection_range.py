@@ -0,0 +1,180 @@
+import random
+from datetime import date, timedelta
+from decimal import Decimal
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from app.modules.reporting.domain.anomaly_detection import (
+    CostAnomalyDetectionService,
+    DailyServiceCostRow,
+    detect_daily_cost_anomalies,
+    detect_daily_cost_anomalies_range,
+)
+
+
+def _synthetic_rows(*, seed: int, start: date, days: int) -> list[DailyServiceCostRow]:
+    rng = random.Random(seed)
+    accounts = [uuid4() for _ in range(3)]
+    rows: list[DailyServiceCostRow] = []
+    for index in range(12):
+        account_id = accounts[index % len(accounts)]
+        service = f"Service{index}"
+        provider = ("AWS ", "azure", "", "gcp")[index % 4]
+        base = Decimal(rng.choice(["0", "5", "40", "120", "900"]))
+        for offset in range(days):
+            day = start + timedelta(days=offset)
+            roll = rng.random()
+            if roll < 0.15:
+                continue  # sparse series: missing days count as zero
+            cost = base * (Decimal("1.5") if day.weekday() >= 5 else Decimal("1"))
+            if roll > 0.93:
+                cost = cost * Decimal(rng.choice(["0", "3", "7"])) + Decimal("60")
+            elif roll > 0.88:
+                cost = Decimal("0")
+            rows.append(
+                DailyServiceCostRow(
+                    day=day,
+                    provider=provider,
+                    account_id=account_id,
+                    account_name=f"acct-{index}-{offset}",
+                    service=service if index != 5 else " ",
+                    cost_usd=cost,
+                )
+            )
+    rng.shuffle(rows)
+    return rows
+
+
+@pytest.mark.parametrize(
+    ("lookback_days", "min_weekday_samples"), [(28, 2), (14, 3), (7, 1)]
+)
+def test_range_detection_matches_per_date_detection(
+    lookback_days: int, min_weekday_samples: int
+) -> None:
+    calendar_start = date(2026, 1, 1)
+    rows = _synthetic_rows(seed=lookback_days, start=calendar_start, days=80)
+    start_date = calendar_start + timedelta(days=lookback_days)
+    end_date = calendar_start + timedelta(days=79)
+
+    ranged = detect_daily_cost_anomalies_range(
+        rows,
+        start_date=start_date,
+        end_date=end_date,
+        lookback_days=lookback_days,
+        min_weekday_samples=min_weekday_samples,
+    )
+
+    expected = []
+    day = start_date
+    while day <= end_date:
+        expected.extend(
+            detect_daily_cost_anomalies(
+                rows,
+                target_date=day,
+                lookback_days=lookback_days,
+                min_weekday_samples=min_weekday_samples,
+            )
+        )
+        day += timedelta(days=1)
+
+    assert expected
+    assert ranged == expected
+
+
+def test_range_detection_keeps_tie_order_and_duplicate_rows() -> None:
+    account_id = uuid4()
+    target = date(2026, 3, 1)
+    rows: list[DailyServiceCostRow] = []
+    for service in ("B", "A"):
+        for offset in range(1, 29):
+            rows.append(
+                DailyServiceCostRow(
+                    day=target - timedelta(days=offset),
+                    provider="aws",
+                    account_id=account_id,
+                    account_name=None,
+                    service=service,
+                    cost_usd=Decimal("100"),
+                )
+            )
+        for cost in ("999", "300"):  # later duplicate row wins
+            rows.append(
+                DailyServiceCostRow(
+                    day=target,
+                    provider="aws",
+                    account_id=account_id,
+                    account_name=None,
+                    service=service,
+                    cost_usd=Decimal(cost),
+                )
+            )
+
+    ranged = detect_daily_cost_anomalies_range(rows, start_date=target, end_date=target)
+
+    assert ranged == detect_daily_cost_anomalies(rows, target_date=target)
+    assert [item.service for item in ranged] == ["B", "A"]
+    assert ranged[0].actual_cost_usd == Decimal("300")
+
+
+def test_range_detection_validates_arguments() -> None:
+    with pytest.raises(ValueError, match="end_date"):
+        detect_daily_cost_anomalies_range(
+            [], start_date=date(2026, 1, 2), end_date=date(2026, 1, 1)
+        )
+    with pytest.raises(ValueError, match="lookback_days"):
+        detect_daily_cost_anomalies_range(
+            [], start_date=date(2026, 1, 1), end_date=date(2026, 1, 1), lookback_days=6
+        )
+    assert (
+        detect_daily_cost_anomalies_range(
+            [], start_date=date(2026, 1, 1), end_date=date(2026, 1, 3)
+        )
+        == []
+    )
+
+
+@pytest.mark.asyncio
+async def test_detect_range_fetches_once_and_filters_severity() -> None:
+    account_id = uuid4()
+    start = date(2026, 2, 1)
+    rows = [
+        DailyServiceCostRow(
+            day=start - timedelta(days=offset),
+            provider="aws",
+            account_id=account_id,
+            account_name="Prod",
+            service="AmazonEC2",
+            cost_usd=Decimal("100"),
+        )
+        for offset in range(1, 29)
+    ]
+    rows.append(
+        DailyServiceCostRow(
+            day=start + timedelta(days=2),
+            provider="aws",
+            account_id=account_id,
+            account_name="Prod",
+            service="AmazonEC2",
+            cost_usd=Decimal("2000"),
+        )
+    )
+    service = CostAnomalyDetectionService(AsyncMock())
+    fetch = AsyncMock(return_value=rows)
+    service.fetch_daily_service_costs = fetch  # type: ignore[method-assign]
+
+    anomalies = await service.detect_range(
+        tenant_id=uuid4(),
+        start_date=start,
+        end_date=start + timedelta(days=3),
+        min_severity="critical",
+    )
+
+    fetch.assert_awaited_once()
+    kwargs = fetch.await_args.kwargs
+    assert kwargs["start_date"] == start - timedelta(days=28)
+    assert kwargs["end_date"] == start + timedelta(days=3)
+    assert [(item.day, item.severity) for item in anomalies] == [
+        (start + timedelta(days=2), "critical")
+    ]
@@ -0,0 +1,142 @@
+"""
+Parity tests for the columnar carbon calculation path.
+The grouped totals must equal a per-record Decimal loop digit for digit.
+"""
+
+import random
+from dataclasses import dataclass
+from decimal import Decimal
+
+import pytest
+
+from app.modules.reporting.domain.calculator import CarbonCalculator
+from app.modules.reporting.domain.carbon_columnar_ops import EnergyFactorLookup
+
+SERVICES = (
+    "Amazon Elastic Compute Cloud - Compute",
+    "Amazon Simple Storage Service",
+    "EC2 - Other",
+    "Virtual Machines",
+    "Cloud Storage",
+    "Unknown Service",
+    None,
+)
+PROVIDERS = ("aws", " AWS ", "azure", "gcp", "saas", "license", "unknown", None)
+
+
+@dataclass
+class _Record:
+    cost_usd: Decimal
+    service: str
+    provider: str | None
+    usage_type: str = ""
+    amount_raw: Decimal | None = None
+
+
+def _per_record_totals(calculator, records, provider="generic"):
+    total_cost, total_energy = Decimal("0"), Decimal("0")
+    for record in records:
+        record_provider = str(record.provider or provider)
+        total_cost += record.cost_usd
+        if (
+            record.amount_raw
+            and record.amount_raw > 0
+            and "EC2" in record.service
+            and "vCPU-Hours" in str(record.usage_type)
+        ):
+            total_energy += record.amount_raw * Decimal("0.010")
+        else:
+            total_energy += record.cost_usd * calculator._resolve_energy_factor(
+                record_provider, record.service
+            )
+    return total_cost, total_energy
+
+
+def _random_records(seed: int, count: int) -> list[_Record]:
+    rng = random.Random(seed)
+    records = []
+    for _ in range(count):
+        service = rng.choice(SERVICES) or "EC2 - Other"
+        vcpu = rng.random() < 0.2
+        records.append(
+            _Record(
+                cost_usd=Decimal(rng.randint(0, 10**9)) / Decimal(10**6),
+                service=service,
+                provider=rng.choice(PROVIDERS),
+                usage_type="BoxUsage:vCPU-Hours" if vcpu else "TimedStorage",
+                amount_raw=Decimal(rng.randint(1, 500)) / 10 if vcpu else None,
+            )
+        )
+    return records
+
+
+@pytest.mark.parametrize("seed", [1, 7, 42])
+def test_records_path_matches_per_record_loop_exactly(seed: int) -> None:
+    calculator = CarbonCalculator()
+    records = _random_records(seed, 2000)
+    captured = {}
+
+    def _capture(total_cost_usd, total_energy_kwh, region, provider="generic"):
+        captured["totals"] = (total_cost_usd, total_energy_kwh)
+        return {}
+
+    calculator._finalize_calculation = _capture
+    calculator.calculate_from_records(records, region="us-east-1")
+
+    expected = _per_record_totals(calculator, records)
+    assert captured["totals"] == expected
+    assert tuple(map(str, captured["totals"])) == tuple(map(str, expected))
+
+
+def test_costs_path_keeps_methodology_checksum_and_skip_semantics() -> None:
+    calculator = CarbonCalculator()
+    cost_data = [
+        {
+            "Groups": [
+                {
+                    "Keys": ["Amazon Elastic Compute Cloud - Compute"],
+                    "Metrics": {"UnblendedCost": {"Amount": "100.125"}},
+                },
+                {
+                    "Keys": ["Amazon Simple Storage Service"],
+                    "Metrics": {"UnblendedCost": {"Amount": "0"}},
+                },
+            ]
+        },
+        {"cost_usd": "12.5", "service": "Virtual Machines", "provider": "Azure"},
+        {"cost_usd": 3, "service": "Cloud Storage", "provider": "gcp"},
+        {"Total": {"UnblendedCost": {"Amount": "4.75"}}},
+        {
+            "Groups": [
+                {"Keys": ["Cloud SQL"], "Metrics": {"UnblendedCost": {"Amount": None}}}
+            ]
+        },
+    ]
+    energy = (
+        Decimal("100.125") * Decimal("0.05")
+        + Decimal("12.5") * Decimal("0.05")
+        + Decimal("3") * Decimal("0.01")
+        + Decimal("4.75") * Decimal("0.03")
+    )
+    reference = calculator._finalize_calculation(
+        Decimal("120.375"), energy, "us-east-1", "aws"
+    )
+
+    result = calculator.calculate_from_costs(
+        cost_data, region="us-east-1", provider="aws"
+    )
+
+    assert result["methodology_metadata"] == reference["methodology_metadata"]
+    assert result["total_co2_kg"] == reference["total_co2_kg"]
+    assert result["total_cost_usd"] == 120.38
+
+
+def test_factor_lookup_matches_calculator_resolution() -> None:
+    calculator = CarbonCalculator()
+    lookup = EnergyFactorLookup(calculator._energy_factors)
+
+    for provider in PROVIDERS:
+        for service in SERVICES:
+            assert lookup.factor(provider, service) == (
+                calculator._resolve_energy_factor(provider, service)
+            )
@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+import asyncio
+
+from scripts.benchmark_audit_log_writer import run_benchmark, summarize_mode
+
+
+def test_summarize_mode_reports_event_rate() -> None:
+    summary = summarize_mode(mode="buffered", events=100, elapsed_seconds=0.5)
+
+    assert summary["events_per_second"] == 200.0
+    assert (
+        summarize_mode(mode="x", events=1, elapsed_seconds=0)["events_per_second"]
+        is None
+    )
+
+
+def test_run_benchmark_writes_every_mode_on_scratch_sqlite() -> None:
+    payload = asyncio.run(run_benchmark(events=30, database_url="", batch_size=8))
+
+    assert payload["backend"] == "sqlite"
+    assert [mode["mode"] for mode in payload["modes"]] == [
+        "per_event_flush",
+        "buffered",
+        "batcher",
+    ]
+    assert all(mode["events"] == 30 for mode in payload["modes"])
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from decimal import Decimal
+
+from scripts.benchmark_enforcement_gate_lock_scopes import (
+    _parse_args,
+    build_workload,
+    summarize_mode,
+)
+
+
+def test_build_workload_interleaves_scopes() -> None:
+    workload = build_workload(scopes=3, gates_per_scope=2)
+
+    assert len(workload) == 6
+    assert [project for project, _ in workload[:3]] == [
+        "bench-scope-000",
+        "bench-scope-001",
+        "bench-scope-002",
+    ]
+    assert {idx for _, idx in workload} == {0, 1}
+
+
+def test_summarize_mode_reports_throughput_and_overspend() -> None:
+    summary = summarize_mode(
+        mode="scoped",
+        elapsed_seconds=2.0,
+        outcomes=["allow", "allow", "deny", "http_503"],
+        reserved_by_scope={"a": Decimal("90"), "b": Decimal("30")},
+        limit_usd=Decimal("100"),
+    )
+
+    assert summary["gates_per_second"] == 2.0
+    assert summary["outcomes"] == {"allow": 2, "deny": 1, "http_503": 1}
+    assert summary["reserved_usd"] == "120"
+    assert summary["overspend_usd"] == "20"
+
+
+def test_parse_args_requires_database_url_and_defaults_both_modes() -> None:
+    args = _parse_args(["--database-url", "postgresql+asyncpg://localhost/bench"])
+
+    assert args.modes == ["legacy", "scoped"]
+    assert args.without_budgets is False
+    assert args.limit_usd == Decimal("100")
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from scripts.benchmark_forecast_event_loop import (
+    LightSyntheticProphet,
+    build_histories,
+    run_benchmark,
+)
+
+
+def test_build_histories_are_distinct_daily_series() -> None:
+    histories = build_histories(count=3, days=10, seed=1)
+
+    assert len(histories) == 3
+    assert len(histories[0]) == 14
+    assert not histories[0]["y"].equals(histories[1]["y"])
+
+
+def test_run_benchmark_reports_latency_for_each_mode() -> None:
+    payload = run_benchmark(
+        forecasts=2,
+        history_days=20,
+        horizon=5,
+        probe_interval_ms=2.0,
+        seed=1,
+        workers=1,
+        model_cls=LightSyntheticProphet,
+    )
+
+    assert payload["forecasts"] == 2
+    assert payload["model"] == "LightSyntheticProphet"
+    for mode in ("inline", "offloaded", "cached"):
+        assert payload[mode]["probe_p99_ms"] >= 0.0
+        assert payload[mode]["wall_seconds"] >= 0.0
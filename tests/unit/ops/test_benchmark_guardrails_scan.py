@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+from scripts.benchmark_guardrails_scan import build_payload, run_benchmark
+
+
+def test_build_payload_shape() -> None:
+    payload = build_payload(records=5, seed=1)
+
+    assert len(payload["records"]) == 5
+    assert {"service", "amount", "tags", "notes"} <= set(payload["records"][0])
+
+
+def test_run_benchmark_reports_matching_verdicts() -> None:
+    payload = run_benchmark(records=200, repeats=1, seed=1)
+
+    assert payload["records"] == 200
+    assert payload["verdicts_match"] is True
+    assert payload["redacted_strings"] > 0
@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+from scripts.benchmark_holt_winters_batch import build_matrix, run_benchmark
+
+
+def test_build_matrix_shape() -> None:
+    matrix = build_matrix(series=4, days=30, seed=1)
+
+    assert matrix.shape == (4, 30)
+    assert (matrix > 0).all()
+
+
+def test_run_benchmark_reports_exact_parity_with_loop() -> None:
+    payload = run_benchmark(series=50, days=60, horizon=7, loop_sample=10, seed=1)
+
+    assert payload["series"] == 50
+    assert payload["max_abs_diff_vs_loop"] == 0.0
+    assert 0.0 < payload["fitted_alpha_mean"] < 1.0
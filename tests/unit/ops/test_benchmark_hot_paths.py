@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import asyncio
+import json
+
+from scripts.benchmark_hot_paths import (
+    baseline_mismatch,
+    compare_with_baseline,
+    main,
+    run_suite,
+)
+from scripts.benchmark_hot_paths_cases import HOT_PATH_CASES
+
+FAST_CASES = ["gate_evaluation", "cache_codecs"]
+
+
+def test_run_suite_times_every_hot_path_on_scratch_sqlite() -> None:
+    payload = asyncio.run(
+        run_suite(database_url="", repeats=2, warmup=0, scale=0.02, seed=3)
+    )
+
+    assert payload["backend"] == "sqlite"
+    assert list(payload["benchmarks"]) == [case.name for case in HOT_PATH_CASES]
+    for result in payload["benchmarks"].values():
+        assert len(result["samples_seconds"]) == 2
+        assert result["median_seconds"] > 0
+
+
+def test_compare_with_baseline_scales_noise_budgets() -> None:
+    run = {
+        "benchmarks": {
+            "bulk_upsert": {"noise_budget": 0.2, "samples_seconds": [1.3] * 6},
+        }
+    }
+    baseline = {
+        "benchmarks": {"bulk_upsert": {"samples_seconds": [1.0, 1.01, 0.99] * 2}}
+    }
+
+    assert compare_with_baseline(run, baseline)[0].status == "regressed"
+    assert (
+        compare_with_baseline(run, baseline, noise_scale=2.0)[0].status == "unchanged"
+    )
+    assert compare_with_baseline(run, None)[0].status == "new"
+
+
+def test_main_stores_baseline_then_fails_on_regression(tmp_path, capsys) -> None:
+    baseline_path = tmp_path / "baseline.json"
+    args = [
+        "--only",
+        *FAST_CASES,
+        "--repeats",
+        "5",
+        "--warmup",
+        "0",
+        "--scale",
+        "0.05",
+        "--baseline",
+        str(baseline_path),
+    ]
+
+    assert main([*args, "--update-baseline"]) == 0
+    stored = json.loads(baseline_path.read_text())
+    assert set(stored["benchmarks"]) == set(FAST_CASES)
+
+    # A baseline ten times faster than any real run must flag a regression.
+    for result in stored["benchmarks"].values():
+        result["samples_seconds"] = [
+            sample / 10 for sample in result["samples_seconds"]
+        ]
+    baseline_path.write_text(json.dumps(stored))
+    out_path = tmp_path / "run.json"
+    assert main([*args, "--out", str(out_path)]) == 1
+    assert set(json.loads(out_path.read_text())["regressions"]) == set(FAST_CASES)
+
+    stored["seed"] = 99
+    baseline_path.write_text(json.dumps(stored))
+    assert main(args) == 2
+    assert "seed" in capsys.readouterr().out
+
+
+def test_baseline_mismatch_names_the_differing_field() -> None:
+    run = {"backend": "sqlite", "scale": 1.0, "seed": 7}
+
+    assert baseline_mismatch(run, dict(run)) is None
+    assert "backend" in str(baseline_mismatch(run, {**run, "backend": "postgresql"}))
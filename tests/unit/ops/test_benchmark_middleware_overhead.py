@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from scripts.benchmark_middleware_overhead import main
+
+
+def test_benchmark_middleware_overhead_reports_all_stacks(tmp_path: Path) -> None:
+    out = tmp_path / "middleware_overhead.json"
+
+    exit_code = main(["--requests", "50", "--warmup", "5", "--out", str(out)])
+
+    assert exit_code == 0
+    payload = json.loads(out.read_text(encoding="utf-8"))
+    assert set(payload["stacks"]) == {"bare", "legacy", "asgi"}
+    assert payload["requests"] == 50
+    assert payload["asgi_speedup_vs_legacy"] > 0
+
+
+def test_benchmark_middleware_overhead_fails_unmet_speedup(tmp_path: Path) -> None:
+    exit_code = main(["--requests", "20", "--warmup", "0", "--min-speedup", "1000"])
+
+    assert exit_code == 1
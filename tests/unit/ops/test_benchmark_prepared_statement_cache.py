@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from scripts.benchmark_prepared_statement_cache import (
+    _parse_args,
+    connect_args_for_mode,
+    summarize_mode,
+)
+
+
+def test_summarize_mode_reports_latency_percentiles() -> None:
+    summary = summarize_mode(
+        mode="cached", latencies_ms=[float(v) for v in range(1, 101)]
+    )
+
+    assert summary["requests"] == 100
+    assert summary["p50_ms"] == 50.5
+    assert summary["p95_ms"] == 95.0
+    assert summary["max_ms"] == 100.0
+    assert summarize_mode(mode="x", latencies_ms=[])["p95_ms"] is None
+
+
+def test_connect_args_disable_or_bound_the_statement_caches() -> None:
+    url = "postgresql+asyncpg://localhost:6543/bench"
+
+    assert connect_args_for_mode("uncached", database_url=url, cache_size=64) == {
+        "statement_cache_size": 0,
+        "prepared_statement_cache_size": 0,
+    }
+    cached = connect_args_for_mode("cached", database_url=url, cache_size=64)
+    assert cached["statement_cache_size"] == 64
+    assert cached["prepared_statement_cache_size"] == 64
+
+
+def test_parse_args_requires_database_url_and_defaults_both_modes() -> None:
+    args = _parse_args(["--database-url", "postgresql+asyncpg://localhost/bench"])
+
+    assert args.modes == ["uncached", "cached"]
+    assert args.cache_size == 256
@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+from scripts.benchmark_rls_statement_verdicts import build_statements, run_benchmark
+
+
+def test_build_statements_produces_realistic_shapes() -> None:
+    statements = build_statements(shapes=10, columns=30)
+
+    assert len(statements) == 10
+    assert any(s.startswith("UPDATE") for s in statements)
+    assert max(len(s) for s in statements) > 1000
+
+
+def test_run_benchmark_reports_hit_ratio() -> None:
+    payload = run_benchmark(executions=500, shapes=20, columns=5, seed=1)
+
+    assert payload["executions"] == 500
+    assert payload["cache_entries"] <= 20
+    assert payload["cache_hit_ratio"] >= 0.9
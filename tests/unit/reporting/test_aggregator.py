@@ -396,27 +396,32 @@ async def test_get_cached_breakdown_empty_cache_rows_fallback(mock_db, tenant_id
 
 
 @pytest.mark.asyncio
-async def test_refresh_materialized_view_pg(mock_db):
+async def test_reconcile_daily_aggregates_pg(mock_db):
     mock_db.bind.dialect.name = "postgresql"
-    res = await CostAggregator.refresh_materialized_view(mock_db)
+    empty_result = MagicMock()
+    empty_result.all.return_value = []
+    mock_db.execute.return_value = empty_result
+    res = await CostAggregator.reconcile_daily_aggregates(mock_db)
     assert res is True
+    assert mock_db.execute.await_count == 2
     mock_db.commit.assert_called_once()
 
 
 @pytest.mark.asyncio
-async def test_refresh_materialized_view_sqlite_skip(mock_db):
-    mock_db.bind.dialect.name = "sqlite"
-    res = await CostAggregator.refresh_materialized_view(mock_db)
+async def test_reconcile_daily_aggregates_unsupported_dialect_skip(mock_db):
+    mock_db.bind.dialect.name = "mysql"
+    res = await CostAggregator.reconcile_daily_aggregates(mock_db)
     assert res is True
     mock_db.execute.assert_not_called()
 
 
 @pytest.mark.asyncio
-async def test_refresh_materialized_view_failure(mock_db):
+async def test_reconcile_daily_aggregates_failure(mock_db):
     mock_db.bind.dialect.name = "postgresql"
-    mock_db.execute.side_effect = SQLAlchemyError("refresh failed")
-    res = await CostAggregator.refresh_materialized_view(mock_db)
+    mock_db.execute.side_effect = SQLAlchemyError("reconcile failed")
+    res = await CostAggregator.reconcile_daily_aggregates(mock_db)
     assert res is False
+    mock_db.rollback.assert_awaited_once()
 
 
 @pytest.mark.asyncio
@@ -431,8 +436,8 @@ async def test_get_cached_breakdown_does_not_swallow_base_exceptions(
 
 
 @pytest.mark.asyncio
-async def test_refresh_materialized_view_does_not_swallow_base_exceptions(mock_db):
+async def test_reconcile_daily_aggregates_does_not_swallow_base_exceptions(mock_db):
     mock_db.bind.dialect.name = "postgresql"
     mock_db.execute.side_effect = KeyboardInterrupt("stop")
     with pytest.raises(KeyboardInterrupt, match="stop"):
-        await CostAggregator.refresh_materialized_view(mock_db)
+        await CostAggregator.reconcile_daily_aggregates(mock_db)
@@ -0,0 +1,289 @@
+import asyncio
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import select, update
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.models.cloud import CloudAccount, CostRecord, DailyCostAggregate
+from app.models.tenant import Tenant
+from app.modules.reporting.domain.aggregator import CostAggregator
+from app.modules.reporting.domain.aggregator_daily_rollup_ops import (
+    check_daily_cost_aggregates,
+    reconcile_daily_cost_aggregates,
+    refresh_daily_cost_aggregates,
+    refresh_daily_cost_aggregates_for_records,
+    rollup_lock_key,
+)
+from app.modules.reporting.domain.persistence import CostPersistenceService
+
+DAY_1 = datetime(2026, 1, 14, 10, tzinfo=timezone.utc)
+DAY_2 = datetime(2026, 1, 15, 10, tzinfo=timezone.utc)
+
+
+async def _account(db) -> CloudAccount:
+    tenant = Tenant(id=uuid4(), name="rollup", plan="pro")
+    db.add(tenant)
+    await db.flush()
+    account = CloudAccount(tenant_id=tenant.id, provider="aws", name="AWS")
+    db.add(account)
+    await db.flush()
+    return account
+
+
+async def _ingest(db, account, rows) -> None:
+    async def stream():
+        for timestamp, service, region, cost in rows:
+            yield {
+                "provider": "aws",
+                "service": service,
+                "region": region,
+                "usage_type": "BoxUsage",
+                "currency": "USD",
+                "timestamp": timestamp,
+                "cost_usd": Decimal(cost),
+            }
+
+    await CostPersistenceService(db).save_records_stream(
+        stream(), tenant_id=account.tenant_id, account_id=account.id
+    )
+
+
+async def _rollup(db, tenant_id) -> dict:
+    rows = (
+        await db.execute(
+            select(DailyCostAggregate).where(DailyCostAggregate.tenant_id == tenant_id)
+        )
+    ).scalars()
+    return {
+        (row.cost_date, row.service, row.region): (row.total_cost, row.record_count)
+        for row in rows
+    }
+
+
+@pytest.mark.asyncio
+async def test_ingestion_maintains_only_touched_buckets(db_session) -> None:
+    account = await _account(db_session)
+    tenant_id = account.tenant_id
+    await _ingest(
+        db_session,
+        account,
+        [
+            (DAY_1, "AmazonEC2", "us-east-1", "10.00"),
+            (DAY_1.replace(hour=11), "AmazonEC2", "us-east-1", "5.00"),
+            (DAY_2, "AmazonS3", "eu-west-1", "2.50"),
+        ],
+    )
+    assert await _rollup(db_session, tenant_id) == {
+        (DAY_1.date(), "AmazonEC2", "us-east-1"): (Decimal("15"), 2),
+        (DAY_2.date(), "AmazonS3", "eu-west-1"): (Decimal("2.5"), 1),
+    }
+
+    # A restatement of one record only recomputes its own bucket.
+    await db_session.execute(
+        update(DailyCostAggregate)
+        .where(DailyCostAggregate.service == "AmazonS3")
+        .values(record_count=99)
+    )
+    await _ingest(db_session, account, [(DAY_1, "AmazonEC2", "us-east-1", "12.00")])
+    rollup = await _rollup(db_session, tenant_id)
+    assert rollup[(DAY_1.date(), "AmazonEC2", "us-east-1")] == (Decimal("17"), 2)
+    assert rollup[(DAY_2.date(), "AmazonS3", "eu-west-1")][1] == 99
+
+    breakdown = await CostAggregator.get_cached_breakdown(
+        db_session, tenant_id, DAY_1.date(), DAY_2.date()
+    )
+    assert breakdown["cached"] is True
+    assert breakdown["total_cost"] == pytest.approx(19.5)
+    assert [item["service"] for item in breakdown["breakdown"]] == [
+        "AmazonEC2",
+        "AmazonS3",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_checker_finds_drift_and_reconcile_repairs_it(db_session) -> None:
+    account = await _account(db_session)
+    tenant_id = account.tenant_id
+    await _ingest(
+        db_session,
+        account,
+        [
+            (DAY_1, "AmazonEC2", "us-east-1", "10.00"),
+            (DAY_2, "AmazonS3", "eu-west-1", "2.50"),
+            (DAY_2, "AmazonRDS", "eu-west-1", "4.00"),
+        ],
+    )
+    window = dict(start_date=DAY_1.date(), end_date=DAY_2.date())
+    clean = await check_daily_cost_aggregates(db_session, **window)
+    assert clean is not None and clean.is_consistent
+    assert clean.checked_buckets == 3
+
+    await db_session.execute(
+        update(DailyCostAggregate)
+        .where(DailyCostAggregate.service == "AmazonEC2")
+        .values(total_cost=Decimal("1.00"))
+    )
+    await db_session.execute(
+        DailyCostAggregate.__table__.delete().where(
+            DailyCostAggregate.service == "AmazonS3"
+        )
+    )
+    db_session.add(
+        DailyCostAggregate(
+            tenant_id=tenant_id,
+            cost_date=date(2026, 1, 15),
+            service="Ghost",
+            region="",
+            total_cost=Decimal("3"),
+            total_carbon=Decimal("0"),
+            record_count=1,
+        )
+    )
+    await db_session.flush()
+
+    drift = await reconcile_daily_cost_aggregates(
+        db_session, tenant_id=tenant_id, **window
+    )
+    assert drift is not None and not drift.is_consistent
+    assert [key[2] for key in drift.mismatched] == ["AmazonEC2"]
+    assert [key[2] for key in drift.missing] == ["AmazonS3"]
+    assert [key[2] for key in drift.stale] == ["Ghost"]
+    assert drift.drifted_days == {tenant_id: [DAY_1.date(), DAY_2.date()]}
+    repaired = await check_daily_cost_aggregates(db_session, **window)
+    assert repaired is not None and repaired.is_consistent
+
+    await CostPersistenceService(db_session).clear_range(
+        tenant_id, account.id, DAY_2.replace(hour=0), DAY_2.replace(hour=23)
+    )
+    assert set(await _rollup(db_session, tenant_id)) == {
+        (DAY_1.date(), "AmazonEC2", "us-east-1")
+    }
+    assert (await db_session.scalar(select(CostRecord.id).limit(1))) is not None
+
+
+@pytest.mark.asyncio
+async def test_postgres_refresh_is_one_bucket_scoped_upsert() -> None:
+    db = MagicMock()
+    db.bind.dialect.name = "postgresql"
+    db.execute = AsyncMock()
+    tenant_id = uuid4()
+
+    touched = await refresh_daily_cost_aggregates_for_records(
+        db,
+        [
+            {
+                "tenant_id": tenant_id,
+                "recorded_at": DAY_1.date(),
+                "service": "AmazonEC2",
+                "region": None,
+            },
+            {
+                "tenant_id": tenant_id,
+                "recorded_at": DAY_1.date(),
+                "service": "AmazonEC2",
+                "region": None,
+            },
+        ],
+    )
+
+    assert touched == 1
+    sql = str(db.execute.await_args.args[0].compile(dialect=postgresql.dialect()))
+    assert "INSERT INTO daily_cost_aggregates" in sql
+    assert "ON CONFLICT (tenant_id, cost_date, service, region) DO UPDATE" in sql
+    assert "GROUP BY" in sql and "IN" in sql
+
+    db.execute.reset_mock()
+    db.bind.dialect.name = "mysql"
+    assert not await refresh_daily_cost_aggregates(
+        db, tenant_id=tenant_id, start_date=DAY_1, end_date=DAY_2
+    )
+    db.execute.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_postgres_refresh_locks_tenant_days_in_order_before_upsert() -> None:
+    db = MagicMock()
+    db.bind.dialect.name = "postgresql"
+    db.execute = AsyncMock()
+    tenant_id = uuid4()
+
+    await refresh_daily_cost_aggregates(
+        db,
+        tenant_id=tenant_id,
+        start_date=DAY_1,
+        end_date=DAY_2,
+        buckets=[
+            (DAY_2.date(), "AmazonS3", ""),
+            (DAY_1.date(), "AmazonEC2", ""),
+            (DAY_2.date(), "AmazonEC2", ""),
+        ],
+    )
+
+    statements = [call.args[0] for call in db.execute.await_args_list]
+    assert len(statements) == 3
+    for statement, day in zip(statements, (DAY_1.date(), DAY_2.date())):
+        sql = str(statement.compile(dialect=postgresql.dialect()))
+        assert "pg_advisory_xact_lock" in sql
+        assert list(statement.compile().params.values()) == [
+            rollup_lock_key(tenant_id, day)
+        ]
+    assert "INSERT INTO daily_cost_aggregates" in str(
+        statements[2].compile(dialect=postgresql.dialect())
+    )
+    assert rollup_lock_key(tenant_id, DAY_1.date()) != rollup_lock_key(
+        uuid4(), DAY_1.date()
+    )
+
+
+@pytest.mark.postgres
+@pytest.mark.asyncio
+async def test_concurrent_refreshes_of_one_day_keep_both_writers_rows(
+    postgres_engine,
+) -> None:
+    sessions = async_sessionmaker(postgres_engine, expire_on_commit=False)
+    async with sessions() as setup:
+        account = await _account(setup)
+        await setup.commit()
+    tenant_id = account.tenant_id
+
+    def record(cost: str, resource_id: str) -> CostRecord:
+        return CostRecord(
+            tenant_id=tenant_id,
+            account_id=account.id,
+            service="AmazonEC2",
+            region="us-east-1",
+            usage_type="BoxUsage",
+            resource_id=resource_id,
+            cost_usd=Decimal(cost),
+            currency="USD",
+            recorded_at=DAY_1.date(),
+            timestamp=DAY_1,
+        )
+
+    async def ingest(db, cost: str, resource_id: str) -> None:
+        db.add(record(cost, resource_id))
+        await db.flush()
+        await refresh_daily_cost_aggregates(
+            db, tenant_id=tenant_id, start_date=DAY_1, end_date=DAY_1
+        )
+
+    async with sessions() as first, sessions() as second:
+        await ingest(first, "10.00", "i-first")
+        second_writer = asyncio.create_task(ingest(second, "5.00", "i-second"))
+        await asyncio.sleep(0.3)
+        # The second refresh waits on the first writer's tenant-day lock ...
+        assert not second_writer.done()
+        await first.commit()
+        # ... and then recomputes with the first writer's committed row.
+        await second_writer
+        await second.commit()
+
+    async with sessions() as check:
+        assert await _rollup(check, tenant_id) == {
+            (DAY_1.date(), "AmazonEC2", "us-east-1"): (Decimal("15"), 2)
+        }
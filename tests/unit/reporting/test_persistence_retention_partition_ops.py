@@ -0,0 +1,253 @@
+from __future__ import annotations
+
+from datetime import date
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from sqlalchemy.exc import OperationalError
+
+from app.modules.reporting.domain.persistence_retention_partition_ops import (
+    drop_expired_partitions,
+    drop_expired_partitions_by_plan,
+)
+from app.shared.core.maintenance import PartitionMaintenanceService
+
+RETENTION_GROUPS = {("free", 30): ["free"], ("growth", 365): ["growth"]}
+
+
+def _pg_db(execute_results: list[object]) -> AsyncMock:
+    db = AsyncMock()
+    db.bind = SimpleNamespace(dialect=SimpleNamespace(name="postgresql"))
+    db.execute = AsyncMock(side_effect=execute_results)
+    return db
+
+
+def _rows(rows: list[SimpleNamespace]) -> MagicMock:
+    result = MagicMock()
+    result.all.return_value = rows
+    return result
+
+
+@pytest.mark.asyncio
+async def test_partition_retention_skips_non_postgres_backends() -> None:
+    db = AsyncMock()
+    db.bind = SimpleNamespace(dialect=SimpleNamespace(name="sqlite"))
+
+    assert (
+        await drop_expired_partitions_by_plan(
+            db,
+            retention_groups=RETENTION_GROUPS,
+            target_date=date(2026, 3, 7),
+            logger_obj=MagicMock(),
+        )
+        is None
+    )
+    assert (
+        await drop_expired_partitions(
+            db, cutoff_date=date(2026, 1, 1), logger_obj=MagicMock()
+        )
+        is None
+    )
+    db.execute.assert_not_awaited()
+
+
+def _sql(db: AsyncMock) -> list[str]:
+    return [str(call.args[0]) for call in db.execute.await_args_list]
+
+
+@pytest.mark.asyncio
+async def test_partition_retention_drops_each_partition_in_its_own_transaction() -> (
+    None
+):
+    growth_tenant = uuid4()
+    dropped_partition_rows = _rows(
+        [
+            SimpleNamespace(
+                tenant_id=growth_tenant,
+                plan="growth",
+                deleted_count=40,
+                oldest_recorded_at=date(2024, 1, 1),
+                newest_recorded_at=date(2024, 1, 31),
+            )
+        ]
+    )
+    db = _pg_db([None, None, dropped_partition_rows])
+    events: list[str] = []
+    db.commit = AsyncMock(side_effect=lambda: events.append("commit"))
+
+    with (
+        patch.object(
+            PartitionMaintenanceService,
+            "list_cost_record_partition_ranges",
+            AsyncMock(
+                return_value=[
+                    ("cost_records_2024_01", date(2024, 1, 1), date(2024, 2, 1)),
+                    ("cost_records_2026_03", date(2026, 3, 1), date(2026, 4, 1)),
+                ]
+            ),
+        ),
+        patch.object(
+            PartitionMaintenanceService,
+            "detach_and_drop_cost_record_partition",
+            AsyncMock(side_effect=lambda name: events.append(f"drop {name}")),
+        ) as drop_partition,
+    ):
+        summary = await drop_expired_partitions_by_plan(
+            db,
+            retention_groups=RETENTION_GROUPS,
+            target_date=date(2026, 3, 7),
+            logger_obj=MagicMock(),
+        )
+
+    assert summary is not None
+    drop_partition.assert_awaited_once_with("cost_records_2024_01")
+    assert db.commit.await_count == 2
+    # The caller's transaction ends before the detach, which commits at once.
+    assert events == ["commit", "drop cost_records_2024_01", "commit"]
+    statements = _sql(db)
+    assert "pg_advisory_xact_lock" in statements[0]
+    assert "lock_timeout" in statements[1]
+    assert summary["partitions_dropped"] == ["cost_records_2024_01"]
+    assert summary["deleted_count"] == 40
+    assert summary["tiers"] == {"growth": 40}
+    assert summary["tenant_reports"] == [
+        {
+            "tenant_id": str(growth_tenant),
+            "tenant_tier": "growth",
+            "retention_days": 365,
+            "deleted_count": 40,
+            "oldest_recorded_at": "2024-01-01",
+            "newest_recorded_at": "2024-01-31",
+        },
+    ]
+    # Partly expired rows are left to the caller's bounded batch deletes.
+    assert not any(statement.lstrip().startswith("DELETE") for statement in statements)
+
+
+@pytest.mark.asyncio
+async def test_partition_retention_skips_partitions_it_cannot_lock_in_time() -> None:
+    db = _pg_db(
+        [
+            None,
+            None,
+            OperationalError("DETACH", {}, Exception("lock timeout")),
+        ]
+    )
+    logger_obj = MagicMock()
+
+    with (
+        patch.object(
+            PartitionMaintenanceService,
+            "list_cost_record_partition_ranges",
+            AsyncMock(
+                return_value=[
+                    ("cost_records_2024_01", date(2024, 1, 1), date(2024, 2, 1))
+                ]
+            ),
+        ),
+        patch.object(
+            PartitionMaintenanceService,
+            "detach_and_drop_cost_record_partition",
+            AsyncMock(),
+        ) as drop_partition,
+    ):
+        summary = await drop_expired_partitions_by_plan(
+            db,
+            retention_groups=RETENTION_GROUPS,
+            target_date=date(2026, 3, 7),
+            logger_obj=logger_obj,
+        )
+
+    assert summary is not None
+    assert summary["partitions_dropped"] == []
+    drop_partition.assert_not_awaited()
+    db.rollback.assert_awaited_once()
+    logger_obj.warning.assert_called_once()
+    assert (
+        logger_obj.warning.call_args.args[0] == "cost_retention_partition_drop_skipped"
+    )
+
+
+@pytest.mark.asyncio
+async def test_partition_retention_keeps_partitions_holding_unlimited_plan_rows() -> (
+    None
+):
+    partition_rows = _rows(
+        [
+            SimpleNamespace(
+                tenant_id=uuid4(),
+                plan="enterprise",
+                deleted_count=10,
+                oldest_recorded_at=date(2023, 1, 1),
+                newest_recorded_at=date(2023, 1, 31),
+            )
+        ]
+    )
+    db = _pg_db([None, None, partition_rows])
+
+    with (
+        patch.object(
+            PartitionMaintenanceService,
+            "list_cost_record_partition_ranges",
+            AsyncMock(
+                return_value=[
+                    ("cost_records_2023_01", date(2023, 1, 1), date(2023, 2, 1))
+                ]
+            ),
+        ),
+        patch.object(
+            PartitionMaintenanceService,
+            "detach_and_drop_cost_record_partition",
+            AsyncMock(),
+        ) as drop_partition,
+    ):
+        summary = await drop_expired_partitions_by_plan(
+            db,
+            retention_groups=RETENTION_GROUPS,
+            target_date=date(2026, 3, 7),
+            logger_obj=MagicMock(),
+        )
+
+    assert summary is not None
+    drop_partition.assert_not_awaited()
+    db.rollback.assert_awaited_once()
+    assert summary["partitions_dropped"] == []
+    assert summary["deleted_count"] == 0
+    assert summary["tenant_reports"] == []
+
+
+@pytest.mark.asyncio
+async def test_drop_expired_partitions_counts_rows_before_dropping() -> None:
+    db = _pg_db([None, None])
+    db.scalar = AsyncMock(return_value=120)
+
+    with (
+        patch.object(
+            PartitionMaintenanceService,
+            "list_cost_record_partition_ranges",
+            AsyncMock(
+                return_value=[
+                    ("cost_records_2024_01", date(2024, 1, 1), date(2024, 2, 1)),
+                    ("cost_records_2024_02", date(2024, 2, 1), date(2024, 3, 1)),
+                ]
+            ),
+        ),
+        patch.object(
+            PartitionMaintenanceService,
+            "detach_and_drop_cost_record_partition",
+            AsyncMock(),
+        ) as drop_partition,
+    ):
+        summary = await drop_expired_partitions(
+            db, cutoff_date=date(2024, 2, 15), logger_obj=MagicMock()
+        )
+
+    assert summary == {
+        "deleted_count": 120,
+        "partitions_dropped": ["cost_records_2024_01"],
+    }
+    drop_partition.assert_awaited_once_with("cost_records_2024_01")
+    assert db.commit.await_count == 2
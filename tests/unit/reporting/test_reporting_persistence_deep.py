@@ -328,6 +328,25 @@ async def test_cleanup_loops(persistence_service, mock_db):
     assert mock_db.flush.called
 
 
+def _expired_rows(*rows: SimpleNamespace) -> MagicMock:
+    result = MagicMock()
+    result.all.return_value = list(rows)
+    return result
+
+
+def _expired(tenant_id, row_count: int, oldest: date, newest: date) -> SimpleNamespace:
+    return SimpleNamespace(
+        tenant_id=tenant_id,
+        row_count=row_count,
+        oldest_recorded_at=oldest,
+        newest_recorded_at=newest,
+    )
+
+
+def _deleted(rowcount: int) -> MagicMock:
+    return MagicMock(rowcount=rowcount)
+
+
 @pytest.mark.asyncio
 async def test_cleanup_expired_records_by_plan_returns_tenant_reports(
     persistence_service, mock_db
@@ -338,44 +357,15 @@ async def test_cleanup_expired_records_by_plan_returns_tenant_reports(
     plan_rows = MagicMock()
     plan_rows.scalars.return_value.all.return_value = ["free", "growth", "enterprise"]
 
-    free_rows = MagicMock()
-    free_rows.all.return_value = [
-        SimpleNamespace(
-            id=uuid4(),
-            tenant_id=tenant_free,
-            recorded_at=date(2025, 1, 1),
-        )
-    ]
-
-    free_empty = MagicMock()
-    free_empty.all.return_value = []
-
-    growth_rows = MagicMock()
-    growth_rows.all.return_value = [
-        SimpleNamespace(
-            id=uuid4(),
-            tenant_id=tenant_growth,
-            recorded_at=date(2024, 1, 15),
-        ),
-        SimpleNamespace(
-            id=uuid4(),
-            tenant_id=tenant_growth,
-            recorded_at=date(2024, 1, 16),
-        ),
-    ]
-
-    growth_empty = MagicMock()
-    growth_empty.all.return_value = []
-
     mock_db.execute = AsyncMock(
         side_effect=[
             plan_rows,
-            free_rows,
-            MagicMock(),
-            free_empty,
-            growth_rows,
-            MagicMock(),
-            growth_empty,
+            _expired_rows(_expired(tenant_free, 1, date(2025, 1, 1), date(2025, 1, 1))),
+            _deleted(1),
+            _expired_rows(
+                _expired(tenant_growth, 2, date(2024, 1, 15), date(2024, 1, 16))
+            ),
+            _deleted(2),
         ]
     )
 
@@ -410,6 +400,173 @@ async def test_cleanup_expired_records_by_plan_returns_tenant_reports(
     assert mock_db.flush.await_count == 2
 
 
+@pytest.mark.asyncio
+async def test_cleanup_expired_records_by_plan_deletes_tenant_day_ranges(
+    persistence_service, mock_db
+):
+    from sqlalchemy.dialects import postgresql
+
+    tenant_id = uuid4()
+    plan_rows = MagicMock()
+    plan_rows.scalars.return_value.all.return_value = ["growth"]
+    mock_db.execute = AsyncMock(
+        side_effect=[
+            plan_rows,
+            _expired_rows(
+                _expired(tenant_id, 300, date(2025, 1, 25), date(2025, 2, 3))
+            ),
+            _deleted(90),
+            _deleted(90),
+            _deleted(30),
+        ]
+    )
+
+    result = await persistence_service.cleanup_expired_records_by_plan(
+        batch_size=100,
+        max_batches=3,
+        as_of_date=date(2026, 3, 7),
+    )
+
+    deletes = [
+        call.args[0].compile(dialect=postgresql.dialect())
+        for call in mock_db.execute.await_args_list[2:]
+    ]
+    # 30 rows a day gives three-day ranges, cut at the month (partition) edge;
+    # the statement budget stops the sweep before February.
+    assert [sorted(stmt.params.values(), key=str) for stmt in deletes] == [
+        sorted([tenant_id, date(2025, 1, 25), date(2025, 1, 28)], key=str),
+        sorted([tenant_id, date(2025, 1, 28), date(2025, 1, 31)], key=str),
+        sorted([tenant_id, date(2025, 1, 31), date(2025, 2, 1)], key=str),
+    ]
+    for stmt in deletes:
+        sql = str(stmt)
+        assert sql.startswith("DELETE FROM cost_records WHERE")
+        assert "cost_records.tenant_id =" in sql and " IN " not in sql
+    assert result["deleted_count"] == 210
+    assert result["tenant_reports"][0]["oldest_recorded_at"] == "2025-01-25"
+    assert result["tenant_reports"][0]["newest_recorded_at"] == "2025-01-31"
+
+
+@pytest.mark.asyncio
+async def test_cleanup_expired_records_by_plan_applies_each_tenants_plan(
+    db_session,
+):
+    from sqlalchemy import select
+
+    from app.models.cloud import CloudAccount, CostRecord
+    from app.models.tenant import Tenant
+
+    async def seed(plan: str, days: list[date]) -> Tenant:
+        tenant = Tenant(id=uuid4(), name=f"retention-{plan}", plan=plan)
+        db_session.add(tenant)
+        await db_session.flush()
+        account = CloudAccount(tenant_id=tenant.id, provider="aws", name="AWS")
+        db_session.add(account)
+        await db_session.flush()
+        for idx, day in enumerate(days):
+            db_session.add(
+                CostRecord(
+                    tenant_id=tenant.id,
+                    account_id=account.id,
+                    service="AmazonEC2",
+                    region="us-east-1",
+                    resource_id=f"i-{idx}",
+                    cost_usd=Decimal("1"),
+                    recorded_at=day,
+                    timestamp=datetime.combine(day, datetime.min.time()),
+                )
+            )
+        await db_session.flush()
+        return tenant
+
+    free = await seed("free", [date(2026, 1, 10), date(2026, 1, 20), date(2026, 3, 1)])
+    pro = await seed("pro", [date(2026, 1, 10)])
+
+    result = await CostPersistenceService(db_session).cleanup_expired_records_by_plan(
+        as_of_date=date(2026, 3, 7)
+    )
+
+    remaining = (
+        await db_session.execute(select(CostRecord.tenant_id, CostRecord.recorded_at))
+    ).all()
+    assert sorted((row.tenant_id, row.recorded_at) for row in remaining) == sorted(
+        [(free.id, date(2026, 3, 1)), (pro.id, date(2026, 1, 10))]
+    )
+    assert result["deleted_count"] == 2
+    assert result["tenant_reports"] == [
+        {
+            "tenant_id": str(free.id),
+            "tenant_tier": "free",
+            "retention_days": 30,
+            "deleted_count": 2,
+            "oldest_recorded_at": "2026-01-10",
+            "newest_recorded_at": "2026-01-20",
+        }
+    ]
+
+
+@pytest.mark.asyncio
+async def test_cleanup_expired_records_by_plan_keeps_batching_after_partition_drops(
+    persistence_service, mock_db
+):
+    tenant_growth = uuid4()
+
+    plan_rows = MagicMock()
+    plan_rows.scalars.return_value.all.return_value = ["growth"]
+
+    mock_db.execute = AsyncMock(
+        side_effect=[
+            plan_rows,
+            _expired_rows(
+                _expired(tenant_growth, 1, date(2025, 2, 1), date(2025, 2, 1))
+            ),
+            _deleted(1),
+        ]
+    )
+    partition_summary = {
+        "deleted_count": 40,
+        "tiers": {"growth": 40},
+        "tenant_reports": [
+            {
+                "tenant_id": str(tenant_growth),
+                "tenant_tier": "growth",
+                "retention_days": 365,
+                "deleted_count": 40,
+                "oldest_recorded_at": "2025-01-01",
+                "newest_recorded_at": "2025-01-31",
+            }
+        ],
+        "partitions_dropped": ["cost_records_2025_01"],
+    }
+
+    with patch(
+        "app.modules.reporting.domain.persistence_retention_ops."
+        "drop_expired_partitions_by_plan",
+        AsyncMock(return_value=partition_summary),
+    ):
+        result = await persistence_service.cleanup_expired_records_by_plan(
+            batch_size=1,
+            max_batches=1,
+            as_of_date=date(2026, 3, 7),
+        )
+
+    # One DELETE for what the partition drops left behind.
+    assert mock_db.execute.await_count == 3
+    assert result["deleted_count"] == 41
+    assert result["tiers"] == {"growth": 41}
+    assert result["partitions_dropped"] == ["cost_records_2025_01"]
+    assert result["tenant_reports"] == [
+        {
+            "tenant_id": str(tenant_growth),
+            "tenant_tier": "growth",
+            "retention_days": 365,
+            "deleted_count": 41,
+            "oldest_recorded_at": "2025-01-01",
+            "newest_recorded_at": "2025-02-01",
+        }
+    ]
+
+
 @pytest.mark.asyncio
 async def test_finalize_batch_success(persistence_service, mock_db):
     mock_res = MagicMock()
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from datetime import datetime, timedelta, timezone
+from decimal import Decimal
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
@@ -238,7 +239,7 @@ async def test_hybrid_verify_and_stream_cloudkitty_conversion_fallback() -> None
         patch.object(adapter, "_get_openstack_token", new=AsyncMock(return_value="token-1")),
         patch.object(adapter, "_get_json", new=AsyncMock(return_value=payload)),
         patch(
-            "app.shared.adapters.hybrid.convert_to_usd",
+            "app.shared.core.currency.get_exchange_rate",
             new=AsyncMock(side_effect=RuntimeError("fx down")),
         ),
     ):
@@ -357,7 +358,7 @@ async def test_hybrid_ledger_helpers_extract_and_conversion_fallback() -> None:
             ),
         ),
         patch(
-            "app.shared.adapters.hybrid.convert_to_usd",
+            "app.shared.core.currency.get_exchange_rate",
             new=AsyncMock(side_effect=RuntimeError("fx down")),
         ),
     ):
@@ -686,7 +687,10 @@ async def test_hybrid_openstack_vmware_and_ledger_success_branches() -> None:
                 }
             ),
         ),
-        patch("app.shared.adapters.hybrid.convert_to_usd", new=AsyncMock(return_value=7.7)),
+        patch(
+            "app.shared.core.currency.get_exchange_rate",
+            new=AsyncMock(return_value=Decimal("0.5")),
+        ),
     ):
         rows = [
             row
@@ -702,7 +706,7 @@ async def test_hybrid_openstack_vmware_and_ledger_success_branches() -> None:
     assert rows[1]["resource_id"] is None
     assert rows[1]["usage_amount"] is None
     assert rows[1]["usage_unit"] is None
-    assert rows[1]["cost_usd"] == 7.7
+    assert rows[1]["cost_usd"] == 6.0
 
 
 @pytest.mark.asyncio
@@ -889,7 +893,7 @@ async def test_hybrid_ledger_cost_path_default_and_usd_no_conversion_branch() ->
                 }
             ),
         ),
-        patch("app.shared.adapters.hybrid.convert_to_usd", new=convert_mock),
+        patch("app.shared.core.currency.get_exchange_rate", new=convert_mock),
     ):
         rows = [
             row
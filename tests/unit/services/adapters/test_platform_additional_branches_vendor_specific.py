@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
+from decimal import Decimal
 from unittest.mock import AsyncMock, patch
 
 import pytest
@@ -167,7 +168,7 @@ async def test_platform_ledger_helpers_extract_and_conversion_fallback() -> None
             ),
         ),
         patch(
-            "app.shared.adapters.platform.convert_to_usd",
+            "app.shared.core.currency.get_exchange_rate",
             new=AsyncMock(side_effect=RuntimeError("fx down")),
         ),
     ):
@@ -303,8 +304,8 @@ async def test_platform_ledger_resolution_and_stream_fields() -> None:
             ),
         ),
         patch(
-            "app.shared.adapters.platform.convert_to_usd",
-            new=AsyncMock(return_value=6.6),
+            "app.shared.core.currency.get_exchange_rate",
+            new=AsyncMock(return_value=Decimal("0.5")),
         ),
     ):
         rows = [
@@ -322,7 +323,7 @@ async def test_platform_ledger_resolution_and_stream_fields() -> None:
     assert rows[1]["resource_id"] is None
     assert rows[1]["usage_amount"] is None
     assert rows[1]["usage_unit"] is None
-    assert rows[1]["cost_usd"] == 6.6
+    assert rows[1]["cost_usd"] == 6.0
 
 
 @pytest.mark.asyncio
@@ -398,7 +399,7 @@ async def test_platform_ledger_path_and_currency_branches() -> None:
                 }
             ),
         ),
-        patch("app.shared.adapters.platform.convert_to_usd", new=AsyncMock(return_value=99.0)),
+        patch("app.shared.core.currency.get_exchange_rate", new=AsyncMock(return_value=99.0)),
     ):
         rows = [
             row
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from app.shared.adapters.paged_stream_ops import stream_blocking_pages
+
+
+@pytest.mark.asyncio
+async def test_stream_blocking_pages_is_lazy_and_bounded() -> None:
+    pulled: list[int] = []
+    threads: set[int] = set()
+
+    def _open() -> object:
+        def _rows():
+            for idx in range(7):
+                threads.add(threading.get_ident())
+                pulled.append(idx)
+                yield idx
+
+        return _rows()
+
+    pages = stream_blocking_pages(_open, page_size=3)
+    assert await pages.__anext__() == [0, 1, 2]
+    assert len(pulled) <= 6
+    assert [page async for page in pages] == [[3, 4, 5], [6]]
+    assert threading.get_ident() not in threads
+
+
+@pytest.mark.asyncio
+async def test_stream_blocking_pages_surfaces_errors_and_closes_early() -> None:
+    def _failing() -> object:
+        def _rows():
+            yield 1
+            raise RuntimeError("page fetch failed")
+
+        return _rows()
+
+    with pytest.raises(RuntimeError, match="page fetch failed"):
+        [page async for page in stream_blocking_pages(_failing, page_size=2)]
+
+    pages = stream_blocking_pages(lambda: iter(range(100)), page_size=10)
+    assert await pages.__anext__() == list(range(10))
+    await pages.aclose()
+    assert [page async for page in stream_blocking_pages(lambda: [], page_size=2)] == []
@@ -253,7 +253,7 @@ async def test_saas_stream_stripe_branch_paths_non_dict_out_of_range_conversion_
     with (
         patch("app.shared.adapters.saas.httpx.AsyncClient", return_value=fake_client),
         patch(
-            "app.shared.adapters.saas.convert_to_usd",
+            "app.shared.core.currency.get_exchange_rate",
             new=AsyncMock(side_effect=RuntimeError("fx down")),
         ),
         patch("app.shared.adapters.saas.logger.warning") as warning,
@@ -315,7 +315,7 @@ async def test_saas_stream_salesforce_branch_paths_non_dict_out_of_range_convers
     with (
         patch("app.shared.adapters.saas.httpx.AsyncClient", return_value=fake_client),
         patch(
-            "app.shared.adapters.saas.convert_to_usd",
+            "app.shared.core.currency.get_exchange_rate",
             new=AsyncMock(side_effect=RuntimeError("fx error")),
         ),
         patch("app.shared.adapters.saas.logger.warning") as warning,
@@ -0,0 +1,325 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.models.llm import LLMBudget, LLMUsage, LLMUsageCounter
+from app.shared.core.pricing import PricingTier
+from app.shared.llm import budget_fair_use
+from app.shared.llm import budget_ledger_ops as ledger
+from app.shared.llm.budget_manager import LLMBudgetManager
+
+
+class _FakeRedis:
+    def __init__(self) -> None:
+        self.values: dict[str, int] = {}
+
+    async def get(self, key: str) -> str | None:
+        value = self.values.get(key)
+        return None if value is None else str(value)
+
+    async def set(self, key: str, value: str, ex: int | None = None) -> None:
+        self.values[key] = int(value)
+
+    async def incr(self, key: str) -> int:
+        self.values[key] = self.values.get(key, 0) + 1
+        return self.values[key]
+
+    async def delete(self, key: str) -> None:
+        self.values.pop(key, None)
+
+
+def _budget(tenant_id, *, limit="1.00", spend="0", reset_at=None) -> LLMBudget:
+    return LLMBudget(
+        tenant_id=tenant_id,
+        monthly_limit_usd=Decimal(limit),
+        alert_threshold_percent=80,
+        hard_limit=True,
+        monthly_spend_usd=Decimal(spend),
+        pending_reservations_usd=Decimal("0"),
+        budget_reset_at=reset_at or datetime.now(timezone.utc),
+    )
+
+
+def test_scope_mapping_mirrors_window_filters() -> None:
+    user_id = uuid4()
+    assert ledger.counter_scope() == "tenant"
+    assert ledger.counter_scope(actor_type="System") == "actor:system"
+    assert ledger.counter_scope(actor_type="user", user_id=user_id) == (
+        f"user:{user_id}"
+    )
+    assert ledger.counter_scope(user_id=user_id) is None
+    assert ledger.usage_scopes("user:analysis", user_id) == (
+        "tenant",
+        "actor:user",
+        f"user:{user_id}",
+    )
+    assert ledger.usage_scopes("system:analysis", user_id) == (
+        "tenant",
+        "actor:system",
+    )
+    assert ledger.usage_scopes("legacy", None) == ("tenant",)
+
+    day = datetime(2026, 3, 9, tzinfo=timezone.utc)
+    assert ledger.utc_day_window(day, day + timedelta(days=1)) == day.date()
+    assert ledger.utc_day_window(day, None) is None
+    late_start = day + timedelta(hours=1)
+    assert ledger.utc_day_window(late_start, day + timedelta(days=1)) is None
+
+
+@pytest.mark.asyncio
+async def test_unsupported_sessions_keep_the_locked_fallback() -> None:
+    db = MagicMock()
+    db.execute = AsyncMock()
+    now = datetime.now(timezone.utc)
+
+    assert ledger.ledger_dialect(db) is None
+    assert (
+        await ledger.reserve_within_limit(
+            db, tenant_id=uuid4(), estimated_cost=Decimal("1"), now=now
+        )
+        is None
+    )
+    assert not await ledger.settle_reservation(
+        db, tenant_id=uuid4(), reserved_usd=Decimal("1"), actual_usd=Decimal("1")
+    )
+    counted = await ledger.count_daily_requests(
+        db, tenant_id=uuid4(), day=now.date(), scope="tenant"
+    )
+    assert counted is None
+    db.execute.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_reservations_never_overspend(
+    async_engine, db_session
+) -> None:
+    tenant_id = uuid4()
+    db_session.add(_budget(tenant_id, limit="1.00", spend="0.10"))
+    await db_session.commit()
+
+    sessions = async_sessionmaker(async_engine, class_=AsyncSession)
+    now = datetime.now(timezone.utc)
+
+    async def reserve() -> Decimal | None:
+        async with sessions() as session:
+            pending = await ledger.reserve_within_limit(
+                session,
+                tenant_id=tenant_id,
+                estimated_cost=Decimal("0.15"),
+                now=now,
+            )
+            await session.commit()
+            return pending
+
+    results = await asyncio.gather(*(reserve() for _ in range(20)))
+
+    granted = [item for item in results if item is not None]
+    assert len(granted) == 6  # 0.10 + 6 * 0.15 = 1.00; a seventh would exceed
+    assert max(granted) == Decimal("0.90")
+    async with sessions() as session:
+        budget = (
+            await session.execute(
+                select(LLMBudget).where(LLMBudget.tenant_id == tenant_id)
+            )
+        ).scalar_one()
+    assert Decimal(str(budget.pending_reservations_usd)) == Decimal("0.90")
+
+
+@pytest.mark.asyncio
+async def test_manager_reserve_and_record_round_trip_through_ledger(db_session) -> None:
+    tenant_id = uuid4()
+    settings = MagicMock(
+        LLM_FAIR_USE_GUARDS_ENABLED=False, LLM_GLOBAL_ABUSE_GUARDS_ENABLED=False
+    )
+    with (
+        patch("app.shared.llm.budget_manager.get_settings", return_value=settings),
+        patch(
+            "app.shared.llm.budget_manager.get_tenant_tier",
+            new=AsyncMock(return_value=PricingTier.PRO),
+        ),
+        patch.object(
+            LLMBudgetManager, "_enforce_daily_analysis_limit", new=AsyncMock()
+        ),
+    ):
+        # First call bootstraps the budget on the locked path, the second takes
+        # the conditional UPDATE.
+        first = await LLMBudgetManager.check_and_reserve(
+            tenant_id, db_session, model="gpt-4o", prompt_tokens=1000
+        )
+        second = await LLMBudgetManager.check_and_reserve(
+            tenant_id, db_session, model="gpt-4o", prompt_tokens=1000
+        )
+        await LLMBudgetManager.record_usage(
+            tenant_id,
+            db_session,
+            model="gpt-4o",
+            prompt_tokens=1000,
+            completion_tokens=500,
+            actual_cost_usd=Decimal("0.0100"),
+        )
+
+    budget = (
+        await db_session.execute(
+            select(LLMBudget).where(LLMBudget.tenant_id == tenant_id)
+        )
+    ).scalar_one()
+    await db_session.refresh(budget)
+    assert Decimal(str(budget.pending_reservations_usd)) == first + second - min(
+        first + second, LLMBudgetManager.estimate_cost(1000, 500, "gpt-4o", "openai")
+    )
+    assert Decimal(str(budget.monthly_spend_usd)) == Decimal("0.0100")
+    now = datetime.now(timezone.utc)
+    spend = await ledger.month_to_date_spend(db_session, tenant_id=tenant_id, now=now)
+    assert Decimal(str(spend)) == Decimal("0.0100")
+
+
+@pytest.mark.asyncio
+async def test_stale_month_is_left_for_the_locked_path(db_session) -> None:
+    tenant_id = uuid4()
+    last_month = datetime.now(timezone.utc) - timedelta(days=40)
+    db_session.add(_budget(tenant_id, reset_at=last_month))
+    await db_session.commit()
+
+    reserved = await ledger.reserve_within_limit(
+        db_session,
+        tenant_id=tenant_id,
+        estimated_cost=Decimal("0.01"),
+        now=datetime.now(timezone.utc),
+    )
+
+    assert reserved is None
+
+
+@pytest.mark.asyncio
+async def test_settlement_and_counters_replace_usage_scans(db_session) -> None:
+    tenant_id, user_id = uuid4(), uuid4()
+    db_session.add(_budget(tenant_id, limit="10.00"))
+    await db_session.commit()
+    now = datetime.now(timezone.utc)
+
+    assert await ledger.reserve_within_limit(
+        db_session, tenant_id=tenant_id, estimated_cost=Decimal("0.30"), now=now
+    ) == Decimal("0.30")
+    assert await ledger.settle_reservation(
+        db_session,
+        tenant_id=tenant_id,
+        reserved_usd=Decimal("0.50"),
+        actual_usd=Decimal("0.25"),
+    )
+    for request_type, actor_user in (
+        ("user:analysis", user_id),
+        ("user:analysis", user_id),
+        ("system:analysis", None),
+    ):
+        db_session.add(
+            LLMUsage(
+                tenant_id=tenant_id,
+                user_id=actor_user,
+                provider="groq",
+                model="m",
+                cost_usd=Decimal("0.25"),
+                request_type=request_type,
+            )
+        )
+        await ledger.increment_usage_counters(
+            db_session,
+            tenant_id=tenant_id,
+            user_id=actor_user,
+            request_type=request_type,
+            cost_usd=Decimal("0.25"),
+            at=now,
+        )
+    await db_session.commit()
+
+    budget = (
+        await db_session.execute(
+            select(LLMBudget).where(LLMBudget.tenant_id == tenant_id)
+        )
+    ).scalar_one()
+    await db_session.refresh(budget)
+    assert Decimal(str(budget.pending_reservations_usd)) == Decimal("0")
+    assert Decimal(str(budget.monthly_spend_usd)) == Decimal("0.25")
+
+    day_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    day_end = day_start + timedelta(days=1)
+    for kwargs, expected in (
+        ({}, 3),
+        ({"actor_type": "system"}, 1),
+        ({"actor_type": "user", "user_id": user_id}, 2),
+    ):
+        with patch.object(
+            budget_fair_use,
+            "count_daily_requests",
+            wraps=ledger.count_daily_requests,
+        ) as from_ledger:
+            counted = await budget_fair_use.count_requests_in_window(
+                tenant_id, db_session, day_start, day_end, **kwargs
+            )
+        from_ledger.assert_awaited_once()
+        scanned = await budget_fair_use.count_requests_in_window(
+            tenant_id, db_session, day_start, None, **kwargs
+        )
+        assert counted == scanned == expected
+    rows = await db_session.execute(
+        select(func.count(LLMUsageCounter.id)).where(
+            LLMUsageCounter.tenant_id == tenant_id
+        )
+    )
+    assert rows.scalar() == 8  # tenant, actor:user, actor:system, user x day/month
+    spend = await ledger.month_to_date_spend(db_session, tenant_id=tenant_id, now=now)
+    assert Decimal(str(spend)) == Decimal("0.75")
+
+
+@pytest.mark.asyncio
+async def test_redis_fast_path_seeds_from_ledger_and_tracks_increments(
+    db_session,
+) -> None:
+    tenant_id = uuid4()
+    now = datetime.now(timezone.utc)
+    await ledger.increment_usage_counters(
+        db_session,
+        tenant_id=tenant_id,
+        user_id=None,
+        request_type="system:analysis",
+        cost_usd=Decimal("0.01"),
+        at=now,
+    )
+    await db_session.commit()
+    redis = _FakeRedis()
+    cache = SimpleNamespace(enabled=True, client=redis)
+    settings = SimpleNamespace(LLM_USAGE_LEDGER_REDIS_ENABLED=True)
+
+    with patch.object(ledger, "get_settings", return_value=settings):
+        count = await ledger.count_daily_requests(
+            db_session, tenant_id=tenant_id, day=now.date(), scope="tenant", cache=cache
+        )
+        assert count == 1
+        await ledger.publish_usage_increment(
+            cache,
+            tenant_id=tenant_id,
+            user_id=None,
+            request_type="system:analysis",
+            at=now,
+        )
+        # The seeded key is bumped; the unseeded actor key is dropped, not invented.
+        assert redis.values == {
+            f"llm:usage_counter:{tenant_id}:{now.date().isoformat()}:tenant": 2
+        }
+        db_session.execute = AsyncMock(side_effect=AssertionError("db read"))
+        assert (
+            await ledger.count_daily_requests(
+                db_session,
+                tenant_id=tenant_id,
+                day=now.date(),
+                scope="tenant",
+                cache=cache,
+            )
+            == 2
+        )
@@ -3,7 +3,6 @@ from __future__ import annotations
 from contextlib import asynccontextmanager
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
-from uuid import uuid4
 
 import pytest
 
@@ -22,20 +21,17 @@ def test_run_enforcement_reconciliation_sweep_wrapper() -> None:
 
 @pytest.mark.asyncio
 async def test_enforcement_reconciliation_sweep_dispatches_per_tenant() -> None:
-    tenant_ids = [uuid4(), uuid4()]
     db = AsyncMock()
     begin_ctx = AsyncMock()
     begin_ctx.__aenter__.return_value = db
     begin_ctx.__aexit__.return_value = None
     db.begin = MagicMock(return_value=begin_ctx)
 
-    select_result = MagicMock()
-    select_result.scalars.return_value.all.return_value = tenant_ids
-    first_insert = MagicMock()
-    first_insert.rowcount = 1
-    second_insert = MagicMock()
-    second_insert.rowcount = 0
-    db.execute.side_effect = [select_result, first_insert, second_insert]
+    count_result = MagicMock()
+    count_result.scalar.return_value = 2
+    insert_result = MagicMock()
+    insert_result.rowcount = 1
+    db.execute.side_effect = [count_result, insert_result]
 
     @asynccontextmanager
     async def _db_cm():
@@ -51,16 +47,17 @@ async def test_enforcement_reconciliation_sweep_dispatches_per_tenant() -> None:
         )
         await _enforcement_reconciliation_sweep_logic()
 
-    assert db.execute.call_count == 3
+    assert db.execute.call_count == 2
     insert_stmt = db.execute.call_args_list[1].args[0]
-    compiled = insert_stmt.compile()
-    assert compiled.params.get("job_type") == JobType.ENFORCEMENT_RECONCILIATION.value
+    params = list(insert_stmt.compile().params.values())
+    assert JobType.ENFORCEMENT_RECONCILIATION.value in params
+    assert {"trigger": "scheduled"} in params
     assert "deduplication_key" in str(insert_stmt)
     mock_enqueued.labels.assert_called_once_with(
         job_type=JobType.ENFORCEMENT_RECONCILIATION.value,
         cohort="ENFORCEMENT",
     )
-    mock_enqueued.labels.return_value.inc.assert_called_once()
+    mock_enqueued.labels.return_value.inc.assert_called_once_with(1)
 
 
 @pytest.mark.asyncio
@@ -0,0 +1,154 @@
+import random
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+
+from app.models.background_job import BackgroundJob, JobStatus, JobType
+from app.models.tenant import Tenant
+from app.tasks.scheduler_cohort_spread_ops import (
+    CohortSpreadPolicy,
+    cohort_dedup_bucket,
+    jitter_fraction,
+    load_job_duration_history,
+    plan_cohort_spread,
+    resolve_spread_policy,
+    spread_cohort_jobs,
+)
+
+NOW = datetime(2026, 3, 2, 7, 30, tzinfo=timezone.utc)
+JOB_TYPES = ("zombie_scan", "cost_ingestion", "finops_analysis")
+
+
+def _fleet(tenants: int, *, seed: int = 7) -> list[tuple[str, float]]:
+    rng = random.Random(seed)
+    return [
+        (f"{uuid4()}:{job_type}", rng.lognormvariate(3.5, 0.8))
+        for _ in range(tenants)
+        for job_type in JOB_TYPES
+    ]
+
+
+def test_policy_defaults_and_dedup_buckets() -> None:
+    settings = SimpleNamespace()
+    policy = resolve_spread_policy("high_value", get_settings_fn=lambda: settings)
+    assert policy.window_seconds == 3 * 3600
+    assert policy.bucket_count == 36
+    daily = resolve_spread_policy(
+        "active",
+        get_settings_fn=lambda: SimpleNamespace(SCHEDULER_COHORT_SPREAD_FRACTION=0),
+    )
+    assert daily.window_seconds == 0 and daily.bucket_count == 1
+
+    assert cohort_dedup_bucket("high_value", NOW) == "2026-03-02T06:00:00+00:00"
+    assert cohort_dedup_bucket("active", NOW) == "2026-03-02T06:00:00+00:00"
+    assert cohort_dedup_bucket("dormant", NOW) == "2026-03-02T07:00:00+00:00"
+    assert jitter_fraction("tenant:zombie_scan") == jitter_fraction(
+        "tenant:zombie_scan"
+    )
+
+
+def test_simulated_fleet_is_spread_within_the_capacity_budget() -> None:
+    policy = resolve_spread_policy(
+        "high_value", get_settings_fn=lambda: SimpleNamespace()
+    )
+    jobs = _fleet(1000)
+
+    plan = plan_cohort_spread(jobs, policy=policy)
+
+    assert len(plan.offsets) == len(jobs) == 3000
+    assert plan.overflow_jobs == 0
+    assert all(0 <= offset < policy.window_seconds for offset in plan.offsets.values())
+    # Every bucket is used and none exceeds its job cap or work budget, versus
+    # all 3000 jobs landing on the cohort tick before.
+    assert min(plan.bucket_jobs) > 0
+    assert plan.peak_bucket_jobs <= policy.bucket_max_jobs
+    assert max(plan.bucket_load_seconds) <= policy.bucket_capacity_seconds
+    shuffled = list(jobs)
+    random.Random(1).shuffle(shuffled)
+    assert plan_cohort_spread(shuffled, policy=policy) == plan
+
+
+def test_heavy_jobs_claim_their_own_buckets_and_overflow_is_counted() -> None:
+    policy = CohortSpreadPolicy(
+        window_seconds=600,
+        bucket_seconds=60,
+        bucket_capacity_seconds=600,
+        bucket_max_jobs=20,
+    )
+    heavy = [(f"heavy-{i}:cost_ingestion", 500.0) for i in range(4)]
+    light = [(f"light-{i}:zombie_scan", 30.0) for i in range(60)]
+
+    plan = plan_cohort_spread(heavy + light, policy=policy)
+
+    heavy_buckets = {int(plan.offsets[key] // 60) for key, _ in heavy}
+    assert len(heavy_buckets) == 4
+    for jobs, load in zip(plan.bucket_jobs, plan.bucket_load_seconds):
+        assert jobs == 1 or load <= policy.bucket_capacity_seconds
+    assert plan.overflow_jobs == 0
+
+    crowded = plan_cohort_spread(
+        [(f"t{i}:zombie_scan", 400.0) for i in range(25)], policy=policy
+    )
+    assert crowded.overflow_jobs == 15
+    assert len(crowded.offsets) == 25
+    assert crowded.peak_bucket_jobs == 3
+
+
+@pytest.mark.asyncio
+async def test_spread_uses_job_history_and_records_metrics(db_session) -> None:
+    tenant = Tenant(id=uuid4(), name="fleet", plan="pro")
+    db_session.add(tenant)
+    for seconds in (600, 1200):
+        started = NOW - timedelta(days=1)
+        db_session.add(
+            BackgroundJob(
+                job_type=JobType.COST_INGESTION.value,
+                tenant_id=tenant.id,
+                status=JobStatus.COMPLETED.value,
+                scheduled_for=started,
+                started_at=started,
+                completed_at=started + timedelta(seconds=seconds),
+                created_at=started,
+            )
+        )
+    await db_session.commit()
+
+    history = await load_job_duration_history(
+        db_session,
+        background_job_model=BackgroundJob,
+        completed_status=JobStatus.COMPLETED,
+        tenant_ids=[tenant.id],
+        job_types=[JobType.COST_INGESTION.value, JobType.ZOMBIE_SCAN.value],
+        now=NOW,
+    )
+    assert history == {
+        (str(tenant.id), JobType.COST_INGESTION.value): pytest.approx(900.0)
+    }
+
+    jobs = [
+        {"tenant_id": tenant.id, "job_type": job_type.value}
+        for job_type in (JobType.COST_INGESTION, JobType.ZOMBIE_SCAN)
+    ]
+    histogram, gauge, counter = MagicMock(), MagicMock(), MagicMock()
+    plan = await spread_cohort_jobs(
+        db_session,
+        cohort_value="high_value",
+        jobs=jobs,
+        now=NOW,
+        background_job_model=BackgroundJob,
+        completed_status=JobStatus.COMPLETED,
+        get_settings_fn=SimpleNamespace,
+        offset_histogram=histogram,
+        peak_bucket_gauge=gauge,
+        overflow_counter=counter,
+    )
+
+    assert sum(plan.bucket_load_seconds) == pytest.approx(960.0)
+    for job in jobs:
+        assert NOW <= job["scheduled_for"] < NOW + timedelta(hours=3)
+    assert histogram.labels.return_value.observe.call_count == 2
+    gauge.labels.return_value.set.assert_called_once_with(plan.peak_bucket_jobs)
+    counter.labels.assert_not_called()
@@ -0,0 +1,136 @@
+import asyncio
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+from uuid import UUID, uuid4
+
+import pytest
+import sqlalchemy as sa
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.models.background_job import BackgroundJob, JobStatus, JobType
+from app.models.tenant import Tenant
+from app.tasks.scheduler_sweep_enqueue_ops import (
+    SweepEnqueueResult,
+    enqueue_jobs_from_select,
+    json_object_expr,
+)
+
+NOW = datetime(2026, 1, 1, 6, 0, tzinfo=timezone.utc)
+
+
+async def _enqueue(db, **overrides):
+    kwargs = dict(
+        insert_fn=sqlite_insert,
+        background_job_model=BackgroundJob,
+        source=sa.select(Tenant.id.label("tenant_id")).order_by(Tenant.id),
+        job_type_value=JobType.ACCEPTANCE_SUITE_CAPTURE.value,
+        bucket="2026-01-01",
+        status=JobStatus.PENDING,
+        now=NOW,
+        payload={"capture_close_package": True},
+    )
+    kwargs.update(overrides)
+    return await enqueue_jobs_from_select(db, **kwargs)
+
+
+async def _seed_tenants(db, count: int) -> list[UUID]:
+    ids = [uuid4() for _ in range(count)]
+    db.add_all(
+        Tenant(id=tenant_id, name=f"t{i}", plan="pro")
+        for i, tenant_id in enumerate(ids)
+    )
+    await db.commit()
+    return ids
+
+
+async def _jobs(db) -> list[BackgroundJob]:
+    return list((await db.execute(sa.select(BackgroundJob))).scalars().all())
+
+
+@pytest.mark.asyncio
+async def test_enqueue_is_one_statement_and_idempotent(db_session) -> None:
+    tenant_ids = await _seed_tenants(db_session, 3)
+
+    first = await _enqueue(db_session)
+    second = await _enqueue(db_session)
+    await db_session.commit()
+
+    assert first == SweepEnqueueResult(candidates=3, inserted=3)
+    assert (second.inserted, second.skipped) == (0, 3)
+    jobs = await _jobs(db_session)
+    assert sorted(job.tenant_id for job in jobs) == sorted(tenant_ids)
+    job = jobs[0]
+    assert job.payload == {"capture_close_package": True}
+    assert job.status == JobStatus.PENDING.value
+    assert (job.attempts, job.max_attempts, job.priority) == (0, 3, 0)
+    assert job.deduplication_key.endswith(":acceptance_suite_capture:2026-01-01")
+    assert len({job.id for job in jobs}) == 3
+
+
+@pytest.mark.asyncio
+async def test_concurrent_sweeps_enqueue_each_job_once(
+    async_engine, db_session
+) -> None:
+    await _seed_tenants(db_session, 5)
+    sessions = async_sessionmaker(async_engine, class_=AsyncSession)
+
+    async def sweep() -> SweepEnqueueResult:
+        async with sessions() as session, session.begin():
+            return await _enqueue(session)
+
+    outcomes = await asyncio.gather(*(sweep() for _ in range(4)))
+
+    assert sum(outcome.inserted for outcome in outcomes) == 5
+    assert sum(outcome.skipped for outcome in outcomes) == 15
+    assert len(await _jobs(db_session)) == 5
+
+
+@pytest.mark.asyncio
+async def test_limit_caps_candidates_and_per_row_payloads(db_session) -> None:
+    tenant_ids = await _seed_tenants(db_session, 3)
+    logger = MagicMock()
+
+    outcome = await _enqueue(
+        db_session,
+        source=sa.select(
+            Tenant.id.label("tenant_id"),
+            json_object_expr(
+                db_session, sa.literal("tenant_ref"), sa.cast(Tenant.id, sa.String)
+            ).label("payload"),
+        ).order_by(Tenant.id),
+        limit=2,
+        scope="acceptance_tenants",
+        logger=logger,
+    )
+
+    assert outcome == SweepEnqueueResult(candidates=2, inserted=2)
+    logger.warning.assert_called_once_with(
+        "scheduler_scope_capped",
+        scope="acceptance_tenants",
+        total_items=3,
+        capped_items=2,
+        limit=2,
+    )
+    jobs = await _jobs(db_session)
+    assert len(jobs) == 2
+    for job in jobs:
+        assert UUID(job.payload["tenant_ref"]) == job.tenant_id
+    assert {job.tenant_id for job in jobs} == set(sorted(tenant_ids)[:2])
+
+
+@pytest.mark.asyncio
+async def test_empty_source_skips_the_insert() -> None:
+    db = MagicMock()
+    result = MagicMock()
+    result.scalar.return_value = 0
+
+    async def execute(_stmt):
+        return result
+
+    db.execute = MagicMock(side_effect=execute)
+
+    outcome = await _enqueue(db)
+
+    assert outcome == SweepEnqueueResult(candidates=0, inserted=0)
+    assert db.execute.call_count == 1
@@ -8,6 +8,7 @@ from unittest.mock import AsyncMock, MagicMock, call, patch
 from uuid import uuid4
 
 import pytest
+from sqlalchemy.dialects import postgresql
 
 from app.modules.governance.domain.scheduler.cohorts import TenantCohort
 from app.tasks import scheduler_tasks as st
@@ -50,6 +51,16 @@ def _rowcount_result(count: int) -> MagicMock:
     return result
 
 
+def _count_result(count: int) -> MagicMock:
+    result = MagicMock()
+    result.scalar.return_value = count
+    return result
+
+
+def _literal_params(stmt: object) -> list[object]:
+    return list(stmt.compile().params.values())
+
+
 class _TimeoutRaiser:
     async def __aenter__(self) -> None:
         raise asyncio.TimeoutError("db session timeout")
@@ -412,12 +423,8 @@ async def test_remediation_sweep_caps_connection_scope_when_limit_exceeded() ->
 async def test_billing_sweep_handles_zero_then_positive_rowcount() -> None:
     db = AsyncMock()
     _configure_sync_begin(db)
-
-    sub1 = SimpleNamespace(id=uuid4(), tenant_id=uuid4())
-    sub2 = SimpleNamespace(id=uuid4(), tenant_id=uuid4())
     db.execute.side_effect = [
-        _scalars_result([sub1, sub2]),
-        _rowcount_result(0),
+        _count_result(2),
         _rowcount_result(1),
     ]
 
@@ -426,17 +433,25 @@ async def test_billing_sweep_handles_zero_then_positive_rowcount() -> None:
         patch("app.tasks.scheduler_tasks.BACKGROUND_JOBS_ENQUEUED") as mock_enqueued,
         patch("app.tasks.scheduler_tasks.SCHEDULER_JOB_RUNS"),
         patch("app.tasks.scheduler_tasks.SCHEDULER_JOB_DURATION"),
+        patch("app.tasks.scheduler_tasks.logger") as mock_logger,
     ):
         await st._billing_sweep_logic()
 
-    mock_enqueued.labels.return_value.inc.assert_called_once()
+    assert db.execute.call_count == 2
+    assert "ON CONFLICT" in str(
+        db.execute.call_args_list[1].args[0].compile(dialect=postgresql.dialect())
+    )
+    mock_enqueued.labels.return_value.inc.assert_called_once_with(1)
+    mock_logger.info.assert_any_call(
+        "billing_sweep_completed", due_count=2, jobs_enqueued=1, jobs_skipped=1
+    )
 
 
 @pytest.mark.asyncio
 async def test_acceptance_sweep_begin_ctx_awaitable_no_tenants_returns_early() -> None:
     db = AsyncMock()
     _configure_awaitable_begin(db)
-    db.execute.return_value = _scalars_result([])
+    db.execute.return_value = _count_result(0)
 
     with (
         patch("app.tasks.scheduler_tasks._open_db_session", return_value=_db_cm(db)),
@@ -451,12 +466,7 @@ async def test_acceptance_sweep_begin_ctx_awaitable_no_tenants_returns_early() -
 async def test_acceptance_sweep_quarterly_payload_flags_and_rowcount_zero_branch() -> None:
     db = AsyncMock()
     _configure_sync_begin(db)
-    tenants = [SimpleNamespace(id=uuid4()), SimpleNamespace(id=uuid4())]
-    db.execute.side_effect = [
-        _scalars_result(tenants),
-        _rowcount_result(0),
-        _rowcount_result(1),
-    ]
+    db.execute.side_effect = [_count_result(2), _rowcount_result(1)]
 
     with (
         patch("app.tasks.scheduler_tasks._open_db_session", return_value=_db_cm(db)),
@@ -469,21 +479,18 @@ async def test_acceptance_sweep_quarterly_payload_flags_and_rowcount_zero_branch
         await st._acceptance_sweep_logic()
 
     insert_stmt = db.execute.call_args_list[1].args[0]
-    compiled = insert_stmt.compile()
-    payload = compiled.params.get("payload")
-    assert payload == {
+    assert {
         "capture_close_package": True,
         "capture_quarterly_report": True,
-    }
-    mock_enqueued.labels.return_value.inc.assert_called_once()
+    } in _literal_params(insert_stmt)
+    mock_enqueued.labels.return_value.inc.assert_called_once_with(1)
 
 
 @pytest.mark.asyncio
 async def test_acceptance_sweep_close_only_payload_path() -> None:
     db = AsyncMock()
     _configure_sync_begin(db)
-    tenant = SimpleNamespace(id=uuid4())
-    db.execute.side_effect = [_scalars_result([tenant]), _rowcount_result(1)]
+    db.execute.side_effect = [_count_result(1), _rowcount_result(1)]
 
     with (
         patch("app.tasks.scheduler_tasks._open_db_session", return_value=_db_cm(db)),
@@ -496,8 +503,7 @@ async def test_acceptance_sweep_close_only_payload_path() -> None:
         await st._acceptance_sweep_logic()
 
     insert_stmt = db.execute.call_args_list[1].args[0]
-    payload = insert_stmt.compile().params.get("payload")
-    assert payload == {"capture_close_package": True}
+    assert {"capture_close_package": True} in _literal_params(insert_stmt)
 
 
 @pytest.mark.asyncio
@@ -581,7 +587,7 @@ async def test_maintenance_sweep_realized_savings_success_with_sync_carbon_commi
         patch("app.shared.core.maintenance.PartitionMaintenanceService") as mock_maintenance_cls,
     ):
         mock_persistence_cls.return_value.finalize_batch = AsyncMock(return_value={"records_finalized": 1})
-        mock_aggregator_cls.return_value.refresh_materialized_view = AsyncMock(return_value=None)
+        mock_aggregator_cls.return_value.reconcile_daily_aggregates = AsyncMock(return_value=None)
         mock_realized_service = MagicMock()
         mock_realized_service.compute_for_request = AsyncMock(side_effect=[object(), None])
         mock_realized_cls.return_value = mock_realized_service
@@ -620,7 +626,7 @@ async def test_maintenance_sweep_realized_savings_query_failure_and_sync_rollbac
         patch("app.tasks.scheduler_tasks.logger") as mock_logger,
     ):
         mock_persistence_cls.return_value.finalize_batch = AsyncMock(return_value={"records_finalized": 0})
-        mock_aggregator_cls.return_value.refresh_materialized_view = AsyncMock(return_value=None)
+        mock_aggregator_cls.return_value.reconcile_daily_aggregates = AsyncMock(return_value=None)
         mock_maintenance = MagicMock()
         mock_maintenance.create_future_partitions = AsyncMock(return_value=0)
         mock_maintenance.archive_old_partitions = AsyncMock(return_value=0)
@@ -637,7 +643,7 @@ async def test_maintenance_sweep_realized_savings_query_failure_and_sync_rollbac
 async def test_enforcement_reconciliation_sweep_begin_ctx_awaitable_success() -> None:
     db = AsyncMock()
     _configure_awaitable_begin(db)
-    db.execute.return_value = _scalars_result([])
+    db.execute.return_value = _count_result(0)
 
     with (
         patch("app.tasks.scheduler_tasks._open_db_session", return_value=_db_cm(db)),
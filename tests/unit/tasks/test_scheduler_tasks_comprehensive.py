@@ -188,7 +188,7 @@ async def test_maintenance_sweep_success(mock_db):
             mock_persist_cls.return_value = mock_persist
 
             mock_agg = MagicMock()
-            mock_agg.refresh_materialized_view = AsyncMock()
+            mock_agg.reconcile_daily_aggregates = AsyncMock()
             mock_agg_cls.return_value = mock_agg
             mock_auto_activate.return_value = {
                 "status": "no_update",
@@ -201,7 +201,7 @@ async def test_maintenance_sweep_success(mock_db):
 
             await _maintenance_sweep_logic()
             mock_persist.finalize_batch.assert_called_with(days_ago=2)
-            mock_agg.refresh_materialized_view.assert_called_with(mock_db)
+            mock_agg.reconcile_daily_aggregates.assert_called_with(mock_db)
             mock_auto_activate.assert_awaited_once()
             mock_maintenance.create_future_partitions.assert_awaited_once_with(
                 months_ahead=3
@@ -223,7 +223,7 @@ async def test_maintenance_archive_logging(mock_db):
         async def _fake_finalize_batch(self, days_ago):
             return {"records_finalized": 0}
 
-        async def _fake_refresh_materialized_view(self, db):
+        async def _fake_reconcile_daily_aggregates(self, db):
             return None
 
         with patch("app.tasks.scheduler_tasks.logger") as mock_logger:
@@ -234,8 +234,8 @@ async def test_maintenance_archive_logging(mock_db):
                     new=_fake_finalize_batch,
                 ),
                 patch(
-                    "app.tasks.scheduler_tasks.CostAggregator.refresh_materialized_view",
-                    new=_fake_refresh_materialized_view,
+                    "app.tasks.scheduler_tasks.CostAggregator.reconcile_daily_aggregates",
+                    new=_fake_reconcile_daily_aggregates,
                 ),
                 patch(
                     "app.shared.core.maintenance.PartitionMaintenanceService.create_future_partitions",
@@ -266,7 +266,7 @@ async def test_maintenance_carbon_factor_refresh_failure_is_logged(mock_db):
         async def _fake_finalize_batch(self, days_ago):
             return {"records_finalized": 0}
 
-        async def _fake_refresh_materialized_view(self, db):
+        async def _fake_reconcile_daily_aggregates(self, db):
             return None
 
         with patch("app.tasks.scheduler_tasks.logger") as mock_logger:
@@ -276,8 +276,8 @@ async def test_maintenance_carbon_factor_refresh_failure_is_logged(mock_db):
                     new=_fake_finalize_batch,
                 ),
                 patch(
-                    "app.tasks.scheduler_tasks.CostAggregator.refresh_materialized_view",
-                    new=_fake_refresh_materialized_view,
+                    "app.tasks.scheduler_tasks.CostAggregator.reconcile_daily_aggregates",
+                    new=_fake_reconcile_daily_aggregates,
                 ),
                 patch(
                     "app.modules.reporting.domain.carbon_factors.CarbonFactorService.auto_activate_latest",
@@ -474,7 +474,7 @@ class TestSchedulerTasksProductionQuality:
             mock_persistence_cls.return_value = mock_persistence
 
             mock_aggregator = MagicMock()
-            mock_aggregator.refresh_materialized_view = AsyncMock()
+            mock_aggregator.reconcile_daily_aggregates = AsyncMock()
             mock_aggregator_cls.return_value = mock_aggregator
 
             # Realized savings query result.
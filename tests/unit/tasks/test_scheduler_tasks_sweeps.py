@@ -238,8 +238,9 @@ class TestBillingSweep:
             patch(
                 "app.tasks.scheduler_tasks.async_session_maker"
             ) as mock_session_maker,
-            patch("app.tasks.scheduler_tasks.BackgroundJob"),
-            patch("app.tasks.scheduler_tasks.BACKGROUND_JOBS_ENQUEUED"),
+            patch(
+                "app.tasks.scheduler_tasks.BACKGROUND_JOBS_ENQUEUED"
+            ) as mock_enqueued,
         ):
             mock_session = AsyncMock()
             mock_session_maker.return_value = mock_session
@@ -251,19 +252,18 @@ class TestBillingSweep:
             )
             mock_session.begin.return_value.__aexit__ = AsyncMock(return_value=None)
 
-            # Mock subscription query
-            mock_sub_result = MagicMock()
-            mock_sub_result.scalars.return_value.all.return_value = [mock_subscription]
-            mock_session.execute.return_value = mock_sub_result
-
-            # Mock job insertion
+            # Count of due subscriptions, then the INSERT ... SELECT
+            mock_count_result = MagicMock()
+            mock_count_result.scalar.return_value = 1
             mock_job_result = MagicMock()
             mock_job_result.rowcount = 1
-            mock_session.execute.side_effect = [mock_sub_result, mock_job_result]
+            mock_session.execute.side_effect = [mock_count_result, mock_job_result]
 
             await _billing_sweep_logic()
 
             # Should have enqueued billing job
+            assert mock_session.execute.call_count == 2
+            mock_enqueued.labels.return_value.inc.assert_called_once_with(1)
 
     @pytest.mark.asyncio
     async def test_billing_sweep_no_due_subscriptions(self):
@@ -281,14 +281,15 @@ class TestBillingSweep:
             )
             mock_session.begin.return_value.__aexit__ = AsyncMock(return_value=None)
 
-            # Mock empty subscription query
+            # Mock empty subscription count
             mock_result = MagicMock()
-            mock_result.scalars.return_value.all.return_value = []
+            mock_result.scalar.return_value = 0
             mock_session.execute.return_value = mock_result
 
             await _billing_sweep_logic()
 
-            # Should handle empty results gracefully
+            # Should handle empty results gracefully without inserting
+            assert mock_session.execute.call_count == 1
 
     def test_run_billing_sweep_task(self):
         """Test the Celery task wrapper for billing sweep."""
@@ -306,19 +307,13 @@ class TestAcceptanceSweep:
 
     @pytest.mark.asyncio
     async def test_acceptance_sweep_enqueues_jobs(self):
-        mock_tenant1 = MagicMock()
-        mock_tenant1.id = uuid4()
-        mock_tenant1.plan = "starter"
-
-        mock_tenant2 = MagicMock()
-        mock_tenant2.id = uuid4()
-        mock_tenant2.plan = "pro"
-
         with (
             patch(
                 "app.tasks.scheduler_tasks.async_session_maker"
             ) as mock_session_maker,
-            patch("app.tasks.scheduler_tasks.BACKGROUND_JOBS_ENQUEUED"),
+            patch(
+                "app.tasks.scheduler_tasks.BACKGROUND_JOBS_ENQUEUED"
+            ) as mock_enqueued,
             patch("app.tasks.scheduler_tasks.SCHEDULER_JOB_RUNS"),
             patch("app.tasks.scheduler_tasks.SCHEDULER_JOB_DURATION"),
         ):
@@ -332,27 +327,24 @@ class TestAcceptanceSweep:
             )
             mock_session.begin.return_value.__aexit__ = AsyncMock(return_value=None)
 
-            # Select tenants
-            mock_result = MagicMock()
-            mock_result.scalars.return_value.all.return_value = [
-                mock_tenant1,
-                mock_tenant2,
-            ]
+            # Count tenants
+            mock_count_result = MagicMock()
+            mock_count_result.scalar.return_value = 2
 
             # Insert results
             mock_insert_result = MagicMock()
-            mock_insert_result.rowcount = 1
+            mock_insert_result.rowcount = 2
 
             mock_session.execute.side_effect = [
-                mock_result,
-                mock_insert_result,
+                mock_count_result,
                 mock_insert_result,
             ]
 
             await _acceptance_sweep_logic()
 
-            # One SELECT + 2 INSERTs
-            assert mock_session.execute.call_count >= 3
+            # One COUNT + one INSERT ... SELECT for every tenant
+            assert mock_session.execute.call_count == 2
+            mock_enqueued.labels.return_value.inc.assert_called_once_with(2)
 
     def test_run_acceptance_sweep_task(self):
         with (
@@ -408,7 +400,7 @@ class TestMaintenanceSweep:
 
             # Mock aggregator
             mock_aggregator = MagicMock()
-            mock_aggregator.refresh_materialized_view = AsyncMock()
+            mock_aggregator.reconcile_daily_aggregates = AsyncMock()
             mock_aggregator_cls.return_value = mock_aggregator
 
             # Realized savings query result.
@@ -420,7 +412,7 @@ class TestMaintenanceSweep:
 
             # Should have called all maintenance operations
             mock_persistence.finalize_batch.assert_called_once_with(days_ago=2)
-            mock_aggregator.refresh_materialized_view.assert_called_once()
+            mock_aggregator.reconcile_daily_aggregates.assert_called_once()
             mock_auto_activate.assert_awaited_once()
             mock_create_partitions.assert_awaited_once_with(months_ahead=3)
             mock_archive_partitions.assert_awaited_once_with(months_old=13)
@@ -489,7 +481,7 @@ class TestMaintenanceSweep:
             mock_persistence_cls.return_value = mock_persistence
 
             mock_aggregator = MagicMock()
-            mock_aggregator.refresh_materialized_view = AsyncMock()
+            mock_aggregator.reconcile_daily_aggregates = AsyncMock()
             mock_aggregator_cls.return_value = mock_aggregator
 
             empty_result = MagicMock()
@@ -550,7 +542,7 @@ class TestMaintenanceSweep:
 
             # Mock aggregator
             mock_aggregator = MagicMock()
-            mock_aggregator.refresh_materialized_view = AsyncMock()
+            mock_aggregator.reconcile_daily_aggregates = AsyncMock()
             mock_aggregator_cls.return_value = mock_aggregator
 
             # Realized savings query result.
@@ -562,7 +554,7 @@ class TestMaintenanceSweep:
             await _maintenance_sweep_logic()
 
             # Should still call aggregator
-            mock_aggregator.refresh_materialized_view.assert_called_once()
+            mock_aggregator.reconcile_daily_aggregates.assert_called_once()
             mock_auto_activate.assert_awaited_once()
             mock_create_partitions.assert_awaited_once_with(months_ahead=3)
             mock_archive_partitions.assert_awaited_once_with(months_old=13)